@@ -1,196 +1,7 @@
-import os
-from typing import Mapping, Optional, Union
-from ._vendor import openai
-from portkey_ai.api_resources import (
-    LLMOptions,
-    Modes,
-    ModesLiteral,
-    ProviderTypes,
-    ProviderTypesLiteral,
-    CacheType,
-    CacheLiteral,
-    Message,
-    PortkeyResponse,
-    Completion,
-    AsyncCompletion,
-    Params,
-    Config,
-    RetrySettings,
-    ChatCompletion,
-    AsyncChatCompletion,
-    ChatCompletionsMessages,
-    AsyncChatCompletionsMessages,
-    createHeaders,
-    Prompts,
-    AsyncPrompts,
-    Portkey,
-    AsyncPortkey,
-    Images,
-    AsyncImages,
-    Assistants,
-    AsyncAssistants,
-    Threads,
-    AsyncThreads,
-    Messages,
-    AsyncMessages,
-    MainFiles,
-    AsyncMainFiles,
-    Models,
-    AsyncModels,
-    Runs,
-    AsyncRuns,
-    Steps,
-    AsyncSteps,
-    Moderations,
-    AsyncModerations,
-    Audio,
-    Transcriptions,
-    Translations,
-    Speech,
-    AsyncAudio,
-    AsyncTranscriptions,
-    AsyncTranslations,
-    AsyncSpeech,
-    Batches,
-    AsyncBatches,
-    FineTuning,
-    Jobs,
-    Checkpoints,
-    AsyncFineTuning,
-    AsyncJobs,
-    AsyncCheckpoints,
-    VectorStores,
-    VectorFiles,
-    VectorFileBatches,
-    AsyncVectorStores,
-    AsyncVectorFiles,
-    AsyncVectorFileBatches,
-    Admin,
-    Users,
-    Invites,
-    Workspaces,
-    WorkspacesUsers,
-    AsyncAdmin,
-    AsyncUsers,
-    AsyncInvites,
-    AsyncWorkspaces,
-    AsyncWorkspacesUsers,
-    BetaChat,
-    AsyncBetaChat,
-    BetaCompletions,
-    AsyncBetaCompletions,
-    Uploads,
-    Parts,
-    AsyncUploads,
-    AsyncParts,
-    Configs,
-    AsyncConfigs,
-    ApiKeys,
-    AsyncApiKeys,
-    VirtualKeys,
-    AsyncVirtualKeys,
-    Logs,
-    AsyncLogs,
-    BetaRealtime,
-    AsyncBetaRealtime,
-    BetaSessions,
-    AsyncBetaSessions,
-    BetaTranscriptionSessions,
-    AsyncBetaTranscriptionSessions,
-    Responses,
-    InputItems,
-    AsyncResponses,
-    AsyncInputItems,
-    Labels,
-    AsyncLabels,
-    Collections,
-    AsyncCollections,
-    FineTuningCheckpoints,
-    AsyncFineTuningCheckpoints,
-    Permissions,
-    AsyncPermissions,
-    Evals,
-    AsyncEvals,
-    EvalsRuns,
-    AsyncEvalsRuns,
-    OutputItems,
-    AsyncOutputItems,
-    Alpha,
-    AsyncAlpha,
-    Graders,
-    AsyncGraders,
-    Containers,
-    AsyncContainers,
-    ContainersFiles,
-    AsyncContainersFiles,
-    Content,
-    AsyncContent,
-    Integrations,
-    AsyncIntegrations,
-    IntegrationsWorkspaces,
-    AsyncIntegrationsWorkspaces,
-    IntegrationsModels,
-    AsyncIntegrationsModels,
-    Providers,
-    AsyncProviders,
-    Guardrails,
-    AsyncGuardrails,
-    Webhooks,
-    AsyncWebhooks,
-    MainRealtime,
-    AsyncMainRealtime,
-    ClientSecrets,
-    AsyncClientSecrets,
-    Conversations,
-    AsyncConversations,
-    ConversationsItems,
-    AsyncConversationsItems,
-    Videos,
-    AsyncVideos,
-    Skills,
-    AsyncSkills,
-    SkillsContent,
-    AsyncSkillsContent,
-    SkillsVersions,
-    AsyncSkillsVersions,
-    SkillsVersionsContent,
-    AsyncSkillsVersionsContent,
-    ChatKit,
-    AsyncChatKit,
-    ChatKitSessions,
-    AsyncChatKitSessions,
-    ChatKitThreads,
-    AsyncChatKitThreads,
-    Calls,
-    AsyncCalls,
-    InputTokens,
-    AsyncInputTokens,
-    Analytics,
-    AsyncAnalytics,
-    AnalyticsGraphs,
-    AsyncAnalyticsGraphs,
-    AnalyticsGroups,
-    AsyncAnalyticsGroups,
-    AnalyticsSummary,
-    AsyncAnalyticsSummary,
-    McpServers,
-    AsyncMcpServers,
-    McpServerCapabilities,
-    AsyncMcpServerCapabilities,
-    McpServerUserAccess,
-    AsyncMcpServerUserAccess,
-    McpServerMetadata,
-    AsyncMcpServerMetadata,
-    McpIntegrations,
-    AsyncMcpIntegrations,
-    McpIntegrationWorkspaces,
-    AsyncMcpIntegrationWorkspaces,
-    McpIntegrationCapabilities,
-    AsyncMcpIntegrationCapabilities,
-    McpIntegrationMetadata,
-    AsyncMcpIntegrationMetadata,
-)
+from __future__ import annotations
 
+import os
+from typing import TYPE_CHECKING, Mapping, Optional, Union
 from portkey_ai.version import VERSION
 from portkey_ai.api_resources.global_constants import (
     PORTKEY_BASE_URL,
@@ -198,6 +9,425 @@ from portkey_ai.api_resources.global_constants import (
     PORTKEY_PROXY_ENV,
     PORTKEY_GATEWAY_URL,
 )
+from portkey_ai._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from ._vendor import openai
+    from portkey_ai.api_resources import (
+        LLMOptions,
+        Modes,
+        ModesLiteral,
+        ProviderTypes,
+        ProviderTypesLiteral,
+        CacheType,
+        CacheLiteral,
+        Message,
+        PortkeyResponse,
+        Completion,
+        AsyncCompletion,
+        Params,
+        Config,
+        RetrySettings,
+        RetryPolicy,
+        RateLimiter,
+        HedgingPolicy,
+        ChatCompletion,
+        AsyncChatCompletion,
+        ChatCompletionsMessages,
+        AsyncChatCompletionsMessages,
+        createHeaders,
+        Prompts,
+        AsyncPrompts,
+        Portkey,
+        AsyncPortkey,
+        Images,
+        AsyncImages,
+        Assistants,
+        AsyncAssistants,
+        Threads,
+        AsyncThreads,
+        Messages,
+        AsyncMessages,
+        MainFiles,
+        AsyncMainFiles,
+        Models,
+        AsyncModels,
+        Runs,
+        AsyncRuns,
+        Steps,
+        AsyncSteps,
+        Moderations,
+        AsyncModerations,
+        Audio,
+        Transcriptions,
+        Translations,
+        Speech,
+        AsyncAudio,
+        AsyncTranscriptions,
+        AsyncTranslations,
+        AsyncSpeech,
+        Batches,
+        AsyncBatches,
+        FineTuning,
+        Jobs,
+        Checkpoints,
+        AsyncFineTuning,
+        AsyncJobs,
+        AsyncCheckpoints,
+        VectorStores,
+        VectorFiles,
+        VectorFileBatches,
+        AsyncVectorStores,
+        AsyncVectorFiles,
+        AsyncVectorFileBatches,
+        Admin,
+        Users,
+        Invites,
+        Workspaces,
+        WorkspacesUsers,
+        AsyncAdmin,
+        AsyncUsers,
+        AsyncInvites,
+        AsyncWorkspaces,
+        AsyncWorkspacesUsers,
+        BetaChat,
+        AsyncBetaChat,
+        BetaCompletions,
+        AsyncBetaCompletions,
+        Uploads,
+        Parts,
+        AsyncUploads,
+        AsyncParts,
+        Configs,
+        AsyncConfigs,
+        ApiKeys,
+        AsyncApiKeys,
+        VirtualKeys,
+        AsyncVirtualKeys,
+        Logs,
+        AsyncLogs,
+        BetaRealtime,
+        AsyncBetaRealtime,
+        BetaSessions,
+        AsyncBetaSessions,
+        BetaTranscriptionSessions,
+        AsyncBetaTranscriptionSessions,
+        Responses,
+        InputItems,
+        AsyncResponses,
+        AsyncInputItems,
+        Labels,
+        AsyncLabels,
+        Collections,
+        AsyncCollections,
+        FineTuningCheckpoints,
+        AsyncFineTuningCheckpoints,
+        Permissions,
+        AsyncPermissions,
+        Evals,
+        AsyncEvals,
+        EvalsRuns,
+        AsyncEvalsRuns,
+        OutputItems,
+        AsyncOutputItems,
+        Alpha,
+        AsyncAlpha,
+        Graders,
+        AsyncGraders,
+        Containers,
+        AsyncContainers,
+        ContainersFiles,
+        AsyncContainersFiles,
+        Content,
+        AsyncContent,
+        Integrations,
+        AsyncIntegrations,
+        IntegrationsWorkspaces,
+        AsyncIntegrationsWorkspaces,
+        IntegrationsModels,
+        AsyncIntegrationsModels,
+        Providers,
+        AsyncProviders,
+        Guardrails,
+        AsyncGuardrails,
+        Webhooks,
+        AsyncWebhooks,
+        MainRealtime,
+        AsyncMainRealtime,
+        ClientSecrets,
+        AsyncClientSecrets,
+        Conversations,
+        AsyncConversations,
+        ConversationsItems,
+        AsyncConversationsItems,
+        Videos,
+        AsyncVideos,
+        Skills,
+        AsyncSkills,
+        SkillsContent,
+        AsyncSkillsContent,
+        SkillsVersions,
+        AsyncSkillsVersions,
+        SkillsVersionsContent,
+        AsyncSkillsVersionsContent,
+        ChatKit,
+        AsyncChatKit,
+        ChatKitSessions,
+        AsyncChatKitSessions,
+        ChatKitThreads,
+        AsyncChatKitThreads,
+        Calls,
+        AsyncCalls,
+        InputTokens,
+        AsyncInputTokens,
+        Analytics,
+        AsyncAnalytics,
+        AnalyticsGraphs,
+        AsyncAnalyticsGraphs,
+        AnalyticsGroups,
+        AsyncAnalyticsGroups,
+        AnalyticsSummary,
+        AsyncAnalyticsSummary,
+        McpServers,
+        AsyncMcpServers,
+        McpServerCapabilities,
+        AsyncMcpServerCapabilities,
+        McpServerUserAccess,
+        AsyncMcpServerUserAccess,
+        McpServerMetadata,
+        AsyncMcpServerMetadata,
+        McpIntegrations,
+        AsyncMcpIntegrations,
+        McpIntegrationWorkspaces,
+        AsyncMcpIntegrationWorkspaces,
+        McpIntegrationCapabilities,
+        AsyncMcpIntegrationCapabilities,
+        McpIntegrationMetadata,
+        AsyncMcpIntegrationMetadata,
+        BulkResult,
+        LazyModel,
+        StreamAccumulator,
+        AsyncStreamAccumulator,
+        ResponseCache,
+        MemoryResponseCache,
+        SQLiteResponseCache,
+        CoalescingTransport,
+        AsyncCoalescingTransport,
+        EmbeddingCache,
+        BatchJobError,
+        BatchResult,
+    )
+
+# Everything else is loaded on first use; see `portkey_ai._lazy`.
+_LAZY_IMPORTS = {
+    "._vendor": ("openai",),
+    "portkey_ai.api_resources": (
+        "LLMOptions",
+        "Modes",
+        "ModesLiteral",
+        "ProviderTypes",
+        "ProviderTypesLiteral",
+        "CacheType",
+        "CacheLiteral",
+        "Message",
+        "PortkeyResponse",
+        "Completion",
+        "AsyncCompletion",
+        "Params",
+        "Config",
+        "RetrySettings",
+        "RetryPolicy",
+        "RateLimiter",
+        "HedgingPolicy",
+        "ChatCompletion",
+        "AsyncChatCompletion",
+        "ChatCompletionsMessages",
+        "AsyncChatCompletionsMessages",
+        "createHeaders",
+        "Prompts",
+        "AsyncPrompts",
+        "Portkey",
+        "AsyncPortkey",
+        "Images",
+        "AsyncImages",
+        "Assistants",
+        "AsyncAssistants",
+        "Threads",
+        "AsyncThreads",
+        "Messages",
+        "AsyncMessages",
+        "MainFiles",
+        "AsyncMainFiles",
+        "Models",
+        "AsyncModels",
+        "Runs",
+        "AsyncRuns",
+        "Steps",
+        "AsyncSteps",
+        "Moderations",
+        "AsyncModerations",
+        "Audio",
+        "Transcriptions",
+        "Translations",
+        "Speech",
+        "AsyncAudio",
+        "AsyncTranscriptions",
+        "AsyncTranslations",
+        "AsyncSpeech",
+        "Batches",
+        "AsyncBatches",
+        "FineTuning",
+        "Jobs",
+        "Checkpoints",
+        "AsyncFineTuning",
+        "AsyncJobs",
+        "AsyncCheckpoints",
+        "VectorStores",
+        "VectorFiles",
+        "VectorFileBatches",
+        "AsyncVectorStores",
+        "AsyncVectorFiles",
+        "AsyncVectorFileBatches",
+        "Admin",
+        "Users",
+        "Invites",
+        "Workspaces",
+        "WorkspacesUsers",
+        "AsyncAdmin",
+        "AsyncUsers",
+        "AsyncInvites",
+        "AsyncWorkspaces",
+        "AsyncWorkspacesUsers",
+        "BetaChat",
+        "AsyncBetaChat",
+        "BetaCompletions",
+        "AsyncBetaCompletions",
+        "Uploads",
+        "Parts",
+        "AsyncUploads",
+        "AsyncParts",
+        "Configs",
+        "AsyncConfigs",
+        "ApiKeys",
+        "AsyncApiKeys",
+        "VirtualKeys",
+        "AsyncVirtualKeys",
+        "Logs",
+        "AsyncLogs",
+        "BetaRealtime",
+        "AsyncBetaRealtime",
+        "BetaSessions",
+        "AsyncBetaSessions",
+        "BetaTranscriptionSessions",
+        "AsyncBetaTranscriptionSessions",
+        "Responses",
+        "InputItems",
+        "AsyncResponses",
+        "AsyncInputItems",
+        "Labels",
+        "AsyncLabels",
+        "Collections",
+        "AsyncCollections",
+        "FineTuningCheckpoints",
+        "AsyncFineTuningCheckpoints",
+        "Permissions",
+        "AsyncPermissions",
+        "Evals",
+        "AsyncEvals",
+        "EvalsRuns",
+        "AsyncEvalsRuns",
+        "OutputItems",
+        "AsyncOutputItems",
+        "Alpha",
+        "AsyncAlpha",
+        "Graders",
+        "AsyncGraders",
+        "Containers",
+        "AsyncContainers",
+        "ContainersFiles",
+        "AsyncContainersFiles",
+        "Content",
+        "AsyncContent",
+        "Integrations",
+        "AsyncIntegrations",
+        "IntegrationsWorkspaces",
+        "AsyncIntegrationsWorkspaces",
+        "IntegrationsModels",
+        "AsyncIntegrationsModels",
+        "Providers",
+        "AsyncProviders",
+        "Guardrails",
+        "AsyncGuardrails",
+        "Webhooks",
+        "AsyncWebhooks",
+        "MainRealtime",
+        "AsyncMainRealtime",
+        "ClientSecrets",
+        "AsyncClientSecrets",
+        "Conversations",
+        "AsyncConversations",
+        "ConversationsItems",
+        "AsyncConversationsItems",
+        "Videos",
+        "AsyncVideos",
+        "Skills",
+        "AsyncSkills",
+        "SkillsContent",
+        "AsyncSkillsContent",
+        "SkillsVersions",
+        "AsyncSkillsVersions",
+        "SkillsVersionsContent",
+        "AsyncSkillsVersionsContent",
+        "ChatKit",
+        "AsyncChatKit",
+        "ChatKitSessions",
+        "AsyncChatKitSessions",
+        "ChatKitThreads",
+        "AsyncChatKitThreads",
+        "Calls",
+        "AsyncCalls",
+        "InputTokens",
+        "AsyncInputTokens",
+        "Analytics",
+        "AsyncAnalytics",
+        "AnalyticsGraphs",
+        "AsyncAnalyticsGraphs",
+        "AnalyticsGroups",
+        "AsyncAnalyticsGroups",
+        "AnalyticsSummary",
+        "AsyncAnalyticsSummary",
+        "McpServers",
+        "AsyncMcpServers",
+        "McpServerCapabilities",
+        "AsyncMcpServerCapabilities",
+        "McpServerUserAccess",
+        "AsyncMcpServerUserAccess",
+        "McpServerMetadata",
+        "AsyncMcpServerMetadata",
+        "McpIntegrations",
+        "AsyncMcpIntegrations",
+        "McpIntegrationWorkspaces",
+        "AsyncMcpIntegrationWorkspaces",
+        "McpIntegrationCapabilities",
+        "AsyncMcpIntegrationCapabilities",
+        "McpIntegrationMetadata",
+        "AsyncMcpIntegrationMetadata",
+        "BulkResult",
+        "LazyModel",
+        "StreamAccumulator",
+        "AsyncStreamAccumulator",
+        "ResponseCache",
+        "MemoryResponseCache",
+        "SQLiteResponseCache",
+        "CoalescingTransport",
+        "AsyncCoalescingTransport",
+        "EmbeddingCache",
+        "BatchJobError",
+        "BatchResult",
+    ),
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
 
 api_key = os.environ.get(PORTKEY_API_KEY_ENV)
 base_url = os.environ.get(PORTKEY_PROXY_ENV, PORTKEY_BASE_URL)
@@ -221,6 +451,9 @@ __all__ = [
     "AsyncChatCompletionsMessages",
     "Params",
     "RetrySettings",
+    "RetryPolicy",
+    "RateLimiter",
+    "HedgingPolicy",
     "ChatCompletion",
     "AsyncChatCompletion",
     "Config",
@@ -397,4 +630,16 @@ __all__ = [
     "AsyncMcpIntegrationCapabilities",
     "McpIntegrationMetadata",
     "AsyncMcpIntegrationMetadata",
+    "BulkResult",
+    "LazyModel",
+    "StreamAccumulator",
+    "AsyncStreamAccumulator",
+    "ResponseCache",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "CoalescingTransport",
+    "AsyncCoalescingTransport",
+    "EmbeddingCache",
+    "BatchJobError",
+    "BatchResult",
 ]
@@ -0,0 +1,49 @@
+"""Module-level lazy attributes (PEP 562) for the package `__init__` files.
+
+The packages list their public names together with the submodule defining
+each one, and only import that submodule the first time the name is used.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Tuple
+
+
+def lazy_attributes(
+    package: str,
+    package_globals: Dict[str, Any],
+    imports: Mapping[str, Iterable[str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """`__getattr__` and `__dir__` for `package`.
+
+    `imports` maps submodules (relative to `package`) to the names to take
+    from them. A resolved name is stored in `package_globals`, so later
+    lookups never reach `__getattr__` again. Submodules of `package` that
+    have not been imported yet are also resolved on attribute access.
+    """
+    modules = {name: module for module, names in imports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            try:
+                value: Any = importlib.import_module(f".{name}", package)
+            except ModuleNotFoundError as err:
+                if err.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(
+                    f"module {package!r} has no attribute {name!r}"
+                ) from None
+        else:
+            source = importlib.import_module(module, package)
+            try:
+                value = getattr(source, name)
+            except AttributeError:
+                # A subpackage, e.g. `openai` from `._vendor`.
+                value = importlib.import_module(f".{name}", source.__name__)
+        package_globals[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(package_globals) | set(modules))
+
+    return __getattr__, __dir__
@@ -1,201 +1,446 @@
 """"""
-from .apis import (
-    Completion,
-    AsyncCompletion,
-    ChatCompletion,
-    AsyncChatCompletion,
-    ChatCompletionsMessages,
-    AsyncChatCompletionsMessages,
-    Generations,
-    AsyncGenerations,
-    Prompts,
-    AsyncPrompts,
-    Feedback,
-    AsyncFeedback,
-    createHeaders,
-    Images,
-    AsyncImages,
-    Assistants,
-    AsyncAssistants,
-    Threads,
-    AsyncThreads,
-    Messages,
-    AsyncMessages,
-    MainFiles,
-    AsyncMainFiles,
-    Models,
-    AsyncModels,
-    Runs,
-    AsyncRuns,
-    Steps,
-    AsyncSteps,
-    Moderations,
-    AsyncModerations,
-    Audio,
-    Transcriptions,
-    Translations,
-    Speech,
-    AsyncAudio,
-    AsyncTranscriptions,
-    AsyncTranslations,
-    AsyncSpeech,
-    Batches,
-    AsyncBatches,
-    FineTuning,
-    Jobs,
-    Checkpoints,
-    AsyncFineTuning,
-    AsyncJobs,
-    AsyncCheckpoints,
-    VectorStores,
-    VectorFiles,
-    VectorFileBatches,
-    AsyncVectorStores,
-    AsyncVectorFiles,
-    AsyncVectorFileBatches,
-    Admin,
-    Users,
-    Invites,
-    Workspaces,
-    WorkspacesUsers,
-    AsyncAdmin,
-    AsyncUsers,
-    AsyncInvites,
-    AsyncWorkspaces,
-    AsyncWorkspacesUsers,
-    BetaChat,
-    AsyncBetaChat,
-    BetaCompletions,
-    AsyncBetaCompletions,
-    Uploads,
-    AsyncUploads,
-    Parts,
-    AsyncParts,
-    Configs,
-    AsyncConfigs,
-    ApiKeys,
-    AsyncApiKeys,
-    VirtualKeys,
-    AsyncVirtualKeys,
-    Logs,
-    AsyncLogs,
-    BetaRealtime,
-    AsyncBetaRealtime,
-    BetaSessions,
-    AsyncBetaSessions,
-    BetaTranscriptionSessions,
-    AsyncBetaTranscriptionSessions,
-    Responses,
-    InputItems,
-    AsyncResponses,
-    AsyncInputItems,
-    Labels,
-    AsyncLabels,
-    Collections,
-    AsyncCollections,
-    FineTuningCheckpoints,
-    AsyncFineTuningCheckpoints,
-    Permissions,
-    AsyncPermissions,
-    Evals,
-    AsyncEvals,
-    EvalsRuns,
-    AsyncEvalsRuns,
-    OutputItems,
-    AsyncOutputItems,
-    Alpha,
-    AsyncAlpha,
-    Graders,
-    AsyncGraders,
-    Containers,
-    AsyncContainers,
-    ContainersFiles,
-    AsyncContainersFiles,
-    Content,
-    AsyncContent,
-    Integrations,
-    AsyncIntegrations,
-    IntegrationsWorkspaces,
-    AsyncIntegrationsWorkspaces,
-    IntegrationsModels,
-    AsyncIntegrationsModels,
-    Providers,
-    AsyncProviders,
-    Guardrails,
-    AsyncGuardrails,
-    Webhooks,
-    AsyncWebhooks,
-    MainRealtime,
-    AsyncMainRealtime,
-    ClientSecrets,
-    AsyncClientSecrets,
-    Conversations,
-    AsyncConversations,
-    ConversationsItems,
-    AsyncConversationsItems,
-    Videos,
-    AsyncVideos,
-    Skills,
-    AsyncSkills,
-    SkillsContent,
-    AsyncSkillsContent,
-    SkillsVersions,
-    AsyncSkillsVersions,
-    SkillsVersionsContent,
-    AsyncSkillsVersionsContent,
-    ChatKit,
-    AsyncChatKit,
-    ChatKitSessions,
-    AsyncChatKitSessions,
-    ChatKitThreads,
-    AsyncChatKitThreads,
-    Calls,
-    AsyncCalls,
-    InputTokens,
-    AsyncInputTokens,
-    Analytics,
-    AsyncAnalytics,
-    AnalyticsGraphs,
-    AsyncAnalyticsGraphs,
-    AnalyticsGroups,
-    AsyncAnalyticsGroups,
-    AnalyticsSummary,
-    AsyncAnalyticsSummary,
-    McpServers,
-    AsyncMcpServers,
-    McpServerCapabilities,
-    AsyncMcpServerCapabilities,
-    McpServerUserAccess,
-    AsyncMcpServerUserAccess,
-    McpServerMetadata,
-    AsyncMcpServerMetadata,
-    McpIntegrations,
-    AsyncMcpIntegrations,
-    McpIntegrationWorkspaces,
-    AsyncMcpIntegrationWorkspaces,
-    McpIntegrationCapabilities,
-    AsyncMcpIntegrationCapabilities,
-    McpIntegrationMetadata,
-    AsyncMcpIntegrationMetadata,
-)
-from .utils import (
-    Modes,
-    ModesLiteral,
-    LLMOptions,
-    ProviderTypes,
-    ProviderTypesLiteral,
-    CacheType,
-    CacheLiteral,
-    Message,
-    PortkeyResponse,
-    Params,
-    Config,
-    RetrySettings,
-)
-from .client import Portkey, AsyncPortkey
-
+from typing import TYPE_CHECKING
+from portkey_ai._lazy import lazy_attributes
 from portkey_ai.version import VERSION
 
+if TYPE_CHECKING:
+    from .apis import (
+        Completion,
+        AsyncCompletion,
+        ChatCompletion,
+        AsyncChatCompletion,
+        ChatCompletionsMessages,
+        AsyncChatCompletionsMessages,
+        Generations,
+        AsyncGenerations,
+        Prompts,
+        AsyncPrompts,
+        Feedback,
+        AsyncFeedback,
+        createHeaders,
+        Images,
+        AsyncImages,
+        Assistants,
+        AsyncAssistants,
+        Threads,
+        AsyncThreads,
+        Messages,
+        AsyncMessages,
+        MainFiles,
+        AsyncMainFiles,
+        Models,
+        AsyncModels,
+        Runs,
+        AsyncRuns,
+        Steps,
+        AsyncSteps,
+        Moderations,
+        AsyncModerations,
+        Audio,
+        Transcriptions,
+        Translations,
+        Speech,
+        AsyncAudio,
+        AsyncTranscriptions,
+        AsyncTranslations,
+        AsyncSpeech,
+        Batches,
+        AsyncBatches,
+        FineTuning,
+        Jobs,
+        Checkpoints,
+        AsyncFineTuning,
+        AsyncJobs,
+        AsyncCheckpoints,
+        VectorStores,
+        VectorFiles,
+        VectorFileBatches,
+        AsyncVectorStores,
+        AsyncVectorFiles,
+        AsyncVectorFileBatches,
+        Admin,
+        Users,
+        Invites,
+        Workspaces,
+        WorkspacesUsers,
+        AsyncAdmin,
+        AsyncUsers,
+        AsyncInvites,
+        AsyncWorkspaces,
+        AsyncWorkspacesUsers,
+        BetaChat,
+        AsyncBetaChat,
+        BetaCompletions,
+        AsyncBetaCompletions,
+        Uploads,
+        AsyncUploads,
+        Parts,
+        AsyncParts,
+        Configs,
+        AsyncConfigs,
+        ApiKeys,
+        AsyncApiKeys,
+        VirtualKeys,
+        AsyncVirtualKeys,
+        Logs,
+        AsyncLogs,
+        BetaRealtime,
+        AsyncBetaRealtime,
+        BetaSessions,
+        AsyncBetaSessions,
+        BetaTranscriptionSessions,
+        AsyncBetaTranscriptionSessions,
+        Responses,
+        InputItems,
+        AsyncResponses,
+        AsyncInputItems,
+        Labels,
+        AsyncLabels,
+        Collections,
+        AsyncCollections,
+        FineTuningCheckpoints,
+        AsyncFineTuningCheckpoints,
+        Permissions,
+        AsyncPermissions,
+        Evals,
+        AsyncEvals,
+        EvalsRuns,
+        AsyncEvalsRuns,
+        OutputItems,
+        AsyncOutputItems,
+        Alpha,
+        AsyncAlpha,
+        Graders,
+        AsyncGraders,
+        Containers,
+        AsyncContainers,
+        ContainersFiles,
+        AsyncContainersFiles,
+        Content,
+        AsyncContent,
+        Integrations,
+        AsyncIntegrations,
+        IntegrationsWorkspaces,
+        AsyncIntegrationsWorkspaces,
+        IntegrationsModels,
+        AsyncIntegrationsModels,
+        Providers,
+        AsyncProviders,
+        Guardrails,
+        AsyncGuardrails,
+        Webhooks,
+        AsyncWebhooks,
+        MainRealtime,
+        AsyncMainRealtime,
+        ClientSecrets,
+        AsyncClientSecrets,
+        Conversations,
+        AsyncConversations,
+        ConversationsItems,
+        AsyncConversationsItems,
+        Videos,
+        AsyncVideos,
+        Skills,
+        AsyncSkills,
+        SkillsContent,
+        AsyncSkillsContent,
+        SkillsVersions,
+        AsyncSkillsVersions,
+        SkillsVersionsContent,
+        AsyncSkillsVersionsContent,
+        ChatKit,
+        AsyncChatKit,
+        ChatKitSessions,
+        AsyncChatKitSessions,
+        ChatKitThreads,
+        AsyncChatKitThreads,
+        Calls,
+        AsyncCalls,
+        InputTokens,
+        AsyncInputTokens,
+        Analytics,
+        AsyncAnalytics,
+        AnalyticsGraphs,
+        AsyncAnalyticsGraphs,
+        AnalyticsGroups,
+        AsyncAnalyticsGroups,
+        AnalyticsSummary,
+        AsyncAnalyticsSummary,
+        McpServers,
+        AsyncMcpServers,
+        McpServerCapabilities,
+        AsyncMcpServerCapabilities,
+        McpServerUserAccess,
+        AsyncMcpServerUserAccess,
+        McpServerMetadata,
+        AsyncMcpServerMetadata,
+        McpIntegrations,
+        AsyncMcpIntegrations,
+        McpIntegrationWorkspaces,
+        AsyncMcpIntegrationWorkspaces,
+        McpIntegrationCapabilities,
+        AsyncMcpIntegrationCapabilities,
+        McpIntegrationMetadata,
+        AsyncMcpIntegrationMetadata,
+    )
+    from .utils import (
+        Modes,
+        ModesLiteral,
+        LLMOptions,
+        ProviderTypes,
+        ProviderTypesLiteral,
+        CacheType,
+        CacheLiteral,
+        Message,
+        PortkeyResponse,
+        Params,
+        Config,
+        RetrySettings,
+    )
+    from .client import Portkey, AsyncPortkey
+    from .retry import RetryPolicy
+    from .rate_limiter import RateLimiter
+    from .hedging import HedgingPolicy
+    from .bulk import BulkResult
+    from .types.lazy_model import LazyModel
+    from .stream_accumulator import StreamAccumulator, AsyncStreamAccumulator
+    from .response_cache import (
+        ResponseCache,
+        MemoryResponseCache,
+        SQLiteResponseCache,
+    )
+    from .coalescing import CoalescingTransport, AsyncCoalescingTransport
+    from .embedding_cache import EmbeddingCache
+    from .batch_jobs import BatchJobError, BatchResult
+
+# Submodules and the public names they define. A submodule is only imported
+# when one of its names is first used, so importing the package does not load
+# every resource and its pydantic types up front.
+_LAZY_IMPORTS = {
+    ".apis": (
+        "Completion",
+        "AsyncCompletion",
+        "ChatCompletion",
+        "AsyncChatCompletion",
+        "ChatCompletionsMessages",
+        "AsyncChatCompletionsMessages",
+        "Generations",
+        "AsyncGenerations",
+        "Prompts",
+        "AsyncPrompts",
+        "Feedback",
+        "AsyncFeedback",
+        "createHeaders",
+        "Images",
+        "AsyncImages",
+        "Assistants",
+        "AsyncAssistants",
+        "Threads",
+        "AsyncThreads",
+        "Messages",
+        "AsyncMessages",
+        "MainFiles",
+        "AsyncMainFiles",
+        "Models",
+        "AsyncModels",
+        "Runs",
+        "AsyncRuns",
+        "Steps",
+        "AsyncSteps",
+        "Moderations",
+        "AsyncModerations",
+        "Audio",
+        "Transcriptions",
+        "Translations",
+        "Speech",
+        "AsyncAudio",
+        "AsyncTranscriptions",
+        "AsyncTranslations",
+        "AsyncSpeech",
+        "Batches",
+        "AsyncBatches",
+        "FineTuning",
+        "Jobs",
+        "Checkpoints",
+        "AsyncFineTuning",
+        "AsyncJobs",
+        "AsyncCheckpoints",
+        "VectorStores",
+        "VectorFiles",
+        "VectorFileBatches",
+        "AsyncVectorStores",
+        "AsyncVectorFiles",
+        "AsyncVectorFileBatches",
+        "Admin",
+        "Users",
+        "Invites",
+        "Workspaces",
+        "WorkspacesUsers",
+        "AsyncAdmin",
+        "AsyncUsers",
+        "AsyncInvites",
+        "AsyncWorkspaces",
+        "AsyncWorkspacesUsers",
+        "BetaChat",
+        "AsyncBetaChat",
+        "BetaCompletions",
+        "AsyncBetaCompletions",
+        "Uploads",
+        "AsyncUploads",
+        "Parts",
+        "AsyncParts",
+        "Configs",
+        "AsyncConfigs",
+        "ApiKeys",
+        "AsyncApiKeys",
+        "VirtualKeys",
+        "AsyncVirtualKeys",
+        "Logs",
+        "AsyncLogs",
+        "BetaRealtime",
+        "AsyncBetaRealtime",
+        "BetaSessions",
+        "AsyncBetaSessions",
+        "BetaTranscriptionSessions",
+        "AsyncBetaTranscriptionSessions",
+        "Responses",
+        "InputItems",
+        "AsyncResponses",
+        "AsyncInputItems",
+        "Labels",
+        "AsyncLabels",
+        "Collections",
+        "AsyncCollections",
+        "FineTuningCheckpoints",
+        "AsyncFineTuningCheckpoints",
+        "Permissions",
+        "AsyncPermissions",
+        "Evals",
+        "AsyncEvals",
+        "EvalsRuns",
+        "AsyncEvalsRuns",
+        "OutputItems",
+        "AsyncOutputItems",
+        "Alpha",
+        "AsyncAlpha",
+        "Graders",
+        "AsyncGraders",
+        "Containers",
+        "AsyncContainers",
+        "ContainersFiles",
+        "AsyncContainersFiles",
+        "Content",
+        "AsyncContent",
+        "Integrations",
+        "AsyncIntegrations",
+        "IntegrationsWorkspaces",
+        "AsyncIntegrationsWorkspaces",
+        "IntegrationsModels",
+        "AsyncIntegrationsModels",
+        "Providers",
+        "AsyncProviders",
+        "Guardrails",
+        "AsyncGuardrails",
+        "Webhooks",
+        "AsyncWebhooks",
+        "MainRealtime",
+        "AsyncMainRealtime",
+        "ClientSecrets",
+        "AsyncClientSecrets",
+        "Conversations",
+        "AsyncConversations",
+        "ConversationsItems",
+        "AsyncConversationsItems",
+        "Videos",
+        "AsyncVideos",
+        "Skills",
+        "AsyncSkills",
+        "SkillsContent",
+        "AsyncSkillsContent",
+        "SkillsVersions",
+        "AsyncSkillsVersions",
+        "SkillsVersionsContent",
+        "AsyncSkillsVersionsContent",
+        "ChatKit",
+        "AsyncChatKit",
+        "ChatKitSessions",
+        "AsyncChatKitSessions",
+        "ChatKitThreads",
+        "AsyncChatKitThreads",
+        "Calls",
+        "AsyncCalls",
+        "InputTokens",
+        "AsyncInputTokens",
+        "Analytics",
+        "AsyncAnalytics",
+        "AnalyticsGraphs",
+        "AsyncAnalyticsGraphs",
+        "AnalyticsGroups",
+        "AsyncAnalyticsGroups",
+        "AnalyticsSummary",
+        "AsyncAnalyticsSummary",
+        "McpServers",
+        "AsyncMcpServers",
+        "McpServerCapabilities",
+        "AsyncMcpServerCapabilities",
+        "McpServerUserAccess",
+        "AsyncMcpServerUserAccess",
+        "McpServerMetadata",
+        "AsyncMcpServerMetadata",
+        "McpIntegrations",
+        "AsyncMcpIntegrations",
+        "McpIntegrationWorkspaces",
+        "AsyncMcpIntegrationWorkspaces",
+        "McpIntegrationCapabilities",
+        "AsyncMcpIntegrationCapabilities",
+        "McpIntegrationMetadata",
+        "AsyncMcpIntegrationMetadata",
+    ),
+    ".utils": (
+        "Modes",
+        "ModesLiteral",
+        "LLMOptions",
+        "ProviderTypes",
+        "ProviderTypesLiteral",
+        "CacheType",
+        "CacheLiteral",
+        "Message",
+        "PortkeyResponse",
+        "Params",
+        "Config",
+        "RetrySettings",
+    ),
+    ".client": (
+        "Portkey",
+        "AsyncPortkey",
+    ),
+    ".retry": ("RetryPolicy",),
+    ".rate_limiter": ("RateLimiter",),
+    ".hedging": ("HedgingPolicy",),
+    ".bulk": ("BulkResult",),
+    ".types.lazy_model": ("LazyModel",),
+    ".stream_accumulator": (
+        "StreamAccumulator",
+        "AsyncStreamAccumulator",
+    ),
+    ".response_cache": (
+        "ResponseCache",
+        "MemoryResponseCache",
+        "SQLiteResponseCache",
+    ),
+    ".coalescing": (
+        "CoalescingTransport",
+        "AsyncCoalescingTransport",
+    ),
+    ".embedding_cache": ("EmbeddingCache",),
+    ".batch_jobs": (
+        "BatchJobError",
+        "BatchResult",
+    ),
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
+
 __version__ = VERSION
 __all__ = [
     "LLMOptions",
@@ -214,6 +459,9 @@ __all__ = [
     "Params",
     "Config",
     "RetrySettings",
+    "RetryPolicy",
+    "RateLimiter",
+    "HedgingPolicy",
     "ChatCompletion",
     "AsyncChatCompletion",
     "Generations",
@@ -389,4 +637,16 @@ __all__ = [
     "AsyncMcpIntegrationCapabilities",
     "McpIntegrationMetadata",
     "AsyncMcpIntegrationMetadata",
+    "BulkResult",
+    "LazyModel",
+    "StreamAccumulator",
+    "AsyncStreamAccumulator",
+    "ResponseCache",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "CoalescingTransport",
+    "AsyncCoalescingTransport",
+    "EmbeddingCache",
+    "BatchJobError",
+    "BatchResult",
 ]
@@ -1,232 +1,496 @@
-from .chat_complete import (
-    ChatCompletion,
-    AsyncChatCompletion,
-    ChatCompletionsMessages,
-    AsyncChatCompletionsMessages,
-)
-from .complete import Completion, AsyncCompletion
-from .generation import Generations, AsyncGenerations, Prompts, AsyncPrompts
-from .feedback import Feedback, AsyncFeedback
-from .create_headers import createHeaders
-from .post import Post, AsyncPost
-from .getMethod import GetMethod, AsyncGetMethod
-from .deleteMethod import DeleteMethod, AsyncDeleteMethod
-from .putMethod import PutMethod, AsyncPutMethod
-from .embeddings import Embeddings, AsyncEmbeddings
-from .images import Images, AsyncImages
-from .assistants import Assistants, AsyncAssistants
-from .threads import (
-    Threads,
-    Messages,
-    Runs,
-    Steps,
-    AsyncThreads,
-    AsyncMessages,
-    AsyncRuns,
-    AsyncSteps,
-)
-from .main_files import MainFiles, AsyncMainFiles
-from .models import Models, AsyncModels
-from .moderations import Moderations, AsyncModerations
-from .audio import (
-    Audio,
-    Transcriptions,
-    Translations,
-    Speech,
-    AsyncAudio,
-    AsyncTranscriptions,
-    AsyncTranslations,
-    AsyncSpeech,
-)
-from .batches import Batches, AsyncBatches
-from .fine_tuning import (
-    FineTuning,
-    Jobs,
-    Checkpoints,
-    Alpha,
-    Graders,
-    AsyncFineTuning,
-    AsyncJobs,
-    AsyncCheckpoints,
-    FineTuningCheckpoints,
-    Permissions,
-    AsyncFineTuningCheckpoints,
-    AsyncPermissions,
-    AsyncAlpha,
-    AsyncGraders,
-)
-from .vector_stores import (
-    VectorStores,
-    VectorFiles,
-    VectorFileBatches,
-    AsyncVectorStores,
-    AsyncVectorFiles,
-    AsyncVectorFileBatches,
-)
-from .admin import (
-    Admin,
-    Users,
-    Invites,
-    Workspaces,
-    WorkspacesUsers,
-    AsyncAdmin,
-    AsyncUsers,
-    AsyncInvites,
-    AsyncWorkspaces,
-    AsyncWorkspacesUsers,
-)
+from typing import TYPE_CHECKING
+from portkey_ai._lazy import lazy_attributes
 
-from .beta_chat import (
-    BetaChat,
-    BetaCompletions,
-    AsyncBetaChat,
-    AsyncBetaCompletions,
-)
+if TYPE_CHECKING:
+    from .chat_complete import (
+        ChatCompletion,
+        AsyncChatCompletion,
+        ChatCompletionsMessages,
+        AsyncChatCompletionsMessages,
+    )
+    from .complete import Completion, AsyncCompletion
+    from .generation import (
+        Generations,
+        AsyncGenerations,
+        Prompts,
+        AsyncPrompts,
+    )
+    from .feedback import Feedback, AsyncFeedback
+    from .create_headers import createHeaders
+    from .post import Post, AsyncPost
+    from .getMethod import GetMethod, AsyncGetMethod
+    from .deleteMethod import DeleteMethod, AsyncDeleteMethod
+    from .putMethod import PutMethod, AsyncPutMethod
+    from .embeddings import Embeddings, AsyncEmbeddings
+    from .images import Images, AsyncImages
+    from .assistants import Assistants, AsyncAssistants
+    from .threads import (
+        Threads,
+        Messages,
+        Runs,
+        Steps,
+        AsyncThreads,
+        AsyncMessages,
+        AsyncRuns,
+        AsyncSteps,
+    )
+    from .main_files import MainFiles, AsyncMainFiles
+    from .models import Models, AsyncModels
+    from .moderations import Moderations, AsyncModerations
+    from .audio import (
+        Audio,
+        Transcriptions,
+        Translations,
+        Speech,
+        AsyncAudio,
+        AsyncTranscriptions,
+        AsyncTranslations,
+        AsyncSpeech,
+    )
+    from .batches import Batches, AsyncBatches
+    from .fine_tuning import (
+        FineTuning,
+        Jobs,
+        Checkpoints,
+        Alpha,
+        Graders,
+        AsyncFineTuning,
+        AsyncJobs,
+        AsyncCheckpoints,
+        FineTuningCheckpoints,
+        Permissions,
+        AsyncFineTuningCheckpoints,
+        AsyncPermissions,
+        AsyncAlpha,
+        AsyncGraders,
+    )
+    from .vector_stores import (
+        VectorStores,
+        VectorFiles,
+        VectorFileBatches,
+        AsyncVectorStores,
+        AsyncVectorFiles,
+        AsyncVectorFileBatches,
+    )
+    from .admin import (
+        Admin,
+        Users,
+        Invites,
+        Workspaces,
+        WorkspacesUsers,
+        AsyncAdmin,
+        AsyncUsers,
+        AsyncInvites,
+        AsyncWorkspaces,
+        AsyncWorkspacesUsers,
+    )
+    from .beta_chat import (
+        BetaChat,
+        BetaCompletions,
+        AsyncBetaChat,
+        AsyncBetaCompletions,
+    )
+    from .beta_realtime import (
+        BetaRealtime,
+        AsyncBetaRealtime,
+        BetaSessions,
+        AsyncBetaSessions,
+        BetaTranscriptionSessions,
+        AsyncBetaTranscriptionSessions,
+    )
+    from .responses import (
+        Responses,
+        InputItems,
+        AsyncResponses,
+        AsyncInputItems,
+        InputTokens,
+        AsyncInputTokens,
+    )
+    from .uploads import (
+        Uploads,
+        Parts,
+        AsyncUploads,
+        AsyncParts,
+    )
+    from .evals import (
+        Evals,
+        AsyncEvals,
+        EvalsRuns,
+        AsyncEvalsRuns,
+        OutputItems,
+        AsyncOutputItems,
+    )
+    from .containers import (
+        Containers,
+        AsyncContainers,
+        ContainersFiles,
+        AsyncContainersFiles,
+        Content,
+        AsyncContent,
+    )
+    from .webhooks import Webhooks, AsyncWebhooks
+    from .configs import Configs, AsyncConfigs
+    from .api_keys import ApiKeys, AsyncApiKeys
+    from .virtual_keys import VirtualKeys, AsyncVirtualKeys
+    from .logs import Logs, AsyncLogs
+    from .labels import Labels, AsyncLabels
+    from .collections import Collections, AsyncCollections
+    from .integrations import (
+        Integrations,
+        AsyncIntegrations,
+        IntegrationsWorkspaces,
+        AsyncIntegrationsWorkspaces,
+        IntegrationsModels,
+        AsyncIntegrationsModels,
+    )
+    from .providers import Providers, AsyncProviders
+    from .guardrails import Guardrails, AsyncGuardrails
+    from .main_realtime import (
+        MainRealtime,
+        AsyncMainRealtime,
+        ClientSecrets,
+        AsyncClientSecrets,
+        Calls,
+        AsyncCalls,
+    )
+    from .conversations import (
+        Conversations,
+        AsyncConversations,
+        ConversationsItems,
+        AsyncConversationsItems,
+    )
+    from .videos import Videos, AsyncVideos
+    from .skills import (
+        Skills,
+        AsyncSkills,
+        SkillsContent,
+        AsyncSkillsContent,
+        SkillsVersions,
+        AsyncSkillsVersions,
+        SkillsVersionsContent,
+        AsyncSkillsVersionsContent,
+    )
+    from .chatkit import (
+        ChatKit,
+        AsyncChatKit,
+        ChatKitSessions,
+        AsyncChatKitSessions,
+        ChatKitThreads,
+        AsyncChatKitThreads,
+    )
+    from .analytics import (
+        Analytics,
+        AsyncAnalytics,
+        AnalyticsGraphs,
+        AsyncAnalyticsGraphs,
+        AnalyticsGroups,
+        AsyncAnalyticsGroups,
+        AnalyticsSummary,
+        AsyncAnalyticsSummary,
+    )
+    from .mcp_servers import (
+        McpServers,
+        AsyncMcpServers,
+        McpServerCapabilities,
+        AsyncMcpServerCapabilities,
+        McpServerUserAccess,
+        AsyncMcpServerUserAccess,
+        McpServerMetadata,
+        AsyncMcpServerMetadata,
+    )
+    from .mcp_integrations import (
+        McpIntegrations,
+        AsyncMcpIntegrations,
+        McpIntegrationWorkspaces,
+        AsyncMcpIntegrationWorkspaces,
+        McpIntegrationCapabilities,
+        AsyncMcpIntegrationCapabilities,
+        McpIntegrationMetadata,
+        AsyncMcpIntegrationMetadata,
+    )
 
-from .beta_realtime import (
-    BetaRealtime,
-    AsyncBetaRealtime,
-    BetaSessions,
-    AsyncBetaSessions,
-    BetaTranscriptionSessions,
-    AsyncBetaTranscriptionSessions,
-)
+# Submodules and the public names they define. A submodule is only imported
+# when one of its names is first used, so importing the package does not load
+# every resource and its pydantic types up front.
+_LAZY_IMPORTS = {
+    ".chat_complete": (
+        "ChatCompletion",
+        "AsyncChatCompletion",
+        "ChatCompletionsMessages",
+        "AsyncChatCompletionsMessages",
+    ),
+    ".complete": (
+        "Completion",
+        "AsyncCompletion",
+    ),
+    ".generation": (
+        "Generations",
+        "AsyncGenerations",
+        "Prompts",
+        "AsyncPrompts",
+    ),
+    ".feedback": (
+        "Feedback",
+        "AsyncFeedback",
+    ),
+    ".create_headers": ("createHeaders",),
+    ".post": (
+        "Post",
+        "AsyncPost",
+    ),
+    ".getMethod": (
+        "GetMethod",
+        "AsyncGetMethod",
+    ),
+    ".deleteMethod": (
+        "DeleteMethod",
+        "AsyncDeleteMethod",
+    ),
+    ".putMethod": (
+        "PutMethod",
+        "AsyncPutMethod",
+    ),
+    ".embeddings": (
+        "Embeddings",
+        "AsyncEmbeddings",
+    ),
+    ".images": (
+        "Images",
+        "AsyncImages",
+    ),
+    ".assistants": (
+        "Assistants",
+        "AsyncAssistants",
+    ),
+    ".threads": (
+        "Threads",
+        "Messages",
+        "Runs",
+        "Steps",
+        "AsyncThreads",
+        "AsyncMessages",
+        "AsyncRuns",
+        "AsyncSteps",
+    ),
+    ".main_files": (
+        "MainFiles",
+        "AsyncMainFiles",
+    ),
+    ".models": (
+        "Models",
+        "AsyncModels",
+    ),
+    ".moderations": (
+        "Moderations",
+        "AsyncModerations",
+    ),
+    ".audio": (
+        "Audio",
+        "Transcriptions",
+        "Translations",
+        "Speech",
+        "AsyncAudio",
+        "AsyncTranscriptions",
+        "AsyncTranslations",
+        "AsyncSpeech",
+    ),
+    ".batches": (
+        "Batches",
+        "AsyncBatches",
+    ),
+    ".fine_tuning": (
+        "FineTuning",
+        "Jobs",
+        "Checkpoints",
+        "Alpha",
+        "Graders",
+        "AsyncFineTuning",
+        "AsyncJobs",
+        "AsyncCheckpoints",
+        "FineTuningCheckpoints",
+        "Permissions",
+        "AsyncFineTuningCheckpoints",
+        "AsyncPermissions",
+        "AsyncAlpha",
+        "AsyncGraders",
+    ),
+    ".vector_stores": (
+        "VectorStores",
+        "VectorFiles",
+        "VectorFileBatches",
+        "AsyncVectorStores",
+        "AsyncVectorFiles",
+        "AsyncVectorFileBatches",
+    ),
+    ".admin": (
+        "Admin",
+        "Users",
+        "Invites",
+        "Workspaces",
+        "WorkspacesUsers",
+        "AsyncAdmin",
+        "AsyncUsers",
+        "AsyncInvites",
+        "AsyncWorkspaces",
+        "AsyncWorkspacesUsers",
+    ),
+    ".beta_chat": (
+        "BetaChat",
+        "BetaCompletions",
+        "AsyncBetaChat",
+        "AsyncBetaCompletions",
+    ),
+    ".beta_realtime": (
+        "BetaRealtime",
+        "AsyncBetaRealtime",
+        "BetaSessions",
+        "AsyncBetaSessions",
+        "BetaTranscriptionSessions",
+        "AsyncBetaTranscriptionSessions",
+    ),
+    ".responses": (
+        "Responses",
+        "InputItems",
+        "AsyncResponses",
+        "AsyncInputItems",
+        "InputTokens",
+        "AsyncInputTokens",
+    ),
+    ".uploads": (
+        "Uploads",
+        "Parts",
+        "AsyncUploads",
+        "AsyncParts",
+    ),
+    ".evals": (
+        "Evals",
+        "AsyncEvals",
+        "EvalsRuns",
+        "AsyncEvalsRuns",
+        "OutputItems",
+        "AsyncOutputItems",
+    ),
+    ".containers": (
+        "Containers",
+        "AsyncContainers",
+        "ContainersFiles",
+        "AsyncContainersFiles",
+        "Content",
+        "AsyncContent",
+    ),
+    ".webhooks": (
+        "Webhooks",
+        "AsyncWebhooks",
+    ),
+    ".configs": (
+        "Configs",
+        "AsyncConfigs",
+    ),
+    ".api_keys": (
+        "ApiKeys",
+        "AsyncApiKeys",
+    ),
+    ".virtual_keys": (
+        "VirtualKeys",
+        "AsyncVirtualKeys",
+    ),
+    ".logs": (
+        "Logs",
+        "AsyncLogs",
+    ),
+    ".labels": (
+        "Labels",
+        "AsyncLabels",
+    ),
+    ".collections": (
+        "Collections",
+        "AsyncCollections",
+    ),
+    ".integrations": (
+        "Integrations",
+        "AsyncIntegrations",
+        "IntegrationsWorkspaces",
+        "AsyncIntegrationsWorkspaces",
+        "IntegrationsModels",
+        "AsyncIntegrationsModels",
+    ),
+    ".providers": (
+        "Providers",
+        "AsyncProviders",
+    ),
+    ".guardrails": (
+        "Guardrails",
+        "AsyncGuardrails",
+    ),
+    ".main_realtime": (
+        "MainRealtime",
+        "AsyncMainRealtime",
+        "ClientSecrets",
+        "AsyncClientSecrets",
+        "Calls",
+        "AsyncCalls",
+    ),
+    ".conversations": (
+        "Conversations",
+        "AsyncConversations",
+        "ConversationsItems",
+        "AsyncConversationsItems",
+    ),
+    ".videos": (
+        "Videos",
+        "AsyncVideos",
+    ),
+    ".skills": (
+        "Skills",
+        "AsyncSkills",
+        "SkillsContent",
+        "AsyncSkillsContent",
+        "SkillsVersions",
+        "AsyncSkillsVersions",
+        "SkillsVersionsContent",
+        "AsyncSkillsVersionsContent",
+    ),
+    ".chatkit": (
+        "ChatKit",
+        "AsyncChatKit",
+        "ChatKitSessions",
+        "AsyncChatKitSessions",
+        "ChatKitThreads",
+        "AsyncChatKitThreads",
+    ),
+    ".analytics": (
+        "Analytics",
+        "AsyncAnalytics",
+        "AnalyticsGraphs",
+        "AsyncAnalyticsGraphs",
+        "AnalyticsGroups",
+        "AsyncAnalyticsGroups",
+        "AnalyticsSummary",
+        "AsyncAnalyticsSummary",
+    ),
+    ".mcp_servers": (
+        "McpServers",
+        "AsyncMcpServers",
+        "McpServerCapabilities",
+        "AsyncMcpServerCapabilities",
+        "McpServerUserAccess",
+        "AsyncMcpServerUserAccess",
+        "McpServerMetadata",
+        "AsyncMcpServerMetadata",
+    ),
+    ".mcp_integrations": (
+        "McpIntegrations",
+        "AsyncMcpIntegrations",
+        "McpIntegrationWorkspaces",
+        "AsyncMcpIntegrationWorkspaces",
+        "McpIntegrationCapabilities",
+        "AsyncMcpIntegrationCapabilities",
+        "McpIntegrationMetadata",
+        "AsyncMcpIntegrationMetadata",
+    ),
+}
 
-from .responses import (
-    Responses,
-    InputItems,
-    AsyncResponses,
-    AsyncInputItems,
-    InputTokens,
-    AsyncInputTokens,
-)
-
-from .uploads import (
-    Uploads,
-    Parts,
-    AsyncUploads,
-    AsyncParts,
-)
-
-from .evals import (
-    Evals,
-    AsyncEvals,
-    EvalsRuns,
-    AsyncEvalsRuns,
-    OutputItems,
-    AsyncOutputItems,
-)
-
-from .containers import (
-    Containers,
-    AsyncContainers,
-    ContainersFiles,
-    AsyncContainersFiles,
-    Content,
-    AsyncContent,
-)
-
-from .webhooks import Webhooks, AsyncWebhooks
-
-from .configs import Configs, AsyncConfigs
-
-from .api_keys import ApiKeys, AsyncApiKeys
-from .virtual_keys import VirtualKeys, AsyncVirtualKeys
-from .logs import Logs, AsyncLogs
-
-from .labels import Labels, AsyncLabels
-
-from .collections import Collections, AsyncCollections
-
-from .integrations import (
-    Integrations,
-    AsyncIntegrations,
-    IntegrationsWorkspaces,
-    AsyncIntegrationsWorkspaces,
-    IntegrationsModels,
-    AsyncIntegrationsModels,
-)
-
-from .providers import (
-    Providers,
-    AsyncProviders,
-)
-
-from .guardrails import (
-    Guardrails,
-    AsyncGuardrails,
-)
-
-from .main_realtime import (
-    MainRealtime,
-    AsyncMainRealtime,
-    ClientSecrets,
-    AsyncClientSecrets,
-    Calls,
-    AsyncCalls,
-)
-
-from .conversations import (
-    Conversations,
-    AsyncConversations,
-    ConversationsItems,
-    AsyncConversationsItems,
-)
-
-from .videos import Videos, AsyncVideos
-
-from .skills import (
-    Skills,
-    AsyncSkills,
-    SkillsContent,
-    AsyncSkillsContent,
-    SkillsVersions,
-    AsyncSkillsVersions,
-    SkillsVersionsContent,
-    AsyncSkillsVersionsContent,
-)
-
-from .chatkit import (
-    ChatKit,
-    AsyncChatKit,
-    ChatKitSessions,
-    AsyncChatKitSessions,
-    ChatKitThreads,
-    AsyncChatKitThreads,
-)
-
-from .analytics import (
-    Analytics,
-    AsyncAnalytics,
-    AnalyticsGraphs,
-    AsyncAnalyticsGraphs,
-    AnalyticsGroups,
-    AsyncAnalyticsGroups,
-    AnalyticsSummary,
-    AsyncAnalyticsSummary,
-)
-
-from .mcp_servers import (
-    McpServers,
-    AsyncMcpServers,
-    McpServerCapabilities,
-    AsyncMcpServerCapabilities,
-    McpServerUserAccess,
-    AsyncMcpServerUserAccess,
-    McpServerMetadata,
-    AsyncMcpServerMetadata,
-)
-
-from .mcp_integrations import (
-    McpIntegrations,
-    AsyncMcpIntegrations,
-    McpIntegrationWorkspaces,
-    AsyncMcpIntegrationWorkspaces,
-    McpIntegrationCapabilities,
-    AsyncMcpIntegrationCapabilities,
-    McpIntegrationMetadata,
-    AsyncMcpIntegrationMetadata,
-)
+__getattr__, __dir__ = lazy_attributes(__name__, globals(), _LAZY_IMPORTS)
 
 __all__ = [
     "Completion",
@@ -1,8 +1,14 @@
-from typing import Any, Dict, List, Literal, Optional, Union
+from functools import cached_property
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
 from urllib.parse import urlencode
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    PageNumbers,
+)
 from portkey_ai.api_resources.types.user_invite_type import (
     UserInviteResponse,
     UserInviteRetrieveAllResponse,
@@ -23,14 +29,23 @@ from portkey_ai.api_resources.utils import PortkeyApiPaths
 class Admin(APIResource):
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.users = Users(client)
-        self.workspaces = Workspaces(client)
+
+    @cached_property
+    def users(self) -> "Users":
+        return Users(self._client)
+
+    @cached_property
+    def workspaces(self) -> "Workspaces":
+        return Workspaces(self._client)
 
 
 class Users(APIResource):
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.invites = Invites(client)
+
+    @cached_property
+    def invites(self) -> "Invites":
+        return Invites(self._client)
 
     def retrieve(self, *, user_id: str) -> UserRetrieveResponse:
         return self._get(
@@ -69,6 +84,10 @@ class Users(APIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over all users. Takes the same arguments as `list`."""
+        return iter_pages(self.list, {"current_page": 0, **kwargs}, PageNumbers())
+
     def update(self, *, user_id: str, role: str) -> Any:
         body = {"role": role}
         return self._put(
@@ -186,7 +205,10 @@ class Invites(APIResource):
 class Workspaces(APIResource):
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.users = WorkspacesUsers(client)
+
+    @cached_property
+    def users(self) -> "WorkspacesUsers":
+        return WorkspacesUsers(self._client)
 
     def create(
         self,
@@ -251,6 +273,10 @@ class Workspaces(APIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over all workspaces. Takes the same arguments as `list`."""
+        return iter_pages(self.list, {"current_page": 0, **kwargs}, PageNumbers())
+
     def update(
         self,
         *,
@@ -403,14 +429,23 @@ class WorkspacesUsers(APIResource):
 class AsyncAdmin(AsyncAPIResource):
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.users = AsyncUsers(client)
-        self.workspaces = AsyncWorkspaces(client)
+
+    @cached_property
+    def users(self) -> "AsyncUsers":
+        return AsyncUsers(self._client)
+
+    @cached_property
+    def workspaces(self) -> "AsyncWorkspaces":
+        return AsyncWorkspaces(self._client)
 
 
 class AsyncUsers(AsyncAPIResource):
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.invites = AsyncInvites(client)
+
+    @cached_property
+    def invites(self) -> "AsyncInvites":
+        return AsyncInvites(self._client)
 
     async def retrieve(self, *, user_id: str) -> UserRetrieveResponse:
         return await self._get(
@@ -449,6 +484,10 @@ class AsyncUsers(AsyncAPIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over all users. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, {"current_page": 0, **kwargs}, PageNumbers())
+
     async def update(self, *, user_id: str, role: str) -> Any:
         body = {"role": role}
         return await self._put(
@@ -566,7 +605,10 @@ class AsyncInvites(AsyncAPIResource):
 class AsyncWorkspaces(AsyncAPIResource):
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.users = AsyncWorkspacesUsers(client)
+
+    @cached_property
+    def users(self) -> "AsyncWorkspacesUsers":
+        return AsyncWorkspacesUsers(self._client)
 
     async def create(
         self,
@@ -631,6 +673,10 @@ class AsyncWorkspaces(AsyncAPIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over all workspaces. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, {"current_page": 0, **kwargs}, PageNumbers())
+
     async def update(
         self,
         *,
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Literal, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
@@ -666,15 +667,20 @@ class AnalyticsSummary(APIResource):
 class Analytics(APIResource):
     """Analytics API for retrieving analytics data from Portkey."""
 
-    graphs: AnalyticsGraphs
-    groups: AnalyticsGroups
-    summary: AnalyticsSummary
-
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.graphs = AnalyticsGraphs(client)
-        self.groups = AnalyticsGroups(client)
-        self.summary = AnalyticsSummary(client)
+
+    @cached_property
+    def graphs(self) -> AnalyticsGraphs:
+        return AnalyticsGraphs(self._client)
+
+    @cached_property
+    def groups(self) -> AnalyticsGroups:
+        return AnalyticsGroups(self._client)
+
+    @cached_property
+    def summary(self) -> AnalyticsSummary:
+        return AnalyticsSummary(self._client)
 
 
 class AsyncAnalyticsGraphs(AsyncAPIResource):
@@ -1331,12 +1337,17 @@ class AsyncAnalyticsSummary(AsyncAPIResource):
 class AsyncAnalytics(AsyncAPIResource):
     """Async Analytics API for retrieving analytics data from Portkey."""
 
-    graphs: AsyncAnalyticsGraphs
-    groups: AsyncAnalyticsGroups
-    summary: AsyncAnalyticsSummary
-
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.graphs = AsyncAnalyticsGraphs(client)
-        self.groups = AsyncAnalyticsGroups(client)
-        self.summary = AsyncAnalyticsSummary(client)
+
+    @cached_property
+    def graphs(self) -> AsyncAnalyticsGraphs:
+        return AsyncAnalyticsGraphs(self._client)
+
+    @cached_property
+    def groups(self) -> AsyncAnalyticsGroups:
+        return AsyncAnalyticsGroups(self._client)
+
+    @cached_property
+    def summary(self) -> AsyncAnalyticsSummary:
+        return AsyncAnalyticsSummary(self._client)
@@ -1,6 +1,17 @@
+from typing import Any, Awaitable, Callable, Mapping, Optional, Type, TypeVar
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
+from portkey_ai.api_resources.hedging import hedged
+from portkey_ai.api_resources.response_cache import (
+    load_cached_response,
+    response_cache_key,
+    store_response,
+)
+from portkey_ai.api_resources.utils import ModelT, parse_response
 import asyncio
 
+T = TypeVar("T")
+R = TypeVar("R", bound="AsyncAPIResource")
+
 
 class APIResource:
     _client: APIClient
@@ -28,6 +39,26 @@ class APIResource:
     def _delete(self, *args, **kwargs):
         return self._client._delete(*args, **kwargs)
 
+    def _parse_response(
+        self,
+        model_class: Type[ModelT],
+        response: Any,
+        cache_key: Optional[str] = None,
+    ) -> ModelT:
+        data = parse_response(model_class, response, self._client.response_model_mode)
+        store_response(self._client, cache_key, response)
+        return data
+
+    def _response_cache_key(
+        self, endpoint: str, params: Mapping[str, Any]
+    ) -> Optional[str]:
+        return response_cache_key(self._client, endpoint, params)
+
+    def _cached_response(
+        self, model_class: Type[ModelT], cache_key: Optional[str]
+    ) -> Optional[ModelT]:
+        return load_cached_response(self._client, model_class, cache_key)
+
 
 class AsyncAPIResource:
     _client: AsyncAPIClient
@@ -53,3 +84,33 @@ class AsyncAPIResource:
 
     async def _sleep(self, seconds: float) -> None:
         await asyncio.sleep(seconds)
+
+    async def _hedged(self: R, send: Callable[[R], Awaitable[T]]) -> T:
+        """`send(self)`, hedged with the client's `hedging_policy` if it has
+        one; the duplicate gets this resource bound to the policy's target."""
+        policy = self._client.hedging_policy
+        if policy is None:
+            return await send(self)
+        client = self._client._hedging_client
+        target = self if client is self._client else type(self)(client)
+        return await hedged(policy, lambda: send(self), lambda: send(target))
+
+    def _parse_response(
+        self,
+        model_class: Type[ModelT],
+        response: Any,
+        cache_key: Optional[str] = None,
+    ) -> ModelT:
+        data = parse_response(model_class, response, self._client.response_model_mode)
+        store_response(self._client, cache_key, response)
+        return data
+
+    def _response_cache_key(
+        self, endpoint: str, params: Mapping[str, Any]
+    ) -> Optional[str]:
+        return response_cache_key(self._client, endpoint, params)
+
+    def _cached_response(
+        self, model_class: Type[ModelT], cache_key: Optional[str]
+    ) -> Optional[ModelT]:
+        return load_cached_response(self._client, model_class, cache_key)
@@ -1,4 +1,3 @@
-import json
 from typing import Any, Literal, Optional, Union
 from portkey_ai._vendor.openai._types import Omit, omit
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
@@ -43,8 +42,7 @@ class Assistants(APIResource):
             top_p=top_p,
             extra_body=kwargs,
         )
-        data = Assistant(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Assistant, response)
 
         return data
 
@@ -57,8 +55,7 @@ class Assistants(APIResource):
             response = self.openai_client.with_raw_response.beta.assistants.retrieve(
                 assistant_id=assistant_id
             )
-        data = Assistant(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Assistant, response)
 
         return data
 
@@ -92,8 +89,7 @@ class Assistants(APIResource):
             top_p=top_p,
             extra_body=kwargs,
         )
-        data = Assistant(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Assistant, response)
 
         return data
 
@@ -109,8 +105,7 @@ class Assistants(APIResource):
         response = self.openai_client.with_raw_response.beta.assistants.list(
             after=after, before=before, limit=limit, order=order
         )
-        data = AssistantList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(AssistantList, response)
 
         return data
 
@@ -118,8 +113,7 @@ class Assistants(APIResource):
         response = self.openai_client.with_raw_response.beta.assistants.delete(
             assistant_id=assistant_id, **kwargs
         )
-        data = AssistantDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(AssistantDeleted, response)
 
         return data
 
@@ -156,8 +150,7 @@ class AsyncAssistants(AsyncAPIResource):
             top_p=top_p,
             extra_body=kwargs,
         )
-        data = Assistant(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Assistant, response)
 
         return data
 
@@ -174,8 +167,7 @@ class AsyncAssistants(AsyncAPIResource):
                     assistant_id=assistant_id
                 )
             )
-        data = Assistant(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Assistant, response)
 
         return data
 
@@ -209,8 +201,7 @@ class AsyncAssistants(AsyncAPIResource):
             top_p=top_p,
             extra_body=kwargs,
         )
-        data = Assistant(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Assistant, response)
 
         return data
 
@@ -226,8 +217,7 @@ class AsyncAssistants(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.beta.assistants.list(
             after=after, before=before, limit=limit, order=order
         )
-        data = AssistantList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(AssistantList, response)
 
         return data
 
@@ -235,7 +225,6 @@ class AsyncAssistants(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.beta.assistants.delete(
             assistant_id=assistant_id, **kwargs
         )
-        data = AssistantDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(AssistantDeleted, response)
 
         return data
@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import Any, List, Union
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
 from portkey_ai.api_resources.global_constants import AUDIO_FILE_DURATION_HEADER
@@ -17,12 +17,23 @@ from portkey_ai.api_resources.types.audio_types import (
 
 
 class Audio(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.transcriptions = Transcriptions(client)
-        self.translations = Translations(client)
-        self.speech = Speech(client)
+
+    @cached_property
+    def transcriptions(self) -> "Transcriptions":
+        return Transcriptions(self._client)
+
+    @cached_property
+    def translations(self) -> "Translations":
+        return Translations(self._client)
+
+    @cached_property
+    def speech(self) -> "Speech":
+        return Speech(self._client)
 
 
 class Transcriptions(APIResource):
@@ -82,14 +93,11 @@ class Transcriptions(APIResource):
             )
 
             if response_format == "verbose_json":
-                data = TranscriptionVerbose(**json.loads(response.text))
-                data._headers = response.headers
+                data = self._parse_response(TranscriptionVerbose, response)
             elif response_format == "json":
-                data = Transcription(**json.loads(response.text))
-                data._headers = response.headers
+                data = self._parse_response(Transcription, response)
             else:
-                data = Transcription(**json.loads(response.text))
-                data._headers = response.headers
+                data = self._parse_response(Transcription, response)
 
             return data
 
@@ -121,8 +129,7 @@ class Translations(APIResource):
             extra_headers=extra_headers,
             extra_body=kwargs,
         )
-        data = Translation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Translation, response)
 
         return data
 
@@ -161,12 +168,23 @@ class Speech(APIResource):
 
 
 class AsyncAudio(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.transcriptions = AsyncTranscriptions(client)
-        self.translations = AsyncTranslations(client)
-        self.speech = AsyncSpeech(client)
+
+    @cached_property
+    def transcriptions(self) -> "AsyncTranscriptions":
+        return AsyncTranscriptions(self._client)
+
+    @cached_property
+    def translations(self) -> "AsyncTranslations":
+        return AsyncTranslations(self._client)
+
+    @cached_property
+    def speech(self) -> "AsyncSpeech":
+        return AsyncSpeech(self._client)
 
 
 class AsyncTranscriptions(AsyncAPIResource):
@@ -228,14 +246,11 @@ class AsyncTranscriptions(AsyncAPIResource):
             )
 
             if response_format == "verbose_json":
-                data = TranscriptionVerbose(**json.loads(response.text))
-                data._headers = response.headers
+                data = self._parse_response(TranscriptionVerbose, response)
             elif response_format == "json":
-                data = Transcription(**json.loads(response.text))
-                data._headers = response.headers
+                data = self._parse_response(Transcription, response)
             else:
-                data = Transcription(**json.loads(response.text))
-                data._headers = response.headers
+                data = self._parse_response(Transcription, response)
 
             return data
 
@@ -267,8 +282,7 @@ class AsyncTranslations(AsyncAPIResource):
             extra_headers=extra_headers,
             extra_body=kwargs,
         )
-        data = Translation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Translation, response)
 
         return data
 
@@ -1,14 +1,74 @@
-import json
-from typing import Any, Dict, Optional, Union
+import os
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
 import typing
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    next_cursor_page,
+)
+from portkey_ai.api_resources.batch_jobs import (
+    TERMINAL_BATCH_STATUSES,
+    BatchJobError,
+    BatchPollBackoff,
+    BatchResult,
+    parse_batch_output,
+    write_batch_shards,
+)
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
+from portkey_ai.api_resources.global_constants import (
+    DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES,
+    DEFAULT_BATCH_MAX_BYTES,
+    DEFAULT_BATCH_MAX_POLL_INTERVAL,
+    DEFAULT_BATCH_MAX_REQUESTS,
+    DEFAULT_BATCH_POLL_INTERVAL,
+)
 from ..._vendor.openai._types import Omit, omit
 
 from portkey_ai.api_resources.types.batches_type import Batch, BatchList
 
 
+def _batch_progress(batches: Iterable[Batch]) -> Any:
+    return tuple(
+        (
+            batch.status,
+            getattr(batch.request_counts, "completed", None),
+            getattr(batch.request_counts, "failed", None),
+        )
+        for batch in batches
+    )
+
+
+async def _aparse_batch_output(
+    lines: AsyncIterator[str], batch_id: str, endpoint: str, mode: str
+) -> AsyncIterator[BatchResult]:
+    async for line in lines:
+        for result in parse_batch_output([line], batch_id, endpoint, mode):
+            yield result
+
+
+def _check_batch(batch: Batch) -> None:
+    if batch.status == "failed":
+        raise BatchJobError(f"Batch {batch.id} failed: {batch.errors}", batch)
+
+
 class Batches(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
@@ -30,8 +90,7 @@ class Batches(APIResource):
             metadata=metadata,
             extra_body=kwargs,
         )
-        data = Batch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Batch, response)
 
         return data
 
@@ -44,8 +103,7 @@ class Batches(APIResource):
             response = self.openai_client.with_raw_response.batches.retrieve(
                 batch_id=batch_id
             )
-        data = Batch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Batch, response)
 
         return data
 
@@ -59,17 +117,135 @@ class Batches(APIResource):
         response = self.openai_client.with_raw_response.batches.list(
             after=after, limit=limit
         )
-        data = BatchList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(BatchList, response)
 
         return data
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Batch]:
+        """Iterate over all batches. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, next_cursor_page)
+
+    def run(
+        self,
+        requests: Iterable[Mapping[str, Any]],
+        *,
+        endpoint: str,
+        completion_window: str = "24h",
+        metadata: Union[Optional[Dict[str, str]], Omit] = omit,
+        max_requests_per_batch: int = DEFAULT_BATCH_MAX_REQUESTS,
+        max_bytes_per_batch: int = DEFAULT_BATCH_MAX_BYTES,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_BATCH_MAX_POLL_INTERVAL,
+        **kwargs: Any,
+    ) -> Iterator[BatchResult]:
+        """Run `requests` as batch jobs and iterate over their results.
+
+        Each request is a request body for `endpoint` or a full batch input
+        line with its own `custom_id`. Requests are encoded to JSONL files on
+        disk as they are consumed, split into batches of at most
+        `max_requests_per_batch` requests and `max_bytes_per_batch` bytes, and
+        every batch is uploaded and created before this returns. Files over
+        `DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES` go through the chunked Uploads
+        API. If an upload or batch creation fails, or `requests` raises, the
+        batches already created are cancelled before the error propagates.
+
+        The returned iterator polls the batches, backing off from
+        `poll_interval` to `max_poll_interval` while none of them makes
+        progress, and streams each finished batch's output and error files
+        as `BatchResult`s in completion order. A batch that fails as a whole
+        raises `BatchJobError`. When iteration stops before every batch has
+        finished, through an error or the caller, the others are cancelled.
+        """
+        batches: List[Batch] = []
+        try:
+            with tempfile.TemporaryDirectory(prefix="portkey-batch-") as directory:
+                for path in write_batch_shards(
+                    requests,
+                    directory,
+                    endpoint=endpoint,
+                    max_requests=max_requests_per_batch,
+                    max_bytes=max_bytes_per_batch,
+                ):
+                    input_file_id = self._upload_batch_input(path)
+                    os.remove(path)
+                    batches.append(
+                        self.create(
+                            completion_window=completion_window,
+                            endpoint=endpoint,
+                            input_file_id=input_file_id,
+                            metadata=metadata,
+                            **kwargs,
+                        )
+                    )
+        except Exception:
+            self._cancel_batches(batches)
+            raise
+        return self._iter_batch_results(
+            batches, endpoint, BatchPollBackoff(poll_interval, max_poll_interval)
+        )
+
+    def _cancel_batches(self, batches: List[Batch]) -> None:
+        for batch in batches:
+            try:
+                self.cancel(str(batch.id))
+            except Exception:
+                warnings.warn(f"Could not cancel batch {batch.id}", stacklevel=3)
+
+    def _upload_batch_input(self, path: str) -> str:
+        if os.path.getsize(path) > DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES:
+            upload = self._client.uploads.upload_file_chunked(
+                file=Path(path), mime_type="application/jsonl", purpose="batch"
+            )
+            file_id = upload.file.id if upload.file else None
+        else:
+            with open(path, "rb") as file:
+                file_id = self._client.files.create(file=file, purpose="batch").id
+        if file_id is None:
+            raise RuntimeError(f"Uploading batch input {path} returned no file id")
+        return file_id
+
+    def _iter_batch_results(
+        self, batches: List[Batch], endpoint: str, backoff: BatchPollBackoff
+    ) -> Iterator[BatchResult]:
+        pending = {str(batch.id): batch for batch in batches}
+        try:
+            while pending:
+                for batch_id in list(pending):
+                    batch = pending[batch_id] = self.retrieve(batch_id)
+                    if batch.status not in TERMINAL_BATCH_STATUSES:
+                        continue
+                    del pending[batch_id]
+                    _check_batch(batch)
+                    for file_id in (batch.output_file_id, batch.error_file_id):
+                        if file_id:
+                            yield from self._iter_file_results(
+                                file_id, batch_id, endpoint
+                            )
+                if pending:
+                    time.sleep(backoff.next_interval(_batch_progress(pending.values())))
+        finally:
+            # A failed batch, an error or the caller stopping early would
+            # leave the other batches running with nobody to read them.
+            self._cancel_batches(list(pending.values()))
+
+    def _iter_file_results(
+        self, file_id: str, batch_id: str, endpoint: str
+    ) -> Iterator[BatchResult]:
+        with self.openai_client.files.with_streaming_response.content(
+            file_id
+        ) as response:
+            yield from parse_batch_output(
+                response.iter_lines(),
+                batch_id,
+                endpoint,
+                self._client.response_model_mode,
+            )
+
     def cancel(self, batch_id: str, **kwargs) -> Batch:
         response = self.openai_client.with_raw_response.batches.cancel(
             batch_id=batch_id, extra_body=kwargs
         )
-        data = Batch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Batch, response)
 
         return data
 
@@ -88,6 +264,8 @@ class Batches(APIResource):
 
 
 class AsyncBatches(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
@@ -109,8 +287,7 @@ class AsyncBatches(AsyncAPIResource):
             metadata=metadata,
             extra_body=kwargs,
         )
-        data = Batch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Batch, response)
 
         return data
 
@@ -123,8 +300,7 @@ class AsyncBatches(AsyncAPIResource):
             response = await self.openai_client.with_raw_response.batches.retrieve(
                 batch_id=batch_id
             )
-        data = Batch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Batch, response)
 
         return data
 
@@ -138,17 +314,134 @@ class AsyncBatches(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.batches.list(
             after=after, limit=limit
         )
-        data = BatchList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(BatchList, response)
 
         return data
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Batch]:
+        """Iterate over all batches. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, next_cursor_page)
+
+    async def run(
+        self,
+        requests: Iterable[Mapping[str, Any]],
+        *,
+        endpoint: str,
+        completion_window: str = "24h",
+        metadata: Union[Optional[Dict[str, str]], Omit] = omit,
+        max_requests_per_batch: int = DEFAULT_BATCH_MAX_REQUESTS,
+        max_bytes_per_batch: int = DEFAULT_BATCH_MAX_BYTES,
+        poll_interval: float = DEFAULT_BATCH_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_BATCH_MAX_POLL_INTERVAL,
+        **kwargs: Any,
+    ) -> AsyncIterator[BatchResult]:
+        """Run `requests` as batch jobs and iterate over their results.
+
+        Each request is a request body for `endpoint` or a full batch input
+        line with its own `custom_id`. Requests are encoded to JSONL files on
+        disk as they are consumed, split into batches of at most
+        `max_requests_per_batch` requests and `max_bytes_per_batch` bytes, and
+        every batch is uploaded and created before this returns, hence the
+        `await`. Files over `DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES` go through the
+        chunked Uploads API. If an upload or batch creation fails, or
+        `requests` raises, the batches already created are cancelled before
+        the error propagates.
+
+        The returned iterator polls the batches, backing off from
+        `poll_interval` to `max_poll_interval` while none of them makes
+        progress, and streams each finished batch's output and error files
+        as `BatchResult`s in completion order. A batch that fails as a whole
+        raises `BatchJobError`. When iteration stops before every batch has
+        finished, through an error or the caller, the others are cancelled.
+        """
+        batches: List[Batch] = []
+        try:
+            with tempfile.TemporaryDirectory(prefix="portkey-batch-") as directory:
+                for path in write_batch_shards(
+                    requests,
+                    directory,
+                    endpoint=endpoint,
+                    max_requests=max_requests_per_batch,
+                    max_bytes=max_bytes_per_batch,
+                ):
+                    input_file_id = await self._upload_batch_input(path)
+                    os.remove(path)
+                    batches.append(
+                        await self.create(
+                            completion_window=completion_window,
+                            endpoint=endpoint,
+                            input_file_id=input_file_id,
+                            metadata=metadata,
+                            **kwargs,
+                        )
+                    )
+        except Exception:
+            await self._cancel_batches(batches)
+            raise
+        return self._iter_batch_results(
+            batches, endpoint, BatchPollBackoff(poll_interval, max_poll_interval)
+        )
+
+    async def _cancel_batches(self, batches: List[Batch]) -> None:
+        for batch in batches:
+            try:
+                await self.cancel(str(batch.id))
+            except Exception:
+                warnings.warn(f"Could not cancel batch {batch.id}", stacklevel=3)
+
+    async def _upload_batch_input(self, path: str) -> str:
+        if os.path.getsize(path) > DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES:
+            upload = await self._client.uploads.upload_file_chunked(
+                file=Path(path), mime_type="application/jsonl", purpose="batch"
+            )
+            file_id = upload.file.id if upload.file else None
+        else:
+            with open(path, "rb") as file:
+                file_id = (
+                    await self._client.files.create(file=file, purpose="batch")
+                ).id
+        if file_id is None:
+            raise RuntimeError(f"Uploading batch input {path} returned no file id")
+        return file_id
+
+    async def _iter_batch_results(
+        self, batches: List[Batch], endpoint: str, backoff: BatchPollBackoff
+    ) -> AsyncIterator[BatchResult]:
+        pending = {str(batch.id): batch for batch in batches}
+        try:
+            while pending:
+                for batch_id in list(pending):
+                    batch = pending[batch_id] = await self.retrieve(batch_id)
+                    if batch.status not in TERMINAL_BATCH_STATUSES:
+                        continue
+                    del pending[batch_id]
+                    _check_batch(batch)
+                    for file_id in (batch.output_file_id, batch.error_file_id):
+                        if file_id:
+                            async with self.openai_client.files.with_streaming_response.content(
+                                file_id
+                            ) as response:
+                                async for result in _aparse_batch_output(
+                                    response.iter_lines(),
+                                    batch_id,
+                                    endpoint,
+                                    self._client.response_model_mode,
+                                ):
+                                    yield result
+                if pending:
+                    await self._sleep(
+                        backoff.next_interval(_batch_progress(pending.values()))
+                    )
+        finally:
+            # A failed batch, an error or the caller stopping early would
+            # leave the other batches running with nobody to read them.
+            await self._cancel_batches(list(pending.values()))
+
     async def cancel(self, batch_id: str, **kwargs) -> Batch:
         response = await self.openai_client.with_raw_response.batches.cancel(
             batch_id=batch_id, extra_body=kwargs
         )
-        data = Batch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Batch, response)
 
         return data
 
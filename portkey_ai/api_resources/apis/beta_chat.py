@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Dict, List, Union
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
@@ -6,10 +7,15 @@ from ..._vendor.openai._types import Omit, omit
 
 
 class BetaChat(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.completions = BetaCompletions(client)
+
+    @cached_property
+    def completions(self) -> "BetaCompletions":
+        return BetaCompletions(self._client)
 
 
 class BetaCompletions(APIResource):
@@ -92,10 +98,15 @@ class BetaCompletions(APIResource):
 
 
 class AsyncBetaChat(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.completions = AsyncBetaCompletions(client)
+
+    @cached_property
+    def completions(self) -> "AsyncBetaCompletions":
+        return AsyncBetaCompletions(self._client)
 
 
 class AsyncBetaCompletions(AsyncAPIResource):
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Iterable, List, Union
 from portkey_ai._vendor.openai.resources.beta.realtime.realtime import (
     AsyncRealtimeConnectionManager,
@@ -16,11 +17,19 @@ from ..._vendor.openai._types import NotGiven, NOT_GIVEN
 
 
 class BetaRealtime(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.sessions = BetaSessions(client)
-        self.transcription_sessions = BetaTranscriptionSessions(client)
+
+    @cached_property
+    def sessions(self) -> "BetaSessions":
+        return BetaSessions(self._client)
+
+    @cached_property
+    def transcription_sessions(self) -> "BetaTranscriptionSessions":
+        return BetaTranscriptionSessions(self._client)
 
     def connect(
         self,
@@ -75,11 +84,19 @@ class BetaTranscriptionSessions(APIResource):
 
 
 class AsyncBetaRealtime(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.sessions = AsyncBetaSessions(client)
-        self.transcription_sessions = AsyncBetaTranscriptionSessions(client)
+
+    @cached_property
+    def sessions(self) -> "AsyncBetaSessions":
+        return AsyncBetaSessions(self._client)
+
+    @cached_property
+    def transcription_sessions(self) -> "AsyncBetaTranscriptionSessions":
+        return AsyncBetaTranscriptionSessions(self._client)
 
     def connect(
         self,
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from functools import cached_property
 import json
 from typing import (
     Any,
     AsyncIterator,
+    Callable,
     Dict,
     Iterable,
     Iterator,
@@ -28,34 +30,58 @@ from portkey_ai.api_resources.types.chat_complete_type import (
 )
 
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    next_cursor_page,
+)
+from portkey_ai.api_resources.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkResult,
+    arun_many,
+    run_many,
+)
 from portkey_ai.api_resources.types.shared_types import Headers, Metadata, Query
+from portkey_ai.api_resources.streaming import AsyncStream, Stream
 from portkey_ai.api_resources.utils import Body
+from ..._vendor.openai import APIStatusError
 from ..._vendor.openai._types import NOT_GIVEN, NotGiven, Omit, omit
 
 __all__ = ["ChatCompletion", "AsyncChatCompletion"]
 
 
 class ChatCompletion(APIResource):
-    completions: Completions
+    _client: Portkey
 
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
-        self.completions = Completions(client)
+
+    @cached_property
+    def completions(self) -> Completions:
+        return Completions(self._client)
 
 
 class AsyncChatCompletion(AsyncAPIResource):
-    completions: AsyncCompletions
+    _client: AsyncPortkey
 
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
-        self.completions = AsyncCompletions(client)
+
+    @cached_property
+    def completions(self) -> AsyncCompletions:
+        return AsyncCompletions(self._client)
 
 
 class Completions(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.messages = ChatCompletionsMessages(client)
+
+    @cached_property
+    def messages(self) -> ChatCompletionsMessages:
+        return ChatCompletionsMessages(self._client)
 
     def stream_create(  # type: ignore[return]
         self,
@@ -79,7 +105,15 @@ class Completions(APIResource):
         timeout = kwargs.pop("timeout", None)
         user_extra_body = kwargs.pop("extra_body", None) or {}
         merged_extra_body = {**user_extra_body, **kwargs}
-        return self.openai_client.chat.completions.create(
+        completions = self.openai_client.chat.completions
+        # The vendored client validates every chunk; in lazy mode the raw
+        # stream is read instead, so that chunks are built like the other
+        # responses.
+        lazy = self._client.response_model_mode == "lazy"
+        create: Callable[..., Any] = (
+            completions.with_raw_response.create if lazy else completions.create
+        )
+        result = create(
             model=model,
             messages=messages,
             stream=stream,
@@ -98,6 +132,13 @@ class Completions(APIResource):
             extra_body=merged_extra_body,
             timeout=timeout,
         )
+        if lazy:
+            return Stream(
+                response=result.http_response,
+                cast_to=ChatCompletionChunk,
+                response_model_mode="lazy",
+            )
+        return result
 
     def normal_create(
         self,
@@ -114,6 +155,7 @@ class Completions(APIResource):
         prediction,
         reasoning_effort,
         store,
+        cache_key=None,
         **kwargs,
     ) -> ChatCompletions:
         extra_headers = kwargs.pop("extra_headers", None)
@@ -140,8 +182,7 @@ class Completions(APIResource):
             extra_body=merged_extra_body,
             timeout=timeout,
         )
-        data = ChatCompletions(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletions, response, cache_key)
         return data
 
     def create(
@@ -162,25 +203,38 @@ class Completions(APIResource):
         store: Union[Optional[bool], Omit] = omit,
         **kwargs,
     ) -> Union[ChatCompletions, Iterator[ChatCompletionChunk]]:
-        if stream is True:
-            return self.stream_create(
-                model=model,
+        cache_key = None
+        if stream is not True:
+            cache_key = self._response_cache_key(
+                "/chat/completions",
+                dict(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    top_p=top_p,
+                    audio=audio,
+                    max_completion_tokens=max_completion_tokens,
+                    metadata=metadata,
+                    modalities=modalities,
+                    prediction=prediction,
+                    reasoning_effort=reasoning_effort,
+                    store=store,
+                    **kwargs,
+                ),
+            )
+            cached = self._cached_response(ChatCompletions, cache_key)
+            if cached is not None:
+                return cached
+        estimated_tokens = self._client._acquire_rate_limit(
+            dict(
                 messages=messages,
-                stream=stream,
-                temperature=temperature,
                 max_tokens=max_tokens,
-                top_p=top_p,
-                audio=audio,
                 max_completion_tokens=max_completion_tokens,
-                metadata=metadata,
-                modalities=modalities,
-                prediction=prediction,
-                reasoning_effort=reasoning_effort,
-                store=store,
-                **kwargs,
             )
-        else:
-            return self.normal_create(
+        )
+        if stream is True:
+            return self.stream_create(
                 model=model,
                 messages=messages,
                 stream=stream,
@@ -196,6 +250,54 @@ class Completions(APIResource):
                 store=store,
                 **kwargs,
             )
+        else:
+            try:
+                response = self.normal_create(
+                    model=model,
+                    messages=messages,
+                    stream=stream,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    top_p=top_p,
+                    audio=audio,
+                    max_completion_tokens=max_completion_tokens,
+                    metadata=metadata,
+                    modalities=modalities,
+                    prediction=prediction,
+                    reasoning_effort=reasoning_effort,
+                    store=store,
+                    cache_key=cache_key,
+                    **kwargs,
+                )
+            except APIStatusError:
+                # An error response uses no tokens.
+                self._client._refund_rate_limit(estimated_tokens)
+                raise
+            self._client._reconcile_rate_limit(estimated_tokens, response.usage)
+            return response
+
+    def create_many(
+        self,
+        requests: Iterable[Dict[str, Any]],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ordered: bool = True,
+    ) -> Iterator[BulkResult[ChatCompletions]]:
+        """Run non-streaming `create` calls for each request dict on a bounded
+        thread pool sharing this client's connection pool.
+
+        Results are yielded as they become available, in input order unless
+        `ordered=False`. A failed request does not stop the batch: its
+        `BulkResult.error` is set instead.
+        """
+        return run_many(
+            self._create_one, requests, concurrency=concurrency, ordered=ordered
+        )
+
+    def _create_one(self, **request: Any) -> ChatCompletions:
+        if request.get("stream"):
+            raise ValueError("`create_many` does not support streaming requests")
+        return self.create(**request)  # type: ignore[return-value]
 
     def retrieve(
         self,
@@ -209,8 +311,7 @@ class Completions(APIResource):
         response = self.openai_client.with_raw_response.chat.completions.retrieve(
             completion_id=completion_id
         )
-        data = ChatCompletions(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletions, response)
 
         return data
 
@@ -237,8 +338,7 @@ class Completions(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletions(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletions, response)
 
         return data
 
@@ -266,11 +366,14 @@ class Completions(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletionList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletionList, response)
 
         return data
 
+    def iter_all(self, **kwargs: Any) -> Iterator[ChatCompletions]:
+        """Iterate over stored chat completions. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, next_cursor_page)
+
     def delete(
         self,
         completion_id: str,
@@ -292,8 +395,7 @@ class Completions(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletionDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletionDeleted, response)
 
         return data
 
@@ -470,10 +572,15 @@ class Completions(APIResource):
 
 
 class AsyncCompletions(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.messages = AsyncChatCompletionsMessages(client)
+
+    @cached_property
+    def messages(self) -> AsyncChatCompletionsMessages:
+        return AsyncChatCompletionsMessages(self._client)
 
     async def stream_create(
         self,
@@ -497,7 +604,15 @@ class AsyncCompletions(AsyncAPIResource):
         timeout = kwargs.pop("timeout", None)
         user_extra_body = kwargs.pop("extra_body", None) or {}
         merged_extra_body = {**user_extra_body, **kwargs}
-        return await self.openai_client.chat.completions.create(
+        completions = self.openai_client.chat.completions
+        # The vendored client validates every chunk; in lazy mode the raw
+        # stream is read instead, so that chunks are built like the other
+        # responses.
+        lazy = self._client.response_model_mode == "lazy"
+        create: Callable[..., Any] = (
+            completions.with_raw_response.create if lazy else completions.create
+        )
+        result = await create(
             model=model,
             messages=messages,
             stream=stream,
@@ -516,6 +631,13 @@ class AsyncCompletions(AsyncAPIResource):
             extra_body=merged_extra_body,
             timeout=timeout,
         )
+        if lazy:
+            return AsyncStream(
+                response=result.http_response,
+                cast_to=ChatCompletionChunk,
+                response_model_mode="lazy",
+            )
+        return result
 
     async def normal_create(
         self,
@@ -532,6 +654,7 @@ class AsyncCompletions(AsyncAPIResource):
         prediction,
         reasoning_effort,
         store,
+        cache_key=None,
         **kwargs,
     ) -> ChatCompletions:
         extra_headers = kwargs.pop("extra_headers", None)
@@ -558,8 +681,7 @@ class AsyncCompletions(AsyncAPIResource):
             extra_body=merged_extra_body,
             timeout=timeout,
         )
-        data = ChatCompletions(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletions, response, cache_key)
         return data
 
     async def create(
@@ -580,25 +702,38 @@ class AsyncCompletions(AsyncAPIResource):
         store: Union[Optional[bool], Omit] = omit,
         **kwargs,
     ) -> Union[ChatCompletions, AsyncIterator[ChatCompletionChunk]]:
-        if stream is True:
-            return await self.stream_create(
-                model=model,
+        cache_key = None
+        if stream is not True:
+            cache_key = self._response_cache_key(
+                "/chat/completions",
+                dict(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    top_p=top_p,
+                    audio=audio,
+                    max_completion_tokens=max_completion_tokens,
+                    metadata=metadata,
+                    modalities=modalities,
+                    prediction=prediction,
+                    reasoning_effort=reasoning_effort,
+                    store=store,
+                    **kwargs,
+                ),
+            )
+            cached = self._cached_response(ChatCompletions, cache_key)
+            if cached is not None:
+                return cached
+        estimated_tokens = await self._client._acquire_rate_limit(
+            dict(
                 messages=messages,
-                stream=stream,
-                temperature=temperature,
                 max_tokens=max_tokens,
-                top_p=top_p,
-                audio=audio,
                 max_completion_tokens=max_completion_tokens,
-                metadata=metadata,
-                modalities=modalities,
-                prediction=prediction,
-                reasoning_effort=reasoning_effort,
-                store=store,
-                **kwargs,
             )
-        else:
-            return await self.normal_create(
+        )
+        if stream is True:
+            return await self.stream_create(
                 model=model,
                 messages=messages,
                 stream=stream,
@@ -614,6 +749,56 @@ class AsyncCompletions(AsyncAPIResource):
                 store=store,
                 **kwargs,
             )
+        else:
+            try:
+                response = await self._hedged(
+                    lambda completions: completions.normal_create(
+                        model=model,
+                        messages=messages,
+                        stream=stream,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        top_p=top_p,
+                        audio=audio,
+                        max_completion_tokens=max_completion_tokens,
+                        metadata=metadata,
+                        modalities=modalities,
+                        prediction=prediction,
+                        reasoning_effort=reasoning_effort,
+                        store=store,
+                        cache_key=cache_key,
+                        **kwargs,
+                    )
+                )
+            except APIStatusError:
+                # An error response uses no tokens.
+                self._client._refund_rate_limit(estimated_tokens)
+                raise
+            self._client._reconcile_rate_limit(estimated_tokens, response.usage)
+            return response
+
+    def create_many(
+        self,
+        requests: Union[Iterable[Dict[str, Any]], AsyncIterator[Dict[str, Any]]],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ordered: bool = True,
+    ) -> AsyncIterator[BulkResult[ChatCompletions]]:
+        """Run non-streaming `create` calls for each request dict with at most
+        `concurrency` in flight on the current event loop.
+
+        Use it with `async for`. Results come back in input order unless
+        `ordered=False`, and failed requests carry their exception in
+        `BulkResult.error` instead of failing the whole batch.
+        """
+        return arun_many(
+            self._create_one, requests, concurrency=concurrency, ordered=ordered
+        )
+
+    async def _create_one(self, **request: Any) -> ChatCompletions:
+        if request.get("stream"):
+            raise ValueError("`create_many` does not support streaming requests")
+        return await self.create(**request)  # type: ignore[return-value]
 
     async def retrieve(
         self,
@@ -622,8 +807,7 @@ class AsyncCompletions(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.chat.completions.retrieve(
             completion_id=completion_id
         )
-        data = ChatCompletions(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletions, response)
 
         return data
 
@@ -650,8 +834,7 @@ class AsyncCompletions(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletions(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletions, response)
 
         return data
 
@@ -679,11 +862,14 @@ class AsyncCompletions(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletionList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletionList, response)
 
         return data
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[ChatCompletions]:
+        """Iterate over stored chat completions. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, next_cursor_page)
+
     async def delete(
         self,
         completion_id: str,
@@ -705,8 +891,7 @@ class AsyncCompletions(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletionDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletionDeleted, response)
 
         return data
 
@@ -917,8 +1102,7 @@ class ChatCompletionsMessages(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatCompletionStoreMessageList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletionStoreMessageList, response)
 
         return data
 
@@ -957,7 +1141,6 @@ class AsyncChatCompletionsMessages(AsyncAPIResource):
                 timeout=timeout,
             )
         )
-        data = ChatCompletionStoreMessageList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatCompletionStoreMessageList, response)
 
         return data
@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import Any, Literal, Optional, Union
 from portkey_ai.api_resources.types.shared_types import Body, Headers, Query
 from ..._vendor.openai._types import (
@@ -31,11 +31,19 @@ from portkey_ai.api_resources.types.chatkit_type import (
 
 
 class ChatKit(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.sessions = ChatKitSessions(client)
-        self.threads = ChatKitThreads(client)
+
+    @cached_property
+    def sessions(self) -> "ChatKitSessions":
+        return ChatKitSessions(self._client)
+
+    @cached_property
+    def threads(self) -> "ChatKitThreads":
+        return ChatKitThreads(self._client)
 
 
 class ChatKitSessions(APIResource):
@@ -67,8 +75,7 @@ class ChatKitSessions(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatSession(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatSession, response)
 
         return data
 
@@ -88,8 +95,7 @@ class ChatKitSessions(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatSession(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatSession, response)
 
         return data
 
@@ -115,8 +121,7 @@ class ChatKitThreads(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatKitThread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatKitThread, response)
         return data
 
     def list(
@@ -143,8 +148,7 @@ class ChatKitThreads(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatKitThreadList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatKitThreadList, response)
         return data
 
     def delete(
@@ -163,8 +167,7 @@ class ChatKitThreads(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ThreadDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadDeleteResponse, response)
         return data
 
     def list_items(
@@ -195,11 +198,19 @@ class ChatKitThreads(APIResource):
 
 
 class AsyncChatKit(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.sessions = AsyncChatKitSessions(client)
-        self.threads = AsyncChatKitThreads(client)
+
+    @cached_property
+    def sessions(self) -> "AsyncChatKitSessions":
+        return AsyncChatKitSessions(self._client)
+
+    @cached_property
+    def threads(self) -> "AsyncChatKitThreads":
+        return AsyncChatKitThreads(self._client)
 
 
 class AsyncChatKitSessions(AsyncAPIResource):
@@ -233,8 +244,7 @@ class AsyncChatKitSessions(AsyncAPIResource):
                 timeout=timeout,
             )
         )
-        data = ChatSession(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatSession, response)
 
         return data
 
@@ -256,8 +266,7 @@ class AsyncChatKitSessions(AsyncAPIResource):
                 timeout=timeout,
             )
         )
-        data = ChatSession(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatSession, response)
 
         return data
 
@@ -285,8 +294,7 @@ class AsyncChatKitThreads(AsyncAPIResource):
                 timeout=timeout,
             )
         )
-        data = ChatKitThread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatKitThread, response)
         return data
 
     async def list(
@@ -313,8 +321,7 @@ class AsyncChatKitThreads(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ChatKitThreadList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ChatKitThreadList, response)
         return data
 
     async def delete(
@@ -335,8 +342,7 @@ class AsyncChatKitThreads(AsyncAPIResource):
                 timeout=timeout,
             )
         )
-        data = ThreadDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadDeleteResponse, response)
         return data
 
     async def list_items(
@@ -1,4 +1,3 @@
-import json
 from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
 from ..._vendor.openai._types import NotGiven, NOT_GIVEN
@@ -91,6 +90,32 @@ class Completion(APIResource):
         stream_options,
         **kwargs,
     ) -> TextCompletion:
+        cache_key = self._response_cache_key(
+            "/completions",
+            dict(
+                model=model,
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                best_of=best_of,
+                echo=echo,
+                frequency_penalty=frequency_penalty,
+                logit_bias=logit_bias,
+                logprobs=logprobs,
+                n=n,
+                presence_penalty=presence_penalty,
+                seed=seed,
+                stop=stop,
+                suffix=suffix,
+                user=user,
+                stream_options=stream_options,
+                **kwargs,
+            ),
+        )
+        cached = self._cached_response(TextCompletion, cache_key)
+        if cached is not None:
+            return cached
         extra_headers = kwargs.pop("extra_headers", None)
         extra_query = kwargs.pop("extra_query", None)
         timeout = kwargs.pop("timeout", None)
@@ -120,8 +145,7 @@ class Completion(APIResource):
             extra_body=merged_extra_body,
             timeout=timeout,
         )
-        data = TextCompletion(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(TextCompletion, response, cache_key)
         return data
 
     def create(
@@ -274,6 +298,32 @@ class AsyncCompletion(AsyncAPIResource):
         stream_options,
         **kwargs,
     ) -> TextCompletion:
+        cache_key = self._response_cache_key(
+            "/completions",
+            dict(
+                model=model,
+                prompt=prompt,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=top_p,
+                best_of=best_of,
+                echo=echo,
+                frequency_penalty=frequency_penalty,
+                logit_bias=logit_bias,
+                logprobs=logprobs,
+                n=n,
+                presence_penalty=presence_penalty,
+                seed=seed,
+                stop=stop,
+                suffix=suffix,
+                user=user,
+                stream_options=stream_options,
+                **kwargs,
+            ),
+        )
+        cached = self._cached_response(TextCompletion, cache_key)
+        if cached is not None:
+            return cached
         extra_headers = kwargs.pop("extra_headers", None)
         extra_query = kwargs.pop("extra_query", None)
         timeout = kwargs.pop("timeout", None)
@@ -303,8 +353,7 @@ class AsyncCompletion(AsyncAPIResource):
             extra_body=merged_extra_body,
             timeout=timeout,
         )
-        data = TextCompletion(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(TextCompletion, response, cache_key)
         return data
 
     async def create(
@@ -1,8 +1,13 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
 from urllib.parse import urlencode
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    single_page,
+)
 from portkey_ai.api_resources.types.configs_type import (
     ConfigAddResponse,
     ConfigGetResponse,
@@ -72,6 +77,10 @@ class Configs(APIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over all configs. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, single_page)
+
     def update(
         self,
         *,
@@ -186,6 +195,10 @@ class AsyncConfigs(AsyncAPIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over all configs. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, single_page)
+
     async def update(
         self,
         *,
@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import Any, Iterable, List, Literal, Union
 from portkey_ai._vendor.openai.types import container_create_params
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
@@ -17,10 +17,15 @@ from ..._vendor.openai._types import FileTypes, Omit, omit
 
 
 class Containers(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.files = ContainersFiles(client)
+
+    @cached_property
+    def files(self) -> "ContainersFiles":
+        return ContainersFiles(self._client)
 
     def create(
         self,
@@ -49,8 +54,7 @@ class Containers(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ContainerCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ContainerCreateResponse, response)
 
         return data
 
@@ -79,8 +83,7 @@ class Containers(APIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-        data = ContainerRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ContainerRetrieveResponse, response)
 
         return data
 
@@ -107,8 +110,7 @@ class Containers(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ContainerListResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ContainerListResponse, response)
 
         return data
 
@@ -131,10 +133,15 @@ class Containers(APIResource):
 
 
 class ContainersFiles(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.content = Content(client)
+
+    @cached_property
+    def content(self) -> "Content":
+        return Content(self._client)
 
     def create(
         self,
@@ -157,8 +164,7 @@ class ContainersFiles(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = FileCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileCreateResponse, response)
 
         return data
 
@@ -191,8 +197,7 @@ class ContainersFiles(APIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-        data = FileRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileRetrieveResponse, response)
 
         return data
 
@@ -219,8 +224,7 @@ class ContainersFiles(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = FileListResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileListResponse, response)
 
         return data
 
@@ -283,10 +287,15 @@ class Content(APIResource):
 
 
 class AsyncContainers(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.files = AsyncContainersFiles(client)
+
+    @cached_property
+    def files(self) -> "AsyncContainersFiles":
+        return AsyncContainersFiles(self._client)
 
     async def create(
         self,
@@ -315,8 +324,7 @@ class AsyncContainers(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ContainerCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ContainerCreateResponse, response)
 
         return data
 
@@ -345,8 +353,7 @@ class AsyncContainers(AsyncAPIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-        data = ContainerRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ContainerRetrieveResponse, response)
 
         return data
 
@@ -373,8 +380,7 @@ class AsyncContainers(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ContainerListResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ContainerListResponse, response)
 
         return data
 
@@ -397,10 +403,15 @@ class AsyncContainers(AsyncAPIResource):
 
 
 class AsyncContainersFiles(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.content = AsyncContent(client)
+
+    @cached_property
+    def content(self) -> "AsyncContent":
+        return AsyncContent(self._client)
 
     async def create(
         self,
@@ -423,8 +434,7 @@ class AsyncContainersFiles(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = FileCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileCreateResponse, response)
 
         return data
 
@@ -461,8 +471,7 @@ class AsyncContainersFiles(AsyncAPIResource):
                     timeout=timeout,
                 )
             )
-        data = FileRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileRetrieveResponse, response)
 
         return data
 
@@ -489,8 +498,7 @@ class AsyncContainersFiles(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = FileListResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileListResponse, response)
 
         return data
 
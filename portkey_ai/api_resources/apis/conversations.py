@@ -1,5 +1,14 @@
-import json
-from typing import Any, Iterable, List, Literal, Optional, Union
+from functools import cached_property
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 from portkey_ai._vendor.openai.types.responses.response_includable import (
     ResponseIncludable,
 )
@@ -7,6 +16,11 @@ from portkey_ai._vendor.openai.types.responses.response_input_item_param import
     ResponseInputItemParam,
 )
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    next_cursor_page,
+)
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
 from portkey_ai.api_resources.types.conversation_type import (
     Conversation,
@@ -18,10 +32,15 @@ import httpx
 
 
 class Conversations(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.items = ConversationsItems(client)
+
+    @cached_property
+    def items(self) -> "ConversationsItems":
+        return ConversationsItems(self._client)
 
     def create(
         self,
@@ -41,8 +60,7 @@ class Conversations(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Conversation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Conversation, response)
 
         return data
 
@@ -62,8 +80,7 @@ class Conversations(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Conversation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Conversation, response)
 
         return data
 
@@ -85,8 +102,7 @@ class Conversations(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Conversation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Conversation, response)
 
         return data
 
@@ -106,17 +122,21 @@ class Conversations(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ConversationDeletedResource(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ConversationDeletedResource, response)
 
         return data
 
 
 class AsyncConversations(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.items = AsyncConversationsItems(client)
+
+    @cached_property
+    def items(self) -> "AsyncConversationsItems":
+        return AsyncConversationsItems(self._client)
 
     async def create(
         self,
@@ -136,8 +156,7 @@ class AsyncConversations(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Conversation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Conversation, response)
 
         return data
 
@@ -157,8 +176,7 @@ class AsyncConversations(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Conversation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Conversation, response)
 
         return data
 
@@ -180,8 +198,7 @@ class AsyncConversations(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Conversation(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Conversation, response)
 
         return data
 
@@ -201,8 +218,7 @@ class AsyncConversations(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = ConversationDeletedResource(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ConversationDeletedResource, response)
 
         return data
 
@@ -285,6 +301,10 @@ class ConversationsItems(APIResource):
 
         return response
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over a conversation's items. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, next_cursor_page)
+
     def delete(
         self,
         item_id: str,
@@ -385,6 +405,10 @@ class AsyncConversationsItems(AsyncAPIResource):
 
         return response
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over a conversation's items. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, next_cursor_page)
+
     async def delete(
         self,
         item_id: str,
@@ -1,10 +1,57 @@
-import json
-from typing import Optional, Union
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sized,
+    TypeVar,
+    Union,
+)
 import typing
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.bulk import DEFAULT_BULK_CONCURRENCY, arun_many, run_many
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
+from portkey_ai.api_resources.embedding_cache import EmbeddingLookup
+from portkey_ai.api_resources.response_cache import route_key
+from portkey_ai.api_resources.embedding_batches import (
+    EmbeddingArrayBuilder,
+    decode_embeddings,
+    import_numpy,
+    iter_embedding_batches,
+)
+from portkey_ai.api_resources.global_constants import (
+    DEFAULT_EMBEDDING_BATCH_SIZE,
+    DEFAULT_EMBEDDING_BATCH_TOKENS,
+)
 from portkey_ai.api_resources.types.embeddings_type import CreateEmbeddingResponse
-from ..._vendor.openai._types import NotGiven, NOT_GIVEN
+from ..._vendor.openai._types import NotGiven, NOT_GIVEN, Omit, omit
+
+if TYPE_CHECKING:
+    import numpy
+
+T = TypeVar("T")
+
+
+def _array_dimensions(dimensions: Union[int, Omit]) -> Optional[int]:
+    return None if isinstance(dimensions, Omit) else dimensions
+
+
+async def _off_loop(function: Callable[..., T], *args: Any) -> T:
+    # Embedding cache lookups and writes block on SQLite and the vector files.
+    # `asyncio.to_thread` would need Python 3.9.
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+
+def _cacheable_texts(input: Any) -> Optional[List[str]]:
+    # Token arrays are sent as they are; only text goes through the
+    # embedding cache.
+    texts = [input] if isinstance(input, str) else input
+    if isinstance(texts, list) and texts and all(isinstance(t, str) for t in texts):
+        return texts
+    return None
 
 
 class Embeddings(APIResource):
@@ -21,8 +68,46 @@ class Embeddings(APIResource):
         dimensions: Union[int, NotGiven] = NOT_GIVEN,
         encoding_format: Union[str, NotGiven] = NOT_GIVEN,
         user: Union[str, NotGiven] = NOT_GIVEN,
-        **kwargs
+        **kwargs,
     ) -> CreateEmbeddingResponse:
+        texts = _cacheable_texts(input)
+        if self._client.embedding_cache is not None and texts is not None:
+            lookup = EmbeddingLookup(
+                self._client.embedding_cache,
+                route_key(self._client),
+                model,
+                dimensions,
+                texts,
+            )
+            if lookup.misses:
+                response = self.openai_client.with_raw_response.embeddings.create(
+                    input=lookup.miss_texts,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format="base64",
+                    user=user,
+                    extra_body=kwargs,
+                )
+                lookup.add_response(response.content, response.headers)
+            return lookup.response(
+                CreateEmbeddingResponse,
+                encoding_format,
+                self._client.response_model_mode,
+            )
+        cache_key = self._response_cache_key(
+            "/embeddings",
+            dict(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                **kwargs,
+            ),
+        )
+        cached = self._cached_response(CreateEmbeddingResponse, cache_key)
+        if cached is not None:
+            return cached
         response = self.openai_client.with_raw_response.embeddings.create(
             input=input,
             model=model,
@@ -32,11 +117,78 @@ class Embeddings(APIResource):
             extra_body=kwargs,
         )
 
-        data = CreateEmbeddingResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(CreateEmbeddingResponse, response, cache_key)
 
         return data
 
+    def create_array(
+        self,
+        input: Iterable[str],
+        *,
+        model: str = "portkey-default",
+        dimensions: Union[int, Omit] = omit,
+        user: Union[str, Omit] = omit,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        **kwargs: Any,
+    ) -> "numpy.ndarray":
+        """Embed any number of texts into a float32 array with one row per
+        text, in input order. Requires numpy.
+
+        `input` is consumed lazily and split into requests of at most
+        `batch_size` texts and `max_batch_tokens` estimated tokens, of which
+        up to `concurrency` run at once. Embeddings are requested as base64
+        and decoded straight into the array, so no Python float objects are
+        created. With an `embedding_cache` on the client only the texts not
+        cached yet are sent.
+        """
+        np = import_numpy()
+        if isinstance(input, str):
+            input = [input]
+        builder = EmbeddingArrayBuilder(
+            np, len(input) if isinstance(input, Sized) else None
+        )
+        embedding_cache = self._client.embedding_cache
+        route = route_key(self._client)
+
+        def embed(input: List[str]) -> "numpy.ndarray":
+            if embedding_cache is None:
+                response = self.openai_client.with_raw_response.embeddings.create(
+                    input=input,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format="base64",
+                    user=user,
+                    extra_body=kwargs,
+                )
+                return decode_embeddings(np, response.content, len(input))
+            lookup = EmbeddingLookup(embedding_cache, route, model, dimensions, input)
+            if lookup.misses:
+                response = self.openai_client.with_raw_response.embeddings.create(
+                    input=lookup.miss_texts,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format="base64",
+                    user=user,
+                    extra_body=kwargs,
+                )
+                lookup.add_response(response.content)
+            return (
+                np.frombuffer(lookup.vector_bytes(), dtype="<f4")
+                .reshape(len(input), -1)
+                .astype(np.float32)
+            )
+
+        batches = iter_embedding_batches(
+            input, batch_size=batch_size, max_batch_tokens=max_batch_tokens
+        )
+        for result in run_many(embed, batches, concurrency=concurrency):
+            if result.error is not None:
+                raise result.error
+            builder.add(result.response)
+        return builder.result(_array_dimensions(dimensions))
+
 
 class AsyncEmbeddings(AsyncAPIResource):
     def __init__(self, client: AsyncPortkey) -> None:
@@ -52,17 +204,129 @@ class AsyncEmbeddings(AsyncAPIResource):
         dimensions: Union[int, NotGiven] = NOT_GIVEN,
         encoding_format: Union[str, NotGiven] = NOT_GIVEN,
         user: Union[str, NotGiven] = NOT_GIVEN,
-        **kwargs
+        **kwargs,
     ) -> CreateEmbeddingResponse:
-        response = await self.openai_client.with_raw_response.embeddings.create(
-            input=input,
-            model=model,
-            dimensions=dimensions,
-            encoding_format=encoding_format,
-            user=user,
-            extra_body=kwargs,
+        texts = _cacheable_texts(input)
+        if self._client.embedding_cache is not None and texts is not None:
+            lookup = await _off_loop(
+                EmbeddingLookup,
+                self._client.embedding_cache,
+                route_key(self._client),
+                model,
+                dimensions,
+                texts,
+            )
+            if lookup.misses:
+                response = await self._hedged(
+                    lambda embeddings: embeddings.openai_client.with_raw_response.embeddings.create(
+                        input=lookup.miss_texts,
+                        model=model,
+                        dimensions=dimensions,
+                        encoding_format="base64",
+                        user=user,
+                        extra_body=kwargs,
+                    )
+                )
+                await _off_loop(lookup.add_response, response.content, response.headers)
+            return lookup.response(
+                CreateEmbeddingResponse,
+                encoding_format,
+                self._client.response_model_mode,
+            )
+        cache_key = self._response_cache_key(
+            "/embeddings",
+            dict(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                **kwargs,
+            ),
+        )
+        cached = self._cached_response(CreateEmbeddingResponse, cache_key)
+        if cached is not None:
+            return cached
+        response = await self._hedged(
+            lambda embeddings: embeddings.openai_client.with_raw_response.embeddings.create(
+                input=input,
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                user=user,
+                extra_body=kwargs,
+            )
         )
-        data = CreateEmbeddingResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(CreateEmbeddingResponse, response, cache_key)
 
         return data
+
+    async def create_array(
+        self,
+        input: Iterable[str],
+        *,
+        model: str = "portkey-default",
+        dimensions: Union[int, Omit] = omit,
+        user: Union[str, Omit] = omit,
+        batch_size: int = DEFAULT_EMBEDDING_BATCH_SIZE,
+        max_batch_tokens: int = DEFAULT_EMBEDDING_BATCH_TOKENS,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        **kwargs: Any,
+    ) -> "numpy.ndarray":
+        """Embed any number of texts into a float32 array with one row per
+        text, in input order. Requires numpy.
+
+        `input` is consumed lazily and split into requests of at most
+        `batch_size` texts and `max_batch_tokens` estimated tokens, of which
+        up to `concurrency` run at once. Embeddings are requested as base64
+        and decoded straight into the array, so no Python float objects are
+        created. With an `embedding_cache` on the client only the texts not
+        cached yet are sent.
+        """
+        np = import_numpy()
+        if isinstance(input, str):
+            input = [input]
+        builder = EmbeddingArrayBuilder(
+            np, len(input) if isinstance(input, Sized) else None
+        )
+        embedding_cache = self._client.embedding_cache
+        route = route_key(self._client)
+
+        async def embed(input: List[str]) -> "numpy.ndarray":
+            if embedding_cache is None:
+                response = await self.openai_client.with_raw_response.embeddings.create(
+                    input=input,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format="base64",
+                    user=user,
+                    extra_body=kwargs,
+                )
+                return decode_embeddings(np, response.content, len(input))
+            lookup = await _off_loop(
+                EmbeddingLookup, embedding_cache, route, model, dimensions, input
+            )
+            if lookup.misses:
+                response = await self.openai_client.with_raw_response.embeddings.create(
+                    input=lookup.miss_texts,
+                    model=model,
+                    dimensions=dimensions,
+                    encoding_format="base64",
+                    user=user,
+                    extra_body=kwargs,
+                )
+                await _off_loop(lookup.add_response, response.content)
+            return (
+                np.frombuffer(lookup.vector_bytes(), dtype="<f4")
+                .reshape(len(input), -1)
+                .astype(np.float32)
+            )
+
+        batches = iter_embedding_batches(
+            input, batch_size=batch_size, max_batch_tokens=max_batch_tokens
+        )
+        async for result in arun_many(embed, batches, concurrency=concurrency):
+            if result.error is not None:
+                raise result.error
+            builder.add(result.response)
+        return builder.result(_array_dimensions(dimensions))
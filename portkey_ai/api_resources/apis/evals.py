@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import Any, Literal, Optional, Union
 from portkey_ai._vendor.openai._types import omit, Omit
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
@@ -25,10 +25,15 @@ from portkey_ai.api_resources.types.shared_types import Metadata
 
 
 class Evals(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.runs = EvalsRuns(client)
+
+    @cached_property
+    def runs(self) -> "EvalsRuns":
+        return EvalsRuns(self._client)
 
     def create(
         self,
@@ -58,8 +63,7 @@ class Evals(APIResource):
             eval_id=eval_id,
         )
 
-        data = EvalRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalRetrieveResponse, response)
 
         return data
 
@@ -78,8 +82,7 @@ class Evals(APIResource):
             extra_body=kwargs,
         )
 
-        data = EvalUpdateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalUpdateResponse, response)
 
         return data
 
@@ -99,8 +102,7 @@ class Evals(APIResource):
             order_by=order_by,
         )
 
-        data = EvalListResponseList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalListResponseList, response)
 
         return data
 
@@ -114,17 +116,21 @@ class Evals(APIResource):
             extra_body=kwargs,
         )
 
-        data = EvalDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalDeleteResponse, response)
 
         return data
 
 
 class EvalsRuns(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.output_items = OutputItems(client)
+
+    @cached_property
+    def output_items(self) -> "OutputItems":
+        return OutputItems(self._client)
 
     def create(
         self,
@@ -142,8 +148,7 @@ class EvalsRuns(APIResource):
             name=name,
             extra_body=kwargs,
         )
-        data = RunCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunCreateResponse, response)
 
         return data
 
@@ -157,8 +162,7 @@ class EvalsRuns(APIResource):
             run_id=run_id,
             eval_id=eval_id,
         )
-        data = RunRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunRetrieveResponse, response)
 
         return data
 
@@ -181,8 +185,7 @@ class EvalsRuns(APIResource):
             order=order,
             status=status,
         )
-        data = RunListResponseList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunListResponseList, response)
 
         return data
 
@@ -198,8 +201,7 @@ class EvalsRuns(APIResource):
             eval_id=eval_id,
             extra_body=kwargs,
         )
-        data = RunDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunDeleteResponse, response)
 
         return data
 
@@ -215,8 +217,7 @@ class EvalsRuns(APIResource):
             eval_id=eval_id,
             extra_body=kwargs,
         )
-        data = RunCancelResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunCancelResponse, response)
 
         return data
 
@@ -240,8 +241,7 @@ class OutputItems(APIResource):
                 run_id=run_id,
             )
         )
-        data = OutputItemRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(OutputItemRetrieveResponse, response)
 
         return data
 
@@ -263,17 +263,21 @@ class OutputItems(APIResource):
             order=order,
             status=status,
         )
-        data = OutputItemListResponseList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(OutputItemListResponseList, response)
 
         return data
 
 
 class AsyncEvals(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.runs = AsyncEvalsRuns(client)
+
+    @cached_property
+    def runs(self) -> "AsyncEvalsRuns":
+        return AsyncEvalsRuns(self._client)
 
     async def create(
         self,
@@ -303,8 +307,7 @@ class AsyncEvals(AsyncAPIResource):
             eval_id=eval_id,
         )
 
-        data = EvalRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalRetrieveResponse, response)
 
         return data
 
@@ -323,8 +326,7 @@ class AsyncEvals(AsyncAPIResource):
             extra_body=kwargs,
         )
 
-        data = EvalUpdateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalUpdateResponse, response)
 
         return data
 
@@ -344,8 +346,7 @@ class AsyncEvals(AsyncAPIResource):
             order_by=order_by,
         )
 
-        data = EvalListResponseList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalListResponseList, response)
 
         return data
 
@@ -359,17 +360,21 @@ class AsyncEvals(AsyncAPIResource):
             extra_body=kwargs,
         )
 
-        data = EvalDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(EvalDeleteResponse, response)
 
         return data
 
 
 class AsyncEvalsRuns(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.output_items = AsyncOutputItems(client)
+
+    @cached_property
+    def output_items(self) -> "AsyncOutputItems":
+        return AsyncOutputItems(self._client)
 
     async def create(
         self,
@@ -387,8 +392,7 @@ class AsyncEvalsRuns(AsyncAPIResource):
             name=name,
             extra_body=kwargs,
         )
-        data = RunCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunCreateResponse, response)
 
         return data
 
@@ -402,8 +406,7 @@ class AsyncEvalsRuns(AsyncAPIResource):
             run_id=run_id,
             eval_id=eval_id,
         )
-        data = RunRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunRetrieveResponse, response)
 
         return data
 
@@ -426,8 +429,7 @@ class AsyncEvalsRuns(AsyncAPIResource):
             order=order,
             status=status,
         )
-        data = RunListResponseList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunListResponseList, response)
 
         return data
 
@@ -443,8 +445,7 @@ class AsyncEvalsRuns(AsyncAPIResource):
             eval_id=eval_id,
             extra_body=kwargs,
         )
-        data = RunDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunDeleteResponse, response)
 
         return data
 
@@ -460,8 +461,7 @@ class AsyncEvalsRuns(AsyncAPIResource):
             eval_id=eval_id,
             extra_body=kwargs,
         )
-        data = RunCancelResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunCancelResponse, response)
 
         return data
 
@@ -485,8 +485,7 @@ class AsyncOutputItems(AsyncAPIResource):
                 run_id=run_id,
             )
         )
-        data = OutputItemRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(OutputItemRetrieveResponse, response)
 
         return data
 
@@ -510,7 +509,6 @@ class AsyncOutputItems(AsyncAPIResource):
                 status=status,
             )
         )
-        data = OutputItemListResponseList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(OutputItemListResponseList, response)
 
         return data
@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import Iterable, List, Literal, Optional, Union
 import typing_extensions
 from portkey_ai._vendor.openai.types.fine_tuning.alpha import grader_run_params
@@ -26,19 +26,35 @@ from portkey_ai.api_resources.types.fine_tuning_type import (
 
 
 class FineTuning(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.jobs = Jobs(client)
-        self.checkpoints = FineTuningCheckpoints(client)
-        self.alpha = Alpha(client)
+
+    @cached_property
+    def jobs(self) -> "Jobs":
+        return Jobs(self._client)
+
+    @cached_property
+    def checkpoints(self) -> "FineTuningCheckpoints":
+        return FineTuningCheckpoints(self._client)
+
+    @cached_property
+    def alpha(self) -> "Alpha":
+        return Alpha(self._client)
 
 
 class Jobs(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.checkpoints = Checkpoints(client)
+
+    @cached_property
+    def checkpoints(self) -> "Checkpoints":
+        return Checkpoints(self._client)
 
     def create(
         self,
@@ -66,8 +82,7 @@ class Jobs(APIResource):
             validation_file=validation_file,
             extra_body=kwargs,
         )
-        data = FineTuningJob(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJob, response)
 
         return data
 
@@ -80,8 +95,7 @@ class Jobs(APIResource):
             response = self.openai_client.with_raw_response.fine_tuning.jobs.retrieve(
                 fine_tuning_job_id=fine_tuning_job_id
             )
-        data = FineTuningJob(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJob, response)
 
         return data
 
@@ -95,8 +109,7 @@ class Jobs(APIResource):
         response = self.openai_client.with_raw_response.fine_tuning.jobs.list(
             after=after, limit=limit, **kwargs
         )
-        data = FineTuningJobList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJobList, response)
 
         return data
 
@@ -104,8 +117,7 @@ class Jobs(APIResource):
         response = self.openai_client.with_raw_response.fine_tuning.jobs.cancel(
             fine_tuning_job_id=fine_tuning_job_id, extra_body=kwargs
         )
-        data = FineTuningJob(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJob, response)
 
         return data
 
@@ -123,8 +135,7 @@ class Jobs(APIResource):
             limit=limit,
             extra_body=kwargs,
         )
-        data = FineTuningJobEventList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJobEventList, response)
 
         return data
 
@@ -151,17 +162,21 @@ class Checkpoints(APIResource):
             )
         )
 
-        data = FineTuningJobCheckpointList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJobCheckpointList, response)
 
         return data
 
 
 class FineTuningCheckpoints(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.permissions = Permissions(client)
+
+    @cached_property
+    def permissions(self) -> "Permissions":
+        return Permissions(self._client)
 
 
 class Permissions(APIResource):
@@ -181,8 +196,7 @@ class Permissions(APIResource):
             project_ids=project_ids,
             extra_body=kwargs,
         )
-        data = PermissionCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionCreateResponse, response)
 
         return data
 
@@ -207,8 +221,7 @@ class Permissions(APIResource):
             project_id=project_id,
             extra_body=kwargs,
         )
-        data = PermissionRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionRetrieveResponse, response)
 
         return data
 
@@ -230,8 +243,7 @@ class Permissions(APIResource):
             project_id=project_id,
             extra_body=kwargs,
         )
-        data = PermissionListPage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionListPage, response)
 
         return data
 
@@ -247,17 +259,21 @@ class Permissions(APIResource):
             fine_tuned_model_checkpoint=fine_tuned_model_checkpoint,
             extra_body=kwargs,
         )
-        data = PermissionDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionDeleteResponse, response)
 
         return data
 
 
 class Alpha(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.graders = Graders(client)
+
+    @cached_property
+    def graders(self) -> "Graders":
+        return Graders(self._client)
 
 
 class Graders(APIResource):
@@ -279,8 +295,7 @@ class Graders(APIResource):
             item=item,
             extra_body=kwargs,
         )
-        data = GraderRunResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(GraderRunResponse, response)
 
         return data
 
@@ -296,26 +311,41 @@ class Graders(APIResource):
                 extra_body=kwargs,
             )
         )
-        data = GraderValidateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(GraderValidateResponse, response)
 
         return data
 
 
 class AsyncFineTuning(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.jobs = AsyncJobs(client)
-        self.checkpoints = AsyncFineTuningCheckpoints(client)
-        self.alpha = AsyncAlpha(client)
+
+    @cached_property
+    def jobs(self) -> "AsyncJobs":
+        return AsyncJobs(self._client)
+
+    @cached_property
+    def checkpoints(self) -> "AsyncFineTuningCheckpoints":
+        return AsyncFineTuningCheckpoints(self._client)
+
+    @cached_property
+    def alpha(self) -> "AsyncAlpha":
+        return AsyncAlpha(self._client)
 
 
 class AsyncJobs(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.checkpoints = AsyncCheckpoints(client)
+
+    @cached_property
+    def checkpoints(self) -> "AsyncCheckpoints":
+        return AsyncCheckpoints(self._client)
 
     async def create(
         self,
@@ -343,8 +373,7 @@ class AsyncJobs(AsyncAPIResource):
             validation_file=validation_file,
             extra_body=kwargs,
         )
-        data = FineTuningJob(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJob, response)
 
         return data
 
@@ -362,8 +391,7 @@ class AsyncJobs(AsyncAPIResource):
                 )
             )
 
-        data = FineTuningJob(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJob, response)
 
         return data
 
@@ -377,8 +405,7 @@ class AsyncJobs(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.fine_tuning.jobs.list(
             after=after, limit=limit, **kwargs
         )
-        data = FineTuningJobList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJobList, response)
 
         return data
 
@@ -386,8 +413,7 @@ class AsyncJobs(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.fine_tuning.jobs.cancel(
             fine_tuning_job_id, extra_body=kwargs
         )
-        data = FineTuningJob(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJob, response)
 
         return data
 
@@ -407,8 +433,7 @@ class AsyncJobs(AsyncAPIResource):
                 extra_body=kwargs,
             )
         )
-        data = FineTuningJobEventList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJobEventList, response)
 
         return data
 
@@ -433,17 +458,21 @@ class AsyncCheckpoints(AsyncAPIResource):
             **kwargs,
         )
 
-        data = FineTuningJobCheckpointList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FineTuningJobCheckpointList, response)
 
         return data
 
 
 class AsyncFineTuningCheckpoints(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.permissions = AsyncPermissions(client)
+
+    @cached_property
+    def permissions(self) -> "AsyncPermissions":
+        return AsyncPermissions(self._client)
 
 
 class AsyncPermissions(AsyncAPIResource):
@@ -463,8 +492,7 @@ class AsyncPermissions(AsyncAPIResource):
             project_ids=project_ids,
             extra_body=kwargs,
         )
-        data = PermissionCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionCreateResponse, response)
 
         return data
 
@@ -489,8 +517,7 @@ class AsyncPermissions(AsyncAPIResource):
             project_id=project_id,
             extra_body=kwargs,
         )
-        data = PermissionRetrieveResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionRetrieveResponse, response)
 
         return data
 
@@ -512,8 +539,7 @@ class AsyncPermissions(AsyncAPIResource):
             project_id=project_id,
             extra_body=kwargs,
         )
-        data = PermissionListPage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionListPage, response)
 
         return data
 
@@ -529,17 +555,21 @@ class AsyncPermissions(AsyncAPIResource):
             fine_tuned_model_checkpoint=fine_tuned_model_checkpoint,
             extra_body=kwargs,
         )
-        data = PermissionDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(PermissionDeleteResponse, response)
 
         return data
 
 
 class AsyncAlpha(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.graders = AsyncGraders(client)
+
+    @cached_property
+    def graders(self) -> "AsyncGraders":
+        return AsyncGraders(self._client)
 
 
 class AsyncGraders(AsyncAPIResource):
@@ -563,8 +593,7 @@ class AsyncGraders(AsyncAPIResource):
                 extra_body=kwargs,
             )
         )
-        data = GraderRunResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(GraderRunResponse, response)
 
         return data
 
@@ -582,7 +611,6 @@ class AsyncGraders(AsyncAPIResource):
                 )
             )
         )
-        data = GraderValidateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(GraderValidateResponse, response)
 
         return data
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import cached_property
 from urllib.parse import urlencode
 import warnings
 from typing import Dict, List, Literal, Union, Mapping, Any, overload
@@ -86,13 +87,20 @@ class AsyncGenerations(AsyncAPIResource):
 
 
 class Prompts(APIResource):
-    completions: Completions
-
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.completions = Completions(client)
-        self.versions = PromptVersions(client)
-        self.partials = PromptPartials(client)
+
+    @cached_property
+    def completions(self) -> Completions:
+        return Completions(self._client)
+
+    @cached_property
+    def versions(self) -> PromptVersions:
+        return PromptVersions(self._client)
+
+    @cached_property
+    def partials(self) -> PromptPartials:
+        return PromptPartials(self._client)
 
     def render(
         self,
@@ -280,13 +288,20 @@ class Prompts(APIResource):
 
 
 class AsyncPrompts(AsyncAPIResource):
-    completions: AsyncCompletions
-
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.completions = AsyncCompletions(client)
-        self.versions = AsyncPromptVersions(client)
-        self.partials = AsyncPromptPartials(client)
+
+    @cached_property
+    def completions(self) -> AsyncCompletions:
+        return AsyncCompletions(self._client)
+
+    @cached_property
+    def versions(self) -> AsyncPromptVersions:
+        return AsyncPromptVersions(self._client)
+
+    @cached_property
+    def partials(self) -> AsyncPromptPartials:
+        return AsyncPromptPartials(self._client)
 
     async def render(
         self,
@@ -555,6 +570,16 @@ class Completions(APIResource):
             **kwargs,
         }
 
+        cache_key = None
+        if not stream:
+            cache_key = self._response_cache_key(
+                f"/prompts/{prompt_id}/completions",
+                dict(body, config=config, extra_headers=extra_headers),
+            )
+            cached = self._cached_response(PromptCompletion, cache_key)
+            if cached is not None:
+                return cached
+
         return self._post(
             f"/prompts/{prompt_id}/completions",
             body=body,
@@ -563,6 +588,7 @@ class Completions(APIResource):
             stream_cls=Stream[PromptCompletionChunk],
             stream=stream,
             headers=extra_headers,
+            cache_key=cache_key,
         )
 
 
@@ -648,14 +674,38 @@ class AsyncCompletions(AsyncAPIResource):
             **kwargs,
         }
 
-        return await self._post(
-            f"/prompts/{prompt_id}/completions",
-            body=body,
-            params=None,
-            cast_to=PromptCompletion,
-            stream_cls=AsyncStream[PromptCompletionChunk],
-            stream=stream,
-            headers=extra_headers,
+        cache_key = None
+        if not stream:
+            cache_key = self._response_cache_key(
+                f"/prompts/{prompt_id}/completions",
+                dict(body, config=config, extra_headers=extra_headers),
+            )
+            cached = self._cached_response(PromptCompletion, cache_key)
+            if cached is not None:
+                return cached
+
+        if stream:
+            return await self._post(
+                f"/prompts/{prompt_id}/completions",
+                body=body,
+                params=None,
+                cast_to=PromptCompletion,
+                stream_cls=AsyncStream[PromptCompletionChunk],
+                stream=stream,
+                headers=extra_headers,
+                cache_key=cache_key,
+            )
+        return await self._hedged(
+            lambda completions: completions._post(
+                f"/prompts/{prompt_id}/completions",
+                body=body,
+                params=None,
+                cast_to=PromptCompletion,
+                stream_cls=AsyncStream[PromptCompletionChunk],
+                stream=stream,
+                headers=extra_headers,
+                cache_key=cache_key,
+            )
         )
 
 
@@ -770,7 +820,10 @@ class AsyncPromptVersions(AsyncAPIResource):
 class PromptPartials(APIResource):
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.versions = PromptPartialVersions(client)
+
+    @cached_property
+    def versions(self) -> PromptPartialVersions:
+        return PromptPartialVersions(self._client)
 
     def create(
         self,
@@ -892,7 +945,10 @@ class PromptPartials(APIResource):
 class AsyncPromptPartials(AsyncAPIResource):
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.versions = AsyncPromptPartialVersions(client)
+
+    @cached_property
+    def versions(self) -> AsyncPromptPartialVersions:
+        return AsyncPromptPartialVersions(self._client)
 
     async def create(
         self,
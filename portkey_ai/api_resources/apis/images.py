@@ -1,4 +1,3 @@
-import json
 from typing import List, Literal, Optional, Union
 import typing
 from portkey_ai._vendor.openai._streaming import AsyncStream, Stream
@@ -40,8 +39,7 @@ class Images(APIResource):
             user=user,
             extra_body=kwargs,
         )
-        data = ImagesResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ImagesResponse, response)
 
         return data
 
@@ -182,8 +180,7 @@ class Images(APIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-            data = ImagesResponse(**json.loads(response.text))
-            data._headers = response.headers
+            data = self._parse_response(ImagesResponse, response)
 
             return data
 
@@ -318,8 +315,7 @@ class Images(APIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-            data = ImagesResponse(**json.loads(response.text))
-            data._headers = response.headers
+            data = self._parse_response(ImagesResponse, response)
 
             return data
 
@@ -348,8 +344,7 @@ class AsyncImages(AsyncAPIResource):
             user=user,
             extra_body=kwargs,
         )
-        data = ImagesResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ImagesResponse, response)
 
         return data
 
@@ -490,8 +485,7 @@ class AsyncImages(AsyncAPIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-            data = ImagesResponse(**json.loads(response.text))
-            data._headers = response.headers
+            data = self._parse_response(ImagesResponse, response)
 
             return data
 
@@ -626,7 +620,6 @@ class AsyncImages(AsyncAPIResource):
                 extra_body=extra_body,
                 timeout=timeout,
             )
-            data = ImagesResponse(**json.loads(response.text))
-            data._headers = response.headers
+            data = self._parse_response(ImagesResponse, response)
 
             return data
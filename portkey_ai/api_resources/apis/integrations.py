@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Dict, List, Literal, Optional, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
@@ -17,8 +18,14 @@ from portkey_ai.api_resources.utils import PortkeyApiPaths
 class Integrations(APIResource):
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.workspaces = IntegrationsWorkspaces(client)
-        self.models = IntegrationsModels(client)
+
+    @cached_property
+    def workspaces(self) -> "IntegrationsWorkspaces":
+        return IntegrationsWorkspaces(self._client)
+
+    @cached_property
+    def models(self) -> "IntegrationsModels":
+        return IntegrationsModels(self._client)
 
     def create(
         self,
@@ -244,8 +251,14 @@ class IntegrationsModels(APIResource):
 class AsyncIntegrations(AsyncAPIResource):
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.workspaces = AsyncIntegrationsWorkspaces(client)
-        self.models = AsyncIntegrationsModels(client)
+
+    @cached_property
+    def workspaces(self) -> "AsyncIntegrationsWorkspaces":
+        return AsyncIntegrationsWorkspaces(self._client)
+
+    @cached_property
+    def models(self) -> "AsyncIntegrationsModels":
+        return AsyncIntegrationsModels(self._client)
 
     async def create(
         self,
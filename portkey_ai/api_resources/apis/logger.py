@@ -1,34 +1,455 @@
+import abc
+import asyncio
+import atexit
+import gzip
 import json
+import logging
 import os
-from typing import Optional
-import requests
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
-from portkey_ai.api_resources.global_constants import PORTKEY_BASE_URL
+import httpx
 
+from portkey_ai.api_resources.fork_safety import ForkSafe, keep_inherited
+from portkey_ai.api_resources.global_constants import (
+    DEFAULT_LOGGER_BATCH_SIZE,
+    DEFAULT_LOGGER_COMPRESS_MIN_BYTES,
+    DEFAULT_LOGGER_FLUSH_INTERVAL,
+    DEFAULT_LOGGER_MAX_QUEUE_SIZE,
+    DEFAULT_LOGGER_TIMEOUT,
+    PORTKEY_BASE_URL,
+)
+
+__all__ = ["Logger", "AsyncLogger"]
+
+logger = logging.getLogger(__name__)
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+# Loggers with queued logs, flushed when the interpreter exits.
+_live_loggers: "weakref.WeakSet[_BaseLogger]" = weakref.WeakSet()
+
+
+def _flush_at_exit() -> None:
+    for portkey_logger in list(_live_loggers):
+        try:
+            portkey_logger._flush_at_exit()
+        except Exception:
+            logger.debug("Failed to flush Portkey logs at exit", exc_info=True)
+
+
+atexit.register(_flush_at_exit)
+
+
+def _as_items(log_object: Any) -> List[Any]:
+    if isinstance(log_object, (list, tuple)):
+        return list(log_object)
+    return [log_object]
+
+
+class _BaseLogger(ForkSafe, abc.ABC):
+    _client: Any
+    _owns_client: bool
 
-class Logger:
     def __init__(
-        self, api_key: Optional[str] = None, base_url: Optional[str] = None
+        self,
+        api_key: Optional[str],
+        base_url: Optional[str],
+        batch_size: int,
+        flush_interval: float,
+        max_queue_size: int,
+        drop_policy: str,
+        compress: bool,
+        timeout: float,
     ) -> None:
         api_key = api_key or os.getenv("PORTKEY_API_KEY")
         if api_key is None:
             raise ValueError("API key is required to use the Logger API")
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be at least 1")
+        if max_queue_size < batch_size:
+            raise ValueError("`max_queue_size` must be at least `batch_size`")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"`drop_policy` must be one of {', '.join(DROP_POLICIES)}, "
+                f"got {drop_policy!r}"
+            )
 
         self.headers = {
             "Content-Type": "application/json",
             "x-portkey-api-key": api_key,
         }
-
         self.url = (base_url or PORTKEY_BASE_URL) + "/logs"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.drop_policy = drop_policy
+        self.compress = compress
+        self.timeout = timeout
+        # Number of logs dropped because the queue was full, or lost because
+        # their batch could not be sent.
+        self.dropped = 0
+        self.failed = 0
+        self._queue: Deque[Any] = deque()
+        self._in_flight = 0
+        self._closed = False
+
+    def _encode(self, log_object: Any) -> Tuple[bytes, Dict[str, str]]:
+        body = json.dumps(log_object, default=vars).encode()
+        headers = self.headers
+        if self.compress and len(body) >= DEFAULT_LOGGER_COMPRESS_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=5)
+            headers = {**headers, "Content-Encoding": "gzip"}
+        return body, headers
 
-    def log(
+    def _take_batch(self) -> List[Any]:
+        queue = self._queue
+        batch = [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+        self._in_flight += len(batch)
+        return batch
+
+    def _enqueue(self, item: Any) -> bool:
+        """Append one log unless the queue is full; applies the drop policy."""
+        if len(self._queue) >= self.max_queue_size:
+            if self.drop_policy == "drop_newest":
+                self.dropped += 1
+                return True
+            if self.drop_policy == "drop_oldest":
+                self._queue.popleft()
+                self.dropped += 1
+            else:
+                return False
+        self._queue.append(item)
+        return True
+
+    def _batch_failed(self, batch: List[Any]) -> None:
+        self.failed += len(batch)
+        logger.warning("Failed to send %d Portkey logs", len(batch), exc_info=True)
+
+    @abc.abstractmethod
+    def _flush_at_exit(self) -> None:
+        """Send what is still queued, as the interpreter exits."""
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # Logs queued before the fork are the parent's to send.
+        self._queue.clear()
+        self._in_flight = 0
+        self._flushing = False
+        _live_loggers.discard(self)
+        if not self._owns_client:
+            return {}
+        inherited = self._client
+        keep_inherited(inherited)
+        self._client = self._new_http_client()
+        return {id(inherited): self._client}
+
+    def _rebind_after_fork(self, replaced: Dict[int, Any]) -> None:
+        self._client = replaced.get(id(self._client), self._client)
+
+    @abc.abstractmethod
+    def _new_http_client(self) -> Any:
+        """A client of the kind this logger sends with."""
+
+
+class Logger(_BaseLogger):
+    """Sends logs to Portkey's `/logs` endpoint from a background thread.
+
+    `log()` only puts the log on a bounded in-memory queue. A daemon thread
+    sends the queue in batches of up to `batch_size` logs, as soon as a batch
+    is full or `flush_interval` seconds after its oldest log was queued, over
+    one keep-alive connection. Bodies above 1 KiB are gzip-compressed unless
+    `compress=False`. When the queue is full, `drop_policy` decides whether the
+    oldest or the newest log is dropped, or whether `log()` blocks. Anything
+    still queued is flushed when the interpreter exits.
+
+    With `background=False`, `log()` sends immediately and returns the response.
+    """
+
+    def __init__(
         self,
-        log_object,
-    ):
-        response = requests.post(
-            url=self.url,
-            data=json.dumps(log_object, default=vars),
-            headers=self.headers,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        *,
+        batch_size: int = DEFAULT_LOGGER_BATCH_SIZE,
+        flush_interval: float = DEFAULT_LOGGER_FLUSH_INTERVAL,
+        max_queue_size: int = DEFAULT_LOGGER_MAX_QUEUE_SIZE,
+        drop_policy: str = "drop_oldest",
+        compress: bool = True,
+        timeout: float = DEFAULT_LOGGER_TIMEOUT,
+        background: bool = True,
+        http_client: Optional[httpx.Client] = None,
+    ) -> None:
+        super().__init__(
+            api_key,
+            base_url,
+            batch_size,
+            flush_interval,
+            max_queue_size,
+            drop_policy,
+            compress,
+            timeout,
         )
+        self.background = background
+        self._owns_client = http_client is None
+        self._client = http_client or self._new_http_client()
+        self._register_after_fork()
+        self._cond = threading.Condition()
+        self._flushing = False
+        self._oldest_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+
+    def log(self, log_object: Any) -> Optional[httpx.Response]:
+        if not self.background:
+            return self._post(log_object)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot log to a closed Logger")
+            # Started first: with the "block" policy, only the flush thread
+            # can make room in a full queue.
+            if self._thread is None or not self._thread.is_alive():
+                self._start()
+            if not self._queue:
+                self._oldest_at = time.monotonic()
+            for item in _as_items(log_object):
+                while not self._enqueue(item):
+                    self._cond.notify_all()
+                    self._cond.wait()
+            self._cond.notify_all()
+        return None
+
+    def _new_http_client(self) -> httpx.Client:
+        return httpx.Client(timeout=self.timeout)
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # The flush thread does not exist in the child, and its lock may have
+        # been held at the time of the fork.
+        self._cond = threading.Condition()
+        self._thread = None
+        return super()._reset_after_fork()
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="portkey-logger", daemon=True
+        )
+        self._thread.start()
+        _live_loggers.add(self)
+
+    def _post(self, log_object: Any) -> httpx.Response:
+        body, headers = self._encode(log_object)
+        return self._client.post(self.url, content=body, headers=headers)
+
+    def _run(self) -> None:
+        cond = self._cond
+        while True:
+            with cond:
+                while True:
+                    if not self._queue:
+                        if self._closed:
+                            return
+                        cond.wait()
+                        continue
+                    if (
+                        len(self._queue) >= self.batch_size
+                        or self._flushing
+                        or self._closed
+                    ):
+                        break
+                    remaining = self._oldest_at + self.flush_interval
+                    remaining -= time.monotonic()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                batch = self._take_batch()
+                self._oldest_at = time.monotonic()
+                cond.notify_all()
+            try:
+                self._post(batch).raise_for_status()
+            except Exception:
+                self._batch_failed(batch)
+            with cond:
+                self._in_flight -= len(batch)
+                cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send everything queued so far; returns False if `timeout` expired."""
+        with self._cond:
+            if not self._queue and not self._in_flight:
+                return True
+            self._flushing = True
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(
+                    lambda: not self._queue and not self._in_flight, timeout
+                )
+            finally:
+                self._flushing = False
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush queued logs, stop the background thread and close the client."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        _live_loggers.discard(self)
+        if self._owns_client:
+            self._client.close()
+
+    def _flush_at_exit(self) -> None:
+        self.close(timeout=self.timeout)
+
+    def __enter__(self) -> "Logger":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncLogger(_BaseLogger):
+    """Async counterpart of `Logger`, flushing from a task on the event loop.
+
+    Call `await close()` before the loop shuts down; logs still queued when the
+    interpreter exits are sent synchronously as a last resort.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        *,
+        batch_size: int = DEFAULT_LOGGER_BATCH_SIZE,
+        flush_interval: float = DEFAULT_LOGGER_FLUSH_INTERVAL,
+        max_queue_size: int = DEFAULT_LOGGER_MAX_QUEUE_SIZE,
+        drop_policy: str = "drop_oldest",
+        compress: bool = True,
+        timeout: float = DEFAULT_LOGGER_TIMEOUT,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(
+            api_key,
+            base_url,
+            batch_size,
+            flush_interval,
+            max_queue_size,
+            drop_policy,
+            compress,
+            timeout,
+        )
+        self._owns_client = http_client is None
+        self._client = http_client or self._new_http_client()
+        self._register_after_fork()
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._space: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._flushing = False
+        self._oldest_at = 0.0
+
+    async def log(self, log_object: Any) -> None:
+        if self._closed:
+            raise RuntimeError("Cannot log to a closed AsyncLogger")
+        if self._task is None or self._task.done():
+            self._start()
+        assert self._wakeup and self._space and self._idle
+        was_empty = not self._queue
+        for item in _as_items(log_object):
+            while not self._enqueue(item):
+                self._space.clear()
+                self._wakeup.set()
+                await self._space.wait()
+        if was_empty:
+            self._oldest_at = time.monotonic()
+        self._idle.clear()
+        if was_empty or len(self._queue) >= self.batch_size:
+            self._wakeup.set()
+
+    def _new_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout)
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # The flush task belongs to the parent's event loop.
+        self._task = None
+        self._wakeup = self._space = self._idle = None
+        return super()._reset_after_fork()
+
+    def _start(self) -> None:
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        _live_loggers.add(self)
+
+    async def _run(self) -> None:
+        assert self._wakeup and self._space and self._idle
+        while True:
+            if not self._queue:
+                if not self._in_flight:
+                    self._idle.set()
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if not (
+                len(self._queue) >= self.batch_size or self._flushing or self._closed
+            ):
+                remaining = self._oldest_at + self.flush_interval - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+            batch = self._take_batch()
+            self._oldest_at = time.monotonic()
+            self._space.set()
+            try:
+                body, headers = self._encode(batch)
+                response = await self._client.post(
+                    self.url, content=body, headers=headers
+                )
+                response.raise_for_status()
+            except Exception:
+                self._batch_failed(batch)
+            finally:
+                self._in_flight -= len(batch)
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been sent."""
+        if self._task is None or self._idle is None or self._wakeup is None:
+            return
+        self._flushing = True
+        self._wakeup.set()
+        try:
+            await self._idle.wait()
+        finally:
+            self._flushing = False
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._task is not None and self._wakeup is not None:
+            self._wakeup.set()
+            await self._task
+        _live_loggers.discard(self)
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _flush_at_exit(self) -> None:
+        queue = self._queue
+        if not queue:
+            return
+        with httpx.Client(timeout=self.timeout) as client:
+            while queue:
+                batch = self._take_batch()
+                body, headers = self._encode(batch)
+                client.post(self.url, content=body, headers=headers)
+
+    async def __aenter__(self) -> "AsyncLogger":
+        return self
 
-        return response
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
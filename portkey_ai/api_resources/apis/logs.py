@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
@@ -18,7 +19,10 @@ from portkey_ai.api_resources.utils import PortkeyApiPaths
 class Logs(APIResource):
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.exports = Exports(client)
+
+    @cached_property
+    def exports(self) -> "Exports":
+        return Exports(self._client)
 
     def create(
         self,
@@ -175,7 +179,10 @@ class Exports(APIResource):
 class AsyncLogs(AsyncAPIResource):
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.exports = AsyncExports(client)
+
+    @cached_property
+    def exports(self) -> "AsyncExports":
+        return AsyncExports(self._client)
 
     async def create(
         self,
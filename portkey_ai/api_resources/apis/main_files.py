@@ -1,8 +1,12 @@
-import json
-from typing import Any, Union
+from typing import Any, AsyncIterator, Iterator, Union
 import typing_extensions
 from portkey_ai._vendor.openai._types import omit, Omit
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    next_cursor_page,
+)
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
 from portkey_ai.api_resources.types.main_file_type import (
     FileDeleted,
@@ -21,8 +25,7 @@ class MainFiles(APIResource):
         response = self.openai_client.with_raw_response.files.create(
             file=file, purpose=purpose, extra_body=kwargs, extra_headers=extra_headers
         )
-        data = FileObject(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileObject, response)
 
         return data
 
@@ -35,8 +38,7 @@ class MainFiles(APIResource):
             response = self.openai_client.with_raw_response.files.retrieve(
                 file_id=file_id
             )
-        data = FileObject(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileObject, response)
 
         return data
 
@@ -56,17 +58,19 @@ class MainFiles(APIResource):
             order=order,
             **kwargs,
         )
-        data = FileList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileList, response)
 
         return data
 
+    def iter_all(self, **kwargs: Any) -> Iterator[FileObject]:
+        """Iterate over all files. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, next_cursor_page)
+
     def delete(self, file_id, **kwargs) -> FileDeleted:
         response = self.openai_client.with_raw_response.files.delete(
             file_id=file_id, extra_body=kwargs
         )
-        data = FileDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileDeleted, response)
 
         return data
 
@@ -114,8 +118,7 @@ class AsyncMainFiles(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.files.create(
             file=file, purpose=purpose, extra_body=kwargs, extra_headers=extra_headers
         )
-        data = FileObject(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileObject, response)
 
         return data
 
@@ -128,8 +131,7 @@ class AsyncMainFiles(AsyncAPIResource):
             response = await self.openai_client.with_raw_response.files.retrieve(
                 file_id=file_id
             )
-        data = FileObject(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileObject, response)
 
         return data
 
@@ -149,17 +151,19 @@ class AsyncMainFiles(AsyncAPIResource):
             order=order,
             **kwargs,
         )
-        data = FileList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileList, response)
 
         return data
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[FileObject]:
+        """Iterate over all files. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, next_cursor_page)
+
     async def delete(self, file_id, **kwargs) -> FileDeleted:
         response = await self.openai_client.with_raw_response.files.delete(
             file_id=file_id, extra_body=kwargs
         )
-        data = FileDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(FileDeleted, response)
 
         return data
 
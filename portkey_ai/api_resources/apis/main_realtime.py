@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, List, Literal, Optional, Union
 
 import httpx
@@ -36,11 +37,19 @@ from portkey_ai.api_resources.types.shared_types import Headers, Query, Body
 
 
 class MainRealtime(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.client_secrets = ClientSecrets(client)
-        self.calls = Calls(client)
+
+    @cached_property
+    def client_secrets(self) -> "ClientSecrets":
+        return ClientSecrets(self._client)
+
+    @cached_property
+    def calls(self) -> "Calls":
+        return Calls(self._client)
 
     def connect(
         self,
@@ -59,11 +68,19 @@ class MainRealtime(APIResource):
 
 
 class AsyncMainRealtime(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.client_secrets = AsyncClientSecrets(client)
-        self.calls = AsyncCalls(client)
+
+    @cached_property
+    def client_secrets(self) -> "AsyncClientSecrets":
+        return AsyncClientSecrets(self._client)
+
+    @cached_property
+    def calls(self) -> "AsyncCalls":
+        return AsyncCalls(self._client)
 
     def connect(
         self,
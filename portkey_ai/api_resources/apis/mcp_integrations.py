@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Any, Dict, List, Literal, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
@@ -138,15 +139,20 @@ class McpIntegrationMetadata(APIResource):
 class McpIntegrations(APIResource):
     """MCP Integrations API for managing MCP integration configurations."""
 
-    workspaces: McpIntegrationWorkspaces
-    capabilities: McpIntegrationCapabilities
-    metadata: McpIntegrationMetadata
-
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.workspaces = McpIntegrationWorkspaces(client)
-        self.capabilities = McpIntegrationCapabilities(client)
-        self.metadata = McpIntegrationMetadata(client)
+
+    @cached_property
+    def workspaces(self) -> McpIntegrationWorkspaces:
+        return McpIntegrationWorkspaces(self._client)
+
+    @cached_property
+    def capabilities(self) -> McpIntegrationCapabilities:
+        return McpIntegrationCapabilities(self._client)
+
+    @cached_property
+    def metadata(self) -> McpIntegrationMetadata:
+        return McpIntegrationMetadata(self._client)
 
     def create(
         self,
@@ -447,15 +453,20 @@ class AsyncMcpIntegrationMetadata(AsyncAPIResource):
 class AsyncMcpIntegrations(AsyncAPIResource):
     """Async MCP Integrations API for managing MCP integration configurations."""
 
-    workspaces: AsyncMcpIntegrationWorkspaces
-    capabilities: AsyncMcpIntegrationCapabilities
-    metadata: AsyncMcpIntegrationMetadata
-
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.workspaces = AsyncMcpIntegrationWorkspaces(client)
-        self.capabilities = AsyncMcpIntegrationCapabilities(client)
-        self.metadata = AsyncMcpIntegrationMetadata(client)
+
+    @cached_property
+    def workspaces(self) -> AsyncMcpIntegrationWorkspaces:
+        return AsyncMcpIntegrationWorkspaces(self._client)
+
+    @cached_property
+    def capabilities(self) -> AsyncMcpIntegrationCapabilities:
+        return AsyncMcpIntegrationCapabilities(self._client)
+
+    @cached_property
+    def metadata(self) -> AsyncMcpIntegrationMetadata:
+        return AsyncMcpIntegrationMetadata(self._client)
 
     async def create(
         self,
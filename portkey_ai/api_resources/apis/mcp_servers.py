@@ -1,8 +1,14 @@
-from typing import Any, Dict, List, Union
+from functools import cached_property
+from typing import Any, AsyncIterator, Dict, Iterator, List, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
 from urllib.parse import urlencode
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    PageNumbers,
+)
 from portkey_ai.api_resources.types.mcp_servers_type import (
     McpServerCreateResponse,
     McpServerRetrieveResponse,
@@ -216,15 +222,20 @@ class McpServerMetadata(APIResource):
 class McpServers(APIResource):
     """MCP Servers API for managing MCP server configurations."""
 
-    capabilities: McpServerCapabilities
-    user_access: McpServerUserAccess
-    metadata: McpServerMetadata
-
     def __init__(self, client: APIClient) -> None:
         super().__init__(client)
-        self.capabilities = McpServerCapabilities(client)
-        self.user_access = McpServerUserAccess(client)
-        self.metadata = McpServerMetadata(client)
+
+    @cached_property
+    def capabilities(self) -> McpServerCapabilities:
+        return McpServerCapabilities(self._client)
+
+    @cached_property
+    def user_access(self) -> McpServerUserAccess:
+        return McpServerUserAccess(self._client)
+
+    @cached_property
+    def metadata(self) -> McpServerMetadata:
+        return McpServerMetadata(self._client)
 
     def create(
         self,
@@ -291,6 +302,10 @@ class McpServers(APIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over all MCP servers. Takes the same arguments as `list`."""
+        return iter_pages(self.list, {"current_page": 0, **kwargs}, PageNumbers())
+
     def retrieve(
         self,
         *,
@@ -630,15 +645,20 @@ class AsyncMcpServerMetadata(AsyncAPIResource):
 class AsyncMcpServers(AsyncAPIResource):
     """Async MCP Servers API for managing MCP server configurations."""
 
-    capabilities: AsyncMcpServerCapabilities
-    user_access: AsyncMcpServerUserAccess
-    metadata: AsyncMcpServerMetadata
-
     def __init__(self, client: AsyncAPIClient) -> None:
         super().__init__(client)
-        self.capabilities = AsyncMcpServerCapabilities(client)
-        self.user_access = AsyncMcpServerUserAccess(client)
-        self.metadata = AsyncMcpServerMetadata(client)
+
+    @cached_property
+    def capabilities(self) -> AsyncMcpServerCapabilities:
+        return AsyncMcpServerCapabilities(self._client)
+
+    @cached_property
+    def user_access(self) -> AsyncMcpServerUserAccess:
+        return AsyncMcpServerUserAccess(self._client)
+
+    @cached_property
+    def metadata(self) -> AsyncMcpServerMetadata:
+        return AsyncMcpServerMetadata(self._client)
 
     async def create(
         self,
@@ -705,6 +725,10 @@ class AsyncMcpServers(AsyncAPIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over all MCP servers. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, {"current_page": 0, **kwargs}, PageNumbers())
+
     async def retrieve(
         self,
         *,
@@ -1,4 +1,3 @@
-import json
 from typing import Union
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
@@ -22,14 +21,12 @@ class Models(APIResource):
             response = self.openai_client.with_raw_response.models.retrieve(
                 model=model, timeout=timeout
             )
-        data = Model(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Model, response)
         return data
 
     def list(self, **kwargs) -> ModelList:
         response = self.openai_client.with_raw_response.models.list(**kwargs)
-        data = ModelList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ModelList, response)
         return data
 
     def delete(
@@ -38,8 +35,7 @@ class Models(APIResource):
         response = self.openai_client.with_raw_response.models.delete(
             model=model, timeout=timeout, extra_body=kwargs
         )
-        data = ModelDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ModelDeleted, response)
         return data
 
 
@@ -59,14 +55,12 @@ class AsyncModels(AsyncAPIResource):
             response = await self.openai_client.with_raw_response.models.retrieve(
                 model=model, timeout=timeout
             )
-        data = Model(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Model, response)
         return data
 
     async def list(self, **kwargs) -> ModelList:
         response = await self.openai_client.with_raw_response.models.list(**kwargs)
-        data = ModelList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ModelList, response)
         return data
 
     async def delete(
@@ -75,6 +69,5 @@ class AsyncModels(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.models.delete(
             model=model, timeout=timeout, extra_body=kwargs
         )
-        data = ModelDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ModelDeleted, response)
         return data
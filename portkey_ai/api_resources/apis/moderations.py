@@ -1,4 +1,3 @@
-import json
 from typing import Any, Iterable, List, Union
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
@@ -21,8 +20,7 @@ class Moderations(APIResource):
         response = self.openai_client.with_raw_response.moderations.create(
             input=input, model=model, extra_body=kwargs
         )
-        data = ModerationCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ModerationCreateResponse, response)
 
         return data
 
@@ -42,7 +40,6 @@ class AsyncModerations(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.moderations.create(
             input=input, model=model, extra_body=kwargs
         )
-        data = ModerationCreateResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ModerationCreateResponse, response)
 
         return data
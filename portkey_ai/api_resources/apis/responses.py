@@ -1,5 +1,15 @@
-import json
-from typing import Iterable, List, Literal, Optional, Type, Union
+from functools import cached_property
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+)
 from portkey_ai._vendor.openai._streaming import AsyncStream, Stream
 from portkey_ai._vendor.openai.lib._parsing._responses import TextFormatT
 from portkey_ai._vendor.openai.lib.streaming.responses._responses import (
@@ -45,6 +55,11 @@ from portkey_ai._vendor.openai.types.websocket_connection_options import (
     WebSocketConnectionOptions,
 )
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    next_cursor_page,
+)
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
 from portkey_ai.api_resources.types.response_type import (
     Response as ResponseType,
@@ -60,11 +75,19 @@ from typing_extensions import overload
 
 
 class Responses(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.input_items = InputItems(client)
-        self.input_tokens = InputTokens(client)
+
+    @cached_property
+    def input_items(self) -> "InputItems":
+        return InputItems(self._client)
+
+    @cached_property
+    def input_tokens(self) -> "InputTokens":
+        return InputTokens(self._client)
 
     @overload
     def create(
@@ -363,8 +386,7 @@ class Responses(APIResource):
             timeout=timeout,
         )
 
-        data = ResponseType(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ResponseType, response)
 
         return data
 
@@ -736,8 +758,6 @@ class Responses(APIResource):
         prompt_cache_key: Union[Optional[str], Omit] = omit,
         **kwargs,
     ) -> CompactedResponse:
-        import json
-
         extra_headers = kwargs.pop("extra_headers", None)
         extra_query = kwargs.pop("extra_query", None)
         extra_body = kwargs.pop("extra_body", None)
@@ -753,8 +773,7 @@ class Responses(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = CompactedResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(CompactedResponse, response)
         return data
 
     def connect(
@@ -803,6 +822,10 @@ class InputItems(APIResource):
 
         return response  # type: ignore[return-value]
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over a response's input items. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, next_cursor_page)
+
 
 class InputTokens(APIResource):
     def __init__(self, client: Portkey) -> None:
@@ -849,17 +872,24 @@ class InputTokens(APIResource):
             timeout=timeout,
         )
 
-        data = InputTokenCountResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(InputTokenCountResponse, response)
         return data
 
 
 class AsyncResponses(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.input_items = AsyncInputItems(client)
-        self.input_tokens = AsyncInputTokens(client)
+
+    @cached_property
+    def input_items(self) -> "AsyncInputItems":
+        return AsyncInputItems(self._client)
+
+    @cached_property
+    def input_tokens(self) -> "AsyncInputTokens":
+        return AsyncInputTokens(self._client)
 
     @overload
     async def create(
@@ -1158,8 +1188,7 @@ class AsyncResponses(AsyncAPIResource):
             timeout=timeout,
         )
 
-        data = ResponseType(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ResponseType, response)
 
         return data
 
@@ -1531,8 +1560,6 @@ class AsyncResponses(AsyncAPIResource):
         prompt_cache_key: Union[Optional[str], Omit] = omit,
         **kwargs,
     ) -> CompactedResponse:
-        import json
-
         extra_headers = kwargs.pop("extra_headers", None)
         extra_query = kwargs.pop("extra_query", None)
         extra_body = kwargs.pop("extra_body", None)
@@ -1548,8 +1575,7 @@ class AsyncResponses(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = CompactedResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(CompactedResponse, response)
         return data
 
     def connect(
@@ -1598,6 +1624,10 @@ class AsyncInputItems(AsyncAPIResource):
 
         return response  # type: ignore[return-value]
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over a response's input items. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, next_cursor_page)
+
 
 class AsyncInputTokens(AsyncAPIResource):
     def __init__(self, client: AsyncPortkey) -> None:
@@ -1646,6 +1676,5 @@ class AsyncInputTokens(AsyncAPIResource):
             )
         )
 
-        data = InputTokenCountResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(InputTokenCountResponse, response)
         return data
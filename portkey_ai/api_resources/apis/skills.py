@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import List, Union
 from typing_extensions import Literal
 
@@ -117,12 +117,15 @@ class AsyncSkillsVersionsContent(AsyncAPIResource):
 
 
 class SkillsVersions(APIResource):
-    content: SkillsVersionsContent
+    _client: Portkey
 
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.content = SkillsVersionsContent(client)
+
+    @cached_property
+    def content(self) -> SkillsVersionsContent:
+        return SkillsVersionsContent(self._client)
 
     def create(
         self,
@@ -145,8 +148,7 @@ class SkillsVersions(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersion(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersion, response)
         return data
 
     def retrieve(
@@ -168,8 +170,7 @@ class SkillsVersions(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersion(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersion, response)
         return data
 
     def list(
@@ -195,8 +196,7 @@ class SkillsVersions(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersionList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersionList, response)
         return data
 
     def delete(
@@ -218,18 +218,20 @@ class SkillsVersions(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersionDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersionDeleted, response)
         return data
 
 
 class AsyncSkillsVersions(AsyncAPIResource):
-    content: AsyncSkillsVersionsContent
+    _client: AsyncPortkey
 
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.content = AsyncSkillsVersionsContent(client)
+
+    @cached_property
+    def content(self) -> AsyncSkillsVersionsContent:
+        return AsyncSkillsVersionsContent(self._client)
 
     async def create(
         self,
@@ -252,8 +254,7 @@ class AsyncSkillsVersions(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersion(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersion, response)
         return data
 
     async def retrieve(
@@ -275,8 +276,7 @@ class AsyncSkillsVersions(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersion(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersion, response)
         return data
 
     async def list(
@@ -302,8 +302,7 @@ class AsyncSkillsVersions(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersionList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersionList, response)
         return data
 
     async def delete(
@@ -325,20 +324,24 @@ class AsyncSkillsVersions(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillVersionDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillVersionDeleted, response)
         return data
 
 
 class Skills(APIResource):
-    content: SkillsContent
-    versions: SkillsVersions
+    _client: Portkey
 
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.content = SkillsContent(client)
-        self.versions = SkillsVersions(client)
+
+    @cached_property
+    def content(self) -> SkillsContent:
+        return SkillsContent(self._client)
+
+    @cached_property
+    def versions(self) -> SkillsVersions:
+        return SkillsVersions(self._client)
 
     def create(
         self,
@@ -357,8 +360,7 @@ class Skills(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = Skill(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Skill, response)
         return data
 
     def retrieve(
@@ -378,8 +380,7 @@ class Skills(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = Skill(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Skill, response)
         return data
 
     def update(
@@ -401,8 +402,7 @@ class Skills(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = Skill(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Skill, response)
         return data
 
     def list(
@@ -426,8 +426,7 @@ class Skills(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillList, response)
         return data
 
     def delete(
@@ -447,20 +446,24 @@ class Skills(APIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillDeleted, response)
         return data
 
 
 class AsyncSkills(AsyncAPIResource):
-    content: AsyncSkillsContent
-    versions: AsyncSkillsVersions
+    _client: AsyncPortkey
 
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.content = AsyncSkillsContent(client)
-        self.versions = AsyncSkillsVersions(client)
+
+    @cached_property
+    def content(self) -> AsyncSkillsContent:
+        return AsyncSkillsContent(self._client)
+
+    @cached_property
+    def versions(self) -> AsyncSkillsVersions:
+        return AsyncSkillsVersions(self._client)
 
     async def create(
         self,
@@ -479,8 +482,7 @@ class AsyncSkills(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = Skill(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Skill, response)
         return data
 
     async def retrieve(
@@ -500,8 +502,7 @@ class AsyncSkills(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = Skill(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Skill, response)
         return data
 
     async def update(
@@ -523,8 +524,7 @@ class AsyncSkills(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = Skill(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Skill, response)
         return data
 
     async def list(
@@ -548,8 +548,7 @@ class AsyncSkills(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillList, response)
         return data
 
     async def delete(
@@ -569,6 +568,5 @@ class AsyncSkills(AsyncAPIResource):
             extra_body={**(extra_body or {}), **kwargs},
             timeout=timeout,
         )
-        data = SkillDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(SkillDeleted, response)
         return data
@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import (
     Any,
     AsyncIterator,
@@ -53,11 +53,19 @@ from ..._vendor.openai.types.beta.assistant_tool_param import AssistantToolParam
 
 
 class Threads(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.messages = Messages(client)
-        self.runs = Runs(client)
+
+    @cached_property
+    def messages(self) -> "Messages":
+        return Messages(self._client)
+
+    @cached_property
+    def runs(self) -> "Runs":
+        return Runs(self._client)
 
     def create(
         self,
@@ -73,8 +81,7 @@ class Threads(APIResource):
             tool_resources=tool_resources,
             extra_body=kwargs,
         )
-        data = Thread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Thread, response)
 
         return data
 
@@ -87,8 +94,7 @@ class Threads(APIResource):
             response = self.openai_client.with_raw_response.beta.threads.retrieve(
                 thread_id=thread_id
             )
-        data = Thread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Thread, response)
 
         return data
 
@@ -106,8 +112,7 @@ class Threads(APIResource):
             tool_resources=tool_resources,
             extra_body=kwargs,
         )
-        data = Thread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Thread, response)
 
         return data
 
@@ -118,8 +123,7 @@ class Threads(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.delete(
             thread_id=thread_id
         )
-        data = ThreadDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadDeleted, response)
 
         return data
 
@@ -145,8 +149,7 @@ class Threads(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.create_and_run(
             assistant_id=assistant_id, extra_body=kwargs
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
         return data
 
     def create_and_run(
@@ -280,8 +283,7 @@ class Messages(APIResource):
             metadata=metadata,
             **kwargs,
         )
-        data = ThreadMessage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessage, response)
 
         return data
 
@@ -298,8 +300,7 @@ class Messages(APIResource):
                     thread_id=thread_id, message_id=message_id
                 )
             )
-        data = ThreadMessage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessage, response)
         return data
 
     def update(
@@ -313,8 +314,7 @@ class Messages(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.messages.update(
             thread_id=thread_id, message_id=message_id, metadata=metadata, **kwargs
         )
-        data = ThreadMessage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessage, response)
         return data
 
     def list(
@@ -337,8 +337,7 @@ class Messages(APIResource):
             run_id=run_id,
             **kwargs,
         )
-        data = MessageList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(MessageList, response)
         return data
 
     def delete(
@@ -347,17 +346,21 @@ class Messages(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.messages.delete(
             message_id=message_id, thread_id=thread_id, **kwargs
         )
-        data = ThreadMessageDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessageDeleted, response)
 
         return data
 
 
 class Runs(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.steps = Steps(client)
+
+    @cached_property
+    def steps(self) -> "Steps":
+        return Steps(self._client)
 
     def stream_create(  # type: ignore[return]
         self,
@@ -392,8 +395,7 @@ class Runs(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.runs.create(
             thread_id=thread_id, assistant_id=assistant_id, extra_body=kwargs
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
         return data
 
     def create(
@@ -422,8 +424,7 @@ class Runs(APIResource):
             response = self.openai_client.with_raw_response.beta.threads.runs.retrieve(
                 thread_id=thread_id, run_id=run_id
             )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -437,8 +438,7 @@ class Runs(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.runs.update(
             thread_id=thread_id, run_id=run_id, metadata=metadata, extra_body=kwargs
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -460,8 +460,7 @@ class Runs(APIResource):
             order=order,
             **kwargs,
         )
-        data = RunList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunList, response)
 
         return data
 
@@ -469,8 +468,7 @@ class Runs(APIResource):
         response = self.openai_client.with_raw_response.beta.threads.runs.cancel(
             thread_id=thread_id, run_id=run_id, **kwargs
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -672,8 +670,7 @@ class Runs(APIResource):
                 **kwargs,
             )
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -753,8 +750,7 @@ class Steps(APIResource):
                     include=include,
                 )
             )
-        data = RunStep(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunStep, response)
 
         return data
 
@@ -780,18 +776,25 @@ class Steps(APIResource):
             order=order,
             **kwargs,
         )
-        data = RunStepList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunStepList, response)
 
         return data
 
 
 class AsyncThreads(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.messages = AsyncMessages(client)
-        self.runs = AsyncRuns(client)
+
+    @cached_property
+    def messages(self) -> "AsyncMessages":
+        return AsyncMessages(self._client)
+
+    @cached_property
+    def runs(self) -> "AsyncRuns":
+        return AsyncRuns(self._client)
 
     async def create(
         self,
@@ -807,8 +810,7 @@ class AsyncThreads(AsyncAPIResource):
             tool_resources=tool_resources,
             extra_body=kwargs,
         )
-        data = Thread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Thread, response)
 
         return data
 
@@ -821,8 +823,7 @@ class AsyncThreads(AsyncAPIResource):
             response = await self.openai_client.with_raw_response.beta.threads.retrieve(
                 thread_id=thread_id
             )
-        data = Thread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Thread, response)
 
         return data
 
@@ -840,8 +841,7 @@ class AsyncThreads(AsyncAPIResource):
             tool_resources=tool_resources,
             extra_body=kwargs,
         )
-        data = Thread(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Thread, response)
 
         return data
 
@@ -852,8 +852,7 @@ class AsyncThreads(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.beta.threads.delete(
             thread_id=thread_id
         )
-        data = ThreadDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadDeleted, response)
 
         return data
 
@@ -881,8 +880,7 @@ class AsyncThreads(AsyncAPIResource):
                 assistant_id=assistant_id, extra_body=kwargs
             )
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
         return data
 
     async def create_and_run(
@@ -1020,8 +1018,7 @@ class AsyncMessages(AsyncAPIResource):
                 **kwargs,
             )
         )
-        data = ThreadMessage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessage, response)
 
         return data
 
@@ -1034,8 +1031,7 @@ class AsyncMessages(AsyncAPIResource):
             response = await self.openai_client.with_raw_response.beta.threads.messages.retrieve(  # noqa: E501
                 thread_id=thread_id, message_id=message_id
             )
-        data = ThreadMessage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessage, response)
         return data
 
     async def update(
@@ -1051,8 +1047,7 @@ class AsyncMessages(AsyncAPIResource):
                 thread_id=thread_id, message_id=message_id, metadata=metadata, **kwargs
             )
         )
-        data = ThreadMessage(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessage, response)
         return data
 
     async def list(
@@ -1077,8 +1072,7 @@ class AsyncMessages(AsyncAPIResource):
                 **kwargs,
             )
         )
-        data = MessageList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(MessageList, response)
         return data
 
     async def delete(
@@ -1089,17 +1083,21 @@ class AsyncMessages(AsyncAPIResource):
                 message_id=message_id, thread_id=thread_id, **kwargs
             )
         )
-        data = ThreadMessageDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(ThreadMessageDeleted, response)
 
         return data
 
 
 class AsyncRuns(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.steps = AsyncSteps(client)
+
+    @cached_property
+    def steps(self) -> "AsyncSteps":
+        return AsyncSteps(self._client)
 
     async def stream_create(
         self,
@@ -1136,8 +1134,7 @@ class AsyncRuns(AsyncAPIResource):
             assistant_id=assistant_id,
             extra_body=kwargs,
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
         return data
 
     async def create(
@@ -1166,8 +1163,7 @@ class AsyncRuns(AsyncAPIResource):
                     thread_id=thread_id, run_id=run_id
                 )
             )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -1181,8 +1177,7 @@ class AsyncRuns(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.beta.threads.runs.update(
             thread_id=thread_id, run_id=run_id, metadata=metadata, extra_body=kwargs
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -1204,8 +1199,7 @@ class AsyncRuns(AsyncAPIResource):
             order=order,
             **kwargs,
         )
-        data = RunList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunList, response)
 
         return data
 
@@ -1213,8 +1207,7 @@ class AsyncRuns(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.beta.threads.runs.cancel(
             thread_id=thread_id, run_id=run_id, extra_body=kwargs
         )
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -1425,8 +1418,7 @@ class AsyncRuns(AsyncAPIResource):
                 **kwargs
         )
         # fmt: on
-        data = Run(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Run, response)
 
         return data
 
@@ -1501,8 +1493,7 @@ class AsyncSteps(AsyncAPIResource):
             response = await self.openai_client.with_raw_response.beta.threads.runs.steps.retrieve(  # noqa: E501
                 thread_id=thread_id, run_id=run_id, step_id=step_id, include=include
             )
-        data = RunStep(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunStep, response)
 
         return data
 
@@ -1530,7 +1521,6 @@ class AsyncSteps(AsyncAPIResource):
                 **kwargs,
             )
         )
-        data = RunStepList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(RunStepList, response)
 
         return data
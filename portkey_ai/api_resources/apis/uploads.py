@@ -1,20 +1,36 @@
-import json
+from functools import cached_property
+import builtins
 import os
-from typing import Any, List, Union
-import typing
+import time
+from typing import Any, List, Optional, Union
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
 from portkey_ai.api_resources.client import AsyncPortkey, Portkey
+from portkey_ai.api_resources.global_constants import (
+    DEFAULT_UPLOAD_CONCURRENCY,
+    DEFAULT_UPLOAD_PART_RETRIES,
+    DEFAULT_UPLOAD_PART_SIZE,
+)
+from portkey_ai.api_resources.multipart_upload import (
+    UploadCheckpoint,
+    UploadSource,
+    aupload_parts,
+    upload_parts,
+)
 from portkey_ai.api_resources.types.upload_types import Upload, UploadPart
 from ..._vendor.openai._types import FileTypes, Omit, omit
 
 
 class Uploads(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.parts = Parts(client)
 
-    @typing.no_type_check
+    @cached_property
+    def parts(self) -> "Parts":
+        return Parts(self._client)
+
     def upload_file_chunked(
         self,
         *,
@@ -25,17 +41,66 @@ class Uploads(APIResource):
         bytes: Union[int, None] = None,
         part_size: Union[int, None] = None,
         md5: Union[str, Omit] = omit,
-    ) -> Any:
-        response = self.openai_client.uploads.upload_file_chunked(
-            file=file,
-            mime_type=mime_type,
-            purpose=purpose,
-            filename=filename,
-            bytes=bytes,
-            part_size=part_size,
-            md5=md5,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        part_retries: int = DEFAULT_UPLOAD_PART_RETRIES,
+        checkpoint: Optional[Union[str, os.PathLike[str]]] = None,
+    ) -> Upload:
+        """Upload a file of any size as parts of `part_size` bytes, up to
+        `concurrency` parts at a time.
+
+        Parts are read from disk as they are sent, so only `concurrency`
+        parts are in memory. Each part is retried up to `part_retries` times
+        on its own. Unless `md5` is given, the file's MD5 is computed along
+        the way and sent on completion. With `checkpoint`, the upload id and
+        finished part ids are saved to that path after every part; calling
+        again with the same path resumes the upload, and the checkpoint is
+        removed once it completes.
+        """
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be at least 1")
+        part_size = part_size or DEFAULT_UPLOAD_PART_SIZE
+        checkpoint_path = None if checkpoint is None else os.fspath(checkpoint)
+        source = UploadSource(file, filename, bytes)
+        try:
+            state = UploadCheckpoint.load(checkpoint_path, source.size, part_size)
+            if state is None:
+                upload = self.create(
+                    bytes=source.size,
+                    filename=source.filename,
+                    mime_type=mime_type,
+                    purpose=purpose,
+                )
+                state = UploadCheckpoint(
+                    checkpoint_path, str(upload.id), source.size, part_size
+                )
+
+            def upload_part(index: int, data: builtins.bytes) -> None:
+                for attempt in range(part_retries + 1):
+                    try:
+                        part = self.parts.create(upload_id=state.upload_id, data=data)
+                        break
+                    except Exception:
+                        if attempt == part_retries:
+                            raise
+                        time.sleep(self._client.retry_policy.backoff(attempt))
+                state.add(index, str(part.id))
+
+            file_md5 = upload_parts(
+                source,
+                state,
+                upload_part,
+                concurrency=concurrency,
+                compute_md5=isinstance(md5, Omit),
+            )
+        finally:
+            source.close()
+        result = self.complete(
+            upload_id=state.upload_id,
+            part_ids=state.part_ids(),
+            md5=md5 if file_md5 is None else file_md5,
         )
-        return response
+        state.remove()
+        return result
 
     def create(
         self, *, bytes: int, filename: str, mime_type: str, purpose: Any, **kwargs
@@ -49,8 +114,7 @@ class Uploads(APIResource):
             extra_body=kwargs,
             extra_headers=extra_headers,
         )
-        data = Upload(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Upload, response)
 
         return data
 
@@ -59,8 +123,7 @@ class Uploads(APIResource):
         response = self.openai_client.with_raw_response.uploads.cancel(
             upload_id=upload_id, extra_body=kwargs, extra_headers=extra_headers
         )
-        data = Upload(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Upload, response)
 
         return data
 
@@ -80,8 +143,7 @@ class Uploads(APIResource):
             extra_body=kwargs,
             extra_headers=extra_headers,
         )
-        data = Upload(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Upload, response)
 
         return data
 
@@ -99,19 +161,22 @@ class Parts(APIResource):
             extra_body=kwargs,
             extra_headers=extra_headers,
         )
-        result = UploadPart(**json.loads(response.text))
-        result._headers = response.headers
+        result = self._parse_response(UploadPart, response)
 
         return result
 
 
 class AsyncUploads(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.parts = AsyncParts(client)
 
-    @typing.no_type_check
+    @cached_property
+    def parts(self) -> "AsyncParts":
+        return AsyncParts(self._client)
+
     async def upload_file_chunked(
         self,
         *,
@@ -122,17 +187,68 @@ class AsyncUploads(AsyncAPIResource):
         bytes: Union[int, None] = None,
         part_size: Union[int, None] = None,
         md5: Union[str, Omit] = omit,
-    ) -> Any:
-        response = await self.openai_client.uploads.upload_file_chunked(
-            file=file,
-            mime_type=mime_type,
-            purpose=purpose,
-            filename=filename,
-            bytes=bytes,
-            part_size=part_size,
-            md5=md5,
+        concurrency: int = DEFAULT_UPLOAD_CONCURRENCY,
+        part_retries: int = DEFAULT_UPLOAD_PART_RETRIES,
+        checkpoint: Optional[Union[str, os.PathLike[str]]] = None,
+    ) -> Upload:
+        """Upload a file of any size as parts of `part_size` bytes, up to
+        `concurrency` parts at a time on the event loop.
+
+        Parts are read from disk as they are sent, so only `concurrency`
+        parts are in memory. Each part is retried up to `part_retries` times
+        on its own. Unless `md5` is given, the file's MD5 is computed along
+        the way and sent on completion. With `checkpoint`, the upload id and
+        finished part ids are saved to that path after every part; calling
+        again with the same path resumes the upload, and the checkpoint is
+        removed once it completes.
+        """
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be at least 1")
+        part_size = part_size or DEFAULT_UPLOAD_PART_SIZE
+        checkpoint_path = None if checkpoint is None else os.fspath(checkpoint)
+        source = UploadSource(file, filename, bytes)
+        try:
+            state = UploadCheckpoint.load(checkpoint_path, source.size, part_size)
+            if state is None:
+                upload = await self.create(
+                    bytes=source.size,
+                    filename=source.filename,
+                    mime_type=mime_type,
+                    purpose=purpose,
+                )
+                state = UploadCheckpoint(
+                    checkpoint_path, str(upload.id), source.size, part_size
+                )
+
+            async def upload_part(index: int, data: builtins.bytes) -> None:
+                for attempt in range(part_retries + 1):
+                    try:
+                        part = await self.parts.create(
+                            upload_id=state.upload_id, data=data
+                        )
+                        break
+                    except Exception:
+                        if attempt == part_retries:
+                            raise
+                        await self._sleep(self._client.retry_policy.backoff(attempt))
+                state.add(index, str(part.id))
+
+            file_md5 = await aupload_parts(
+                source,
+                state,
+                upload_part,
+                concurrency=concurrency,
+                compute_md5=isinstance(md5, Omit),
+            )
+        finally:
+            source.close()
+        result = await self.complete(
+            upload_id=state.upload_id,
+            part_ids=state.part_ids(),
+            md5=md5 if file_md5 is None else file_md5,
         )
-        return response
+        state.remove()
+        return result
 
     async def create(
         self, *, bytes: int, filename: str, mime_type: str, purpose: Any, **kwargs
@@ -146,8 +262,7 @@ class AsyncUploads(AsyncAPIResource):
             extra_body=kwargs,
             extra_headers=extra_headers,
         )
-        data = Upload(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Upload, response)
 
         return data
 
@@ -156,8 +271,7 @@ class AsyncUploads(AsyncAPIResource):
         response = await self.openai_client.with_raw_response.uploads.cancel(
             upload_id=upload_id, extra_body=kwargs, extra_headers=extra_headers
         )
-        data = Upload(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Upload, response)
 
         return data
 
@@ -177,8 +291,7 @@ class AsyncUploads(AsyncAPIResource):
             extra_body=kwargs,
             extra_headers=extra_headers,
         )
-        data = Upload(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Upload, response)
 
         return data
 
@@ -196,7 +309,6 @@ class AsyncParts(AsyncAPIResource):
             extra_body=kwargs,
             extra_headers=extra_headers,
         )
-        result = UploadPart(**json.loads(response.text))
-        result._headers = response.headers
+        result = self._parse_response(UploadPart, response)
 
         return result
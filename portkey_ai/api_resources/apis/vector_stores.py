@@ -1,4 +1,4 @@
-import json
+from functools import cached_property
 from typing import Any, Dict, Iterable, List, Optional, Union
 import typing
 from portkey_ai._vendor.openai.types.vector_stores import file_batch_create_params
@@ -24,11 +24,19 @@ from portkey_ai.api_resources.types.vector_stores_type import (
 
 
 class VectorStores(APIResource):
+    _client: Portkey
+
     def __init__(self, client: Portkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.files = VectorFiles(client)
-        self.file_batches = VectorFileBatches(client)
+
+    @cached_property
+    def files(self) -> "VectorFiles":
+        return VectorFiles(self._client)
+
+    @cached_property
+    def file_batches(self) -> "VectorFileBatches":
+        return VectorFileBatches(self._client)
 
     def create(
         self,
@@ -48,8 +56,7 @@ class VectorStores(APIResource):
             metadata=metadata,
             name=name,
         )
-        data = VectorStore(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStore, response)
 
         return data
 
@@ -67,8 +74,7 @@ class VectorStores(APIResource):
             response = self.openai_client.with_raw_response.vector_stores.retrieve(
                 vector_store_id=vector_store_id,
             )
-        data = VectorStore(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStore, response)
 
         return data
 
@@ -88,8 +94,7 @@ class VectorStores(APIResource):
             name=name,
             **kwargs,
         )
-        data = VectorStore(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStore, response)
 
         return data
 
@@ -110,8 +115,7 @@ class VectorStores(APIResource):
             order=order,
             **kwargs,
         )
-        data = VectorStoreList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreList, response)
 
         return data
 
@@ -124,8 +128,7 @@ class VectorStores(APIResource):
             vector_store_id=vector_store_id,
             **kwargs,
         )
-        data = VectorStoreDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreDeleted, response)
 
         return data
 
@@ -149,8 +152,7 @@ class VectorFiles(APIResource):
             chunking_strategy=chunking_strategy,
             **kwargs,
         )
-        data = VectorStoreFile(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFile, response)
 
         return data
 
@@ -176,8 +178,7 @@ class VectorFiles(APIResource):
                     vector_store_id=vector_store_id,
                 )
             )
-        data = VectorStoreFile(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFile, response)
 
         return data
 
@@ -202,8 +203,7 @@ class VectorFiles(APIResource):
             order=order,
             **kwargs,
         )
-        data = VectorStoreFileList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileList, response)
 
         return data
 
@@ -219,8 +219,7 @@ class VectorFiles(APIResource):
             vector_store_id=vector_store_id,
             **kwargs,
         )
-        data = VectorStoreFileDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileDeleted, response)
 
         return data
 
@@ -332,8 +331,7 @@ class VectorFileBatches(APIResource):
                 **kwargs,
             )
         )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
@@ -351,8 +349,7 @@ class VectorFileBatches(APIResource):
                 batch_id=batch_id,
                 vector_store_id=vector_store_id,
             )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
@@ -366,8 +363,7 @@ class VectorFileBatches(APIResource):
                 **kwargs,
             )
         )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
@@ -424,8 +420,7 @@ class VectorFileBatches(APIResource):
             order=order,
             **kwargs,
         )
-        data = VectorStoreFileList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileList, response)
 
         return data
 
@@ -473,11 +468,19 @@ class VectorFileBatches(APIResource):
 
 
 class AsyncVectorStores(AsyncAPIResource):
+    _client: AsyncPortkey
+
     def __init__(self, client: AsyncPortkey) -> None:
         super().__init__(client)
         self.openai_client = client.openai_client
-        self.files = AsyncVectorFiles(client)
-        self.file_batches = AsyncVectorFileBatches(client)
+
+    @cached_property
+    def files(self) -> "AsyncVectorFiles":
+        return AsyncVectorFiles(self._client)
+
+    @cached_property
+    def file_batches(self) -> "AsyncVectorFileBatches":
+        return AsyncVectorFileBatches(self._client)
 
     async def create(
         self,
@@ -497,8 +500,7 @@ class AsyncVectorStores(AsyncAPIResource):
             metadata=metadata,
             name=name,
         )
-        data = VectorStore(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStore, response)
 
         return data
 
@@ -520,8 +522,7 @@ class AsyncVectorStores(AsyncAPIResource):
                     vector_store_id=vector_store_id,
                 )
             )
-        data = VectorStore(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStore, response)
 
         return data
 
@@ -541,8 +542,7 @@ class AsyncVectorStores(AsyncAPIResource):
             name=name,
             **kwargs,
         )
-        data = VectorStore(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStore, response)
 
         return data
 
@@ -563,8 +563,7 @@ class AsyncVectorStores(AsyncAPIResource):
             order=order,
             **kwargs,
         )
-        data = VectorStoreList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreList, response)
 
         return data
 
@@ -577,8 +576,7 @@ class AsyncVectorStores(AsyncAPIResource):
             vector_store_id=vector_store_id,
             **kwargs,
         )
-        data = VectorStoreDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreDeleted, response)
 
         return data
 
@@ -604,8 +602,7 @@ class AsyncVectorFiles(AsyncAPIResource):
                 **kwargs,
             )
         )
-        data = VectorStoreFile(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFile, response)
 
         return data
 
@@ -627,8 +624,7 @@ class AsyncVectorFiles(AsyncAPIResource):
                 file_id=file_id,
                 vector_store_id=vector_store_id,
             )
-        data = VectorStoreFile(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFile, response)
 
         return data
 
@@ -653,8 +649,7 @@ class AsyncVectorFiles(AsyncAPIResource):
             order=order,
             **kwargs,
         )
-        data = VectorStoreFileList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileList, response)
 
         return data
 
@@ -672,8 +667,7 @@ class AsyncVectorFiles(AsyncAPIResource):
                 **kwargs,
             )
         )
-        data = VectorStoreFileDeleted(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileDeleted, response)
 
         return data
 
@@ -782,8 +776,7 @@ class AsyncVectorFileBatches(AsyncAPIResource):
             chunking_strategy=chunking_strategy,
             **kwargs,
         )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
@@ -801,8 +794,7 @@ class AsyncVectorFileBatches(AsyncAPIResource):
                 batch_id=batch_id,
                 vector_store_id=vector_store_id,
             )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
@@ -814,8 +806,7 @@ class AsyncVectorFileBatches(AsyncAPIResource):
             vector_store_id=vector_store_id,
             **kwargs,
         )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
@@ -874,8 +865,7 @@ class AsyncVectorFileBatches(AsyncAPIResource):
             order=order,
             **kwargs,
         )
-        data = VectorStoreFileBatch(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VectorStoreFileBatch, response)
 
         return data
 
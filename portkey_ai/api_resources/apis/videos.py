@@ -1,4 +1,3 @@
-import json
 from typing import Any, Literal, Optional, Union
 
 import httpx
@@ -52,8 +51,7 @@ class Videos(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
 
         return data
 
@@ -113,8 +111,7 @@ class Videos(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
 
         return data
 
@@ -138,8 +135,7 @@ class Videos(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = VideoList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoList, response)
         return data
 
     def delete(
@@ -158,8 +154,7 @@ class Videos(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = VideoDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoDeleteResponse, response)
         return data
 
     def create_character(
@@ -182,8 +177,7 @@ class Videos(APIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = VideoCreateCharacterResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoCreateCharacterResponse, response)
         return data
 
     def download_content(
@@ -226,8 +220,7 @@ class Videos(APIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
         return data
 
     def extend(
@@ -252,8 +245,7 @@ class Videos(APIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
         return data
 
     def get_character(
@@ -273,8 +265,7 @@ class Videos(APIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = VideoGetCharacterResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoGetCharacterResponse, response)
         return data
 
     def remix(
@@ -295,8 +286,7 @@ class Videos(APIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
         return data
 
 
@@ -329,8 +319,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
 
         return data
 
@@ -390,8 +379,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
 
         return data
 
@@ -415,8 +403,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = VideoList(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoList, response)
         return data
 
     async def delete(
@@ -435,8 +422,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = VideoDeleteResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoDeleteResponse, response)
         return data
 
     async def create_character(
@@ -459,8 +445,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = VideoCreateCharacterResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoCreateCharacterResponse, response)
         return data
 
     async def download_content(
@@ -503,8 +488,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
         return data
 
     async def extend(
@@ -529,8 +513,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
         return data
 
     async def get_character(
@@ -550,8 +533,7 @@ class AsyncVideos(AsyncAPIResource):
             extra_body={**(extra_body or {})},
             timeout=timeout,
         )
-        data = VideoGetCharacterResponse(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(VideoGetCharacterResponse, response)
         return data
 
     async def remix(
@@ -572,6 +554,5 @@ class AsyncVideos(AsyncAPIResource):
             extra_body=extra_body,
             timeout=timeout,
         )
-        data = Video(**json.loads(response.text))
-        data._headers = response.headers
+        data = self._parse_response(Video, response)
         return data
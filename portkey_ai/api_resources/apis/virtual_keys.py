@@ -1,8 +1,13 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Union
 from portkey_ai._vendor.openai import NOT_GIVEN, NotGiven
 from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
 from urllib.parse import urlencode
 from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+from portkey_ai.api_resources.pagination import (
+    aiter_pages,
+    iter_pages,
+    single_page,
+)
 from portkey_ai.api_resources.types.virtual_keys_type import (
     VirtualKeysListReponse,
     VirtualKeysUpdateResponse,
@@ -70,6 +75,10 @@ class VirtualKeys(APIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> Iterator[Any]:
+        """Iterate over all virtual keys. Takes the same arguments as `list`."""
+        return iter_pages(self.list, kwargs, single_page)
+
     def retrieve(self, *, slug: Optional[str]) -> Any:
         return self._get(
             f"{PortkeyApiPaths.VIRTUAL_KEYS_API}/{slug}",
@@ -184,6 +193,10 @@ class AsyncVirtualKeys(AsyncAPIResource):
             headers={},
         )
 
+    def iter_all(self, **kwargs: Any) -> AsyncIterator[Any]:
+        """Iterate over all virtual keys. Takes the same arguments as `list`."""
+        return aiter_pages(self.list, kwargs, single_page)
+
     async def retrieve(self, *, slug: Optional[str]) -> Any:
         return await self._get(
             f"{PortkeyApiPaths.VIRTUAL_KEYS_API}/{slug}",
@@ -2,9 +2,13 @@ from __future__ import annotations
 import asyncio
 
 import json
-from types import TracebackType
+import time
+from functools import cached_property, lru_cache
+from types import MappingProxyType, TracebackType
 from typing import (
     Dict,
+    FrozenSet,
+    TypeVar,
     Any,
     List,
     Union,
@@ -20,17 +24,248 @@ import httpx
 import platform
 
 from portkey_ai.api_resources.apis.create_headers import createHeaders
-from .global_constants import PORTKEY_HEADER_PREFIX, DEFAULT_CONNECTION_LIMITS
-from .utils import remove_empty_values, Options, set_base_url, create_model_instance
+from .global_constants import (
+    DEFAULT_WARMUP_CONNECTIONS,
+    DEFAULT_WARMUP_TIMEOUT,
+    PORTKEY_HEADER_PREFIX,
+)
+from .coalescing import AsyncCoalescingTransport, CoalescingTransport
+from .connection_pool import (
+    awarm_connections,
+    build_limits,
+    pool_stats,
+    warm_connections,
+)
+from .fork_safety import ForkSafe, keep_inherited
+from .utils import prune_empty_values, Options, set_base_url, create_model_instance
 from .exceptions import (
     APIStatusError,
     APITimeoutError,
     APIConnectionError,
 )
 from portkey_ai.version import VERSION
-from .utils import ResponseT, make_status_error, default_api_key
+from .utils import (
+    RESPONSE_MODEL_MODES,
+    ResponseT,
+    build_model,
+    make_status_error,
+    default_api_key,
+)
+from portkey_ai.utils.json_utils import json_dumps, json_loads
 from .common_types import StreamT, AsyncStreamT
 from .streaming import Stream, AsyncStream
+from .retry import RetryPolicy
+from .rate_limiter import RateLimiter
+from .embedding_cache import EmbeddingCache
+from .hedging import HedgingPolicy
+from .response_cache import ResponseCache, store_response
+
+
+ClientT = TypeVar("ClientT")
+
+# Client options that are only sent to the gateway as headers. Changing them on a
+# derived client only needs a header overlay.
+HEADER_OPTIONS = frozenset(
+    (
+        "api_key",
+        "virtual_key",
+        "config",
+        "provider",
+        "trace_id",
+        "metadata",
+        "debug",
+        "cache_force_refresh",
+        "custom_host",
+        "openai_project",
+        "openai_organization",
+        "aws_secret_access_key",
+        "aws_access_key_id",
+        "aws_session_token",
+        "aws_region",
+        "vertex_project_id",
+        "vertex_region",
+        "workers_ai_account_id",
+        "azure_resource_name",
+        "azure_deployment_id",
+        "azure_api_version",
+        "azure_endpoint_name",
+        "huggingface_base_url",
+        "cache_namespace",
+        "request_timeout",
+        "strict_open_ai_compliance",
+        "anthropic_beta",
+        "anthropic_version",
+        "mistral_fim_completion",
+        "vertex_storage_bucket_name",
+        "provider_file_name",
+        "provider_model",
+        "aws_s3_bucket",
+        "aws_s3_object_key",
+        "aws_bedrock_model",
+        "fireworks_account_id",
+    )
+)
+
+# Options that are baked into the connection pool, the vendored OpenAI client or
+# process-wide state, so changing them needs a fully constructed client.
+REBUILD_OPTIONS = frozenset(
+    (
+        "base_url",
+        "websocket_base_url",
+        "webhook_secret",
+        "http_client",
+        "instrumentation",
+        "forward_headers",
+    )
+)
+
+
+# Headers that only depend on the interpreter and package version.
+RUNTIME_HEADERS: Mapping[str, str] = MappingProxyType(
+    {
+        f"{PORTKEY_HEADER_PREFIX}package-version": f"portkey-{VERSION}",
+        f"{PORTKEY_HEADER_PREFIX}runtime": platform.python_implementation(),
+        f"{PORTKEY_HEADER_PREFIX}runtime-version": platform.python_version(),
+    }
+)
+
+
+def _with_json_content_type(headers: httpx.Headers) -> httpx.Headers:
+    if "content-type" not in headers:
+        headers["Content-Type"] = "application/json"
+    return headers
+
+
+class HeaderBlock:
+    """The default and custom headers of a client, merged and encoded once.
+
+    Requests without option headers get the encoded block itself; httpx copies
+    it while merging it into the request, so it is never modified. Option
+    headers are laid over the merged block, except for names the client's
+    custom headers already set, which take precedence as in `_build_headers`.
+    """
+
+    __slots__ = (
+        "api_key",
+        "custom_headers",
+        "_merged",
+        "_custom_names",
+        "_headers",
+        "_json_headers",
+    )
+
+    def __init__(self, api_key: Optional[str], custom_headers: Mapping[str, Any]):
+        self.api_key = api_key
+        self.custom_headers = custom_headers
+        self._merged = {
+            f"{PORTKEY_HEADER_PREFIX}api-key": api_key,
+            **RUNTIME_HEADERS,
+            **custom_headers,
+        }
+        self._custom_names = frozenset(name.lower() for name in custom_headers)
+        self._headers = httpx.Headers(self._merged)
+        self._json_headers = _with_json_content_type(httpx.Headers(self._merged))
+
+    def is_current(self, api_key: Optional[str], custom_headers: Mapping) -> bool:
+        return custom_headers is self.custom_headers and api_key == self.api_key
+
+    def build(
+        self, option_headers: Optional[Mapping[str, Any]], json_content: bool = False
+    ) -> httpx.Headers:
+        """Headers for one request; `json_content` adds a JSON content type
+        unless one is already set."""
+        if option_headers:
+            overlay = {
+                name: value
+                for name, value in option_headers.items()
+                if name.lower() not in self._custom_names
+            }
+            if overlay:
+                headers = httpx.Headers({**self._merged, **overlay})
+                return _with_json_content_type(headers) if json_content else headers
+        return self._json_headers if json_content else self._headers
+
+
+@lru_cache(maxsize=None)
+def _cached_properties(cls: type) -> FrozenSet[str]:
+    return frozenset(
+        name
+        for klass in cls.__mro__
+        for name, value in vars(klass).items()
+        if isinstance(value, cached_property)
+    )
+
+
+def _copy_instance(obj: ClientT) -> ClientT:
+    """Shallow copy of `obj` without the values cached by its `cached_property`s,
+    so that resources bound to the original are rebuilt for the copy on access.
+    """
+    cls: type = type(obj)
+    copied: Any = object.__new__(cls)
+    cached = _cached_properties(cls)
+    copied.__dict__.update(
+        (name, value) for name, value in obj.__dict__.items() if name not in cached
+    )
+    return copied
+
+
+def derive_client(
+    client: ClientT, options: Mapping[str, Any], kwargs: Mapping[str, Any]
+) -> Optional[ClientT]:
+    """Derive a copy of `client` with `options` applied, for `copy`/`with_options`.
+
+    Like a full copy, a falsy option keeps the client's current value. The
+    derived client shares the connection pool, retry policy and rate limiter of
+    `client`; only the headers of the options that changed are rebuilt and laid
+    over the existing ones, and resources are created lazily on first access.
+    Returns None when an option in `REBUILD_OPTIONS` changes, in which case a
+    new client has to be constructed.
+    """
+    source: Any = client
+    changed: Dict[str, Any] = {}
+    for name, value in options.items():
+        current = source._client if name == "http_client" else getattr(source, name)
+        if value and value is not current:
+            changed[name] = value
+    if not REBUILD_OPTIONS.isdisjoint(changed):
+        return None
+
+    derived: Any = _copy_instance(client)
+    derived.response_headers = None
+    derived._owns_http_client = False
+    derived._register_after_fork()
+    for name, value in changed.items():
+        setattr(derived, name, value)
+    if "response_model_mode" in changed:
+        _check_response_model_mode(derived.response_model_mode)
+
+    header_options = {
+        name: value for name, value in changed.items() if name in HEADER_OPTIONS
+    }
+    openai_client = None
+    if header_options or kwargs:
+        derived.kwargs = {**source.kwargs, **kwargs}
+        overlay = createHeaders(
+            forward_headers=source.forward_headers, **header_options, **kwargs
+        )
+        derived.custom_headers = {**source.custom_headers, **overlay}
+        derived.allHeaders = {**source.allHeaders, **overlay}
+        openai_client = _copy_instance(source.openai_client)
+        openai_client._custom_headers = derived.allHeaders
+    if "retry_policy" in changed:
+        openai_client = openai_client or _copy_instance(source.openai_client)
+        openai_client.max_retries = derived.retry_policy.max_retries
+    if openai_client is not None:
+        derived.openai_client = openai_client
+    return derived
+
+
+def _check_response_model_mode(response_model_mode: Optional[str]) -> None:
+    if response_model_mode not in RESPONSE_MODEL_MODES:
+        raise ValueError(
+            "`response_model_mode` must be one of "
+            f"{', '.join(RESPONSE_MODEL_MODES)}, got {response_model_mode!r}"
+        )
 
 
 class MissingStreamClassError(TypeError):
@@ -41,7 +276,7 @@ class MissingStreamClassError(TypeError):
         )
 
 
-class APIClient:
+class APIClient(ForkSafe):
     _client: httpx.Client
     _default_stream_cls: Union[type[Stream[Any]], None] = None
     max_retries: int = 1
@@ -92,6 +327,15 @@ class APIClient:
         aws_bedrock_model: Optional[str] = None,
         fireworks_account_id: Optional[str] = None,
         calculate_audio_duration: Optional[bool] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_model_mode: Optional[str] = None,
+        connection_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        keepalive_expiry: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
         **kwargs,
     ) -> None:
         self.base_url = set_base_url(base_url, api_key)
@@ -136,6 +380,16 @@ class APIClient:
         self.aws_bedrock_model = aws_bedrock_model
         self.fireworks_account_id = fireworks_account_id
         self.calculate_audio_duration = calculate_audio_duration
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=self.max_retries)
+        self.rate_limiter = rate_limiter
+        self.response_model_mode = response_model_mode or "strict"
+        self.connection_limits = connection_limits
+        self.http2 = http2
+        self.keepalive_expiry = keepalive_expiry
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
+        self.embedding_cache = embedding_cache
+        _check_response_model_mode(self.response_model_mode)
         self.kwargs = kwargs
 
         self.custom_headers = createHeaders(
@@ -180,15 +434,49 @@ class APIClient:
         )
 
         self.allHeaders = self._build_headers(create_model_instance(Options))
-        self._client = http_client or httpx.Client(
+        self._header_block: Optional[HeaderBlock] = None
+        # One pool per client: it is also handed to the vendored OpenAI client.
+        self._owns_http_client = http_client is None
+        self._client = http_client or self._build_http_client()
+        self._register_after_fork()
+
+        self.response_headers: httpx.Headers | None = None
+
+    def _build_http_client(self) -> httpx.Client:
+        limits = build_limits(self.connection_limits, self.keepalive_expiry)
+        transport: Optional[CoalescingTransport] = None
+        if self.coalesce_requests:
+            # httpx only applies `limits` and `http2` to its default transport,
+            # so the wrapped one is configured here instead.
+            transport = CoalescingTransport(
+                httpx.HTTPTransport(limits=limits, http2=bool(self.http2))
+            )
+        return httpx.Client(
             base_url=self.base_url,
             headers={
                 "Accept": "application/json",
             },
-            limits=DEFAULT_CONNECTION_LIMITS,
+            limits=limits,
+            http2=bool(self.http2),
+            transport=transport,
+            follow_redirects=True,
         )
 
-        self.response_headers: httpx.Headers | None = None
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # A fresh pool in a forked child; see `fork_safety`.
+        if not self._owns_http_client:
+            return {}
+        inherited = self._client
+        keep_inherited(inherited)
+        self._use_http_client(self._build_http_client())
+        return {id(inherited): self._client}
+
+    def _rebind_after_fork(self, replaced: Dict[int, Any]) -> None:
+        if id(self._client) in replaced:
+            self._use_http_client(replaced[id(self._client)])
+
+    def _use_http_client(self, http_client: httpx.Client) -> None:
+        self._client = http_client
 
     def _serialize_header_values(
         self, headers: Optional[Mapping[str, Any]]
@@ -218,6 +506,7 @@ class APIClient:
         stream_cls: type[StreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> StreamT:
         ...
 
@@ -233,6 +522,7 @@ class APIClient:
         stream_cls: type[StreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> ResponseT:
         ...
 
@@ -248,6 +538,7 @@ class APIClient:
         stream_cls: type[StreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> Union[ResponseT, StreamT]:
         ...
 
@@ -262,6 +553,7 @@ class APIClient:
         stream_cls: type[StreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> Union[ResponseT, StreamT]:
         if path.endswith("/generate"):
             opts = self._construct_generate_options(
@@ -283,6 +575,7 @@ class APIClient:
                 params=params,
                 headers=headers,
             )
+        opts.cache_key = cache_key
 
         res = self._request(
             options=opts,
@@ -515,8 +808,8 @@ class APIClient:
         opts.url = url
         json_body = body
         opts.files = files
-        opts.json_body = remove_empty_values(json_body)
-        opts.headers = remove_empty_values(headers)
+        opts.json_body = prune_empty_values(json_body)
+        opts.headers = prune_empty_values(headers)
         return opts
 
     def _construct(
@@ -535,17 +828,15 @@ class APIClient:
         opts.url = url
         opts.files = files
         if method != "get":
-            opts.json_body = remove_empty_values(body)
-        opts.headers = remove_empty_values(headers)
+            opts.json_body = prune_empty_values(body)
+        opts.headers = prune_empty_values(headers)
         return opts
 
     @property
     def _default_headers(self) -> Mapping[str, str]:
         return {
             f"{PORTKEY_HEADER_PREFIX}api-key": self.api_key,
-            f"{PORTKEY_HEADER_PREFIX}package-version": f"portkey-{VERSION}",
-            f"{PORTKEY_HEADER_PREFIX}runtime": platform.python_implementation(),
-            f"{PORTKEY_HEADER_PREFIX}runtime-version": platform.python_version(),
+            **RUNTIME_HEADERS,
         }
 
     def _build_headers(self, options: Options) -> Dict[str, Any]:
@@ -555,6 +846,20 @@ class APIClient:
         )
         return headers_dict
 
+    def _request_headers(
+        self, options: Options, json_content: bool = False
+    ) -> httpx.Headers:
+        """Headers for one request: the client's `HeaderBlock` plus the option
+        headers. The block is recompiled only after `custom_headers` or
+        `api_key` is replaced, e.g. on a copy made with `with_options`.
+
+        The result may be shared between requests and must not be modified.
+        """
+        block = self._header_block
+        if block is None or not block.is_current(self.api_key, self.custom_headers):
+            block = self._header_block = HeaderBlock(self.api_key, self.custom_headers)
+        return block.build(options.headers, json_content)
+
     def _merge_mappings(
         self,
         *args,
@@ -570,12 +875,54 @@ class APIClient:
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection counts and limits of the pool shared by this client and
+        its vendored OpenAI client."""
+        return pool_stats(self._client)
+
+    def warmup(
+        self,
+        n_connections: int = DEFAULT_WARMUP_CONNECTIONS,
+        *,
+        timeout: float = DEFAULT_WARMUP_TIMEOUT,
+    ) -> List[Dict[str, Any]]:
+        """Open `n_connections` keep-alive connections ahead of traffic, so
+        that the first requests do not pay for connection setup.
+
+        `HEAD` requests are sent concurrently to `base_url` and, when it is on
+        another host, to the vendored OpenAI client's base URL, and each
+        connection is held until all of them are open. `n_connections` is
+        capped at the pool's `max_keepalive_connections`; over HTTP/2 a single
+        connection is opened. Idle connections are closed after
+        `keepalive_expiry`, so warm up shortly before traffic arrives.
+
+        Returns one entry per request with its URL, whether it opened a new
+        connection, the TCP connect and TLS handshake times, the total time to
+        the response in seconds, and the error if the request failed.
+        """
+        return warm_connections(
+            self._client, self._warmup_urls(), n_connections, timeout
+        )
+
+    def _warmup_urls(self) -> List[Union[str, httpx.URL]]:
+        return [self.base_url]
+
+    def coalescing_stats(self) -> Optional[Dict[str, int]]:
+        """Requests sent upstream and requests that joined an identical one in
+        flight, or None when the pool does not coalesce requests."""
+        transport = getattr(self._client, "_transport", None)
+        if isinstance(transport, (CoalescingTransport, AsyncCoalescingTransport)):
+            return transport.stats()
+        return None
+
     def close(self) -> None:
         """Close the underlying HTTPX client.
 
-        The client will *not* be usable after this.
+        The client will *not* be usable after this. An HTTPX client passed in
+        as `http_client`, or shared with the client this one was copied from,
+        is left open for its owner to close.
         """
-        if hasattr(self, "_client"):
+        if hasattr(self, "_client") and self._owns_http_client:
             self._client.close()
 
     def __enter__(self: Any) -> Any:
@@ -590,43 +937,73 @@ class APIClient:
         self.close()
 
     def _build_request(self, options: Options) -> httpx.Request:
-        headers = self._build_headers(options)
         params = options.params
+        content = None
         json_body = options.json_body
+        if json_body is not None and options.files is None:
+            # Encoded once, straight to bytes, instead of through httpx's `json=`.
+            content = json_dumps(json_body)
+            json_body = None
+        headers = self._request_headers(options, json_content=content is not None)
         request = self._client.build_request(
             method=options.method,
             url=options.url,
             headers=headers,
             params=params,
+            content=content,
             json=json_body,
             files=options.files,
             timeout=options.timeout,
         )
         return request
 
+    @property
+    def _rate_limit_key(self) -> Optional[str]:
+        return self.virtual_key or self.provider
+
+    def _acquire_rate_limit(self, body: Optional[Mapping[str, Any]]) -> int:
+        """Wait for the rate limiter, if any, and return the estimated tokens."""
+        if self.rate_limiter is None:
+            return 0
+        tokens = self.rate_limiter.estimate_tokens(body)
+        self.rate_limiter.acquire(self._rate_limit_key, tokens)
+        return tokens
+
+    def _reconcile_rate_limit(self, estimated_tokens: int, usage: Any) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.reconcile(self._rate_limit_key, estimated_tokens, usage)
+
+    def _refund_rate_limit(self, estimated_tokens: int) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.refund(self._rate_limit_key, estimated_tokens)
+
     def _should_retry(self, response: httpx.Response) -> bool:
-        # Retry Conditions
-        retry_status_code = response.status_code
-        retry_trace_id = response.headers.get("x-portkey-trace-id")
-        retry_request_id = response.headers.get("x-portkey-request-id")
-        retry_gateway_exception = response.headers.get("x-portkey-gateway-exception")
-
-        if (
-            retry_status_code < 500
-            or retry_trace_id
-            or retry_request_id
-            or retry_gateway_exception
-        ):
-            return False
-
-        return True
+        return self.retry_policy.should_retry_response(response)
+
+    def _retry_delay(
+        self,
+        retry_count: int,
+        started_at: float,
+        options: Options,
+        response: Optional[httpx.Response],
+        exc: Optional[Exception] = None,
+    ) -> Optional[float]:
+        if response is not None and not self._should_retry(response):
+            return None
+        if exc is not None and not self.retry_policy.should_retry_exception(exc):
+            return None
+        return self.retry_policy.next_delay(
+            retry_count,
+            started_at,
+            response=response,
+            max_retries=options.max_retries,
+        )
 
     @overload
     def _request(
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: Literal[False],
         cast_to: Type[ResponseT],
         stream_cls: Type[StreamT],
@@ -638,7 +1015,6 @@ class APIClient:
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: Literal[True],
         cast_to: Type[ResponseT],
         stream_cls: Type[StreamT],
@@ -650,7 +1026,6 @@ class APIClient:
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: bool,
         cast_to: Type[ResponseT],
         stream_cls: Type[StreamT],
@@ -661,48 +1036,52 @@ class APIClient:
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: bool,
         cast_to: Type[ResponseT],
         stream_cls: Type[StreamT],
     ) -> Union[ResponseT, StreamT]:
-        request = self._build_request(options)
-        try:
-            res = self._client.send(request, auth=self.custom_auth, stream=stream)
-            res.raise_for_status()
-        except httpx.HTTPStatusError as err:  # 4xx and 5xx errors
-            # If the response is streamed then we need to explicitly read the response
-            # to completion before attempting to access the response text.
-
-            if retry_count < self.max_retries and self._should_retry(err.response):
-                self._request(
-                    options=options,
-                    stream=stream,
-                    cast_to=cast_to,
-                    stream_cls=stream_cls,
-                    retry_count=retry_count + 1,
-                )
-            err.response.read()
-            raise self._make_status_error_from_response(request, err.response) from None
-        except httpx.TimeoutException as err:
-            raise APITimeoutError(request=request) from err
-        except Exception as err:
-            if retry_count < self.max_retries:
-                self._request(
-                    options=options,
-                    stream=stream,
-                    cast_to=cast_to,
-                    stream_cls=stream_cls,
-                    retry_count=retry_count + 1,
+        started_at = time.monotonic()
+        retry_count = 0
+        while True:
+            estimated_tokens = self._acquire_rate_limit(options.json_body)
+            request = self._build_request(options)
+            try:
+                res = self._client.send(request, auth=self.custom_auth, stream=stream)
+                res.raise_for_status()
+            except httpx.HTTPStatusError as err:  # 4xx and 5xx errors
+                # If the response is streamed then we need to explicitly read the
+                # response to completion before attempting to access the response
+                # text.
+                err.response.read()
+                # Every attempt takes from the token budget; one the API
+                # answered with an error gives its tokens back.
+                self._refund_rate_limit(estimated_tokens)
+                delay = self._retry_delay(
+                    retry_count, started_at, options, err.response
                 )
-            raise APIConnectionError(request=request) from err
+                if delay is None:
+                    raise self._make_status_error_from_response(
+                        request, err.response
+                    ) from None
+            except Exception as err:
+                delay = self._retry_delay(retry_count, started_at, options, None, err)
+                if delay is None:
+                    if isinstance(err, httpx.TimeoutException):
+                        raise APITimeoutError(request=request) from err
+                    raise APIConnectionError(request=request) from err
+            else:
+                break
+            time.sleep(delay)
+            retry_count += 1
 
         self.response_headers = res.headers
         if stream or res.headers["content-type"] == "text/event-stream":
             if stream_cls is None:
                 raise MissingStreamClassError()
             stream_response = stream_cls(
-                response=res, cast_to=self._extract_stream_chunk_type(stream_cls)
+                response=res,
+                cast_to=self._extract_stream_chunk_type(stream_cls),
+                response_model_mode=self.response_model_mode,
             )
             return stream_response
 
@@ -712,12 +1091,14 @@ class APIClient:
         response = (
             cast(
                 ResponseT,
-                cast_to(**res.json()),
+                build_model(cast_to, json_loads(res.content), self.response_model_mode),
             )
             if not isinstance(cast_to, httpx.Response)
             else cast(ResponseT, res)
         )
         response._headers = res.headers  # type: ignore
+        store_response(self, options.cache_key, res)
+        self._reconcile_rate_limit(estimated_tokens, getattr(response, "usage", None))
         return response
 
     def _extract_stream_chunk_type(self, stream_cls: Type) -> type:
@@ -756,7 +1137,7 @@ class AsyncHttpxClientWrapper(httpx.AsyncClient):
             pass
 
 
-class AsyncAPIClient:
+class AsyncAPIClient(ForkSafe):
     _client: httpx.AsyncClient
     _default_stream_cls: Union[type[AsyncStream[Any]], None] = None
     max_retries: int = 1
@@ -807,6 +1188,16 @@ class AsyncAPIClient:
         aws_bedrock_model: Optional[str] = None,
         fireworks_account_id: Optional[str] = None,
         calculate_audio_duration: Optional[bool] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_model_mode: Optional[str] = None,
+        connection_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        keepalive_expiry: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
         **kwargs,
     ) -> None:
         self.base_url = set_base_url(base_url, api_key)
@@ -851,6 +1242,17 @@ class AsyncAPIClient:
         self.aws_bedrock_model = aws_bedrock_model
         self.fireworks_account_id = fireworks_account_id
         self.calculate_audio_duration = calculate_audio_duration
+        self.retry_policy = retry_policy or RetryPolicy(max_retries=self.max_retries)
+        self.rate_limiter = rate_limiter
+        self.response_model_mode = response_model_mode or "strict"
+        self.connection_limits = connection_limits
+        self.http2 = http2
+        self.keepalive_expiry = keepalive_expiry
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
+        self.embedding_cache = embedding_cache
+        self.hedging_policy = hedging_policy
+        _check_response_model_mode(self.response_model_mode)
         self.kwargs = kwargs
 
         self.custom_headers = createHeaders(
@@ -895,15 +1297,49 @@ class AsyncAPIClient:
         )
 
         self.allHeaders = self._build_headers(create_model_instance(Options))
-        self._client = http_client or AsyncHttpxClientWrapper(
+        self._header_block: Optional[HeaderBlock] = None
+        # One pool per client: it is also handed to the vendored OpenAI client.
+        self._owns_http_client = http_client is None
+        self._client = http_client or self._build_http_client()
+        self._register_after_fork()
+
+        self.response_headers: httpx.Headers | None = None
+
+    def _build_http_client(self) -> httpx.AsyncClient:
+        limits = build_limits(self.connection_limits, self.keepalive_expiry)
+        transport: Optional[AsyncCoalescingTransport] = None
+        if self.coalesce_requests:
+            # httpx only applies `limits` and `http2` to its default transport,
+            # so the wrapped one is configured here instead.
+            transport = AsyncCoalescingTransport(
+                httpx.AsyncHTTPTransport(limits=limits, http2=bool(self.http2))
+            )
+        return AsyncHttpxClientWrapper(
             base_url=self.base_url,
             headers={
                 "Accept": "application/json",
             },
-            limits=DEFAULT_CONNECTION_LIMITS,
+            limits=limits,
+            http2=bool(self.http2),
+            transport=transport,
+            follow_redirects=True,
         )
 
-        self.response_headers: httpx.Headers | None = None
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # A fresh pool in a forked child; see `fork_safety`.
+        if not self._owns_http_client:
+            return {}
+        inherited = self._client
+        keep_inherited(inherited)
+        self._use_http_client(self._build_http_client())
+        return {id(inherited): self._client}
+
+    def _rebind_after_fork(self, replaced: Dict[int, Any]) -> None:
+        if id(self._client) in replaced:
+            self._use_http_client(replaced[id(self._client)])
+
+    def _use_http_client(self, http_client: httpx.AsyncClient) -> None:
+        self._client = http_client
 
     def _serialize_header_values(
         self, headers: Optional[Mapping[str, Any]]
@@ -933,6 +1369,7 @@ class AsyncAPIClient:
         stream_cls: type[AsyncStreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> ResponseT:
         ...
 
@@ -948,6 +1385,7 @@ class AsyncAPIClient:
         stream_cls: type[AsyncStreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> AsyncStreamT:
         ...
 
@@ -963,6 +1401,7 @@ class AsyncAPIClient:
         stream_cls: type[AsyncStreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> Union[ResponseT, AsyncStreamT]:
         ...
 
@@ -977,6 +1416,7 @@ class AsyncAPIClient:
         stream_cls: type[AsyncStreamT],
         params: Mapping[str, str],
         headers: Mapping[str, str],
+        cache_key: Optional[str] = None,
     ) -> Union[ResponseT, AsyncStreamT]:
         if path.endswith("/generate"):
             opts = await self._construct_generate_options(
@@ -998,6 +1438,7 @@ class AsyncAPIClient:
                 params=params,
                 headers=headers,
             )
+        opts.cache_key = cache_key
 
         res = await self._request(
             options=opts,
@@ -1230,8 +1671,8 @@ class AsyncAPIClient:
         opts.url = url
         json_body = body
         opts.files = files
-        opts.json_body = remove_empty_values(json_body)
-        opts.headers = remove_empty_values(headers)
+        opts.json_body = prune_empty_values(json_body)
+        opts.headers = prune_empty_values(headers)
         return opts
 
     async def _construct(
@@ -1250,17 +1691,15 @@ class AsyncAPIClient:
         opts.url = url
         opts.files = files
         if method != "get" or method != "delete":
-            opts.json_body = remove_empty_values(body)
-        opts.headers = remove_empty_values(headers)
+            opts.json_body = prune_empty_values(body)
+        opts.headers = prune_empty_values(headers)
         return opts
 
     @property
     def _default_headers(self) -> Mapping[str, str]:
         return {
             f"{PORTKEY_HEADER_PREFIX}api-key": self.api_key,
-            f"{PORTKEY_HEADER_PREFIX}package-version": f"portkey-{VERSION}",
-            f"{PORTKEY_HEADER_PREFIX}runtime": platform.python_implementation(),
-            f"{PORTKEY_HEADER_PREFIX}runtime-version": platform.python_version(),
+            **RUNTIME_HEADERS,
         }
 
     def _build_headers(self, options: Options) -> Dict[str, Any]:
@@ -1270,6 +1709,20 @@ class AsyncAPIClient:
         )
         return headers_dict
 
+    def _request_headers(
+        self, options: Options, json_content: bool = False
+    ) -> httpx.Headers:
+        """Headers for one request: the client's `HeaderBlock` plus the option
+        headers. The block is recompiled only after `custom_headers` or
+        `api_key` is replaced, e.g. on a copy made with `with_options`.
+
+        The result may be shared between requests and must not be modified.
+        """
+        block = self._header_block
+        if block is None or not block.is_current(self.api_key, self.custom_headers):
+            block = self._header_block = HeaderBlock(self.api_key, self.custom_headers)
+        return block.build(options.headers, json_content)
+
     def _merge_mappings(
         self,
         *args,
@@ -1285,12 +1738,47 @@ class AsyncAPIClient:
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection counts and limits of the pool shared by this client and
+        its vendored OpenAI client."""
+        return pool_stats(self._client)
+
+    @property
+    def _hedging_client(self) -> AsyncAPIClient:
+        """The client hedged requests are duplicated on."""
+        return self
+
+    async def warmup(
+        self,
+        n_connections: int = DEFAULT_WARMUP_CONNECTIONS,
+        *,
+        timeout: float = DEFAULT_WARMUP_TIMEOUT,
+    ) -> List[Dict[str, Any]]:
+        """Async counterpart of `APIClient.warmup`, opening the connections
+        from the running event loop."""
+        return await awarm_connections(
+            self._client, self._warmup_urls(), n_connections, timeout
+        )
+
+    def _warmup_urls(self) -> List[Union[str, httpx.URL]]:
+        return [self.base_url]
+
+    def coalescing_stats(self) -> Optional[Dict[str, int]]:
+        """Requests sent upstream and requests that joined an identical one in
+        flight, or None when the pool does not coalesce requests."""
+        transport = getattr(self._client, "_transport", None)
+        if isinstance(transport, (CoalescingTransport, AsyncCoalescingTransport)):
+            return transport.stats()
+        return None
+
     async def close(self) -> None:
         """Close the underlying HTTPX client.
 
-        The client will *not* be usable after this.
+        The client will *not* be usable after this. An HTTPX client passed in
+        as `http_client`, or shared with the client this one was copied from,
+        is left open for its owner to close.
         """
-        if hasattr(self, "_client"):
+        if hasattr(self, "_client") and self._owns_http_client:
             await self._client.aclose()
 
     async def __aenter__(self: Any) -> Any:
@@ -1305,42 +1793,72 @@ class AsyncAPIClient:
         await self.close()
 
     async def _build_request(self, options: Options) -> httpx.Request:
-        headers = self._build_headers(options)
         params = options.params
+        content = None
         json_body = options.json_body
+        if json_body is not None:
+            # Encoded once, straight to bytes, instead of through httpx's `json=`.
+            content = json_dumps(json_body)
+            json_body = None
+        headers = self._request_headers(options, json_content=content is not None)
         request = self._client.build_request(
             method=options.method,
             url=options.url,
             headers=headers,
             params=params,
+            content=content,
             json=json_body,
             timeout=options.timeout,
         )
         return request
 
+    @property
+    def _rate_limit_key(self) -> Optional[str]:
+        return self.virtual_key or self.provider
+
+    async def _acquire_rate_limit(self, body: Optional[Mapping[str, Any]]) -> int:
+        """Wait for the rate limiter, if any, and return the estimated tokens."""
+        if self.rate_limiter is None:
+            return 0
+        tokens = self.rate_limiter.estimate_tokens(body)
+        await self.rate_limiter.aacquire(self._rate_limit_key, tokens)
+        return tokens
+
+    def _reconcile_rate_limit(self, estimated_tokens: int, usage: Any) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.reconcile(self._rate_limit_key, estimated_tokens, usage)
+
+    def _refund_rate_limit(self, estimated_tokens: int) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.refund(self._rate_limit_key, estimated_tokens)
+
     def _should_retry(self, response: httpx.Response) -> bool:
-        # Retry Conditions
-        retry_status_code = response.status_code
-        retry_trace_id = response.headers.get("x-portkey-trace-id")
-        retry_request_id = response.headers.get("x-portkey-request-id")
-        retry_gateway_exception = response.headers.get("x-portkey-gateway-exception")
-
-        if (
-            retry_status_code < 500
-            or retry_trace_id
-            or retry_request_id
-            or retry_gateway_exception
-        ):
-            return False
-
-        return True
+        return self.retry_policy.should_retry_response(response)
+
+    def _retry_delay(
+        self,
+        retry_count: int,
+        started_at: float,
+        options: Options,
+        response: Optional[httpx.Response],
+        exc: Optional[Exception] = None,
+    ) -> Optional[float]:
+        if response is not None and not self._should_retry(response):
+            return None
+        if exc is not None and not self.retry_policy.should_retry_exception(exc):
+            return None
+        return self.retry_policy.next_delay(
+            retry_count,
+            started_at,
+            response=response,
+            max_retries=options.max_retries,
+        )
 
     @overload
     async def _request(
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: Literal[False],
         cast_to: Type[ResponseT],
         stream_cls: Type[AsyncStreamT],
@@ -1352,7 +1870,6 @@ class AsyncAPIClient:
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: Literal[True],
         cast_to: Type[ResponseT],
         stream_cls: Type[AsyncStreamT],
@@ -1364,7 +1881,6 @@ class AsyncAPIClient:
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: bool,
         cast_to: Type[ResponseT],
         stream_cls: Type[AsyncStreamT],
@@ -1375,47 +1891,54 @@ class AsyncAPIClient:
         self,
         *,
         options: Options,
-        retry_count: int = 0,
         stream: bool,
         cast_to: Type[ResponseT],
         stream_cls: Type[AsyncStreamT],
     ) -> Union[ResponseT, AsyncStreamT]:
-        request = await self._build_request(options)
-        try:
-            res = await self._client.send(request, auth=self.custom_auth, stream=stream)
-            res.raise_for_status()
-        except httpx.HTTPStatusError as err:  # 4xx and 5xx errors
-            # If the response is streamed then we need to explicitly read the response
-            # to completion before attempting to access the response text.
-            if retry_count < self.max_retries and self._should_retry(err.response):
-                await self._request(
-                    options=options,
-                    stream=stream,
-                    cast_to=cast_to,
-                    stream_cls=stream_cls,
-                    retry_count=retry_count + 1,
+        started_at = time.monotonic()
+        retry_count = 0
+        while True:
+            estimated_tokens = await self._acquire_rate_limit(options.json_body)
+            request = await self._build_request(options)
+            try:
+                res = await self._client.send(
+                    request, auth=self.custom_auth, stream=stream
                 )
-            await err.response.aread()
-            raise self._make_status_error_from_response(request, err.response) from None
-        except httpx.TimeoutException as err:
-            raise APITimeoutError(request=request) from err
-        except Exception as err:
-            if retry_count < self.max_retries:
-                await self._request(
-                    options=options,
-                    stream=stream,
-                    cast_to=cast_to,
-                    stream_cls=stream_cls,
-                    retry_count=retry_count + 1,
+                res.raise_for_status()
+            except httpx.HTTPStatusError as err:  # 4xx and 5xx errors
+                # If the response is streamed then we need to explicitly read the
+                # response to completion before attempting to access the response
+                # text.
+                await err.response.aread()
+                # Every attempt takes from the token budget; one the API
+                # answered with an error gives its tokens back.
+                self._refund_rate_limit(estimated_tokens)
+                delay = self._retry_delay(
+                    retry_count, started_at, options, err.response
                 )
-            raise APIConnectionError(request=request) from err
+                if delay is None:
+                    raise self._make_status_error_from_response(
+                        request, err.response
+                    ) from None
+            except Exception as err:
+                delay = self._retry_delay(retry_count, started_at, options, None, err)
+                if delay is None:
+                    if isinstance(err, httpx.TimeoutException):
+                        raise APITimeoutError(request=request) from err
+                    raise APIConnectionError(request=request) from err
+            else:
+                break
+            await asyncio.sleep(delay)
+            retry_count += 1
 
         self.response_headers = res.headers
         if stream or res.headers["content-type"] == "text/event-stream":
             if stream_cls is None:
                 raise MissingStreamClassError()
             stream_response = stream_cls(
-                response=res, cast_to=self._extract_stream_chunk_type(stream_cls)
+                response=res,
+                cast_to=self._extract_stream_chunk_type(stream_cls),
+                response_model_mode=self.response_model_mode,
             )
             return stream_response
 
@@ -1425,12 +1948,14 @@ class AsyncAPIClient:
         response = (
             cast(
                 ResponseT,
-                cast_to(**res.json()),
+                build_model(cast_to, json_loads(res.content), self.response_model_mode),
             )
             if not isinstance(cast_to, httpx.Response)
             else cast(ResponseT, res)
         )
         response._headers = res.headers  # type: ignore
+        store_response(self, options.cache_key, res)
+        self._reconcile_rate_limit(estimated_tokens, getattr(response, "usage", None))
         return response
 
     def _extract_stream_chunk_type(self, stream_cls: Type) -> type:
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Type, Union
+
+from portkey_ai.utils.json_utils import json_dumps, json_loads
+from .types.chat_complete_type import ChatCompletions
+from .types.complete_type import TextCompletion
+from .types.embeddings_type import CreateEmbeddingResponse
+from .utils import build_model
+
+__all__ = [
+    "BatchJobError",
+    "BatchResult",
+    "BatchPollBackoff",
+    "TERMINAL_BATCH_STATUSES",
+    "write_batch_shards",
+    "parse_batch_output",
+]
+
+TERMINAL_BATCH_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Response models for the endpoints batches are most often run against;
+# other endpoints' bodies are returned as dicts.
+BATCH_RESPONSE_MODELS: Dict[str, Type[Any]] = {
+    "/v1/chat/completions": ChatCompletions,
+    "/v1/completions": TextCompletion,
+    "/v1/embeddings": CreateEmbeddingResponse,
+}
+
+
+class BatchJobError(Exception):
+    """Raised by `batches.run` when one of its batches fails as a whole, e.g.
+    because its input file did not validate."""
+
+    def __init__(self, message: str, batch: Any) -> None:
+        super().__init__(message)
+        self.batch = batch
+
+
+class BatchResult:
+    """Outcome of one request in a batch job, keyed by its `custom_id`.
+
+    `response` is the response body, typed for known endpoints, and `error`
+    is set instead when the request failed.
+    """
+
+    __slots__ = ("custom_id", "batch_id", "status_code", "response", "error")
+
+    def __init__(
+        self,
+        custom_id: str,
+        batch_id: str,
+        status_code: Optional[int] = None,
+        response: Any = None,
+        error: Any = None,
+    ) -> None:
+        self.custom_id = custom_id
+        self.batch_id = batch_id
+        self.status_code = status_code
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and (self.status_code or 200) < 400
+
+    def __repr__(self) -> str:
+        outcome = "ok" if self.ok else f"error={self.error!r}"
+        return f"BatchResult(custom_id={self.custom_id!r}, {outcome})"
+
+
+class BatchPollBackoff:
+    """Poll intervals that grow by `factor` up to `maximum` while a job makes
+    no progress, and drop back to `initial` when it does."""
+
+    def __init__(self, initial: float, maximum: float, factor: float = 1.5) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.interval = initial
+        self._progress: Any = None
+
+    def next_interval(self, progress: Any) -> float:
+        if progress != self._progress:
+            self._progress = progress
+            self.interval = self.initial
+        else:
+            self.interval = min(self.interval * self.factor, self.maximum)
+        return self.interval
+
+
+def _batch_line(request: Mapping[str, Any], index: int, endpoint: str) -> bytes:
+    if "body" in request and "custom_id" in request:
+        line = {"method": "POST", "url": endpoint, **request}
+    else:
+        line = {
+            "custom_id": str(index),
+            "method": "POST",
+            "url": endpoint,
+            "body": request,
+        }
+    return json_dumps(line) + b"\n"
+
+
+def write_batch_shards(
+    requests: Iterable[Mapping[str, Any]],
+    directory: str,
+    *,
+    endpoint: str,
+    max_requests: int,
+    max_bytes: int,
+) -> Iterator[str]:
+    """Encode `requests` as batch input JSONL files under `directory`, each
+    within `max_requests` lines and `max_bytes` bytes, yielding each path once
+    it is complete.
+
+    Requests are written out as they are consumed, so only one line is held
+    in memory. Each request is either a full batch line with a `custom_id`
+    and `body`, or a bare request body, which gets its index as `custom_id`.
+    A request whose line alone exceeds `max_bytes` raises `ValueError`.
+    """
+    out = None
+    lines = size = shard = 0
+    try:
+        for index, request in enumerate(requests):
+            line = _batch_line(request, index, endpoint)
+            if out is not None and (
+                lines == max_requests or size + len(line) > max_bytes
+            ):
+                out.close()
+                yield out.name
+                out = None
+            if len(line) > max_bytes:
+                raise ValueError(
+                    f"Request {index} is {len(line)} bytes as a batch line, "
+                    f"over the {max_bytes}-byte batch limit"
+                )
+            if out is None:
+                out = open(os.path.join(directory, f"batch-{shard}.jsonl"), "wb")
+                lines = size = 0
+                shard += 1
+            out.write(line)
+            lines += 1
+            size += len(line)
+        if out is not None:
+            out.close()
+            yield out.name
+            out = None
+    finally:
+        if out is not None:
+            out.close()
+
+
+def parse_batch_output(
+    lines: Iterable[Union[str, bytes]],
+    batch_id: str,
+    endpoint: str,
+    mode: str = "strict",
+) -> Iterator[BatchResult]:
+    """Parse a batch output or error file line by line into `BatchResult`s."""
+    model_class = BATCH_RESPONSE_MODELS.get(endpoint)
+    for line in lines:
+        if not line.strip():
+            continue
+        data = json_loads(line)
+        response = data.get("response") or {}
+        body = response.get("body")
+        status_code = response.get("status_code")
+        if (
+            model_class is not None
+            and isinstance(body, dict)
+            and (status_code or 200) < 400
+        ):
+            body = build_model(model_class, body, mode)
+        yield BatchResult(
+            custom_id=data.get("custom_id"),
+            batch_id=batch_id,
+            status_code=status_code,
+            response=body,
+            error=data.get("error"),
+        )
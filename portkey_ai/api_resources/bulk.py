@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+__all__ = ["BulkResult", "run_many", "arun_many"]
+
+T = TypeVar("T")
+
+DEFAULT_BULK_CONCURRENCY = 8
+
+
+class BulkResult(Generic[T]):
+    """Outcome of one request in a bulk call: either `response` or `error`."""
+
+    __slots__ = ("index", "request", "response", "error")
+
+    def __init__(
+        self,
+        index: int,
+        request: Mapping[str, Any],
+        response: Optional[T] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.index = index
+        self.request = request
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else "ok"
+        return f"BulkResult(index={self.index}, {outcome})"
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least 1")
+
+
+def run_many(
+    fn: Callable[..., T],
+    requests: Iterable[Mapping[str, Any]],
+    *,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ordered: bool = True,
+) -> Iterator[BulkResult[T]]:
+    """Call `fn(**request)` for every request on a bounded thread pool.
+
+    At most `concurrency` requests are in flight, and the input iterable is
+    consumed lazily, so arbitrarily long inputs are fine. With `ordered=True`
+    results are yielded in input order (finished results waiting on an earlier
+    one count towards `concurrency`), otherwise in completion order.
+    """
+    _check_concurrency(concurrency)
+    source = enumerate(requests)
+    exhausted = False
+    pending: Dict[Future, Tuple[int, Mapping[str, Any]]] = {}
+    done_buffer: Dict[int, BulkResult[T]] = {}
+    next_index = 0
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        while True:
+            while not exhausted and len(pending) + len(done_buffer) < concurrency:
+                try:
+                    index, request = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending[executor.submit(fn, **request)] = (index, request)
+
+            if not pending:
+                break
+
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index, request = pending.pop(future)
+                error = future.exception()
+                result: BulkResult[T] = BulkResult(
+                    index,
+                    request,
+                    response=None if error else future.result(),
+                    error=error,
+                )
+                if not ordered:
+                    yield result
+                else:
+                    done_buffer[index] = result
+
+            while next_index in done_buffer:
+                yield done_buffer.pop(next_index)
+                next_index += 1
+    finally:
+        # Requests that have not started yet are dropped if the caller stops
+        # iterating early; the ones already running are left to finish.
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def arun_many(
+    fn: Callable[..., Awaitable[T]],
+    requests: Union[Iterable[Mapping[str, Any]], AsyncIterator[Mapping[str, Any]]],
+    *,
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ordered: bool = True,
+) -> AsyncIterator[BulkResult[T]]:
+    """Async counterpart of `run_many`, running up to `concurrency` coroutines
+    on the current event loop. `requests` may be a sync or async iterable.
+    """
+    _check_concurrency(concurrency)
+    if hasattr(requests, "__anext__"):
+        source: Any = requests
+    else:
+        source = _to_async_iterator(requests)  # type: ignore[arg-type]
+    index = 0
+    exhausted = False
+    pending: Dict[asyncio.Task, Tuple[int, Mapping[str, Any]]] = {}
+    done_buffer: Dict[int, BulkResult[T]] = {}
+    next_index = 0
+
+    try:
+        while True:
+            while not exhausted and len(pending) + len(done_buffer) < concurrency:
+                try:
+                    request = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(fn(**request))
+                pending[task] = (index, request)
+                index += 1
+
+            if not pending:
+                break
+
+            finished: Set[asyncio.Task]
+            finished, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                task_index, request = pending.pop(task)
+                error = task.exception()
+                result: BulkResult[T] = BulkResult(
+                    task_index,
+                    request,
+                    response=None if error else task.result(),
+                    error=error,
+                )
+                if not ordered:
+                    yield result
+                else:
+                    done_buffer[task_index] = result
+
+            while next_index in done_buffer:
+                yield done_buffer.pop(next_index)
+                next_index += 1
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _to_async_iterator(
+    iterable: Iterable[Mapping[str, Any]]
+) -> AsyncIterator[Mapping[str, Any]]:
+    for item in iterable:
+        yield item
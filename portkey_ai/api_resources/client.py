@@ -1,8 +1,18 @@
 from __future__ import annotations
+from functools import cached_property
 from typing import Any, Dict, List, Mapping, Optional, Union
 import httpx
 from portkey_ai.api_resources import apis
-from portkey_ai.api_resources.base_client import APIClient, AsyncAPIClient
+from portkey_ai.api_resources.base_client import (
+    APIClient,
+    AsyncAPIClient,
+    derive_client,
+)
+from portkey_ai.api_resources.retry import RetryPolicy
+from portkey_ai.api_resources.rate_limiter import RateLimiter
+from portkey_ai.api_resources.embedding_cache import EmbeddingCache
+from portkey_ai.api_resources.hedging import HedgingPolicy
+from portkey_ai.api_resources.response_cache import ResponseCache
 from .._vendor.openai import OpenAI, AsyncOpenAI
 from portkey_ai.api_resources.global_constants import (
     OPEN_AI_API_KEY,
@@ -10,56 +20,29 @@ from portkey_ai.api_resources.global_constants import (
 
 
 class Portkey(APIClient):
-    completions: apis.Completion
-    chat: apis.ChatCompletion
-    generations: apis.Generations
-    prompts: apis.Prompts
-    embeddings: apis.Embeddings
-    feedback: apis.Feedback
-    images: apis.Images
-    files: apis.MainFiles
-    models: apis.Models
-    moderations: apis.Moderations
-    audio: apis.Audio
-    batches: apis.Batches
-    fine_tuning: apis.FineTuning
-    vector_stores: apis.VectorStores
-    responses: apis.Responses
-    webhooks: apis.Webhooks
-    evals: apis.Evals
-    containers: apis.Containers
-    admin: apis.Admin
-    uploads: apis.Uploads
-    configs: apis.Configs
-    api_keys: apis.ApiKeys
-    virtual_keys: apis.VirtualKeys
-    logs: apis.Logs
-    labels: apis.Labels
-    collections: apis.Collections
-    integrations: apis.Integrations
-    providers: apis.Providers
-    guardrails: apis.Guardrails
-    realtime: apis.MainRealtime
-    conversations: apis.Conversations
-    videos: apis.Videos
-    skills: apis.Skills
-    analytics: apis.Analytics
-    mcp_servers: apis.McpServers
-    mcp_integrations: apis.McpIntegrations
-
-    class beta:
-        assistants: apis.Assistants
-        threads: apis.Threads
-        chat: apis.BetaChat
-        realtime: apis.BetaRealtime
-        chatkit: apis.ChatKit
-
+    class Beta:
         def __init__(self, client: Portkey) -> None:
-            self.assistants = apis.Assistants(client)
-            self.threads = apis.Threads(client)
-            self.chat = apis.BetaChat(client)
-            self.realtime = apis.BetaRealtime(client)
-            self.chatkit = apis.ChatKit(client)
+            self._client = client
+
+        @cached_property
+        def assistants(self) -> apis.Assistants:
+            return apis.Assistants(self._client)
+
+        @cached_property
+        def threads(self) -> apis.Threads:
+            return apis.Threads(self._client)
+
+        @cached_property
+        def chat(self) -> apis.BetaChat:
+            return apis.BetaChat(self._client)
+
+        @cached_property
+        def realtime(self) -> apis.BetaRealtime:
+            return apis.BetaRealtime(self._client)
+
+        @cached_property
+        def chatkit(self) -> apis.ChatKit:
+            return apis.ChatKit(self._client)
 
     def __init__(
         self,
@@ -107,6 +90,15 @@ class Portkey(APIClient):
         aws_bedrock_model: Optional[str] = None,
         fireworks_account_id: Optional[str] = None,
         calculate_audio_duration: Optional[bool] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_model_mode: Optional[str] = None,
+        connection_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        keepalive_expiry: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -153,6 +145,15 @@ class Portkey(APIClient):
             aws_bedrock_model=aws_bedrock_model,
             fireworks_account_id=fireworks_account_id,
             calculate_audio_duration=calculate_audio_duration,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_model_mode=response_model_mode,
+            connection_limits=connection_limits,
+            http2=http2,
+            keepalive_expiry=keepalive_expiry,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+            embedding_cache=embedding_cache,
             **kwargs,
         )
 
@@ -160,50 +161,12 @@ class Portkey(APIClient):
             api_key=OPEN_AI_API_KEY,
             base_url=self.base_url,
             default_headers=self.allHeaders,
-            http_client=http_client,
-            max_retries=1,
+            http_client=self._client,
+            max_retries=self.retry_policy.max_retries,
             websocket_base_url=self.websocket_base_url,
             webhook_secret=self.webhook_secret,
         )
 
-        self.completions = apis.Completion(self)
-        self.chat = apis.ChatCompletion(self)
-        self.generations = apis.Generations(self)
-        self.prompts = apis.Prompts(self)
-        self.embeddings = apis.Embeddings(self)
-        self.feedback = apis.Feedback(self)
-        self.images = apis.Images(self)
-        self.files = apis.MainFiles(self)
-        self.models = apis.Models(self)
-        self.moderations = apis.Moderations(self)
-        self.audio = apis.Audio(self)
-        self.batches = apis.Batches(self)
-        self.fine_tuning = apis.FineTuning(self)
-        self.vector_stores = apis.VectorStores(self)
-        self.responses = apis.Responses(self)
-        self.webhooks = apis.Webhooks(self)
-        self.evals = apis.Evals(self)
-        self.containers = apis.Containers(self)
-        self.admin = apis.Admin(self)
-        self.uploads = apis.Uploads(self)
-        self.configs = apis.Configs(self)
-        self.api_keys = apis.ApiKeys(self)
-        self.virtual_keys = apis.VirtualKeys(self)
-        self.logs = apis.Logs(self)
-        self.labels = apis.Labels(self)
-        self.collections = apis.Collections(self)
-        self.integrations = apis.Integrations(self)
-        self.providers = apis.Providers(self)
-        self.guardrails = apis.Guardrails(self)
-        self.realtime = apis.MainRealtime(self)
-        self.conversations = apis.Conversations(self)
-        self.videos = apis.Videos(self)
-        self.skills = apis.Skills(self)
-        self.analytics = apis.Analytics(self)
-        self.mcp_servers = apis.McpServers(self)
-        self.mcp_integrations = apis.McpIntegrations(self)
-        self.beta = self.beta(self)  # type: ignore
-
         if self.instrumentation:
             try:
                 from portkey_ai.api_resources.instrumentation import (
@@ -217,6 +180,161 @@ class Portkey(APIClient):
                 )
             initialize_instrumentation(api_key=self.api_key, base_url=self.base_url)
 
+    @cached_property
+    def completions(self) -> apis.Completion:
+        return apis.Completion(self)
+
+    @cached_property
+    def chat(self) -> apis.ChatCompletion:
+        return apis.ChatCompletion(self)
+
+    @cached_property
+    def generations(self) -> apis.Generations:
+        return apis.Generations(self)
+
+    @cached_property
+    def prompts(self) -> apis.Prompts:
+        return apis.Prompts(self)
+
+    @cached_property
+    def embeddings(self) -> apis.Embeddings:
+        return apis.Embeddings(self)
+
+    @cached_property
+    def feedback(self) -> apis.Feedback:
+        return apis.Feedback(self)
+
+    @cached_property
+    def images(self) -> apis.Images:
+        return apis.Images(self)
+
+    @cached_property
+    def files(self) -> apis.MainFiles:
+        return apis.MainFiles(self)
+
+    @cached_property
+    def models(self) -> apis.Models:
+        return apis.Models(self)
+
+    @cached_property
+    def moderations(self) -> apis.Moderations:
+        return apis.Moderations(self)
+
+    @cached_property
+    def audio(self) -> apis.Audio:
+        return apis.Audio(self)
+
+    @cached_property
+    def batches(self) -> apis.Batches:
+        return apis.Batches(self)
+
+    @cached_property
+    def fine_tuning(self) -> apis.FineTuning:
+        return apis.FineTuning(self)
+
+    @cached_property
+    def vector_stores(self) -> apis.VectorStores:
+        return apis.VectorStores(self)
+
+    @cached_property
+    def responses(self) -> apis.Responses:
+        return apis.Responses(self)
+
+    @cached_property
+    def webhooks(self) -> apis.Webhooks:
+        return apis.Webhooks(self)
+
+    @cached_property
+    def evals(self) -> apis.Evals:
+        return apis.Evals(self)
+
+    @cached_property
+    def containers(self) -> apis.Containers:
+        return apis.Containers(self)
+
+    @cached_property
+    def admin(self) -> apis.Admin:
+        return apis.Admin(self)
+
+    @cached_property
+    def uploads(self) -> apis.Uploads:
+        return apis.Uploads(self)
+
+    @cached_property
+    def configs(self) -> apis.Configs:
+        return apis.Configs(self)
+
+    @cached_property
+    def api_keys(self) -> apis.ApiKeys:
+        return apis.ApiKeys(self)
+
+    @cached_property
+    def virtual_keys(self) -> apis.VirtualKeys:
+        return apis.VirtualKeys(self)
+
+    @cached_property
+    def logs(self) -> apis.Logs:
+        return apis.Logs(self)
+
+    @cached_property
+    def labels(self) -> apis.Labels:
+        return apis.Labels(self)
+
+    @cached_property
+    def collections(self) -> apis.Collections:
+        return apis.Collections(self)
+
+    @cached_property
+    def integrations(self) -> apis.Integrations:
+        return apis.Integrations(self)
+
+    @cached_property
+    def providers(self) -> apis.Providers:
+        return apis.Providers(self)
+
+    @cached_property
+    def guardrails(self) -> apis.Guardrails:
+        return apis.Guardrails(self)
+
+    @cached_property
+    def realtime(self) -> apis.MainRealtime:
+        return apis.MainRealtime(self)
+
+    @cached_property
+    def conversations(self) -> apis.Conversations:
+        return apis.Conversations(self)
+
+    @cached_property
+    def videos(self) -> apis.Videos:
+        return apis.Videos(self)
+
+    @cached_property
+    def skills(self) -> apis.Skills:
+        return apis.Skills(self)
+
+    @cached_property
+    def analytics(self) -> apis.Analytics:
+        return apis.Analytics(self)
+
+    @cached_property
+    def mcp_servers(self) -> apis.McpServers:
+        return apis.McpServers(self)
+
+    @cached_property
+    def mcp_integrations(self) -> apis.McpIntegrations:
+        return apis.McpIntegrations(self)
+
+    @cached_property
+    def beta(self) -> Portkey.Beta:
+        return self.Beta(self)
+
+    def _use_http_client(self, http_client: httpx.Client) -> None:
+        super()._use_http_client(http_client)
+        self.openai_client._client = http_client
+
+    def _warmup_urls(self) -> List[Union[str, httpx.URL]]:
+        return [self.base_url, self.openai_client.base_url]
+
     def copy(
         self,
         *,
@@ -263,8 +381,23 @@ class Portkey(APIClient):
         aws_bedrock_model: Optional[str] = None,
         fireworks_account_id: Optional[str] = None,
         calculate_audio_duration: Optional[bool] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_model_mode: Optional[str] = None,
+        connection_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        keepalive_expiry: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
         **kwargs,
     ) -> Portkey:
+        # Every named argument, as passed; falsy ones keep the current value.
+        options = dict(locals())
+        del options["self"], options["kwargs"]
+        derived = derive_client(self, options, kwargs)
+        if derived is not None:
+            return derived
         return self.__class__(
             api_key=api_key or self.api_key,
             base_url=base_url or self.base_url,
@@ -313,6 +446,15 @@ class Portkey(APIClient):
             fireworks_account_id=fireworks_account_id or self.fireworks_account_id,
             calculate_audio_duration=calculate_audio_duration
             or self.calculate_audio_duration,
+            retry_policy=retry_policy or self.retry_policy,
+            rate_limiter=rate_limiter or self.rate_limiter,
+            response_model_mode=response_model_mode or self.response_model_mode,
+            connection_limits=connection_limits or self.connection_limits,
+            http2=http2 or self.http2,
+            keepalive_expiry=keepalive_expiry or self.keepalive_expiry,
+            response_cache=response_cache or self.response_cache,
+            coalesce_requests=coalesce_requests or self.coalesce_requests,
+            embedding_cache=embedding_cache or self.embedding_cache,
             **self.kwargs,
             **kwargs,
         )
@@ -356,56 +498,29 @@ class Portkey(APIClient):
 
 
 class AsyncPortkey(AsyncAPIClient):
-    completions: apis.AsyncCompletion
-    chat: apis.AsyncChatCompletion
-    generations: apis.AsyncGenerations
-    prompts: apis.AsyncPrompts
-    embeddings: apis.AsyncEmbeddings
-    feedback: apis.AsyncFeedback
-    images: apis.AsyncImages
-    files: apis.AsyncMainFiles
-    models: apis.AsyncModels
-    moderations: apis.AsyncModerations
-    audio: apis.AsyncAudio
-    batches: apis.AsyncBatches
-    fine_tuning: apis.AsyncFineTuning
-    vector_stores: apis.AsyncVectorStores
-    responses: apis.AsyncResponses
-    webhooks: apis.AsyncWebhooks
-    evals: apis.AsyncEvals
-    containers: apis.AsyncContainers
-    admin: apis.AsyncAdmin
-    uploads: apis.AsyncUploads
-    configs: apis.AsyncConfigs
-    api_keys: apis.AsyncApiKeys
-    virtual_keys: apis.AsyncVirtualKeys
-    logs: apis.AsyncLogs
-    labels: apis.AsyncLabels
-    collections: apis.AsyncCollections
-    integrations: apis.AsyncIntegrations
-    providers: apis.AsyncProviders
-    guardrails: apis.AsyncGuardrails
-    realtime: apis.AsyncMainRealtime
-    conversations: apis.AsyncConversations
-    videos: apis.AsyncVideos
-    skills: apis.AsyncSkills
-    analytics: apis.AsyncAnalytics
-    mcp_servers: apis.AsyncMcpServers
-    mcp_integrations: apis.AsyncMcpIntegrations
-
-    class beta:
-        assistants: apis.AsyncAssistants
-        threads: apis.AsyncThreads
-        chat: apis.AsyncBetaChat
-        realtime: apis.AsyncBetaRealtime
-        chatkit: apis.AsyncChatKit
-
+    class Beta:
         def __init__(self, client: AsyncPortkey) -> None:
-            self.assistants = apis.AsyncAssistants(client)
-            self.threads = apis.AsyncThreads(client)
-            self.chat = apis.AsyncBetaChat(client)
-            self.realtime = apis.AsyncBetaRealtime(client)
-            self.chatkit = apis.AsyncChatKit(client)
+            self._client = client
+
+        @cached_property
+        def assistants(self) -> apis.AsyncAssistants:
+            return apis.AsyncAssistants(self._client)
+
+        @cached_property
+        def threads(self) -> apis.AsyncThreads:
+            return apis.AsyncThreads(self._client)
+
+        @cached_property
+        def chat(self) -> apis.AsyncBetaChat:
+            return apis.AsyncBetaChat(self._client)
+
+        @cached_property
+        def realtime(self) -> apis.AsyncBetaRealtime:
+            return apis.AsyncBetaRealtime(self._client)
+
+        @cached_property
+        def chatkit(self) -> apis.AsyncChatKit:
+            return apis.AsyncChatKit(self._client)
 
     def __init__(
         self,
@@ -453,6 +568,16 @@ class AsyncPortkey(AsyncAPIClient):
         aws_bedrock_model: Optional[str] = None,
         fireworks_account_id: Optional[str] = None,
         calculate_audio_duration: Optional[bool] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_model_mode: Optional[str] = None,
+        connection_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        keepalive_expiry: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -499,6 +624,16 @@ class AsyncPortkey(AsyncAPIClient):
             aws_bedrock_model=aws_bedrock_model,
             fireworks_account_id=fireworks_account_id,
             calculate_audio_duration=calculate_audio_duration,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_model_mode=response_model_mode,
+            connection_limits=connection_limits,
+            http2=http2,
+            keepalive_expiry=keepalive_expiry,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+            embedding_cache=embedding_cache,
+            hedging_policy=hedging_policy,
             **kwargs,
         )
 
@@ -506,50 +641,12 @@ class AsyncPortkey(AsyncAPIClient):
             api_key=OPEN_AI_API_KEY,
             base_url=self.base_url,
             default_headers=self.allHeaders,
-            http_client=http_client,
-            max_retries=1,
+            http_client=self._client,
+            max_retries=self.retry_policy.max_retries,
             websocket_base_url=self.websocket_base_url,
             webhook_secret=self.webhook_secret,
         )
 
-        self.completions = apis.AsyncCompletion(self)
-        self.chat = apis.AsyncChatCompletion(self)
-        self.generations = apis.AsyncGenerations(self)
-        self.prompts = apis.AsyncPrompts(self)
-        self.embeddings = apis.AsyncEmbeddings(self)
-        self.feedback = apis.AsyncFeedback(self)
-        self.images = apis.AsyncImages(self)
-        self.files = apis.AsyncMainFiles(self)
-        self.models = apis.AsyncModels(self)
-        self.moderations = apis.AsyncModerations(self)
-        self.audio = apis.AsyncAudio(self)
-        self.batches = apis.AsyncBatches(self)
-        self.fine_tuning = apis.AsyncFineTuning(self)
-        self.vector_stores = apis.AsyncVectorStores(self)
-        self.responses = apis.AsyncResponses(self)
-        self.webhooks = apis.AsyncWebhooks(self)
-        self.evals = apis.AsyncEvals(self)
-        self.containers = apis.AsyncContainers(self)
-        self.admin = apis.AsyncAdmin(self)
-        self.uploads = apis.AsyncUploads(self)
-        self.configs = apis.AsyncConfigs(self)
-        self.api_keys = apis.AsyncApiKeys(self)
-        self.virtual_keys = apis.AsyncVirtualKeys(self)
-        self.logs = apis.AsyncLogs(self)
-        self.labels = apis.AsyncLabels(self)
-        self.collections = apis.AsyncCollections(self)
-        self.integrations = apis.AsyncIntegrations(self)
-        self.providers = apis.AsyncProviders(self)
-        self.guardrails = apis.AsyncGuardrails(self)
-        self.realtime = apis.AsyncMainRealtime(self)
-        self.conversations = apis.AsyncConversations(self)
-        self.videos = apis.AsyncVideos(self)
-        self.skills = apis.AsyncSkills(self)
-        self.analytics = apis.AsyncAnalytics(self)
-        self.mcp_servers = apis.AsyncMcpServers(self)
-        self.mcp_integrations = apis.AsyncMcpIntegrations(self)
-        self.beta = self.beta(self)  # type: ignore
-
         if self.instrumentation:
             try:
                 from portkey_ai.api_resources.instrumentation import (
@@ -563,6 +660,172 @@ class AsyncPortkey(AsyncAPIClient):
                 )
             initialize_instrumentation(api_key=self.api_key, base_url=self.base_url)
 
+    @cached_property
+    def completions(self) -> apis.AsyncCompletion:
+        return apis.AsyncCompletion(self)
+
+    @cached_property
+    def chat(self) -> apis.AsyncChatCompletion:
+        return apis.AsyncChatCompletion(self)
+
+    @cached_property
+    def generations(self) -> apis.AsyncGenerations:
+        return apis.AsyncGenerations(self)
+
+    @cached_property
+    def prompts(self) -> apis.AsyncPrompts:
+        return apis.AsyncPrompts(self)
+
+    @cached_property
+    def embeddings(self) -> apis.AsyncEmbeddings:
+        return apis.AsyncEmbeddings(self)
+
+    @cached_property
+    def feedback(self) -> apis.AsyncFeedback:
+        return apis.AsyncFeedback(self)
+
+    @cached_property
+    def images(self) -> apis.AsyncImages:
+        return apis.AsyncImages(self)
+
+    @cached_property
+    def files(self) -> apis.AsyncMainFiles:
+        return apis.AsyncMainFiles(self)
+
+    @cached_property
+    def models(self) -> apis.AsyncModels:
+        return apis.AsyncModels(self)
+
+    @cached_property
+    def moderations(self) -> apis.AsyncModerations:
+        return apis.AsyncModerations(self)
+
+    @cached_property
+    def audio(self) -> apis.AsyncAudio:
+        return apis.AsyncAudio(self)
+
+    @cached_property
+    def batches(self) -> apis.AsyncBatches:
+        return apis.AsyncBatches(self)
+
+    @cached_property
+    def fine_tuning(self) -> apis.AsyncFineTuning:
+        return apis.AsyncFineTuning(self)
+
+    @cached_property
+    def vector_stores(self) -> apis.AsyncVectorStores:
+        return apis.AsyncVectorStores(self)
+
+    @cached_property
+    def responses(self) -> apis.AsyncResponses:
+        return apis.AsyncResponses(self)
+
+    @cached_property
+    def webhooks(self) -> apis.AsyncWebhooks:
+        return apis.AsyncWebhooks(self)
+
+    @cached_property
+    def evals(self) -> apis.AsyncEvals:
+        return apis.AsyncEvals(self)
+
+    @cached_property
+    def containers(self) -> apis.AsyncContainers:
+        return apis.AsyncContainers(self)
+
+    @cached_property
+    def admin(self) -> apis.AsyncAdmin:
+        return apis.AsyncAdmin(self)
+
+    @cached_property
+    def uploads(self) -> apis.AsyncUploads:
+        return apis.AsyncUploads(self)
+
+    @cached_property
+    def configs(self) -> apis.AsyncConfigs:
+        return apis.AsyncConfigs(self)
+
+    @cached_property
+    def api_keys(self) -> apis.AsyncApiKeys:
+        return apis.AsyncApiKeys(self)
+
+    @cached_property
+    def virtual_keys(self) -> apis.AsyncVirtualKeys:
+        return apis.AsyncVirtualKeys(self)
+
+    @cached_property
+    def logs(self) -> apis.AsyncLogs:
+        return apis.AsyncLogs(self)
+
+    @cached_property
+    def labels(self) -> apis.AsyncLabels:
+        return apis.AsyncLabels(self)
+
+    @cached_property
+    def collections(self) -> apis.AsyncCollections:
+        return apis.AsyncCollections(self)
+
+    @cached_property
+    def integrations(self) -> apis.AsyncIntegrations:
+        return apis.AsyncIntegrations(self)
+
+    @cached_property
+    def providers(self) -> apis.AsyncProviders:
+        return apis.AsyncProviders(self)
+
+    @cached_property
+    def guardrails(self) -> apis.AsyncGuardrails:
+        return apis.AsyncGuardrails(self)
+
+    @cached_property
+    def realtime(self) -> apis.AsyncMainRealtime:
+        return apis.AsyncMainRealtime(self)
+
+    @cached_property
+    def conversations(self) -> apis.AsyncConversations:
+        return apis.AsyncConversations(self)
+
+    @cached_property
+    def videos(self) -> apis.AsyncVideos:
+        return apis.AsyncVideos(self)
+
+    @cached_property
+    def skills(self) -> apis.AsyncSkills:
+        return apis.AsyncSkills(self)
+
+    @cached_property
+    def analytics(self) -> apis.AsyncAnalytics:
+        return apis.AsyncAnalytics(self)
+
+    @cached_property
+    def mcp_servers(self) -> apis.AsyncMcpServers:
+        return apis.AsyncMcpServers(self)
+
+    @cached_property
+    def mcp_integrations(self) -> apis.AsyncMcpIntegrations:
+        return apis.AsyncMcpIntegrations(self)
+
+    @cached_property
+    def beta(self) -> AsyncPortkey.Beta:
+        return self.Beta(self)
+
+    @cached_property
+    def _hedging_client(self) -> AsyncPortkey:
+        policy = self.hedging_policy
+        if policy is None:
+            return self
+        # The hedge header keeps a coalescing transport from merging the
+        # duplicate into the request it hedges.
+        return self.with_options(
+            virtual_key=policy.virtual_key, config=policy.config, hedge=True
+        )
+
+    def _use_http_client(self, http_client: httpx.AsyncClient) -> None:
+        super()._use_http_client(http_client)
+        self.openai_client._client = http_client
+
+    def _warmup_urls(self) -> List[Union[str, httpx.URL]]:
+        return [self.base_url, self.openai_client.base_url]
+
     def copy(
         self,
         *,
@@ -609,8 +872,24 @@ class AsyncPortkey(AsyncAPIClient):
         aws_bedrock_model: Optional[str] = None,
         fireworks_account_id: Optional[str] = None,
         calculate_audio_duration: Optional[bool] = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        response_model_mode: Optional[str] = None,
+        connection_limits: Optional[httpx.Limits] = None,
+        http2: Optional[bool] = None,
+        keepalive_expiry: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        coalesce_requests: Optional[bool] = None,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
         **kwargs,
     ) -> AsyncPortkey:
+        # Every named argument, as passed; falsy ones keep the current value.
+        options = dict(locals())
+        del options["self"], options["kwargs"]
+        derived = derive_client(self, options, kwargs)
+        if derived is not None:
+            return derived
         return self.__class__(
             api_key=api_key or self.api_key,
             base_url=base_url or self.base_url,
@@ -659,6 +938,16 @@ class AsyncPortkey(AsyncAPIClient):
             fireworks_account_id=fireworks_account_id or self.fireworks_account_id,
             calculate_audio_duration=calculate_audio_duration
             or self.calculate_audio_duration,
+            retry_policy=retry_policy or self.retry_policy,
+            rate_limiter=rate_limiter or self.rate_limiter,
+            response_model_mode=response_model_mode or self.response_model_mode,
+            connection_limits=connection_limits or self.connection_limits,
+            http2=http2 or self.http2,
+            keepalive_expiry=keepalive_expiry or self.keepalive_expiry,
+            response_cache=response_cache or self.response_cache,
+            coalesce_requests=coalesce_requests or self.coalesce_requests,
+            embedding_cache=embedding_cache or self.embedding_cache,
+            hedging_policy=hedging_policy or self.hedging_policy,
             **self.kwargs,
             **kwargs,
         )
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+__all__ = ["CoalescingTransport", "AsyncCoalescingTransport"]
+
+FlightKey = Tuple[bytes, str, bytes, Tuple[Tuple[bytes, bytes], ...]]
+
+
+def flight_key(request: httpx.Request) -> Optional[FlightKey]:
+    """Method, URL, body hash and headers of `request`, or None when its body is
+    streamed (e.g. a multipart upload) and so cannot be compared up front."""
+    try:
+        body = request.content
+    except httpx.RequestNotRead:
+        return None
+    return (
+        request.method.encode(),
+        str(request.url),
+        hashlib.sha256(body).digest(),
+        tuple((name, value) for name, _, value in request.headers._list),
+    )
+
+
+def _shared_error(error: BaseException) -> BaseException:
+    # A leader interrupted by cancellation or KeyboardInterrupt must not cancel
+    # the requests that joined it; they fail like any other lost connection.
+    if isinstance(error, Exception):
+        return error
+    return httpx.ReadError("the coalesced request was interrupted")
+
+
+class _Flight:
+    """One upstream request and the body chunks read from it so far.
+
+    Every request that joined the flight reads the same chunks by index.
+    Whichever reader gets ahead pulls the next chunk from upstream, so a
+    slow or abandoned reader never holds the others back.
+    """
+
+    def __init__(self) -> None:
+        self.response: Optional[httpx.Response] = None
+        self.error: Optional[BaseException] = None
+        self.chunks: List[bytes] = []
+        self.finished = False
+        self.stream_error: Optional[BaseException] = None
+        self.readers = 1
+
+    def response_for(self, stream: Any) -> httpx.Response:
+        upstream = self.response
+        assert upstream is not None
+        return httpx.Response(
+            status_code=upstream.status_code,
+            headers=upstream.headers,
+            stream=stream,
+            extensions=upstream.extensions,
+        )
+
+
+class _SyncFlight(_Flight):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready = threading.Event()
+        self.lock = threading.Lock()
+        self._iterator: Optional[Iterator[bytes]] = None
+
+    def chunk(self, index: int) -> Optional[bytes]:
+        with self.lock:
+            while index >= len(self.chunks) and not self.finished:
+                if self._iterator is None:
+                    assert self.response is not None
+                    self._iterator = iter(self.response.stream)  # type: ignore
+                try:
+                    self.chunks.append(next(self._iterator))
+                except StopIteration:
+                    self._finish()
+                except BaseException as err:
+                    self.stream_error = err
+                    self._finish()
+                    raise
+            if index >= len(self.chunks) and self.stream_error is not None:
+                # The body broke off while another reader was pulling it.
+                raise _shared_error(self.stream_error)
+            return self.chunks[index] if index < len(self.chunks) else None
+
+    def release(self) -> None:
+        with self.lock:
+            self.readers -= 1
+            if self.readers == 0 and not self.finished:
+                self._finish()
+
+    def _finish(self) -> None:
+        self.finished = True
+        if self.response is not None:
+            self.response.close()
+
+
+class _TeeStream(httpx.SyncByteStream):
+    def __init__(self, flight: _SyncFlight) -> None:
+        self._flight = flight
+        self._closed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        index = 0
+        while True:
+            chunk = self._flight.chunk(index)
+            if chunk is None:
+                return
+            yield chunk
+            index += 1
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._flight.release()
+
+
+class CoalescingTransport(httpx.BaseTransport):
+    """Sends byte-identical concurrent requests upstream once.
+
+    A request that matches one already waiting for its response headers, by
+    method, URL, body hash and headers, joins it instead of being sent. Every
+    joined request gets its own response, and their bodies, including
+    server-sent event streams, are teed from the single upstream response.
+    Errors are raised to every joined request.
+
+    Wrap the transport of a custom `http_client` with this to get the same
+    behaviour as the `coalesce_requests` client option.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+        self._flights: Dict[FlightKey, _SyncFlight] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def _pool(self) -> Any:
+        # Lets `pool_stats` see the pool of the wrapped transport.
+        return getattr(self._transport, "_pool", None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"requests": self.requests, "coalesced": self.coalesced}
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = flight_key(request)
+        if key is None:
+            with self._lock:
+                self.requests += 1
+            return self._transport.handle_request(request)
+
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                leader = True
+                flight = self._flights[key] = _SyncFlight()
+                self.requests += 1
+            else:
+                leader = False
+                flight.readers += 1
+                self.coalesced += 1
+
+        if leader:
+            try:
+                flight.response = self._transport.handle_request(request)
+            except BaseException as err:
+                flight.error = err
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.ready.set()
+        else:
+            flight.ready.wait()
+
+        if flight.error is not None:
+            raise flight.error if leader else _shared_error(flight.error)
+        return flight.response_for(_TeeStream(flight))
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _AsyncFlight(_Flight):
+    def __init__(self) -> None:
+        super().__init__()
+        self.ready = asyncio.Event()
+        self.lock = asyncio.Lock()
+        self._iterator: Optional[AsyncIterator[bytes]] = None
+
+    async def chunk(self, index: int) -> Optional[bytes]:
+        async with self.lock:
+            while index >= len(self.chunks) and not self.finished:
+                if self._iterator is None:
+                    assert self.response is not None
+                    self._iterator = self.response.stream.__aiter__()  # type: ignore
+                try:
+                    self.chunks.append(await self._iterator.__anext__())
+                except StopAsyncIteration:
+                    await self._finish()
+                except BaseException as err:
+                    self.stream_error = err
+                    await self._finish()
+                    raise
+            if index >= len(self.chunks) and self.stream_error is not None:
+                # The body broke off while another reader was pulling it.
+                raise _shared_error(self.stream_error)
+            return self.chunks[index] if index < len(self.chunks) else None
+
+    async def release(self) -> None:
+        async with self.lock:
+            self.readers -= 1
+            if self.readers == 0 and not self.finished:
+                await self._finish()
+
+    async def _finish(self) -> None:
+        self.finished = True
+        if self.response is not None:
+            await self.response.aclose()
+
+
+class _AsyncTeeStream(httpx.AsyncByteStream):
+    def __init__(self, flight: _AsyncFlight) -> None:
+        self._flight = flight
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        index = 0
+        while True:
+            chunk = await self._flight.chunk(index)
+            if chunk is None:
+                return
+            yield chunk
+            index += 1
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            self._closed = True
+            await self._flight.release()
+
+
+class AsyncCoalescingTransport(httpx.AsyncBaseTransport):
+    """Async version of `CoalescingTransport`, for requests made from one
+    event loop."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+        self._flights: Dict[FlightKey, _AsyncFlight] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    @property
+    def _pool(self) -> Any:
+        return getattr(self._transport, "_pool", None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "coalesced": self.coalesced}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = flight_key(request)
+        if key is None:
+            self.requests += 1
+            return await self._transport.handle_async_request(request)
+
+        flight = self._flights.get(key)
+        leader = flight is None
+        if flight is None:
+            flight = self._flights[key] = _AsyncFlight()
+            self.requests += 1
+            try:
+                flight.response = await self._transport.handle_async_request(request)
+            except BaseException as err:
+                flight.error = err
+            finally:
+                del self._flights[key]
+                flight.ready.set()
+        else:
+            flight.readers += 1
+            self.coalesced += 1
+            await flight.ready.wait()
+
+        if flight.error is not None:
+            raise flight.error if leader else _shared_error(flight.error)
+        return flight.response_for(_AsyncTeeStream(flight))
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from .global_constants import DEFAULT_CONNECTION_LIMITS, PORTKEY_HEADER_PREFIX
+
+__all__ = ["build_limits", "pool_stats", "warm_connections", "awarm_connections"]
+
+
+def build_limits(
+    limits: Optional[httpx.Limits] = None, keepalive_expiry: Optional[float] = None
+) -> httpx.Limits:
+    """Connection limits for a client's pool: `limits` (or the defaults), with
+    `keepalive_expiry` applied on top when given."""
+    limits = limits or DEFAULT_CONNECTION_LIMITS
+    if keepalive_expiry is None:
+        return limits
+    return httpx.Limits(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def pool_stats(http_client: Union[httpx.Client, httpx.AsyncClient]) -> Dict[str, Any]:
+    """Snapshot of the connection pool behind `http_client`.
+
+    Clients with a custom transport have no pool to inspect, so all counts are
+    zero and the limits are None.
+    """
+    pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+    connections = list(getattr(pool, "connections", None) or ())
+    idle = 0
+    http2 = 0
+    for connection in connections:
+        if connection.is_idle():
+            idle += 1
+        if "HTTP/2" in connection.info():
+            http2 += 1
+    return {
+        "connections": len(connections),
+        "active": len(connections) - idle,
+        "idle": idle,
+        "http2": http2,
+        "queued_requests": len(getattr(pool, "_requests", None) or ()),
+        "max_connections": getattr(pool, "_max_connections", None),
+        "max_keepalive_connections": getattr(pool, "_max_keepalive_connections", None),
+        "keepalive_expiry": getattr(pool, "_keepalive_expiry", None),
+    }
+
+
+class _HandshakeTimer:
+    """Times a request's connection setup through httpcore's `trace` extension."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.error: Optional[str] = None
+        self._marks: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self._finished: Optional[float] = None
+
+    def __call__(self, event: str, info: Any) -> None:
+        self._marks.setdefault(event, time.perf_counter())
+
+    async def atrace(self, event: str, info: Any) -> None:
+        self(event, info)
+
+    def finish(self) -> None:
+        self._finished = time.perf_counter()
+
+    def _span(self, step: str) -> Optional[float]:
+        started = self._marks.get(f"connection.{step}.started")
+        complete = self._marks.get(f"connection.{step}.complete")
+        if started is None or complete is None:
+            return None
+        return complete - started
+
+    def timings(self) -> Dict[str, Any]:
+        return {
+            "url": self.url,
+            "new_connection": "connection.connect_tcp.started" in self._marks,
+            "connect": self._span("connect_tcp"),
+            "tls": self._span("start_tls"),
+            "total": None if self._finished is None else self._finished - self._started,
+            "error": self.error,
+        }
+
+
+class _Gate:
+    """Opens once every warm-up request has its response, so that none of
+    them hands its connection back to the pool for another one to reuse."""
+
+    def __init__(self, count: int, opened: Any) -> None:
+        self._count = count
+        self._lock = threading.Lock()
+        self.opened = opened
+
+    def arrive(self) -> None:
+        with self._lock:
+            self._count -= 1
+            if self._count <= 0:
+                self.opened.set()
+
+
+def _warmup_origins(urls: Iterable[Union[str, httpx.URL]]) -> List[str]:
+    origins: Dict[Tuple[str, str, Optional[int]], str] = {}
+    for url in urls:
+        parsed = httpx.URL(str(url))
+        origins.setdefault((parsed.scheme, parsed.host, parsed.port), str(url))
+    return list(origins.values())
+
+
+def _warmup_count(
+    http_client: Union[httpx.Client, httpx.AsyncClient], n_connections: int
+) -> int:
+    if n_connections < 1:
+        raise ValueError("`n_connections` must be at least 1")
+    # Connections beyond the keep-alive limit would be closed right away.
+    keepalive = pool_stats(http_client)["max_keepalive_connections"]
+    return n_connections if keepalive is None else min(n_connections, keepalive)
+
+
+def _warmup_headers(index: int) -> Dict[str, str]:
+    # Distinct headers keep a coalescing transport from merging the requests.
+    return {f"{PORTKEY_HEADER_PREFIX}warmup": str(index)}
+
+
+def warm_connections(
+    http_client: httpx.Client,
+    urls: Iterable[Union[str, httpx.URL]],
+    n_connections: int,
+    timeout: float,
+) -> List[Dict[str, Any]]:
+    """Open `n_connections` concurrent connections to the origin of each of
+    `urls` with `HEAD` requests, and return the timings of each request.
+
+    See `APIClient.warmup`.
+    """
+    count = _warmup_count(http_client, n_connections)
+    origins = _warmup_origins(urls)
+    gates = {url: _Gate(count, threading.Event()) for url in origins}
+
+    def warm(url: str, index: int) -> Dict[str, Any]:
+        timer = _HandshakeTimer(url)
+        gate = gates[url]
+        arrived = False
+        try:
+            with http_client.stream(
+                "HEAD",
+                url,
+                timeout=timeout,
+                extensions={"trace": timer},
+                headers=_warmup_headers(index),
+            ) as response:
+                timer.finish()
+                gate.arrive()
+                arrived = True
+                gate.opened.wait(timeout)
+                # Reading the (empty) body returns the connection to the pool;
+                # closing the response unread would close the connection.
+                response.read()
+        except httpx.HTTPError as error:
+            timer.error = repr(error)
+        finally:
+            if not arrived:
+                gate.arrive()
+        return timer.timings()
+
+    jobs = [(url, index) for url in origins for index in range(count)]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        return list(executor.map(lambda job: warm(*job), jobs))
+
+
+async def awarm_connections(
+    http_client: httpx.AsyncClient,
+    urls: Iterable[Union[str, httpx.URL]],
+    n_connections: int,
+    timeout: float,
+) -> List[Dict[str, Any]]:
+    """Async counterpart of `warm_connections`."""
+    count = _warmup_count(http_client, n_connections)
+    origins = _warmup_origins(urls)
+    gates = {url: _Gate(count, asyncio.Event()) for url in origins}
+
+    async def warm(url: str, index: int) -> Dict[str, Any]:
+        timer = _HandshakeTimer(url)
+        gate = gates[url]
+        arrived = False
+        try:
+            async with http_client.stream(
+                "HEAD",
+                url,
+                timeout=timeout,
+                extensions={"trace": timer.atrace},
+                headers=_warmup_headers(index),
+            ) as response:
+                timer.finish()
+                gate.arrive()
+                arrived = True
+                try:
+                    await asyncio.wait_for(gate.opened.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                await response.aread()
+        except httpx.HTTPError as error:
+            timer.error = repr(error)
+        finally:
+            if not arrived:
+                gate.arrive()
+        return timer.timings()
+
+    return list(
+        await asyncio.gather(
+            *(warm(url, index) for url in origins for index in range(count))
+        )
+    )
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import base64
+import math
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from portkey_ai.utils.json_utils import json_loads
+
+if TYPE_CHECKING:
+    import numpy
+
+__all__ = [
+    "import_numpy",
+    "iter_embedding_batches",
+    "decode_embeddings",
+    "EmbeddingArrayBuilder",
+]
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            """Please install numpy to get embeddings as arrays,
+            you can use `pip install 'portkey-ai[numpy]'` to install"""
+        ) from None
+    return numpy
+
+
+def iter_embedding_batches(
+    texts: Iterable[str],
+    *,
+    batch_size: int,
+    max_batch_tokens: int,
+    chars_per_token: float = 4.0,
+) -> Iterator[Dict[str, List[str]]]:
+    """Split `texts` into `{"input": [...]}` requests of at most `batch_size`
+    texts and, by a characters-per-token estimate, `max_batch_tokens` tokens.
+
+    `texts` is consumed lazily. A single text over the token budget is sent
+    on its own and left for the provider to truncate or reject.
+    """
+    if batch_size < 1:
+        raise ValueError("`batch_size` must be at least 1")
+    if max_batch_tokens < 1:
+        raise ValueError("`max_batch_tokens` must be at least 1")
+    batch: List[str] = []
+    tokens = 0
+    for text in texts:
+        if not isinstance(text, str):
+            raise TypeError(f"Expected texts to be str, got {type(text).__name__}")
+        text_tokens = math.ceil(len(text) / chars_per_token)
+        if batch and (
+            len(batch) == batch_size or tokens + text_tokens > max_batch_tokens
+        ):
+            yield {"input": batch}
+            batch = []
+            tokens = 0
+        batch.append(text)
+        tokens += text_tokens
+    if batch:
+        yield {"input": batch}
+
+
+def decode_embeddings(numpy: Any, content: bytes, count: int) -> "numpy.ndarray":
+    """Decode an embeddings response body into a `(count, dimensions)` float32
+    array, in input order.
+
+    Base64 embeddings are copied straight from their bytes with
+    `numpy.frombuffer`; providers that ignore `encoding_format` and return
+    float lists are converted too.
+    """
+    data = json_loads(content)["data"]
+    if len(data) != count:
+        raise ValueError(
+            f"Expected {count} embeddings in the response, got {len(data)}"
+        )
+    out = None
+    for item in data:
+        embedding = item["embedding"]
+        if isinstance(embedding, str):
+            row = numpy.frombuffer(base64.b64decode(embedding), dtype="<f4")
+        else:
+            row = numpy.asarray(embedding, dtype="<f4")
+        if out is None:
+            out = numpy.empty((count, row.shape[0]), dtype=numpy.float32)
+        out[item["index"]] = row
+    return out
+
+
+class EmbeddingArrayBuilder:
+    """Collects per-batch arrays into one contiguous float32 array.
+
+    When the number of texts is known up front the result is allocated once,
+    after the first batch reveals the dimensions, and filled in place;
+    otherwise the batches are concatenated at the end.
+    """
+
+    def __init__(self, numpy: Any, total: Optional[int] = None) -> None:
+        self._numpy = numpy
+        self._total = total
+        self._out: Optional["numpy.ndarray"] = None
+        self._parts: List["numpy.ndarray"] = []
+        self._rows = 0
+
+    def add(self, batch: "numpy.ndarray") -> None:
+        if self._total is None:
+            self._parts.append(batch)
+        else:
+            if self._out is None:
+                self._out = self._numpy.empty(
+                    (self._total, batch.shape[1]), dtype=self._numpy.float32
+                )
+            self._out[self._rows : self._rows + len(batch)] = batch
+        self._rows += len(batch)
+
+    def result(self, dimensions: Optional[int] = None) -> "numpy.ndarray":
+        numpy = self._numpy
+        if self._rows == 0:
+            return numpy.empty((0, dimensions or 0), dtype=numpy.float32)
+        if self._out is not None:
+            return self._out[: self._rows]
+        if len(self._parts) == 1:
+            return numpy.ascontiguousarray(self._parts[0])
+        return numpy.concatenate(self._parts)
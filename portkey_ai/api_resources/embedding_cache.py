@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import mmap
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import httpx
+
+from portkey_ai.utils.json_utils import json_loads
+from .._vendor.openai._types import NotGiven, Omit
+from .fork_safety import ForkSafe, keep_inherited
+from .utils import ModelT, build_model
+
+__all__ = ["EmbeddingCache", "EmbeddingLookup"]
+
+_ROW_ITEM_SIZE = 4  # float32
+
+
+def _to_float32_bytes(embedding: Any) -> bytes:
+    """Little-endian float32 bytes of an embedding given as base64 or floats."""
+    if isinstance(embedding, str):
+        return base64.b64decode(embedding)
+    values = array("f", embedding)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _to_floats(row: bytes) -> List[float]:
+    values = array("f")
+    values.frombytes(row)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+class _VectorFile:
+    """Append-only file of fixed-size float32 rows, read through `mmap`."""
+
+    def __init__(self, path: str, dimensions: int) -> None:
+        self.row_size = dimensions * _ROW_ITEM_SIZE
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._map: Optional[mmap.mmap] = None
+
+    def rows(self) -> int:
+        return os.fstat(self._fd).st_size // self.row_size
+
+    def append(self, rows: Sequence[bytes]) -> int:
+        """Write `rows` after the last complete row and return the first row
+        number. Callers serialise appends across processes."""
+        first = self.rows()
+        os.pwrite(self._fd, b"".join(rows), first * self.row_size)
+        return first
+
+    def read(self, row: int) -> bytes:
+        end = (row + 1) * self.row_size
+        if self._map is None or len(self._map) < end:
+            # The file has grown (possibly in another process) since it was
+            # last mapped.
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+        return self._map[row * self.row_size : end]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        os.close(self._fd)
+
+
+class EmbeddingCache(ForkSafe):
+    """Persistent, content-addressed cache of embedding vectors.
+
+    Vectors are keyed on the client settings that pick the provider (base
+    URL, config, provider and keys), model, requested dimensions and a SHA-256
+    hash of the text, so clients routed to different providers under the same
+    `model` name do not share entries. They are stored as float32 rows in one memory-mapped file per vector
+    size under `path`, with a SQLite index mapping keys to rows. Several
+    processes can share a directory: the index runs in WAL mode, and appends
+    happen inside an index write transaction. A forked child opens its own
+    connection to the index.
+
+    Pass an instance as `embedding_cache` to `Portkey`/`AsyncPortkey`, and
+    `embeddings.create` and `embeddings.create_array` only send the texts
+    that are not cached yet.
+    """
+
+    def __init__(self, path: str, *, timeout: float = 30.0) -> None:
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._files: Dict[int, _VectorFile] = {}
+        self._db = self._connect()
+        self._register_after_fork()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key BLOB PRIMARY KEY, dimensions INTEGER NOT NULL, row INTEGER NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(
+            os.path.join(self.path, "index.sqlite"),
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # SQLite connections must not be used across a fork. The vector files
+        # are only written with `pwrite` at explicit offsets, so their
+        # descriptors can be shared.
+        keep_inherited(self._db)
+        self._db = self._connect()
+        self._lock = threading.Lock()
+        return {}
+
+    @staticmethod
+    def key(route: str, model: Optional[str], dimensions: Any, text: str) -> bytes:
+        if isinstance(dimensions, (NotGiven, Omit)) or dimensions is None:
+            dimensions = ""
+        return hashlib.sha256(
+            f"{route}\0{model}\0{dimensions}\0{text}".encode()
+        ).digest()
+
+    def _file(self, dimensions: int) -> _VectorFile:
+        vectors = self._files.get(dimensions)
+        if vectors is None:
+            vectors = self._files[dimensions] = _VectorFile(
+                os.path.join(self.path, f"vectors-{dimensions}.f32"), dimensions
+            )
+        return vectors
+
+    def get_many(self, keys: Sequence[bytes]) -> List[Optional[bytes]]:
+        """float32 row bytes for each key, or None where it is not cached."""
+        found: Dict[bytes, Tuple[int, int]] = {}
+        with self._lock:
+            # Stay below SQLite's default limit on bound parameters.
+            for start in range(0, len(keys), 500):
+                chunk = keys[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                for key, dimensions, row in self._db.execute(
+                    "SELECT key, dimensions, row FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ):
+                    found[key] = (dimensions, row)
+            rows = []
+            for key in keys:
+                location = found.get(key)
+                rows.append(
+                    None
+                    if location is None
+                    else self._file(location[0]).read(location[1])
+                )
+            hits = len(keys) - rows.count(None)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return rows
+
+    def put_many(self, keys: Sequence[bytes], rows: Sequence[bytes]) -> None:
+        by_dimensions: Dict[int, List[Tuple[bytes, bytes]]] = {}
+        for key, row in zip(keys, rows):
+            dimensions = len(row) // _ROW_ITEM_SIZE
+            by_dimensions.setdefault(dimensions, []).append((key, row))
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                for dimensions, items in by_dimensions.items():
+                    first = self._file(dimensions).append([row for _, row in items])
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, dimensions, row) "
+                        "VALUES (?, ?, ?)",
+                        [
+                            (key, dimensions, first + offset)
+                            for offset, (key, _) in enumerate(items)
+                        ],
+                    )
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            (entries,) = self._db.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "size_bytes": sum(
+                    vectors.rows() * vectors.row_size
+                    for vectors in self._files.values()
+                ),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            for vectors in self._files.values():
+                vectors.close()
+            self._files.clear()
+            self._db.close()
+
+
+class EmbeddingLookup:
+    """Cached and missing embeddings for one request's texts.
+
+    Only `miss_texts` need to be sent; `add_response` stores their embeddings
+    and merges them back in input order.
+    """
+
+    def __init__(
+        self,
+        cache: EmbeddingCache,
+        route: str,
+        model: Optional[str],
+        dimensions: Any,
+        texts: List[str],
+    ) -> None:
+        self.cache = cache
+        self.model = model
+        self.keys = [cache.key(route, model, dimensions, text) for text in texts]
+        self.rows = cache.get_many(self.keys)
+        self.misses = [index for index, row in enumerate(self.rows) if row is None]
+        self.miss_texts = [texts[index] for index in self.misses]
+        self.usage: Dict[str, int] = {"prompt_tokens": 0, "total_tokens": 0}
+        self.headers = httpx.Headers()
+
+    def add_response(self, content: bytes, headers: Any = None) -> None:
+        data = json_loads(content)
+        items = sorted(data["data"], key=lambda item: item["index"])
+        if len(items) != len(self.misses):
+            raise ValueError(
+                f"Expected {len(self.misses)} embeddings in the response, "
+                f"got {len(items)}"
+            )
+        rows = [_to_float32_bytes(item["embedding"]) for item in items]
+        self.cache.put_many([self.keys[index] for index in self.misses], rows)
+        for index, row in zip(self.misses, rows):
+            self.rows[index] = row
+        self.model = data.get("model") or self.model
+        self.usage = data.get("usage") or self.usage
+        if headers is not None:
+            self.headers = headers
+
+    def vector_bytes(self) -> bytes:
+        """All rows, in input order, as one float32 buffer."""
+        return b"".join(self.rows)  # type: ignore[arg-type]
+
+    def response(
+        self, model_class: Type[ModelT], encoding_format: Any, mode: str = "strict"
+    ) -> ModelT:
+        """The merged response, shaped like one from the embeddings endpoint."""
+        as_base64 = encoding_format == "base64"
+        data = {
+            "object": "list",
+            "model": self.model,
+            "data": [
+                {
+                    "object": "embedding",
+                    "index": index,
+                    "embedding": (
+                        base64.b64encode(row).decode() if as_base64 else _to_floats(row)  # type: ignore[arg-type]
+                    ),
+                }
+                for index, row in enumerate(self.rows)
+            ],
+            "usage": self.usage,
+        }
+        result = build_model(model_class, data, mode)
+        result._headers = self.headers  # type: ignore[attr-defined]
+        return result
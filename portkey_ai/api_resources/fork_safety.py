@@ -0,0 +1,60 @@
+"""Fresh connection pools and background workers in forked children.
+
+A client built before `os.fork` (a pre-fork gunicorn app, a multiprocessing
+pool) would otherwise hand the parent's pooled sockets, logger queue and flush
+thread to every child. Objects registered here reset that state in the child
+right after the fork.
+"""
+
+import os
+import weakref
+from typing import Any, Dict, List
+
+__all__ = ["ForkSafe", "keep_inherited"]
+
+_registered: "weakref.WeakSet[ForkSafe]" = weakref.WeakSet()
+
+# HTTP clients and SQLite connections inherited from the parent. They are
+# never closed in the child, as that could shut down connections the parent is
+# still using (an HTTP/2 GOAWAY, say), and are kept here so garbage collection
+# does not close them either.
+_inherited: List[Any] = []
+
+
+class ForkSafe:
+    """Base for objects holding sockets, threads or tasks that must not be
+    shared with a forked child."""
+
+    def _register_after_fork(self) -> None:
+        _registered.add(self)
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        """Drop state inherited from the parent.
+
+        Returns the HTTP clients rebuilt in its place, keyed by the id of the
+        inherited client each one replaces.
+        """
+        return {}
+
+    def _rebind_after_fork(self, replaced: Dict[int, Any]) -> None:
+        """Switch to HTTP clients rebuilt by other objects, such as the pool a
+        derived client shares with the one it was copied from."""
+
+
+def _after_fork_in_child() -> None:
+    objects = list(_registered)
+    replaced: Dict[int, Any] = {}
+    for obj in objects:
+        replaced.update(obj._reset_after_fork())
+    for obj in objects:
+        obj._rebind_after_fork(replaced)
+
+
+def keep_inherited(connection: Any) -> None:
+    """Leave an HTTP client or database connection inherited from the parent
+    open for good."""
+    _inherited.append(connection)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
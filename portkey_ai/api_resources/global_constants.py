@@ -37,6 +37,28 @@ Please check the `base_url` parameter in the Portkey client.
 """
 
 DEFAULT_MAX_RETRIES = 2
+DEFAULT_RETRY_INITIAL_DELAY = 0.5
+DEFAULT_RETRY_MAX_DELAY = 8.0
+DEFAULT_RETRY_MAX_RETRY_AFTER = 60.0
+DEFAULT_RETRY_STATUS_CODES = (408, 429, 502, 503, 504)
+DEFAULT_LOGGER_BATCH_SIZE = 100
+DEFAULT_LOGGER_FLUSH_INTERVAL = 1.0
+DEFAULT_LOGGER_MAX_QUEUE_SIZE = 10_000
+DEFAULT_LOGGER_TIMEOUT = 10.0
+DEFAULT_LOGGER_COMPRESS_MIN_BYTES = 1024
+DEFAULT_SPAN_EXPORT_MAX_BATCH_SIZE = 512
+# Per-request limits of OpenAI's embeddings endpoint.
+DEFAULT_EMBEDDING_BATCH_SIZE = 2048
+DEFAULT_EMBEDDING_BATCH_TOKENS = 300_000
+# Per-batch input limits of OpenAI's batch API.
+DEFAULT_BATCH_MAX_REQUESTS = 50_000
+DEFAULT_BATCH_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES = 64 * 1024 * 1024
+DEFAULT_UPLOAD_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_UPLOAD_CONCURRENCY = 4
+DEFAULT_UPLOAD_PART_RETRIES = 3
+DEFAULT_BATCH_POLL_INTERVAL = 5.0
+DEFAULT_BATCH_MAX_POLL_INTERVAL = 60.0
 VERSION = "0.1.0"
 DEFAULT_TIMEOUT = 60
 PORTKEY_HEADER_PREFIX = "x-portkey-"
@@ -46,7 +68,17 @@ LOCAL_BASE_URL = "http://localhost:8787/v1"
 PORTKEY_API_KEY_ENV = "PORTKEY_API_KEY"
 PORTKEY_PROXY_ENV = "PORTKEY_PROXY"
 OPEN_AI_API_KEY = "OPENAI_API_KEY"
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
 DEFAULT_CONNECTION_LIMITS = httpx.Limits(
-    max_connections=1000, max_keepalive_connections=100
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
 )
+DEFAULT_WARMUP_CONNECTIONS = 10
+DEFAULT_WARMUP_TIMEOUT = 10.0
+DEFAULT_HEDGING_INITIAL_DELAY = 1.0
+DEFAULT_HEDGING_MIN_DELAY = 0.05
+DEFAULT_HEDGING_PERCENTILE = 95.0
+DEFAULT_HEDGING_WINDOW = 1000
+DEFAULT_HEDGING_MIN_SAMPLES = 20
 AUDIO_FILE_DURATION_HEADER = "x-portkey-audio-file-duration"
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Optional,
+    TypeVar,
+)
+
+from .global_constants import (
+    DEFAULT_HEDGING_INITIAL_DELAY,
+    DEFAULT_HEDGING_MIN_DELAY,
+    DEFAULT_HEDGING_MIN_SAMPLES,
+    DEFAULT_HEDGING_PERCENTILE,
+    DEFAULT_HEDGING_WINDOW,
+)
+
+__all__ = ["HedgingPolicy", "hedged"]
+
+T = TypeVar("T")
+
+
+class HedgingPolicy:
+    """Opt-in hedged requests for `AsyncPortkey`.
+
+    When a non-streaming `chat.completions.create`, `embeddings.create` or
+    `prompts.completions.create` has no response after the hedging delay, a
+    duplicate request is sent. The first one to succeed is returned and the
+    other is cancelled, which closes its connection.
+
+    With `delay`, the hedging delay is fixed. Otherwise it is the `percentile`
+    of the latencies of the last `window` successful requests, never below
+    `min_delay`, and `initial_delay` until `min_samples` have been seen.
+
+    The duplicate goes to the same target, or to `virtual_key` and/or
+    `config` when given, as if sent from `client.with_options(virtual_key=...,
+    config=...)`. It carries an `x-portkey-hedge` header, so a client with
+    `coalesce_requests` does not merge it into the original. A duplicate chat
+    completion shares the `rate_limiter` allowance taken by the original,
+    while a duplicate prompt completion waits for and is counted by the
+    limiter like any other request.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        *,
+        percentile: float = DEFAULT_HEDGING_PERCENTILE,
+        initial_delay: float = DEFAULT_HEDGING_INITIAL_DELAY,
+        min_delay: float = DEFAULT_HEDGING_MIN_DELAY,
+        window: int = DEFAULT_HEDGING_WINDOW,
+        min_samples: int = DEFAULT_HEDGING_MIN_SAMPLES,
+        virtual_key: Optional[str] = None,
+        config: Optional[Any] = None,
+    ) -> None:
+        if delay is not None and delay < 0:
+            raise ValueError("`delay` must be greater than or equal to 0")
+        if not 0 < percentile <= 100:
+            raise ValueError("`percentile` must be in (0, 100]")
+        if window < 1 or min_samples < 1:
+            raise ValueError("`window` and `min_samples` must be at least 1")
+        self.delay = delay
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.virtual_key = virtual_key
+        self.config = config
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self._latencies: Deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"HedgingPolicy(delay={self.delay}, percentile={self.percentile}, "
+            f"virtual_key={self.virtual_key!r})"
+        )
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for a response before sending the duplicate."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(self._latencies)
+        index = math.ceil(len(latencies) * self.percentile / 100) - 1
+        return max(self.min_delay, latencies[index])
+
+    def observe(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests sent, how many were hedged and how many of those the
+        duplicate won, and the current hedging delay."""
+        return {
+            "requests": self.requests,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "delay": self.hedge_delay(),
+        }
+
+
+async def _cancel(task: "asyncio.Future[Any]") -> None:
+    # Waiting for the cancelled request lets httpx close its connection.
+    task.cancel()
+    try:
+        await task
+    except BaseException:
+        pass
+
+
+async def hedged(
+    policy: HedgingPolicy,
+    send: Callable[[], Awaitable[T]],
+    send_hedge: Callable[[], Awaitable[T]],
+) -> T:
+    """Await `send()` and, if it is still running after the policy's delay,
+    `send_hedge()` as well; return the first successful result.
+
+    If both fail, the error of the first is raised. The latency observed by
+    the policy is measured from the start of `send()` even when the duplicate
+    wins, so that slow originals still count towards the hedging delay.
+    """
+    policy.requests += 1
+    started = time.monotonic()
+    primary = asyncio.ensure_future(send())
+    hedge: Optional["asyncio.Future[T]"] = None
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=policy.hedge_delay())
+        if done:
+            result = primary.result()
+            policy.observe(time.monotonic() - started)
+            return result
+
+        policy.hedged += 1
+        hedge = asyncio.ensure_future(send_hedge())
+        pending = {primary, hedge}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    policy.observe(time.monotonic() - started)
+                    if task is hedge:
+                        policy.hedge_wins += 1
+                    for loser in pending:
+                        await _cancel(loser)
+                    return task.result()
+        return primary.result()
+    except BaseException:
+        for running in (primary, hedge):
+            if running is not None and not running.done():
+                await _cancel(running)
+        raise
@@ -1,19 +1,117 @@
-import json
-from typing import Any, Sequence
+from typing import Any, Dict, Optional, Sequence
 from opentelemetry.sdk.trace.export import (
     SpanExporter,
     SpanExportResult,
     ReadableSpan,
 )
+from opentelemetry.sdk.util import ns_to_iso_str
+from opentelemetry.trace import format_span_id, format_trace_id
 
 from portkey_ai.api_resources.apis.logger import Logger
+from portkey_ai.api_resources.global_constants import (
+    DEFAULT_LOGGER_TIMEOUT,
+    DEFAULT_SPAN_EXPORT_MAX_BATCH_SIZE,
+)
 from portkey_ai.utils import string_to_uuid
 
 
+def _format_attributes(attributes: Any) -> Optional[Dict[str, Any]]:
+    if attributes is None:
+        return None
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in attributes.items()
+    }
+
+
+def _format_context(context: Any) -> Dict[str, Any]:
+    return {
+        "trace_id": f"0x{format_trace_id(context.trace_id)}",
+        "span_id": f"0x{format_span_id(context.span_id)}",
+        "trace_state": repr(context.trace_state),
+    }
+
+
 class PortkeySpanExporter(SpanExporter):
-    def __init__(self, api_key: str, base_url: str):
+    """Exports spans to Portkey's `/logs` endpoint.
+
+    One `Logger` (and so one pooled HTTP connection) is kept for the lifetime
+    of the exporter. Spans are sent in requests of at most `max_batch_size`
+    logs each.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        *,
+        max_batch_size: int = DEFAULT_SPAN_EXPORT_MAX_BATCH_SIZE,
+        compress: bool = True,
+        timeout: float = DEFAULT_LOGGER_TIMEOUT,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be at least 1")
         self.api_key = api_key
         self.base_url = base_url
+        self.max_batch_size = max_batch_size
+        # Export already runs on the span processor's worker thread, so the
+        # logger sends synchronously and reports failures back here.
+        self._logger = Logger(
+            api_key=api_key,
+            base_url=base_url,
+            compress=compress,
+            timeout=timeout,
+            background=False,
+        )
+        self._resource: Any = None
+        self._resource_json: Optional[Dict[str, Any]] = None
+
+    def _format_resource(self, resource: Any) -> Optional[Dict[str, Any]]:
+        # Spans from one provider share a resource, so it is formatted once.
+        if resource is None:
+            return None
+        if resource is not self._resource:
+            self._resource_json = {
+                "attributes": _format_attributes(resource.attributes),
+                "schema_url": resource.schema_url,
+            }
+            self._resource = resource
+        return self._resource_json
+
+    def format_span(self, span: ReadableSpan) -> Dict[str, Any]:
+        """Build the same dict as `json.loads(span.to_json())`, without the JSON
+        round trip."""
+        status: Dict[str, Any] = {"status_code": str(span.status.status_code.name)}
+        if span.status.description:
+            status["description"] = span.status.description
+        return {
+            "name": span.name,
+            "context": _format_context(span.context) if span.context else None,
+            "kind": str(span.kind),
+            "parent_id": (
+                f"0x{format_span_id(span.parent.span_id)}" if span.parent else None
+            ),
+            "start_time": ns_to_iso_str(span.start_time) if span.start_time else None,
+            "end_time": ns_to_iso_str(span.end_time) if span.end_time else None,
+            "status": status,
+            "attributes": _format_attributes(span.attributes),
+            "events": [
+                {
+                    "name": event.name,
+                    "timestamp": ns_to_iso_str(event.timestamp),
+                    "attributes": _format_attributes(event.attributes),
+                }
+                for event in span.events
+            ],
+            "links": [
+                {
+                    "context": _format_context(link.context),
+                    "attributes": _format_attributes(link.attributes),
+                }
+                for link in span.links
+            ],
+            "resource": self._format_resource(span.resource),
+        }
 
     def transform_span_to_log(self, span: ReadableSpan) -> dict:
         start_time = span.start_time
@@ -23,6 +121,7 @@ class PortkeySpanExporter(SpanExporter):
             response_time = (end_time - start_time) * 10**-6
         else:
             response_time = 0
+        attributes = span.attributes or {}
         log = {
             "metadata": {
                 "traceId": string_to_uuid(span.context.trace_id),
@@ -32,21 +131,13 @@ class PortkeySpanExporter(SpanExporter):
                 "startTime": start_time,
                 "endTime": end_time,
                 "_logType": "opentelemetry",
-                "_source": (
-                    span.attributes.get("_source", "unknown")
-                    if span.attributes
-                    else "unknown"
-                ),
-                "framework.version": (
-                    span.attributes.get("framework.version", "unknown")
-                    if span.attributes
-                    else "unknown"
-                ),
+                "_source": attributes.get("_source", "unknown"),
+                "framework.version": attributes.get("framework.version", "unknown"),
             },
             "request": {
                 "method": "POST",
                 "headers": {"Content-Type": "application/json"},
-                "body": json.loads(span.to_json()),
+                "body": self.format_span(span),
             },
             "response": {
                 "status": 200,
@@ -58,13 +149,19 @@ class PortkeySpanExporter(SpanExporter):
         return log
 
     def export(self, spans: Sequence[ReadableSpan], **kwargs: Any) -> SpanExportResult:
-        logger = Logger(api_key=self.api_key, base_url=self.base_url)
-        logs = []
-        for span in spans:
-            logs.append(self.transform_span_to_log(span))
         try:
-            logger.log(logs)
+            for start in range(0, len(spans), self.max_batch_size):
+                logs = [
+                    self.transform_span_to_log(span)
+                    for span in spans[start : start + self.max_batch_size]
+                ]
+                response = self._logger.log(logs)
+                if response is not None and response.is_error:
+                    return SpanExportResult.FAILURE
         except Exception:
             return SpanExportResult.FAILURE
 
         return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        self._logger.close()
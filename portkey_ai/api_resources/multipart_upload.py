@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import asyncio
+import builtins
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+__all__ = ["UploadSource", "UploadCheckpoint", "upload_parts", "aupload_parts"]
+
+
+class UploadSource:
+    """Random access to the file being uploaded, without loading it whole.
+
+    Paths are read part by part with `os.pread` (or seek and read where that
+    is unavailable); in-memory files are sliced.
+    """
+
+    def __init__(
+        self,
+        file: Union[os.PathLike, bytes],
+        filename: Optional[str] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        self._data: Optional[memoryview] = None
+        self._fd: Optional[int] = None
+        if isinstance(file, builtins.bytes):
+            if filename is None:
+                raise TypeError(
+                    "The `filename` argument must be given for in-memory files"
+                )
+            self._data = memoryview(file)
+            self.filename = filename
+            self.size = len(file) if size is None else size
+        else:
+            self._fd = os.open(
+                os.fspath(file), os.O_RDONLY | getattr(os, "O_BINARY", 0)
+            )
+            self.filename = filename or os.path.basename(os.fspath(file))
+            self.size = os.fstat(self._fd).st_size if size is None else size
+        self._lock = threading.Lock()
+
+    def read(self, offset: int, length: int) -> bytes:
+        if self._data is not None:
+            return bytes(self._data[offset : offset + length])
+        assert self._fd is not None
+        if hasattr(os, "pread"):
+            return os.pread(self._fd, length, offset)
+        with self._lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            return os.read(self._fd, length)
+
+    def parts(self, part_size: int) -> Iterator[Tuple[int, int, int]]:
+        """`(index, offset, length)` of every part."""
+        for index, offset in enumerate(range(0, self.size, part_size)):
+            yield index, offset, min(part_size, self.size - offset)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class UploadCheckpoint:
+    """The upload id and completed part ids of a chunked upload, saved to
+    `path` (when given) after every part so an interrupted upload can resume.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        upload_id: str,
+        size: int,
+        part_size: int,
+        parts: Optional[Dict[int, str]] = None,
+    ) -> None:
+        self.path = path
+        self.upload_id = upload_id
+        self.size = size
+        self.part_size = part_size
+        self.parts: Dict[int, str] = dict(parts or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, path: Optional[str], size: int, part_size: int
+    ) -> Optional["UploadCheckpoint"]:
+        """The checkpoint at `path`, if there is one for a file of this size
+        split into parts of this size."""
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            data = json.load(f)
+        if data.get("bytes") != size or data.get("part_size") != part_size:
+            return None
+        parts = {int(index): part_id for index, part_id in data["parts"].items()}
+        return cls(path, data["upload_id"], size, part_size, parts)
+
+    def add(self, index: int, part_id: str) -> None:
+        with self._lock:
+            self.parts[index] = part_id
+            if self.path is None:
+                return
+            tmp = f"{self.path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump(
+                    {
+                        "upload_id": self.upload_id,
+                        "bytes": self.size,
+                        "part_size": self.part_size,
+                        "parts": self.parts,
+                    },
+                    f,
+                )
+            os.replace(tmp, self.path)
+
+    def part_ids(self) -> List[str]:
+        return [self.parts[index] for index in sorted(self.parts)]
+
+    def remove(self) -> None:
+        if self.path is not None and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _pending_parts(
+    source: UploadSource,
+    checkpoint: UploadCheckpoint,
+    hasher: Optional[Any],
+) -> Iterator[Tuple[int, bytes]]:
+    # Parts are read in order so the MD5 can be computed incrementally;
+    # parts already uploaded are still read when it is needed.
+    for index, offset, length in source.parts(checkpoint.part_size):
+        done = index in checkpoint.parts
+        if done and hasher is None:
+            continue
+        data = source.read(offset, length)
+        if hasher is not None:
+            hasher.update(data)
+        if not done:
+            yield index, data
+
+
+def upload_parts(
+    source: UploadSource,
+    checkpoint: UploadCheckpoint,
+    upload_part: Callable[[int, bytes], Any],
+    *,
+    concurrency: int,
+    compute_md5: bool,
+) -> Optional[str]:
+    """Call `upload_part(index, data)` for every part not in `checkpoint`, up
+    to `concurrency` at a time, and return the file's MD5 if requested.
+
+    Only `concurrency` parts are held in memory at once.
+    """
+    hasher = hashlib.md5() if compute_md5 else None
+    pending: Set[Future] = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            for index, data in _pending_parts(source, checkpoint, hasher):
+                while len(pending) >= concurrency:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        future.result()
+                pending.add(executor.submit(upload_part, index, data))
+            for future in pending:
+                future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+    return hasher.hexdigest() if hasher is not None else None
+
+
+async def aupload_parts(
+    source: UploadSource,
+    checkpoint: UploadCheckpoint,
+    upload_part: Callable[[int, bytes], Awaitable[Any]],
+    *,
+    concurrency: int,
+    compute_md5: bool,
+) -> Optional[str]:
+    """Async counterpart of `upload_parts`, running the part uploads as tasks
+    on the current event loop."""
+    hasher = hashlib.md5() if compute_md5 else None
+    pending: Set[asyncio.Future] = set()
+    try:
+        for index, data in _pending_parts(source, checkpoint, hasher):
+            while len(pending) >= concurrency:
+                finished, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in finished:
+                    task.result()
+            pending.add(asyncio.ensure_future(upload_part(index, data)))
+        if pending:
+            finished, pending = await asyncio.wait(pending)
+            for task in finished:
+                task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+    return hasher.hexdigest() if hasher is not None else None
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+__all__ = [
+    "iter_pages",
+    "aiter_pages",
+    "next_cursor_page",
+    "PageNumbers",
+    "single_page",
+]
+
+Params = Dict[str, Any]
+NextParams = Callable[[Any, Params], Optional[Params]]
+
+
+def _page_items(page: Any) -> List[Any]:
+    if isinstance(page, dict):
+        return page.get("data") or []
+    return getattr(page, "data", None) or []
+
+
+def _field(value: Any, name: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def next_cursor_page(page: Any, params: Params) -> Optional[Params]:
+    """Parameters for the page after `page` on OpenAI-style endpoints, which
+    return `has_more` and take the last seen id as `after`."""
+    items = _page_items(page)
+    if not items or not _field(page, "has_more"):
+        return None
+    after = _field(page, "last_id") or _field(items[-1], "id")
+    if after is None:
+        return None
+    return {**params, "after": after}
+
+
+class PageNumbers:
+    """Next-page parameters for endpoints paged by `current_page`, which stop
+    once `total` items have been seen or a page comes back empty."""
+
+    def __init__(self) -> None:
+        self.seen = 0
+
+    def __call__(self, page: Any, params: Params) -> Optional[Params]:
+        items = _page_items(page)
+        self.seen += len(items)
+        total = _field(page, "total")
+        if not items or (total is not None and self.seen >= total):
+            return None
+        # `list` takes `current_page=None` for the first page as well.
+        return {**params, "current_page": (params.get("current_page") or 0) + 1}
+
+
+def single_page(page: Any, params: Params) -> Optional[Params]:
+    """For list endpoints that return everything at once."""
+    return None
+
+
+def iter_pages(
+    fetch: Callable[..., Any], params: Params, next_params: NextParams
+) -> Iterator[Any]:
+    """Yield every item of every page from `fetch(**params)`.
+
+    The next page is requested on a background thread as soon as the current
+    one arrives, so it downloads while the caller works through the current
+    page. At most two pages are held at a time.
+    """
+    executor = ThreadPoolExecutor(max_workers=1)
+    future: Optional[Future] = executor.submit(fetch, **params)
+    try:
+        while future is not None:
+            page = future.result()
+            next_page = next_params(page, params)
+            future = None
+            if next_page is not None:
+                params = next_page
+                future = executor.submit(fetch, **params)
+            yield from _page_items(page)
+    finally:
+        # A prefetch the caller no longer needs is left to finish on its own.
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[..., Awaitable[Any]], params: Params, next_params: NextParams
+) -> AsyncIterator[Any]:
+    """Async counterpart of `iter_pages`; the next page is fetched in a task
+    on the current event loop."""
+    task: Optional[asyncio.Future] = asyncio.ensure_future(fetch(**params))
+    try:
+        while task is not None:
+            page = await task
+            next_page = next_params(page, params)
+            task = None
+            if next_page is not None:
+                params = next_page
+                task = asyncio.ensure_future(fetch(**params))
+            for item in _page_items(page):
+                yield item
+    finally:
+        if task is not None:
+            task.cancel()
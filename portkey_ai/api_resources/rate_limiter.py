@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from .fork_safety import ForkSafe
+
+__all__ = ["RateLimiter"]
+
+DEFAULT_RATE_LIMIT_KEY = "default"
+
+
+class _TokenBucket:
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        self._refill(now)
+        # A single request larger than the whole budget would never fit, so it
+        # only waits for a full bucket.
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, amount: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class _KeyBuckets:
+    def __init__(
+        self,
+        requests_per_minute: Optional[float],
+        tokens_per_minute: Optional[float],
+    ) -> None:
+        self.requests = (
+            _TokenBucket(requests_per_minute) if requests_per_minute else None
+        )
+        self.tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+
+class RateLimiter(ForkSafe):
+    """Client-side token bucket limiter for requests and tokens per minute.
+
+    Budgets are tracked per key, which the clients derive from their
+    `virtual_key` (or `provider`), so one limiter can be shared between every
+    client in the process that talks to the same key. Token usage is estimated
+    before sending from the prompt and `max_tokens`, and reconciled with the
+    `usage` reported in the response once it is known. Each retry of a
+    request counts again, and an attempt answered with an error gives its
+    estimated tokens back.
+
+    A process forked from one using the limiter starts from a copy of its
+    budgets, which are not shared with the parent from then on.
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        chars_per_token: float = 4.0,
+        limits: Optional[Mapping[str, Mapping[str, float]]] = None,
+    ) -> None:
+        if requests_per_minute is None and tokens_per_minute is None and not limits:
+            raise ValueError(
+                "Either `requests_per_minute`, `tokens_per_minute` or `limits` "
+                "must be set"
+            )
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.chars_per_token = chars_per_token
+        self.limits = dict(limits or {})
+        self._buckets: Dict[str, _KeyBuckets] = {}
+        self._lock = threading.Lock()
+        self._register_after_fork()
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # Another thread may have held the lock at the time of the fork.
+        self._lock = threading.Lock()
+        return {}
+
+    def _get_buckets(self, key: str) -> _KeyBuckets:
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            limits = self.limits.get(key, {})
+            buckets = _KeyBuckets(
+                limits.get("requests_per_minute", self.requests_per_minute),
+                limits.get("tokens_per_minute", self.tokens_per_minute),
+            )
+            self._buckets[key] = buckets
+        return buckets
+
+    def _try_acquire(self, key: str, tokens: int) -> float:
+        with self._lock:
+            buckets = self._get_buckets(key)
+            now = time.monotonic()
+            wait = 0.0
+            if buckets.requests is not None:
+                wait = max(wait, buckets.requests.wait_time(1, now))
+            if buckets.tokens is not None and tokens:
+                wait = max(wait, buckets.tokens.wait_time(tokens, now))
+            if wait == 0.0:
+                if buckets.requests is not None:
+                    buckets.requests.consume(1)
+                if buckets.tokens is not None and tokens:
+                    buckets.tokens.consume(tokens)
+            return wait
+
+    def acquire(self, key: Optional[str] = None, tokens: int = 0) -> None:
+        """Block until a request estimated at `tokens` tokens fits the budget."""
+        key = key or DEFAULT_RATE_LIMIT_KEY
+        while True:
+            wait = self._try_acquire(key, tokens)
+            if wait == 0.0:
+                return
+            time.sleep(wait)
+
+    async def aacquire(self, key: Optional[str] = None, tokens: int = 0) -> None:
+        key = key or DEFAULT_RATE_LIMIT_KEY
+        while True:
+            wait = self._try_acquire(key, tokens)
+            if wait == 0.0:
+                return
+            await asyncio.sleep(wait)
+
+    def reconcile(self, key: Optional[str], estimated_tokens: int, usage: Any) -> None:
+        """Correct the token budget once the real usage of a request is known."""
+        if usage is None:
+            return
+        if isinstance(usage, Mapping):
+            actual = usage.get("total_tokens")
+        else:
+            actual = getattr(usage, "total_tokens", None)
+        if actual is None:
+            return
+        with self._lock:
+            buckets = self._get_buckets(key or DEFAULT_RATE_LIMIT_KEY)
+            if buckets.tokens is not None:
+                buckets.tokens.adjust(estimated_tokens - actual)
+
+    def refund(self, key: Optional[str], estimated_tokens: int) -> None:
+        """Give back the tokens taken for a request that was answered with an
+        error, which uses no tokens. The request itself still counts."""
+        if not estimated_tokens:
+            return
+        with self._lock:
+            buckets = self._get_buckets(key or DEFAULT_RATE_LIMIT_KEY)
+            if buckets.tokens is not None:
+                buckets.tokens.adjust(estimated_tokens)
+
+    def estimate_tokens(self, body: Optional[Mapping[str, Any]]) -> int:
+        """Rough token estimate for a request body: prompt characters divided by
+        `chars_per_token`, plus the requested completion budget.
+        """
+        if not body or (not self.tokens_per_minute and not self.limits):
+            return 0
+        chars = 0
+        messages = body.get("messages")
+        if isinstance(messages, (list, tuple)):
+            for message in messages:
+                if isinstance(message, Mapping):
+                    chars += _content_length(message.get("content"))
+        prompt = body.get("prompt")
+        if prompt is not None:
+            chars += _content_length(prompt)
+        input = body.get("input")
+        if input is not None:
+            chars += _content_length(input)
+        completion_tokens = body.get("max_completion_tokens") or body.get("max_tokens")
+        if not isinstance(completion_tokens, int):
+            completion_tokens = 0
+        return int(chars / self.chars_per_token) + completion_tokens
+
+
+def _content_length(content: Any) -> int:
+    if isinstance(content, str):
+        return len(content)
+    if isinstance(content, (list, tuple)):
+        total = 0
+        for part in content:
+            if isinstance(part, str):
+                total += len(part)
+            elif isinstance(part, Mapping) and isinstance(part.get("text"), str):
+                total += len(part["text"])
+        return total
+    return 0
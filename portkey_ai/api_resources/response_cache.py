@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+
+import httpx
+from pydantic import BaseModel
+
+from portkey_ai.utils.json_utils import json_loads
+from .._vendor.openai._types import NotGiven, Omit
+from .fork_safety import ForkSafe, keep_inherited
+from .utils import ModelT, build_model
+
+__all__ = [
+    "ResponseCache",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "response_cache_key",
+    "load_cached_response",
+    "store_response",
+]
+
+# Headers that label a request for observability but do not change its result.
+CACHE_KEY_IGNORED_HEADERS = frozenset(
+    (
+        "x-portkey-trace-id",
+        "x-portkey-span-id",
+        "x-portkey-parent-span-id",
+        "x-portkey-span-name",
+        "x-portkey-metadata",
+        "x-portkey-cache-force-refresh",
+    )
+)
+
+# Request arguments that do not change the result.
+CACHE_KEY_IGNORED_PARAMS = frozenset(("timeout",))
+
+# A cached response: the raw body and the response headers.
+CacheEntry = Tuple[bytes, Dict[str, str]]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        if hasattr(value, "model_dump"):
+            return value.model_dump()
+        return value.dict()
+    if isinstance(value, (tuple, set, frozenset)):
+        return list(value)
+    raise TypeError(f"{type(value).__name__} cannot be part of a cache key")
+
+
+def _key_headers(headers: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    return {
+        name.lower(): value
+        for name, value in (headers or {}).items()
+        if name.lower() not in CACHE_KEY_IGNORED_HEADERS
+    }
+
+
+def route_key(client: Any) -> str:
+    """The client settings that pick the provider a request goes to (base URL,
+    config, provider and keys), canonically encoded."""
+    return json.dumps(
+        {
+            "base_url": str(client.base_url),
+            "headers": _key_headers(client.custom_headers),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def response_cache_key(
+    client: Any, endpoint: str, params: Mapping[str, Any]
+) -> Optional[str]:
+    """Canonical hash of a request: the endpoint, its arguments and the client
+    settings that pick the provider (base URL, config, provider and keys).
+
+    Returns None when `client` has no `response_cache`, or when an argument
+    cannot be represented canonically, e.g. a file object; such requests are
+    not cached.
+    """
+    if client.response_cache is None:
+        return None
+    key_params = {}
+    for name, value in params.items():
+        if isinstance(value, (NotGiven, Omit)) or name in CACHE_KEY_IGNORED_PARAMS:
+            continue
+        if name == "extra_headers":
+            value = _key_headers(value)
+        key_params[name] = value
+    try:
+        canonical = json.dumps(
+            {
+                "endpoint": endpoint,
+                "params": key_params,
+                "base_url": str(client.base_url),
+                "headers": _key_headers(client.custom_headers),
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=_json_default,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_cached_response(
+    client: Any, model_class: Type[ModelT], key: Optional[str]
+) -> Optional[ModelT]:
+    """The cached response for `key`, built like a fresh one, or None.
+
+    Lookups are skipped while the client has `cache_force_refresh` set, so the
+    request goes out and its response replaces the cached one.
+    """
+    if key is None or client.cache_force_refresh:
+        return None
+    entry = client.response_cache.get(key)
+    if entry is None:
+        return None
+    content, headers = entry
+    data = build_model(model_class, json_loads(content), client.response_model_mode)
+    data._headers = httpx.Headers(headers)  # type: ignore[attr-defined]
+    return data
+
+
+def store_response(client: Any, key: Optional[str], response: Any) -> None:
+    if key is not None:
+        client.response_cache.set(key, response.content, response.headers)
+
+
+class ResponseCache(ForkSafe, abc.ABC):
+    """Base class for client-side caches of non-streaming responses.
+
+    Pass an instance as `response_cache` to `Portkey`/`AsyncPortkey` to serve
+    repeated `chat.completions.create`, `completions.create`,
+    `embeddings.create` and `prompts.completions.create` calls locally. Entries
+    are keyed by `response_cache_key` and expire after `ttl` seconds, if set.
+
+    Subclasses implement `_get`, `_set`, `_delete`, `_clear` and `_size`; hit,
+    miss and eviction counts are kept here. A forked child starts its counts
+    from the parent's and, for `SQLiteResponseCache`, opens its own connection.
+    """
+
+    def __init__(self, *, ttl: Optional[float] = None) -> None:
+        if ttl is not None and ttl <= 0:
+            raise ValueError("`ttl` must be positive")
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._stats_lock = threading.Lock()
+        self._register_after_fork()
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # Another thread may have held a lock at the time of the fork.
+        self._stats_lock = threading.Lock()
+        return {}
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._get(key)
+        with self._stats_lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return entry
+
+    def set(self, key: str, content: bytes, headers: Mapping[str, str]) -> None:
+        self._set(key, (bytes(content), dict(headers)))
+
+    def delete(self, key: str) -> None:
+        self._delete(key)
+
+    def clear(self) -> None:
+        self._clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts since construction and the current size."""
+        entries, size_bytes = self._size()
+        with self._stats_lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": entries,
+                "size_bytes": size_bytes,
+            }
+
+    def _count_evictions(self, count: int) -> None:
+        if count:
+            with self._stats_lock:
+                self.evictions += count
+
+    @abc.abstractmethod
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        """The entry stored under `key`, or None."""
+
+    @abc.abstractmethod
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        """Store `entry` under `key`, evicting entries as needed."""
+
+    @abc.abstractmethod
+    def _delete(self, key: str) -> None:
+        """Remove the entry stored under `key`, if any."""
+
+    @abc.abstractmethod
+    def _clear(self) -> None:
+        """Remove every entry."""
+
+    @abc.abstractmethod
+    def _size(self) -> Tuple[int, int]:
+        """The number of entries and their total size in bytes."""
+
+
+def _entry_size(entry: CacheEntry) -> int:
+    content, headers = entry
+    return len(content) + sum(len(k) + len(v) for k, v in headers.items())
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache, bounded by entry count and, optionally, by the
+    total size of the cached bodies and headers in bytes."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+    ) -> None:
+        super().__init__(ttl=ttl)
+        if max_entries < 1:
+            raise ValueError("`max_entries` must be at least 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Tuple[float, int, CacheEntry]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        self._lock = threading.Lock()
+        return super()._reset_after_fork()
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, size, entry = item
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self._bytes -= size
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        size = _entry_size(entry)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        evicted = 0
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (time.monotonic(), size, entry)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                evicted += 1
+        self._count_evictions(evicted)
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is not None:
+                self._bytes -= item[1]
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _size(self) -> Tuple[int, int]:
+        with self._lock:
+            return len(self._entries), self._bytes
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Cache stored in a SQLite database file, shared by every process that
+    opens the same `path`.
+
+    The database runs in WAL mode, so readers in other processes are not
+    blocked by writers, and is memory-mapped for reads. Least recently used
+    entries are removed once there are more than `max_entries`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        timeout: float = 30.0,
+        mmap_size: int = 256 * 1024 * 1024,
+    ) -> None:
+        super().__init__(ttl=ttl)
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("`max_entries` must be at least 1")
+        self.path = path
+        self.max_entries = max_entries
+        self._timeout = timeout
+        self._mmap_size = mmap_size
+        self._lock = threading.Lock()
+        self._db = self._connect()
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, content BLOB NOT NULL, headers TEXT NOT NULL, "
+            "size INTEGER NOT NULL, stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(
+            self.path,
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute(f"PRAGMA mmap_size={int(self._mmap_size)}")
+        return db
+
+    def _reset_after_fork(self) -> Dict[int, Any]:
+        # SQLite connections must not be used across a fork.
+        keep_inherited(self._db)
+        self._db = self._connect()
+        self._lock = threading.Lock()
+        return super()._reset_after_fork()
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT content, headers, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            content, headers, stored_at = row
+            if self.ttl is not None and now - stored_at > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._db.execute(
+                "UPDATE responses SET used_at = ? WHERE key = ?", (now, key)
+            )
+        return bytes(content), json.loads(headers)
+
+    def _set(self, key: str, entry: CacheEntry) -> None:
+        content, headers = entry
+        now = time.time()
+        evicted = 0
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, content, headers, size, stored_at, used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, content, json.dumps(headers), _entry_size(entry), now, now),
+            )
+            if self.max_entries is not None:
+                evicted = self._db.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                    "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        self._count_evictions(max(evicted, 0))
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def _size(self) -> Tuple[int, int]:
+        with self._lock:
+            entries, size_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return entries, size_bytes
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
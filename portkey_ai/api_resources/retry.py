@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import httpx
+
+from .global_constants import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_INITIAL_DELAY,
+    DEFAULT_RETRY_MAX_DELAY,
+    DEFAULT_RETRY_MAX_RETRY_AFTER,
+    DEFAULT_RETRY_STATUS_CODES,
+    PORTKEY_HEADER_PREFIX,
+)
+
+__all__ = ["RetryPolicy"]
+
+# Headers set by the gateway once it has processed a request. A 5xx response
+# carrying one of these has already been through the gateway's own retry
+# handling, so it is only retried client-side if its status code is listed in
+# `retry_on_status_codes`.
+GATEWAY_RESPONSE_HEADERS = (
+    f"{PORTKEY_HEADER_PREFIX}trace-id",
+    f"{PORTKEY_HEADER_PREFIX}request-id",
+    f"{PORTKEY_HEADER_PREFIX}gateway-exception",
+)
+
+
+class RetryPolicy:
+    """Controls how `APIClient`/`AsyncAPIClient` retry failed requests.
+
+    Delays grow exponentially from `initial_delay` up to `max_delay` and use
+    full jitter, i.e. the actual sleep is drawn uniformly from `[0, backoff]`.
+    When the server sends `retry-after-ms`, `retry-after` or
+    `x-ratelimit-reset` the advertised delay is used instead, as long as it is
+    not longer than `max_retry_after`.
+
+    `total_timeout` bounds the wall-clock time spent across all attempts: a
+    retry is not scheduled if its delay would push the request past it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        initial_delay: float = DEFAULT_RETRY_INITIAL_DELAY,
+        max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+        backoff_multiplier: float = 2.0,
+        jitter: bool = True,
+        retry_on_status_codes: Optional[Iterable[int]] = None,
+        retry_on_connection_errors: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = DEFAULT_RETRY_MAX_RETRY_AFTER,
+        total_timeout: Optional[float] = None,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("`max_retries` must be greater than or equal to 0")
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.backoff_multiplier = backoff_multiplier
+        self.jitter = jitter
+        self.retry_on_status_codes = frozenset(
+            DEFAULT_RETRY_STATUS_CODES
+            if retry_on_status_codes is None
+            else retry_on_status_codes
+        )
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.total_timeout = total_timeout
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, "
+            f"initial_delay={self.initial_delay}, max_delay={self.max_delay}, "
+            f"retry_on_status_codes={sorted(self.retry_on_status_codes)}, "
+            f"total_timeout={self.total_timeout})"
+        )
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        if response.status_code in self.retry_on_status_codes:
+            return True
+        if response.status_code < 500:
+            return False
+        return not any(response.headers.get(h) for h in GATEWAY_RESPONSE_HEADERS)
+
+    def should_retry_exception(self, exc: Exception) -> bool:
+        return self.retry_on_connection_errors and isinstance(
+            exc, (httpx.TransportError, httpx.TimeoutException)
+        )
+
+    def backoff(self, retry_count: int) -> float:
+        """Backoff for the `retry_count`-th retry (0-based), jitter included."""
+        delay = min(
+            self.max_delay,
+            self.initial_delay * (self.backoff_multiplier**retry_count),
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return max(delay, 0.0)
+
+    def retry_after(self, response: Optional[httpx.Response]) -> Optional[float]:
+        """Delay in seconds advertised by the server, if any."""
+        if response is None or not self.respect_retry_after:
+            return None
+        headers = response.headers
+
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            try:
+                return float(retry_after_ms) / 1000
+            except ValueError:
+                pass
+
+        retry_after = headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                try:
+                    retry_date = parsedate_to_datetime(retry_after)
+                    return retry_date.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+
+        ratelimit_reset = headers.get("x-ratelimit-reset")
+        if ratelimit_reset is not None:
+            try:
+                reset = float(ratelimit_reset)
+            except ValueError:
+                return None
+            # Some providers send an absolute epoch timestamp, others a delta.
+            return reset - time.time() if reset > 1e9 else reset
+
+        return None
+
+    def compute_delay(
+        self, retry_count: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        server_delay = self.retry_after(response)
+        if server_delay is not None and 0 <= server_delay <= self.max_retry_after:
+            return server_delay
+        return self.backoff(retry_count)
+
+    def next_delay(
+        self,
+        retry_count: int,
+        started_at: float,
+        response: Optional[httpx.Response] = None,
+        max_retries: Optional[int] = None,
+    ) -> Optional[float]:
+        """Delay before the next attempt, or `None` if the request must not be
+        retried again.
+        """
+        if retry_count >= (self.max_retries if max_retries is None else max_retries):
+            return None
+        delay = self.compute_delay(retry_count, response)
+        if self.total_timeout is not None:
+            elapsed = time.monotonic() - started_at
+            if elapsed + delay >= self.total_timeout:
+                return None
+        return delay
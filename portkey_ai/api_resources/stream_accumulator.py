@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from .types.chat_complete_type import ChatCompletions
+from .utils import validate_model
+
+__all__ = ["StreamAccumulator", "AsyncStreamAccumulator"]
+
+_COMPLETION_FIELDS = ("id", "created", "model", "system_fingerprint", "service_tier")
+
+
+def _get(obj: Any, key: str) -> Any:
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _to_dict(obj: Any) -> Any:
+    if obj is None or isinstance(obj, dict):
+        return obj
+    for method in ("model_dump", "to_dict", "dict"):
+        dump = getattr(obj, method, None)
+        if callable(dump):
+            return dump()
+    return obj
+
+
+class _ToolCallState:
+    __slots__ = ("id", "type", "name", "arguments")
+
+    def __init__(self) -> None:
+        self.id: Optional[str] = None
+        self.type: Optional[str] = None
+        self.name: Optional[str] = None
+        self.arguments: List[str] = []
+
+    def build(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": self.type or "function",
+            "function": {"name": self.name, "arguments": "".join(self.arguments)},
+        }
+
+
+class _ChoiceState:
+    __slots__ = (
+        "index",
+        "role",
+        "content",
+        "refusal",
+        "finish_reason",
+        "tool_calls",
+        "function_call",
+        "logprobs",
+    )
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.role: Optional[str] = None
+        self.content: List[str] = []
+        self.refusal: List[str] = []
+        self.finish_reason: Optional[str] = None
+        self.tool_calls: Dict[int, _ToolCallState] = {}
+        self.function_call: Optional[_ToolCallState] = None
+        self.logprobs: Dict[str, List[Any]] = {}
+
+    def add(self, choice: Any) -> None:
+        finish_reason = _get(choice, "finish_reason")
+        if finish_reason:
+            self.finish_reason = finish_reason
+
+        logprobs = _get(choice, "logprobs")
+        if logprobs is not None:
+            for key in ("content", "refusal"):
+                tokens = _get(logprobs, key)
+                if tokens:
+                    self.logprobs.setdefault(key, []).extend(
+                        _to_dict(token) for token in tokens
+                    )
+
+        delta = _get(choice, "delta")
+        if delta is None:
+            return
+        role = _get(delta, "role")
+        if role:
+            self.role = role
+        content = _get(delta, "content")
+        if content:
+            self.content.append(content)
+        refusal = _get(delta, "refusal")
+        if refusal:
+            self.refusal.append(refusal)
+
+        function_call = _get(delta, "function_call")
+        if function_call is not None:
+            if self.function_call is None:
+                self.function_call = _ToolCallState()
+            self._add_function(self.function_call, function_call)
+
+        for tool_call in _get(delta, "tool_calls") or ():
+            index = _get(tool_call, "index")
+            if index is None:
+                index = self._index_for_id(_get(tool_call, "id"))
+            state = self.tool_calls.get(index)
+            if state is None:
+                state = self.tool_calls[index] = _ToolCallState()
+            tool_call_id = _get(tool_call, "id")
+            if tool_call_id:
+                state.id = tool_call_id
+            tool_call_type = _get(tool_call, "type")
+            if tool_call_type:
+                state.type = tool_call_type
+            function = _get(tool_call, "function")
+            if function is not None:
+                self._add_function(state, function)
+
+    def _index_for_id(self, tool_call_id: Optional[str]) -> int:
+        for index, state in self.tool_calls.items():
+            if tool_call_id is not None and state.id == tool_call_id:
+                return index
+        if tool_call_id is None and self.tool_calls:
+            # A fragment without index or id continues the latest call.
+            return max(self.tool_calls)
+        return len(self.tool_calls)
+
+    @staticmethod
+    def _add_function(state: _ToolCallState, function: Any) -> None:
+        name = _get(function, "name")
+        if name and not state.name:
+            state.name = name
+        arguments = _get(function, "arguments")
+        if arguments:
+            state.arguments.append(arguments)
+
+    def build(self) -> Dict[str, Any]:
+        message: Dict[str, Any] = {
+            "role": self.role or "assistant",
+            "content": "".join(self.content) if self.content else None,
+        }
+        if self.refusal:
+            message["refusal"] = "".join(self.refusal)
+        if self.tool_calls:
+            message["tool_calls"] = [
+                self.tool_calls[index].build() for index in sorted(self.tool_calls)
+            ]
+        if self.function_call is not None:
+            message["function_call"] = self.function_call.build()["function"]
+        return {
+            "index": self.index,
+            "finish_reason": self.finish_reason,
+            "logprobs": self.logprobs or None,
+            "message": message,
+        }
+
+
+class _Accumulator:
+    def __init__(self) -> None:
+        self._fields: Dict[str, Any] = {}
+        self._choices: Dict[int, _ChoiceState] = {}
+        self._usage: Any = None
+        self._headers: Any = None
+        self._completion: Optional[ChatCompletions] = None
+
+    def add(self, chunk: Any) -> Any:
+        """Merge one `ChatCompletionChunk` (or an equivalent dict) and return it.
+
+        Text and argument fragments are only collected here; they are joined
+        once when the final completion is built.
+        """
+        self._completion = None
+        fields = self._fields
+        for key in _COMPLETION_FIELDS:
+            if key not in fields:
+                value = _get(chunk, key)
+                if value is not None:
+                    fields[key] = value
+        usage = _get(chunk, "usage")
+        if usage is not None:
+            self._usage = usage
+        for choice in _get(chunk, "choices") or ():
+            index = _get(choice, "index") or 0
+            state = self._choices.get(index)
+            if state is None:
+                state = self._choices[index] = _ChoiceState(index)
+            state.add(choice)
+        return chunk
+
+    def _build(self) -> ChatCompletions:
+        if self._completion is None:
+            data = dict(self._fields)
+            data["object"] = "chat.completion"
+            data["choices"] = [
+                self._choices[index].build() for index in sorted(self._choices)
+            ]
+            data["usage"] = _to_dict(self._usage)
+            completion = validate_model(ChatCompletions, data)
+            completion._headers = self._headers
+            self._completion = completion
+        return self._completion
+
+
+class StreamAccumulator(_Accumulator):
+    """Assembles a full `ChatCompletions` from a chat completion stream.
+
+    Iterating over the accumulator yields the live chunks while merging them,
+    including tool call argument fragments, logprobs and usage, in time linear
+    in the size of the stream::
+
+        stream = StreamAccumulator(
+            portkey.chat.completions.create(..., stream=True)
+        )
+        for chunk in stream:
+            ...
+        completion = stream.final_completion()
+    """
+
+    def __init__(self, stream: Iterable[Any]) -> None:
+        super().__init__()
+        self._stream = stream
+        self._iterator = iter(stream)
+        response = getattr(stream, "response", None)
+        self._headers = getattr(response, "headers", None)
+
+    def __iter__(self) -> Iterator[Any]:
+        for chunk in self._iterator:
+            yield self.add(chunk)
+
+    def final_completion(self) -> ChatCompletions:
+        """Consume whatever is left of the stream and return the completion."""
+        for _ in self:
+            pass
+        return self._build()
+
+    def close(self) -> None:
+        close = getattr(self._stream, "close", None)
+        if callable(close):
+            close()
+
+    def __enter__(self) -> "StreamAccumulator":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncStreamAccumulator(_Accumulator):
+    """Async counterpart of `StreamAccumulator` for `AsyncStream` responses."""
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__()
+        self._stream = stream
+        self._iterator: AsyncIterator[Any] = stream.__aiter__()
+        response = getattr(stream, "response", None)
+        self._headers = getattr(response, "headers", None)
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        async for chunk in self._iterator:
+            yield self.add(chunk)
+
+    async def final_completion(self) -> ChatCompletions:
+        async for _ in self:
+            pass
+        return self._build()
+
+    async def close(self) -> None:
+        close = getattr(self._stream, "close", None)
+        if callable(close):
+            await close()
+
+    async def __aenter__(self) -> "AsyncStreamAccumulator":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
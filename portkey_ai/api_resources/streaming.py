@@ -1,13 +1,15 @@
 from __future__ import annotations
 import json
-from typing import Any, Iterator, AsyncIterator, Generic, cast, Union, Type
+from typing import Any, Iterator, AsyncIterator, Generic, List, cast, Union, Type
 import httpx
 from .utils import (
     ResponseT,
+    build_model,
     make_status_error,
 )
 from types import TracebackType
 from typing_extensions import Self
+from portkey_ai.utils.json_utils import json_loads
 
 
 class ServerSentEvent:
@@ -18,12 +20,14 @@ class ServerSentEvent:
         data: Union[str, None] = None,
         id: Union[str, None] = None,
         retry: Union[int, None] = None,
+        raw: Union[bytes, memoryview, None] = None,
     ) -> None:
-        if data is None:
+        if data is None and raw is None:
             data = ""
 
         self._id = id
         self._data = data
+        self._raw = raw
         self._event = event or None
         self._retry = retry
 
@@ -41,9 +45,22 @@ class ServerSentEvent:
 
     @property
     def data(self) -> str:
+        if self._data is None:
+            self._data = bytes(self._raw).decode("utf-8")  # type: ignore[arg-type]
         return self._data
 
+    @property
+    def done(self) -> bool:
+        """Whether this is the `[DONE]` sentinel that ends a stream."""
+        if self is _DONE_EVENT:
+            return True
+        if self._raw is not None:
+            return self._raw[:6] == b"[DONE]"
+        return self.data.startswith("[DONE]")
+
     def json(self) -> Any:
+        if self._raw is not None:
+            return json_loads(self._raw)
         return json.loads(self.data)
 
     def __repr__(self) -> str:
@@ -138,15 +155,159 @@ class SSEDecoder:
         return None
 
 
+_DONE_EVENT = ServerSentEvent(data="[DONE]")
+_PING_EVENT = ServerSentEvent(event="ping")
+
+
+class SSEBytesDecoder:
+    """Incremental SSE parser that works on raw bytes chunks.
+
+    Events are split on blank lines with `bytes.find`, and the payload of a
+    single `data:` line (the common case) is kept as a `memoryview` slice that
+    goes straight to the JSON decoder, so nothing is decoded to `str` unless
+    `ServerSentEvent.data` is read. `[DONE]` and `ping` events are returned as
+    shared instances. Chunks that complete no event are only collected, and
+    joined once an event ends, so a large event arriving in many small chunks
+    is copied once rather than on every chunk.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._ends_with_newline = False
+        self._pending_cr = False
+        self._last_event_id: Union[str, None] = None
+
+    def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
+        """Given an iterator that yields raw chunks, yield every complete event"""
+        for chunk in iterator:
+            yield from self.feed(chunk)
+        yield from self.flush()
+
+    async def aiter_bytes(
+        self, iterator: AsyncIterator[bytes]
+    ) -> AsyncIterator[ServerSentEvent]:
+        async for chunk in iterator:
+            for sse in self.feed(chunk):
+                yield sse
+        for sse in self.flush():
+            yield sse
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """Add a chunk and return the events it completes."""
+        if self._pending_cr:
+            chunk = b"\r" + chunk
+            self._pending_cr = False
+        if b"\r" in chunk:
+            # A lone trailing CR may be the first half of a CRLF.
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                self._pending_cr = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        if not chunk:
+            return []
+        if b"\n\n" not in chunk and not (
+            self._ends_with_newline and chunk.startswith(b"\n")
+        ):
+            self._chunks.append(chunk)
+            self._ends_with_newline = chunk.endswith(b"\n")
+            return []
+        if self._chunks:
+            self._chunks.append(chunk)
+            buffer = b"".join(self._chunks)
+        else:
+            buffer = chunk
+        events: List[ServerSentEvent] = []
+        start = 0
+        while True:
+            end = buffer.find(b"\n\n", start)
+            if end == -1:
+                break
+            if end > start:
+                sse = self._decode_event(buffer, start, end)
+                if sse is not None:
+                    events.append(sse)
+            start = end + 2
+        rest = buffer[start:]
+        self._chunks = [rest] if rest else []
+        self._ends_with_newline = rest.endswith(b"\n")
+        return events
+
+    def flush(self) -> List[ServerSentEvent]:
+        """Resolve a CR held back from the last chunk once the stream ends."""
+        if not self._pending_cr:
+            return []
+        self._pending_cr = False
+        return self.feed(b"\n")
+
+    def _decode_event(
+        self, buffer: bytes, start: int, end: int
+    ) -> Union[ServerSentEvent, None]:
+        # Fast path: a block made of a single `data:` line.
+        if buffer.startswith(b"data:", start) and buffer.find(b"\n", start, end) == -1:
+            start += 5
+            if buffer.startswith(b" ", start):
+                start += 1
+            if buffer.startswith(b"[DONE]", start):
+                return _DONE_EVENT
+            return ServerSentEvent(
+                raw=memoryview(buffer)[start:end], id=self._last_event_id
+            )
+        if buffer.startswith(b"event: ping", start) and end - start == 11:
+            return _PING_EVENT
+        return self._decode_fields(buffer[start:end])
+
+    def _decode_fields(self, block: bytes) -> Union[ServerSentEvent, None]:
+        # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
+        event: Union[str, None] = None
+        data: List[bytes] = []
+        retry: Union[int, None] = None
+        has_id = False
+        for line in block.split(b"\n"):
+            if not line or line.startswith(b":"):
+                continue
+            fieldname, _, value = line.partition(b":")
+            if value.startswith(b" "):
+                value = value[1:]
+            if fieldname == b"data":
+                data.append(value)
+            elif fieldname == b"event":
+                event = value.decode("utf-8")
+            elif fieldname == b"id":
+                has_id = True
+                if b"\0" not in value:
+                    self._last_event_id = value.decode("utf-8")
+            elif fieldname == b"retry":
+                try:
+                    retry = int(value)
+                except ValueError:
+                    pass
+        if event is None and not data and not has_id and retry is None:
+            return None
+        return ServerSentEvent(
+            event=event,
+            raw=b"\n".join(data),
+            id=self._last_event_id,
+            retry=retry,
+        )
+
+
 class Stream(Generic[ResponseT]):
     """Provides the core interface to iterate over a synchronous stream response."""
 
     response: httpx.Response
 
-    def __init__(self, *, response: httpx.Response, cast_to: Type[ResponseT]) -> None:
+    def __init__(
+        self,
+        *,
+        response: httpx.Response,
+        cast_to: Type[ResponseT],
+        response_model_mode: str = "strict",
+    ) -> None:
         self._cast_to = cast_to
+        self._response_model_mode = response_model_mode
         self.response = response
-        self._decoder = SSEDecoder()
+        self._decoder = SSEBytesDecoder()
         self._iterator = self.__stream__()
 
     def __next__(self) -> ResponseT:
@@ -157,17 +318,20 @@ class Stream(Generic[ResponseT]):
             yield item
 
     def _iter_events(self) -> Iterator[ServerSentEvent]:
-        yield from self._decoder.iter(self.response.iter_lines())
+        yield from self._decoder.iter_bytes(self.response.iter_bytes())
 
     def __stream__(self) -> Iterator[ResponseT]:
         response = self.response
         for sse in self._iter_events():
-            if sse.data.startswith("[DONE]"):
+            if sse.done:
                 break
             if sse.event is None:
-                yield cast(ResponseT, self._cast_to(**sse.json())) if not isinstance(
-                    self._cast_to, httpx.Response
-                ) else cast(ResponseT, sse)
+                yield cast(
+                    ResponseT,
+                    build_model(self._cast_to, sse.json(), self._response_model_mode),
+                ) if not isinstance(self._cast_to, httpx.Response) else cast(
+                    ResponseT, sse
+                )
 
             if sse.event == "ping":
                 continue
@@ -208,10 +372,17 @@ class AsyncStream(Generic[ResponseT]):
 
     response: httpx.Response
 
-    def __init__(self, *, response: httpx.Response, cast_to: Type[ResponseT]) -> None:
+    def __init__(
+        self,
+        *,
+        response: httpx.Response,
+        cast_to: Type[ResponseT],
+        response_model_mode: str = "strict",
+    ) -> None:
         self._cast_to = cast_to
+        self._response_model_mode = response_model_mode
         self.response = response
-        self._decoder = SSEDecoder()
+        self._decoder = SSEBytesDecoder()
         self._iterator = self.__stream__()
 
     async def __anext__(self) -> ResponseT:
@@ -222,19 +393,22 @@ class AsyncStream(Generic[ResponseT]):
             yield item
 
     async def _iter_events(self) -> AsyncIterator[ServerSentEvent]:
-        async for sse in self._decoder.aiter(self.response.aiter_lines()):
+        async for sse in self._decoder.aiter_bytes(self.response.aiter_bytes()):
             yield sse
 
     async def __stream__(self) -> AsyncIterator[ResponseT]:
         response = self.response
 
         async for sse in self._iter_events():
-            if sse.data.startswith("[DONE]"):
+            if sse.done:
                 break
             if sse.event is None:
-                yield cast(ResponseT, self._cast_to(**sse.json())) if not isinstance(
-                    self._cast_to, httpx.Response
-                ) else cast(ResponseT, sse)
+                yield cast(
+                    ResponseT,
+                    build_model(self._cast_to, sse.json(), self._response_model_mode),
+                ) if not isinstance(self._cast_to, httpx.Response) else cast(
+                    ResponseT, sse
+                )
 
             if sse.event == "ping":
                 continue
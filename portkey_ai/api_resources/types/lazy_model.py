@@ -0,0 +1,141 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union, get_args, get_origin
+
+import httpx
+from pydantic import BaseModel
+
+from .utils import parse_headers
+
+__all__ = ["LazyModel"]
+
+_MISSING = object()
+
+# (model class, attribute) -> how to wrap the raw value:
+# None for plain values, or (is_list, nested model class).
+_field_kinds: Dict[Tuple[type, str], Optional[Tuple[bool, type]]] = {}
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+def _field_annotation(model_class: type, name: str) -> Any:
+    fields = getattr(model_class, "model_fields", None)
+    if fields is not None:
+        field = fields.get(name)
+        return field.annotation if field is not None else _MISSING
+    fields = getattr(model_class, "__fields__", {})
+    field = fields.get(name)
+    return field.outer_type_ if field is not None else _MISSING
+
+
+def _kind_of(annotation: Any) -> Optional[Tuple[bool, type]]:
+    if _is_model(annotation):
+        return (False, annotation)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Union:
+        for arg in args:
+            kind = _kind_of(arg)
+            if kind is not None:
+                return kind
+    elif origin in (list, List) and args and _is_model(args[0]):
+        return (True, args[0])
+    return None
+
+
+def _field_kind(model_class: type, name: str) -> Optional[Tuple[bool, type]]:
+    key = (model_class, name)
+    try:
+        return _field_kinds[key]
+    except KeyError:
+        annotation = _field_annotation(model_class, name)
+        kind = None if annotation is _MISSING else _kind_of(annotation)
+        _field_kinds[key] = kind
+        return kind
+
+
+class LazyModel:
+    """Read-only stand-in for a response model that skips validation.
+
+    It keeps the decoded JSON as is and only wraps a nested object, in another
+    `LazyModel`, when that attribute is first read. Attribute access, `get`,
+    `__getitem__` and `get_headers` behave like on the wrapped model class;
+    call `validate()` to get a fully validated instance of it.
+
+    Clients with `response_model_mode="lazy"` return these for JSON responses
+    and chat completion stream chunks. Other streams, such as those of
+    `completions`, `responses` and assistant runs, are parsed by the vendored
+    OpenAI client and still yield validated models.
+    """
+
+    __slots__ = ("_model_class", "_data", "_cache", "_headers")
+
+    def __init__(self, model_class: type, data: Dict[str, Any]) -> None:
+        self._model_class = model_class
+        self._data = data
+        self._cache: Dict[str, Any] = {}
+        self._headers: Optional[httpx.Headers] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        value = self._data.get(name, _MISSING)
+        if value is _MISSING:
+            if _field_annotation(self._model_class, name) is _MISSING:
+                raise AttributeError(
+                    f"'{self._model_class.__name__}' object has no attribute '{name}'"
+                )
+            value = None
+        else:
+            kind = _field_kind(self._model_class, name)
+            if kind is not None:
+                is_list, nested_class = kind
+                if is_list and isinstance(value, list):
+                    value = [
+                        LazyModel(nested_class, item)
+                        if isinstance(item, dict)
+                        else item
+                        for item in value
+                    ]
+                elif not is_list and isinstance(value, dict):
+                    value = LazyModel(nested_class, value)
+        cache[name] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key, None)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        return getattr(self, key, None) or default
+
+    def get_headers(self) -> Optional[Dict[str, str]]:
+        return parse_headers(self._headers)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._data
+
+    model_dump = dict = to_dict
+
+    def validate(self) -> Any:
+        """Validate the raw data into an instance of the wrapped model class."""
+        model_validate = getattr(self._model_class, "model_validate", None)
+        if model_validate is not None:
+            model = model_validate(self._data)
+        else:
+            model = self._model_class.parse_obj(self._data)  # type: ignore
+        if self._headers is not None:
+            model._headers = self._headers
+        return model
+
+    def __str__(self) -> str:
+        return json.dumps(self._data, indent=4)
+
+    def __repr__(self) -> str:
+        return f"LazyModel[{self._model_class.__name__}]({self._data!r})"
@@ -2,13 +2,26 @@ from __future__ import annotations
 
 import json
 import os
-from typing import List, Dict, Any, Optional, Union, Mapping, Literal, TypeVar, cast
+from itertools import islice
+from typing import (
+    List,
+    Dict,
+    Any,
+    Optional,
+    Union,
+    Mapping,
+    Literal,
+    Type,
+    TypeVar,
+    cast,
+)
 from enum import Enum, EnumMeta
 from typing_extensions import TypedDict, NotRequired
 import httpx
 import portkey_ai
 from pydantic import BaseModel
 from .._vendor.openai._types import NOT_GIVEN
+from portkey_ai.utils.json_utils import json_loads
 
 from portkey_ai.api_resources.types.chat_complete_type import (
     ChatCompletionChunk,
@@ -19,6 +32,7 @@ from portkey_ai.api_resources.types.complete_type import (
     TextCompletion,
 )
 from portkey_ai.api_resources.types.feedback_type import FeedbackResponse
+from portkey_ai.api_resources.types.lazy_model import LazyModel
 from portkey_ai.api_resources.types.generation_type import (
     PromptCompletion,
     PromptCompletionChunk,
@@ -152,6 +166,8 @@ class Options(BaseModel):
     # json structure
     json_body: Optional[Mapping[str, Any]] = None
     files: Any = None
+    # key under which a successful response is stored in the response cache
+    cache_key: Optional[str] = None
 
 
 class FunctionCall(BaseModel):
@@ -257,6 +273,47 @@ def remove_empty_values(
         return cast(dict, data)
 
 
+def _is_empty_value(value: Any) -> bool:
+    return value is NOT_GIVEN or (isinstance(value, str) and not value)
+
+
+def prune_empty_values(data: Any) -> Any:
+    """Drop `NOT_GIVEN` and `""` values from a request body, like
+    `remove_empty_values`, without copying it.
+
+    The input is never modified. A dict or list is only rebuilt when something
+    inside it is dropped; everything else, including large content parts such
+    as base64 images, is returned as the same object.
+    """
+    if isinstance(data, dict):
+        pruned: Optional[Dict[str, Any]] = None
+        for index, (key, value) in enumerate(data.items()):
+            if _is_empty_value(value):
+                if pruned is None:
+                    pruned = dict(islice(data.items(), index))
+                continue
+            cleaned = prune_empty_values(value)
+            if pruned is None and cleaned is not value:
+                pruned = dict(islice(data.items(), index))
+            if pruned is not None:
+                pruned[key] = cleaned
+        return data if pruned is None else pruned
+    if isinstance(data, list):
+        pruned_list: Optional[List[Any]] = None
+        for index, item in enumerate(data):
+            if _is_empty_value(item):
+                if pruned_list is None:
+                    pruned_list = data[:index]
+                continue
+            cleaned = prune_empty_values(item)
+            if pruned_list is None and cleaned is not item:
+                pruned_list = data[:index]
+            if pruned_list is not None:
+                pruned_list.append(cleaned)
+        return data if pruned_list is None else pruned_list
+    return data
+
+
 class Constructs(BaseModel):
     provider: Union[ProviderTypes, ProviderTypesLiteral, str]
     api_key: Optional[str] = None
@@ -531,3 +588,53 @@ def create_model_instance(model_class):
     except AttributeError:
         # Fall back to Pydantic v1 method
         return model_class.construct()
+
+
+ModelT = TypeVar("ModelT")
+
+
+def validate_model(model_class: Type[ModelT], data: Any) -> ModelT:
+    """Validate already-decoded JSON into `model_class` on Pydantic v1 and v2.
+
+    Classes that are not Pydantic models are called with the data as keyword
+    arguments.
+    """
+    model_validate = getattr(model_class, "model_validate", None)
+    if model_validate is not None:
+        return model_validate(data)
+    parse_obj = getattr(model_class, "parse_obj", None)
+    if parse_obj is not None:
+        return parse_obj(data)
+    return model_class(**data)
+
+
+RESPONSE_MODEL_MODES = ("strict", "lazy")
+
+
+def build_model(model_class: Type[ModelT], data: Any, mode: str = "strict") -> ModelT:
+    """Build the response object for already-decoded JSON.
+
+    In `"lazy"` mode a JSON object is wrapped in a `LazyModel` instead of being
+    validated, so nested models are only created for the fields that are read.
+    """
+    if (
+        mode == "lazy"
+        and isinstance(data, dict)
+        and isinstance(model_class, type)
+        and issubclass(model_class, BaseModel)
+    ):
+        return cast(ModelT, LazyModel(model_class, data))
+    return validate_model(model_class, data)
+
+
+def parse_response(
+    model_class: Type[ModelT], response: Any, mode: str = "strict"
+) -> ModelT:
+    """Build `model_class` from a raw HTTP response and attach its headers.
+
+    The body is decoded once, straight from bytes (see `json_loads`), instead of
+    going through `response.text`.
+    """
+    data = build_model(model_class, json_loads(response.content), mode)
+    data._headers = response.headers  # type: ignore[attr-defined]
+    return data
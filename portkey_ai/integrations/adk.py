@@ -490,6 +490,14 @@ def _merge_function_call_item(target: Any, source: Any) -> None:
         target.status = source_status
 
 
+def _flush_streamed_arguments(
+    item: Any, streamed_arguments: dict[int, list[str]]
+) -> None:
+    fragments = streamed_arguments.pop(id(item), None)
+    if fragments is not None:
+        item.arguments = "".join(fragments)
+
+
 def _merge_streamed_function_calls(
     response: Any, streamed_function_calls: dict[int, Any]
 ) -> Any:
@@ -648,6 +656,7 @@ class PortkeyAdk(_AdkBaseLlm):  # type: ignore[misc]  # _AdkBaseLlm may be a stu
         final_response: Any = None
         streamed_function_calls_by_index: dict[int, Any] = {}
         streamed_function_calls_by_id: dict[str, Any] = {}
+        streamed_arguments: dict[int, list[str]] = {}
 
         async for event in stream_response:  # type: ignore[union-attr]  # create() returns union of Response|AsyncStream; we know it's AsyncStream here
             event_type: str | None = getattr(event, "type", None)
@@ -694,7 +703,12 @@ class PortkeyAdk(_AdkBaseLlm):  # type: ignore[misc]  # _AdkBaseLlm may be a stu
                         item = streamed_function_calls_by_id.get(str(item_id))
                 delta = getattr(event, "delta", "")
                 if item is not None and delta:
-                    item.arguments = f"{getattr(item, 'arguments', '')}{delta}"
+                    # Fragments are joined once, when the call is complete.
+                    fragments = streamed_arguments.get(id(item))
+                    if fragments is None:
+                        fragments = [getattr(item, "arguments", None) or ""]
+                        streamed_arguments[id(item)] = fragments
+                    fragments.append(delta)
 
             elif event_type == "response.function_call_arguments.done":
                 output_index = getattr(event, "output_index", None)
@@ -708,6 +722,7 @@ class PortkeyAdk(_AdkBaseLlm):  # type: ignore[misc]  # _AdkBaseLlm may be a stu
                     if item_id is not None:
                         item = streamed_function_calls_by_id.get(str(item_id))
                 if item is not None:
+                    _flush_streamed_arguments(item, streamed_arguments)
                     arguments = getattr(event, "arguments", None)
                     if arguments is not None:
                         item.arguments = arguments
@@ -717,6 +732,8 @@ class PortkeyAdk(_AdkBaseLlm):  # type: ignore[misc]  # _AdkBaseLlm may be a stu
 
             elif event_type == "response.completed":
                 final_response = getattr(event, "response", None)
+                for item in streamed_function_calls_by_index.values():
+                    _flush_streamed_arguments(item, streamed_arguments)
                 if final_response is not None and streamed_function_calls_by_index:
                     final_response = _merge_streamed_function_calls(
                         final_response, streamed_function_calls_by_index
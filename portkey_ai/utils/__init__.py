@@ -1,4 +1,10 @@
-from .json_utils import serialize_kwargs, serialize_args
+from .json_utils import serialize_kwargs, serialize_args, json_loads, json_dumps
 from .hashing_utils import string_to_uuid
 
-__all__ = ["serialize_kwargs", "serialize_args", "string_to_uuid"]
+__all__ = [
+    "serialize_kwargs",
+    "serialize_args",
+    "json_loads",
+    "json_dumps",
+    "string_to_uuid",
+]
@@ -1,4 +1,58 @@
 import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None  # type: ignore[assignment]
+
+
+def json_loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Decode JSON with the fastest available backend.
+
+    `orjson` and `msgspec` are used when installed and accept bytes directly, so
+    response bodies never need to be decoded to `str` first. Inputs they reject
+    but the standard library accepts, such as `NaN`, fall back to `json.loads`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    elif msgspec is not None:
+        try:
+            return msgspec.json.decode(data)
+        except msgspec.DecodeError:
+            pass
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    """Encode JSON to UTF-8 bytes with the fastest available backend.
+
+    Output is compact, as httpx produces for `json=`. Values the optional
+    backends cannot encode, such as non-string keys, fall back to `json.dumps`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data)
+        except TypeError:
+            pass
+    elif msgspec is not None:
+        try:
+            return msgspec.json.encode(data)
+        except TypeError:
+            pass
+    return json.dumps(
+        data, ensure_ascii=False, separators=(",", ":"), allow_nan=False
+    ).encode("utf-8")
 
 
 def serialize_kwargs(**kwargs):
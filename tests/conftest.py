@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+
+import httpx
+import pytest
+
+from portkey_ai import AsyncPortkey, Portkey
+
+BASE_URL = "http://gateway.test/v1"
+
+
+@pytest.fixture
+def make_client() -> Callable[..., Portkey]:
+    """Build a `Portkey` client whose requests are answered by `handler`.
+
+    Keyword arguments go to `Portkey`, except `transport`, which replaces the
+    mock transport (to wrap it, say).
+    """
+
+    def make(
+        handler: Optional[Callable[[httpx.Request], httpx.Response]] = None,
+        *,
+        transport: Optional[httpx.BaseTransport] = None,
+        **kwargs: Any,
+    ) -> Portkey:
+        http_client = httpx.Client(
+            base_url=BASE_URL, transport=transport or httpx.MockTransport(handler)
+        )
+        return Portkey(
+            api_key="test", base_url=BASE_URL, http_client=http_client, **kwargs
+        )
+
+    return make
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncPortkey]:
+    """Build an `AsyncPortkey` client whose requests are answered by `handler`,
+    which may be sync or async. Arguments are as for `make_client`."""
+
+    def make(
+        handler: Optional[Callable[[httpx.Request], Any]] = None,
+        *,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        **kwargs: Any,
+    ) -> AsyncPortkey:
+        http_client = httpx.AsyncClient(
+            base_url=BASE_URL, transport=transport or httpx.MockTransport(handler)
+        )
+        return AsyncPortkey(
+            api_key="test", base_url=BASE_URL, http_client=http_client, **kwargs
+        )
+
+    return make
@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import re
+
+import httpx
+import pytest
+
+from portkey_ai import BatchJobError
+from portkey_ai.api_resources.apis import batches
+from portkey_ai.api_resources.batch_jobs import BatchPollBackoff, write_batch_shards
+from portkey_ai.api_resources.types.chat_complete_type import ChatCompletions
+from portkey_ai.api_resources.types.upload_types import Upload
+
+
+def completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl",
+        "object": "chat.completion",
+        "model": "m",
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+    }
+
+
+class BatchGateway:
+    """A batch API that finishes each batch after `polls` retrievals and
+    answers every request with its `custom_id` upper-cased."""
+
+    def __init__(self, polls: int = 2, fail: bool = False) -> None:
+        self.polls = polls
+        self.fail = fail
+        self.files: dict = {}
+        self.batches: dict = {}
+        self.retrievals: dict = {}
+        self.cancelled: list = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if request.method == "POST" and path.endswith("/files"):
+            file_id = f"file-{len(self.files)}"
+            match = re.search(
+                rb'filename="[^"]*"\r\n(?:[^\r\n]+\r\n)*\r\n(.*?)\r\n--',
+                request.read(),
+                re.S,
+            )
+            assert match is not None
+            self.files[file_id] = match.group(1)
+            return httpx.Response(200, json={"id": file_id, "object": "file"})
+        if request.method == "POST" and path.endswith("/batches"):
+            body = json.loads(request.content)
+            batch_id = f"batch-{len(self.batches)}"
+            self.batches[batch_id] = body
+            self.retrievals[batch_id] = 0
+            return httpx.Response(200, json={"id": batch_id, "status": "validating"})
+        match = re.search(r"/batches/([^/]+)/cancel$", path)
+        if match:
+            self.cancelled.append(match.group(1))
+            return httpx.Response(
+                200, json={"id": match.group(1), "status": "cancelling"}
+            )
+        match = re.search(r"/batches/([^/]+)$", path)
+        if match:
+            batch_id = match.group(1)
+            self.retrievals[batch_id] += 1
+            if self.retrievals[batch_id] < self.polls:
+                return httpx.Response(
+                    200, json={"id": batch_id, "status": "in_progress"}
+                )
+            if self.fail:
+                return httpx.Response(
+                    200,
+                    json={"id": batch_id, "status": "failed", "errors": {"data": []}},
+                )
+            return httpx.Response(
+                200,
+                json={
+                    "id": batch_id,
+                    "status": "completed",
+                    "output_file_id": f"out-{batch_id}",
+                },
+            )
+        match = re.search(r"/files/out-([^/]+)/content$", path)
+        if match:
+            batch = self.batches[match.group(1)]
+            lines = self.files[batch["input_file_id"]].splitlines()
+            output = b"".join(
+                json.dumps(
+                    {
+                        "custom_id": json.loads(line)["custom_id"],
+                        "response": {
+                            "status_code": 200,
+                            "body": completion(json.loads(line)["custom_id"].upper()),
+                        },
+                        "error": None,
+                    }
+                ).encode()
+                + b"\n"
+                for line in lines
+            )
+            return httpx.Response(200, content=output)
+        return httpx.Response(404, json={"error": {"message": path}})
+
+
+def requests(count: int):
+    for i in range(count):
+        yield {
+            "custom_id": f"req-{i}",
+            "body": {"model": "m", "messages": [{"role": "user", "content": "hi"}]},
+        }
+
+
+class TestWriteBatchShards:
+    def test_shards_by_count_and_size(self, tmp_path) -> None:
+        paths = list(
+            write_batch_shards(
+                ({"n": i} for i in range(5)),
+                str(tmp_path),
+                endpoint="/v1/embeddings",
+                max_requests=2,
+                max_bytes=10_000,
+            )
+        )
+        lines = [open(p, "rb").read().splitlines() for p in paths]
+        assert [len(shard) for shard in lines] == [2, 2, 1]
+        first = json.loads(lines[0][0])
+        assert first == {
+            "custom_id": "0",
+            "method": "POST",
+            "url": "/v1/embeddings",
+            "body": {"n": 0},
+        }
+
+        (tmp_path / "small").mkdir()
+        one_per_file = list(
+            write_batch_shards(
+                ({"n": i} for i in range(3)),
+                str(tmp_path / "small"),
+                endpoint="/v1/embeddings",
+                max_requests=100,
+                max_bytes=len(lines[0][0]) + 1,
+            )
+        )
+        assert len(one_per_file) == 3
+
+    def test_oversized_request_raises(self, tmp_path) -> None:
+        shards = write_batch_shards(
+            [{"n": 1}, {"text": "x" * 100}],
+            str(tmp_path),
+            endpoint="/v1/embeddings",
+            max_requests=1,
+            max_bytes=90,
+        )
+        assert next(shards).endswith("batch-0.jsonl")
+        with pytest.raises(ValueError, match="Request 1"):
+            next(shards)
+
+    def test_backoff(self) -> None:
+        backoff = BatchPollBackoff(1.0, 3.0, factor=2.0)
+        assert [backoff.next_interval(0) for _ in range(4)] == [1.0, 2.0, 3.0, 3.0]
+        assert backoff.next_interval(1) == 1.0
+
+
+class TestBatchesRun:
+    def test_end_to_end(self, make_client) -> None:
+        gateway = BatchGateway()
+        portkey = make_client(gateway)
+
+        results = portkey.batches.run(
+            requests(5),
+            endpoint="/v1/chat/completions",
+            max_requests_per_batch=2,
+            poll_interval=0.001,
+        )
+        by_id = {r.custom_id: r for r in results}
+
+        assert len(gateway.batches) == 3
+        assert all(
+            b["endpoint"] == "/v1/chat/completions" for b in gateway.batches.values()
+        )
+        assert sorted(by_id) == [f"req-{i}" for i in range(5)]
+        result = by_id["req-3"]
+        assert result.ok
+        assert isinstance(result.response, ChatCompletions)
+        assert result.response.choices[0].message.content == "REQ-3"
+
+    def test_input_files_are_removed(self, make_client) -> None:
+        gateway = BatchGateway(polls=1)
+        portkey = make_client(gateway)
+        seen = []
+        original = portkey.batches._upload_batch_input
+
+        def upload(path: str):
+            seen.append(path)
+            return original(path)
+
+        portkey.batches._upload_batch_input = upload  # type: ignore[method-assign]
+        list(portkey.batches.run(requests(1), endpoint="/v1/chat/completions"))
+        assert seen and not os.path.exists(os.path.dirname(seen[0]))
+
+    def test_failed_batch_raises(self, make_client) -> None:
+        portkey = make_client(BatchGateway(polls=1, fail=True))
+        results = portkey.batches.run(requests(1), endpoint="/v1/chat/completions")
+        with pytest.raises(BatchJobError) as info:
+            list(results)
+        assert info.value.batch.id == "batch-0"
+
+    def test_failed_batch_cancels_the_others(self, make_client) -> None:
+        gateway = BatchGateway(polls=1, fail=True)
+        portkey = make_client(gateway)
+        results = portkey.batches.run(
+            requests(3), endpoint="/v1/chat/completions", max_requests_per_batch=1
+        )
+        with pytest.raises(BatchJobError):
+            list(results)
+        assert gateway.cancelled == ["batch-1", "batch-2"]
+
+    def test_stopping_early_cancels_pending_batches(self, make_client) -> None:
+        gateway = BatchGateway(polls=1)
+        portkey = make_client(gateway)
+        results = portkey.batches.run(
+            requests(3), endpoint="/v1/chat/completions", max_requests_per_batch=1
+        )
+        assert next(results).custom_id == "req-0"
+        results.close()
+        assert gateway.cancelled == ["batch-1", "batch-2"]
+
+    def test_upload_without_file_raises(self, make_client, monkeypatch) -> None:
+        monkeypatch.setattr(batches, "DEFAULT_BATCH_CHUNKED_UPLOAD_BYTES", 0)
+        gateway = BatchGateway()
+        portkey = make_client(gateway)
+        portkey.uploads.upload_file_chunked = (  # type: ignore[method-assign]
+            lambda **kwargs: Upload(id="upload-1", status="cancelled")
+        )
+        with pytest.raises(RuntimeError, match="returned no file id"):
+            portkey.batches.run(requests(1), endpoint="/v1/chat/completions")
+        assert gateway.batches == {}
+
+    def test_later_failure_cancels_created_batches(self, make_client) -> None:
+        gateway = BatchGateway()
+        portkey = make_client(gateway)
+
+        def failing_requests():
+            yield from requests(2)
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError, match="source failed"):
+            portkey.batches.run(
+                failing_requests(),
+                endpoint="/v1/chat/completions",
+                max_requests_per_batch=1,
+            )
+        assert len(gateway.batches) == 1
+        assert gateway.cancelled == ["batch-0"]
+
+    def test_async(self, make_async_client) -> None:
+        gateway = BatchGateway()
+        portkey = make_async_client(gateway)
+
+        async def run():
+            results = await portkey.batches.run(
+                requests(3),
+                endpoint="/v1/chat/completions",
+                max_requests_per_batch=2,
+                poll_interval=0.001,
+            )
+            return [r.custom_id async for r in results]
+
+        assert sorted(asyncio.run(run())) == ["req-0", "req-1", "req-2"]
+        assert len(gateway.batches) == 2
+
+    def test_async_stopping_early_cancels_pending_batches(
+        self, make_async_client
+    ) -> None:
+        gateway = BatchGateway(polls=1)
+        portkey = make_async_client(gateway)
+
+        async def run():
+            results = await portkey.batches.run(
+                requests(3), endpoint="/v1/chat/completions", max_requests_per_batch=1
+            )
+            first = await results.__anext__()
+            await results.aclose()
+            return first.custom_id
+
+        assert asyncio.run(run()) == "req-0"
+        assert gateway.cancelled == ["batch-1", "batch-2"]
+
+    def test_async_oversized_request_cancels_created_batches(
+        self, make_async_client
+    ) -> None:
+        gateway = BatchGateway()
+        portkey = make_async_client(gateway)
+        oversized = {"custom_id": "big", "body": {"text": "x" * 10_000}}
+
+        async def run():
+            await portkey.batches.run(
+                [*requests(1), oversized],
+                endpoint="/v1/chat/completions",
+                max_requests_per_batch=1,
+                max_bytes_per_batch=1_000,
+            )
+
+        with pytest.raises(ValueError, match="Request 1"):
+            asyncio.run(run())
+        assert gateway.cancelled == ["batch-0"]
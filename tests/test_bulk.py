@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+import pytest
+
+from portkey_ai.api_resources.bulk import arun_many, run_many
+
+
+def chat_completion(content: str) -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": content},
+            }
+        ],
+    }
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    content = json.loads(request.content)["messages"][0]["content"]
+    if content == "fail":
+        return httpx.Response(400, json={"error": {"message": "bad request"}})
+    return httpx.Response(200, json=chat_completion(content.upper()))
+
+
+def requests_for(*contents: str):
+    return (
+        {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": c}]}
+        for c in contents
+    )
+
+
+class TestRunMany:
+    def test_bounded_concurrency_and_input_order(self) -> None:
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def work(delay: float) -> float:
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(delay)
+            with lock:
+                state["running"] -= 1
+            return delay
+
+        delays = [0.03, 0.01, 0.02, 0.0, 0.01, 0.02]
+        results = list(run_many(work, ({"delay": d} for d in delays), concurrency=2))
+        assert [r.index for r in results] == list(range(len(delays)))
+        assert [r.response for r in results] == delays
+        assert state["peak"] <= 2
+
+    @pytest.mark.asyncio
+    async def test_async_completion_order(self) -> None:
+        async def work(delay: float) -> float:
+            await asyncio.sleep(delay)
+            return delay
+
+        results = [
+            r
+            async for r in arun_many(
+                work, [{"delay": 0.05}, {"delay": 0.0}], concurrency=2, ordered=False
+            )
+        ]
+        assert [r.index for r in results] == [1, 0]
+
+
+class TestCreateMany:
+    def test_per_item_errors(self, make_client) -> None:
+        portkey = make_client(handler)
+        results = list(
+            portkey.chat.completions.create_many(
+                requests_for("a", "fail", "c"), concurrency=2
+            )
+        )
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[0].response.choices[0].message.content == "A"
+        assert results[2].response.choices[0].message.content == "C"
+
+    @pytest.mark.asyncio
+    async def test_async_create_many(self, make_async_client) -> None:
+        portkey = make_async_client(handler)
+        contents = [str(i) for i in range(20)]
+        results = [
+            r
+            async for r in portkey.chat.completions.create_many(
+                requests_for(*contents), concurrency=4
+            )
+        ]
+        assert all(r.ok for r in results)
+        assert [r.response.choices[0].message.content for r in results] == contents
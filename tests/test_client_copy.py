@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from portkey_ai import AsyncPortkey, Portkey, RetryPolicy
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "hi"},
+        }
+    ],
+}
+
+
+class TestWithOptions:
+    def test_header_overlay(self) -> None:
+        portkey = Portkey(api_key="test", virtual_key="vk", metadata={"a": "1"})
+        derived = portkey.with_options(trace_id="trace", metadata={"b": "2"})
+
+        assert derived.trace_id == "trace"
+        assert derived.virtual_key == "vk"
+        assert derived.custom_headers["x-portkey-trace-id"] == "trace"
+        assert derived.custom_headers["x-portkey-metadata"] == '{"b": "2"}'
+        assert derived.openai_client.default_headers["x-portkey-trace-id"] == "trace"
+        # The original client is left untouched.
+        assert "x-portkey-trace-id" not in portkey.custom_headers
+        assert "x-portkey-trace-id" not in portkey.openai_client.default_headers
+        assert portkey.custom_headers["x-portkey-metadata"] == '{"a": "1"}'
+
+    def test_shares_pool_and_rebinds_resources(self) -> None:
+        portkey = Portkey(api_key="test")
+        parent_chat = portkey.chat
+        derived = portkey.copy(
+            trace_id="trace", retry_policy=RetryPolicy(max_retries=5)
+        )
+
+        assert derived._client is portkey._client
+        assert derived.openai_client._client is portkey.openai_client._client
+        assert derived.openai_client.max_retries == 5
+        assert portkey.openai_client.max_retries == portkey.retry_policy.max_retries
+        assert derived.chat is not parent_chat
+        assert derived.chat._client is derived
+        assert derived.chat.completions.openai_client is derived.openai_client
+        assert derived.beta.threads._client is derived
+
+    def test_rebuilds_when_pool_options_change(self) -> None:
+        portkey = Portkey(api_key="test")
+        derived = portkey.copy(base_url="http://other.test/v1")
+        assert derived.base_url == "http://other.test/v1"
+        assert derived.openai_client.base_url == "http://other.test/v1/"
+
+    def test_rejects_unknown_response_model_mode(self) -> None:
+        with pytest.raises(ValueError):
+            Portkey(api_key="test").copy(response_model_mode="fast")
+
+    def test_derived_client_sends_overlay_headers(self, make_client) -> None:
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(200, json=CHAT_COMPLETION)
+
+        portkey = make_client(handler)
+        portkey.with_options(trace_id="trace").chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+        portkey.chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+        assert seen[0]["x-portkey-trace-id"] == "trace"
+        assert "x-portkey-trace-id" not in seen[1]
+
+    def test_closing_derived_client_keeps_parent_pool(self, make_client) -> None:
+        portkey = make_client(lambda request: httpx.Response(200, json=CHAT_COMPLETION))
+        with portkey.with_options(trace_id="trace"):
+            pass
+        portkey.copy(base_url="http://other.test/v1").close()
+        response = portkey.chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+        assert response.choices[0].message.content == "hi"
+
+        owner = Portkey(api_key="test")
+        owner.with_options(trace_id="trace").close()
+        assert not owner._client.is_closed
+        owner.close()
+        assert owner._client.is_closed
+
+    def test_async_closing_derived_client_keeps_parent_pool(self) -> None:
+        async def main():
+            portkey = AsyncPortkey(api_key="test")
+            async with portkey.with_options(trace_id="trace"):
+                pass
+            assert not portkey._client.is_closed
+            await portkey.close()
+            assert portkey._client.is_closed
+
+        asyncio.run(main())
+
+    def test_async_copy(self) -> None:
+        portkey = AsyncPortkey(api_key="test")
+        derived = portkey.with_options(trace_id="trace")
+        assert isinstance(derived, AsyncPortkey)
+        assert derived._client is portkey._client
+        assert derived.chat._client is derived
+
+    def test_derivation_is_cheap(self) -> None:
+        portkey = Portkey(api_key="test", virtual_key="vk")
+        rounds = 1000
+        started_at = time.perf_counter()
+        for i in range(rounds):
+            portkey.with_options(trace_id=str(i), metadata={"request": str(i)})
+        per_copy = (time.perf_counter() - started_at) / rounds
+        assert per_copy < 0.0005
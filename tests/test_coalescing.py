@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from portkey_ai import AsyncCoalescingTransport, CoalescingTransport, Portkey
+
+from .conftest import BASE_URL
+
+EMBEDDING = {
+    "object": "list",
+    "model": "text-embedding-3-small",
+    "data": [{"object": "embedding", "index": 0, "embedding": [0.1, 0.2]}],
+    "usage": {"prompt_tokens": 1, "total_tokens": 1},
+}
+
+CHUNK = (
+    b'data: {"id":"c","object":"chat.completion.chunk","model":"m",'
+    b'"choices":[{"index":0,"delta":{"content":"hi"}}]}\n\n'
+)
+
+
+class SlowGateway:
+    def __init__(self, delay: float = 0.2) -> None:
+        self.delay = delay
+        self.requests: list = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        time.sleep(self.delay)
+        if request.url.path.endswith("/chat/completions"):
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=iter([CHUNK, CHUNK, b"data: [DONE]\n\n"]),
+            )
+        return httpx.Response(200, json=EMBEDDING)
+
+
+@pytest.fixture
+def make_coalescing_client(make_client):
+    return lambda gateway: make_client(
+        transport=CoalescingTransport(httpx.MockTransport(gateway))
+    )
+
+
+def run_concurrently(count: int, fn) -> list:
+    with ThreadPoolExecutor(count) as pool:
+        return list(pool.map(lambda i: fn(i), range(count)))
+
+
+class TestCoalescingTransport:
+    def test_identical_requests_are_sent_once(self, make_coalescing_client) -> None:
+        gateway = SlowGateway()
+        portkey = make_coalescing_client(gateway)
+        results = run_concurrently(
+            8,
+            lambda i: portkey.embeddings.create(
+                input="same text", model="text-embedding-3-small"
+            ),
+        )
+        assert len(gateway.requests) == 1
+        assert all(r.data[0].embedding == [0.1, 0.2] for r in results)
+        assert portkey.coalescing_stats() == {"requests": 1, "coalesced": 7}
+
+    def test_different_bodies_are_not_coalesced(self, make_coalescing_client) -> None:
+        gateway = SlowGateway(delay=0.05)
+        portkey = make_coalescing_client(gateway)
+        run_concurrently(
+            4,
+            lambda i: portkey.embeddings.create(
+                input=f"text {i}", model="text-embedding-3-small"
+            ),
+        )
+        assert len(gateway.requests) == 4
+
+    def test_portkey_client_path(self, make_coalescing_client) -> None:
+        gateway = SlowGateway()
+        portkey = make_coalescing_client(gateway)
+        results = run_concurrently(
+            4, lambda i: portkey.post("/prompts/pp-1/render", variables={"a": 1})
+        )
+        assert len(gateway.requests) == 1
+        assert all(r.model == "text-embedding-3-small" for r in results)
+
+    def test_streams_are_teed(self, make_coalescing_client) -> None:
+        gateway = SlowGateway()
+        portkey = make_coalescing_client(gateway)
+
+        def stream(i: int) -> list:
+            chunks = portkey.chat.completions.create(
+                model="m", messages=[{"role": "user", "content": "hi"}], stream=True
+            )
+            return [chunk.choices[0].delta.content for chunk in chunks]
+
+        results = run_concurrently(3, stream)
+        assert len(gateway.requests) == 1
+        assert results == [["hi", "hi"]] * 3
+
+    def test_errors_reach_every_request(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            time.sleep(0.2)
+            raise httpx.ConnectError("refused", request=request)
+
+        client = httpx.Client(
+            transport=CoalescingTransport(httpx.MockTransport(handler))
+        )
+
+        def send(i: int):
+            try:
+                client.get(f"{BASE_URL}/models")
+            except httpx.ConnectError as err:
+                return err
+
+        assert all(isinstance(r, httpx.ConnectError) for r in run_concurrently(3, send))
+        assert len(calls) == 1
+
+    def test_client_option_wraps_own_pool(self) -> None:
+        portkey = Portkey(api_key="test", coalesce_requests=True)
+        assert isinstance(portkey._client._transport, CoalescingTransport)
+        assert portkey.openai_client._client is portkey._client
+        assert portkey.pool_stats()["max_connections"] is not None
+        assert Portkey(api_key="test").coalescing_stats() is None
+
+
+class TestAsyncCoalescingTransport:
+    @pytest.mark.asyncio
+    async def test_identical_requests_are_sent_once(self, make_async_client) -> None:
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json=EMBEDDING)
+
+        portkey = make_async_client(
+            transport=AsyncCoalescingTransport(httpx.MockTransport(handler))
+        )
+        results = await asyncio.gather(
+            *(
+                portkey.embeddings.create(input="same", model="text-embedding-3-small")
+                for _ in range(5)
+            )
+        )
+        assert len(requests) == 1
+        assert all(r.data[0].embedding == [0.1, 0.2] for r in results)
+        assert portkey.coalescing_stats() == {"requests": 1, "coalesced": 4}
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import httpx
+
+from portkey_ai import AsyncPortkey, Portkey
+from portkey_ai.api_resources.connection_pool import build_limits
+
+
+class TestConnectionPool:
+    def test_one_pool_for_both_clients(self) -> None:
+        portkey = Portkey(api_key="test")
+        assert portkey.openai_client._client is portkey._client
+
+        async_portkey = AsyncPortkey(api_key="test")
+        assert async_portkey.openai_client._client is async_portkey._client
+
+    def test_limits_and_stats(self) -> None:
+        portkey = Portkey(
+            api_key="test",
+            connection_limits=httpx.Limits(
+                max_connections=10, max_keepalive_connections=4
+            ),
+            keepalive_expiry=30,
+        )
+        stats = portkey.pool_stats()
+        assert stats["connections"] == 0
+        assert stats["max_connections"] == 10
+        assert stats["max_keepalive_connections"] == 4
+        assert stats["keepalive_expiry"] == 30
+
+    def test_build_limits(self) -> None:
+        limits = build_limits(keepalive_expiry=1.5)
+        assert limits.max_connections == 1000
+        assert limits.keepalive_expiry == 1.5
+
+    def test_custom_transport_has_no_pool(self, make_client) -> None:
+        portkey = make_client(lambda r: httpx.Response(200))
+        assert portkey.openai_client._client is portkey._client
+        assert portkey.pool_stats()["max_connections"] is None
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import struct
+import threading
+
+import httpx
+import pytest
+
+from portkey_ai.api_resources.embedding_batches import iter_embedding_batches
+
+
+class EmbeddingGateway:
+    """Embeds each text as `[len(text), 1.0, 2.0]`, base64-encoded on request."""
+
+    def __init__(self) -> None:
+        self.batches: list = []
+        self.lock = threading.Lock()
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        with self.lock:
+            self.batches.append(body)
+        data = []
+        for index, text in enumerate(body["input"]):
+            vector = [float(len(text)), 1.0, 2.0]
+            embedding = (
+                base64.b64encode(struct.pack("<3f", *vector)).decode()
+                if body.get("encoding_format") == "base64"
+                else vector
+            )
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+        # Providers may return items out of order; `index` is authoritative.
+        data.reverse()
+        return httpx.Response(
+            200, json={"object": "list", "model": body["model"], "data": data}
+        )
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        return self.response(request)
+
+
+class TestIterEmbeddingBatches:
+    def test_splits_by_count(self) -> None:
+        batches = list(
+            iter_embedding_batches(
+                (str(i) for i in range(5)), batch_size=2, max_batch_tokens=100
+            )
+        )
+        assert [b["input"] for b in batches] == [["0", "1"], ["2", "3"], ["4"]]
+
+    def test_splits_by_estimated_tokens(self) -> None:
+        texts = ["a" * 40, "b" * 40, "c" * 80, "d"]
+        batches = list(
+            iter_embedding_batches(texts, batch_size=100, max_batch_tokens=20)
+        )
+        # 10 + 10 tokens fit, the 20-token text goes alone.
+        assert [len(b["input"]) for b in batches] == [2, 1, 1]
+
+    def test_rejects_non_strings(self) -> None:
+        with pytest.raises(TypeError):
+            list(iter_embedding_batches([1], batch_size=1, max_batch_tokens=1))
+
+
+class TestCreateArray:
+    def test_returns_float32_rows_in_input_order(self, make_client) -> None:
+        numpy = pytest.importorskip("numpy")
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway)
+        texts = ["x" * i for i in range(1, 11)]
+
+        array = portkey.embeddings.create_array(
+            texts, model="text-embedding-3-small", batch_size=3, concurrency=4
+        )
+
+        assert array.dtype == numpy.float32
+        assert array.shape == (10, 3)
+        assert array.flags["C_CONTIGUOUS"]
+        assert array[:, 0].tolist() == [float(i) for i in range(1, 11)]
+        assert len(gateway.batches) == 4
+        assert all(b["encoding_format"] == "base64" for b in gateway.batches)
+
+    def test_unsized_iterable_and_float_lists(self, make_client) -> None:
+        numpy = pytest.importorskip("numpy")
+
+        class FloatGateway(EmbeddingGateway):
+            def __call__(self, request: httpx.Request) -> httpx.Response:
+                body = json.loads(request.content)
+                body.pop("encoding_format")
+                return self.response(httpx.Request("POST", request.url, json=body))
+
+        portkey = make_client(FloatGateway())
+        array = portkey.embeddings.create_array(
+            (t for t in ["a", "bb", "ccc"]), model="m", batch_size=2
+        )
+        assert array.dtype == numpy.float32
+        assert array[:, 0].tolist() == [1.0, 2.0, 3.0]
+
+    def test_empty_input(self, make_client) -> None:
+        pytest.importorskip("numpy")
+        portkey = make_client(EmbeddingGateway())
+        assert portkey.embeddings.create_array([], dimensions=8).shape == (0, 8)
+
+    def test_async(self, make_async_client) -> None:
+        pytest.importorskip("numpy")
+        gateway = EmbeddingGateway()
+        portkey = make_async_client(gateway)
+        array = asyncio.run(
+            portkey.embeddings.create_array(["a", "bb", "ccc"], model="m", batch_size=1)
+        )
+        assert array[:, 0].tolist() == [1.0, 2.0, 3.0]
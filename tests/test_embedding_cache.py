@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import struct
+import threading
+
+import httpx
+import pytest
+
+from portkey_ai import EmbeddingCache
+
+
+class EmbeddingGateway:
+    """Embeds each text as `[len(text), 1.0, 2.0]`, base64-encoded on request."""
+
+    def __init__(self) -> None:
+        self.inputs: list = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.inputs.append(body["input"])
+        data = []
+        for index, text in enumerate(body["input"]):
+            vector = [float(len(text)), 1.0, 2.0]
+            embedding = (
+                base64.b64encode(struct.pack("<3f", *vector)).decode()
+                if body.get("encoding_format") == "base64"
+                else vector
+            )
+            data.append({"object": "embedding", "index": index, "embedding": embedding})
+        data.reverse()
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "model": body["model"],
+                "data": data,
+                "usage": {"prompt_tokens": 3, "total_tokens": 3},
+            },
+        )
+
+
+class TestEmbeddingCache:
+    def test_only_misses_are_sent(self, make_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+
+        first = portkey.embeddings.create(input=["a", "bb"], model="m")
+        second = portkey.embeddings.create(input=["ccc", "a", "dddd", "bb"], model="m")
+
+        assert gateway.inputs == [["a", "bb"], ["ccc", "dddd"]]
+        assert [d.embedding for d in first.data] == [[1.0, 1.0, 2.0], [2.0, 1.0, 2.0]]
+        assert [d.index for d in second.data] == [0, 1, 2, 3]
+        assert [d.embedding[0] for d in second.data] == [3.0, 1.0, 4.0, 2.0]
+        assert second.usage.total_tokens == 3
+
+    def test_full_hit_sends_nothing(self, make_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+        portkey.embeddings.create(input="hello", model="m")
+
+        result = portkey.embeddings.create(input="hello", model="m")
+
+        assert len(gateway.inputs) == 1
+        assert result.data[0].embedding == [5.0, 1.0, 2.0]
+        assert result.usage.total_tokens == 0
+        stats = portkey.embedding_cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["size_bytes"] == 12
+
+    def test_keyed_on_route_model_and_dimensions(self, make_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+        portkey.embeddings.create(input="x", model="m")
+        portkey.embeddings.create(input="x", model="other")
+        portkey.embeddings.create(input="x", model="m", dimensions=3)
+        assert len(gateway.inputs) == 3
+
+        # The default model name says nothing about the provider behind it.
+        for options in ({"virtual_key": "a"}, {"virtual_key": "b"}, {"config": "pc-1"}):
+            portkey.with_options(**options).embeddings.create(input="x")
+        assert len(gateway.inputs) == 6
+        portkey.with_options(virtual_key="a", trace_id="t").embeddings.create(input="x")
+        assert len(gateway.inputs) == 6
+
+    def test_base64_responses(self, make_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+        portkey.embeddings.create(input="abc", model="m")
+
+        result = portkey.embeddings.create(
+            input="abc", model="m", encoding_format="base64"
+        )
+        raw = base64.b64decode(result.data[0].embedding)
+        assert struct.unpack("<3f", raw) == (3.0, 1.0, 2.0)
+
+    def test_persists_across_instances(self, make_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        cache = EmbeddingCache(str(tmp_path))
+        make_client(gateway, embedding_cache=cache).embeddings.create(
+            input=["a", "bb"], model="m"
+        )
+        cache.close()
+
+        reopened = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+        result = reopened.embeddings.create(input=["bb", "a"], model="m")
+        assert len(gateway.inputs) == 1
+        assert [d.embedding[0] for d in result.data] == [2.0, 1.0]
+
+    def test_token_arrays_bypass_cache(self, make_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+        portkey.embeddings.create(input=[[1, 2, 3]], model="m")
+        assert portkey.embedding_cache.stats()["entries"] == 0
+
+    def test_create_array(self, make_client, tmp_path) -> None:
+        numpy = pytest.importorskip("numpy")
+        gateway = EmbeddingGateway()
+        portkey = make_client(gateway, embedding_cache=EmbeddingCache(str(tmp_path)))
+        portkey.embeddings.create(input=["bb"], model="m")
+
+        array = portkey.embeddings.create_array(["a", "bb", "ccc"], model="m")
+
+        assert gateway.inputs[-1] == ["a", "ccc"]
+        assert array.dtype == numpy.float32
+        assert array[:, 0].tolist() == [1.0, 2.0, 3.0]
+
+    def test_async(self, make_async_client, tmp_path) -> None:
+        gateway = EmbeddingGateway()
+        portkey = make_async_client(
+            gateway, embedding_cache=EmbeddingCache(str(tmp_path))
+        )
+
+        async def run():
+            await portkey.embeddings.create(input=["a"], model="m")
+            return await portkey.embeddings.create(input=["a", "bb"], model="m")
+
+        result = asyncio.run(run())
+        assert gateway.inputs == [["a"], ["bb"]]
+        assert [d.embedding[0] for d in result.data] == [1.0, 2.0]
+
+    def test_async_cache_io_runs_off_the_event_loop(
+        self, make_async_client, tmp_path
+    ) -> None:
+        cache = EmbeddingCache(str(tmp_path))
+        threads = []
+        for name in ("get_many", "put_many"):
+            method = getattr(cache, name)
+
+            def record(*args, method=method):
+                threads.append(threading.get_ident())
+                return method(*args)
+
+            setattr(cache, name, record)
+        portkey = make_async_client(EmbeddingGateway(), embedding_cache=cache)
+
+        async def run():
+            await portkey.embeddings.create(input=["a"], model="m")
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(run())
+        assert len(threads) == 2
+        assert loop_thread not in threads
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import os
+import signal
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from portkey_ai import (
+    AsyncPortkey,
+    EmbeddingCache,
+    MemoryResponseCache,
+    Portkey,
+    RateLimiter,
+    SQLiteResponseCache,
+)
+from portkey_ai.api_resources.apis.logger import Logger
+
+from .conftest import BASE_URL
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+
+
+def in_child(check) -> dict:
+    """Run `check()` in a forked child and return the dict it produced."""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        # A child deadlocked on a lock held at fork time dies instead of
+        # leaving the parent waiting.
+        signal.alarm(10)
+        os.close(read_fd)
+        try:
+            os.write(write_fd, json.dumps(check()).encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        data = f.read()
+    os.waitpid(pid, 0)
+    return json.loads(data)
+
+
+class PortServer(ThreadingHTTPServer):
+    """Answers every request with the client port of its connection."""
+
+    def __init__(self) -> None:
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                body = str(self.client_address[1]).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def server():
+    server = PortServer()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestForkSafety:
+    def test_child_opens_its_own_connections(self, server) -> None:
+        portkey = Portkey(api_key="test", base_url=server.url)
+        parent_port = portkey._client.get(server.url).text
+
+        child = in_child(
+            lambda: {
+                "port": portkey._client.get(server.url).text,
+                "openai": portkey.openai_client._client is portkey._client,
+            }
+        )
+
+        assert child["port"] != parent_port
+        assert child["openai"]
+        assert portkey._client.get(server.url).text == parent_port
+
+    def test_copies_share_the_rebuilt_pool(self) -> None:
+        portkey = Portkey(api_key="test", base_url=BASE_URL)
+        derived = portkey.copy(virtual_key="other")
+        parent_pool = id(portkey._client)
+
+        child = in_child(
+            lambda: {
+                "rebuilt": id(portkey._client) != parent_pool,
+                "shared": derived._client is portkey._client,
+                "openai": derived.openai_client._client is portkey._client,
+            }
+        )
+
+        assert child == {"rebuilt": True, "shared": True, "openai": True}
+
+    def test_async_client_and_custom_http_client(self) -> None:
+        portkey = AsyncPortkey(api_key="test", base_url=BASE_URL)
+        parent_pool = id(portkey._client)
+        custom = AsyncPortkey(api_key="test", http_client=httpx.AsyncClient())
+        custom_pool = id(custom._client)
+
+        child = in_child(
+            lambda: {
+                "rebuilt": id(portkey._client) != parent_pool,
+                "openai": portkey.openai_client._client is portkey._client,
+                "custom": id(custom._client) == custom_pool,
+            }
+        )
+
+        assert child == {"rebuilt": True, "openai": True, "custom": True}
+
+    def test_logger_drops_parent_queue_and_thread(self) -> None:
+        log = Logger(api_key="test", base_url=BASE_URL)
+        log._thread = threading.Thread(target=lambda: None)
+        log._queue.extend([{"a": 1}, {"b": 2}])
+        parent_client = id(log._client)
+
+        child = in_child(
+            lambda: {
+                "queued": len(log._queue),
+                "thread": log._thread is None,
+                "client": id(log._client) != parent_client,
+            }
+        )
+
+        assert child == {"queued": 0, "thread": True, "client": True}
+        assert len(log._queue) == 2
+        log._queue.clear()
+
+    def test_caches_and_rate_limiter_reset_locks_and_connections(
+        self, tmp_path
+    ) -> None:
+        sqlite_cache = SQLiteResponseCache(str(tmp_path / "responses.sqlite"))
+        memory_cache = MemoryResponseCache()
+        embedding_cache = EmbeddingCache(str(tmp_path / "embeddings"))
+        limiter = RateLimiter(requests_per_minute=60)
+        locks = [
+            sqlite_cache._lock,
+            memory_cache._lock,
+            embedding_cache._lock,
+            limiter._lock,
+        ]
+        parent_dbs = [id(sqlite_cache._db), id(embedding_cache._db)]
+
+        def check() -> dict:
+            sqlite_cache.set("key", b"body", {})
+            memory_cache.set("key", b"body", {})
+            key = EmbeddingCache.key("", "m", None, "text")
+            embedding_cache.put_many([key], [b"\0" * 8])
+            limiter.acquire("key")
+            return {
+                "new_dbs": parent_dbs
+                != [id(sqlite_cache._db), id(embedding_cache._db)],
+                "sqlite": sqlite_cache.get("key") is not None,
+                "memory": memory_cache.get("key") is not None,
+                "embedding": embedding_cache.get_many([key])[0] == b"\0" * 8,
+            }
+
+        # Held by the parent across the fork, as if another thread were
+        # using them.
+        for lock in locks:
+            lock.acquire()
+        try:
+            child = in_child(check)
+        finally:
+            for lock in locks:
+                lock.release()
+
+        assert child == {
+            "new_dbs": True,
+            "sqlite": True,
+            "memory": True,
+            "embedding": True,
+        }
+        assert sqlite_cache.get("key") is not None
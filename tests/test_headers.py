@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+
+from portkey_ai import Portkey
+from portkey_ai.api_resources import base_client
+from portkey_ai.api_resources.utils import Options, create_model_instance
+
+
+def make_options(headers=None) -> Options:
+    options = create_model_instance(Options)
+    options.method = "post"
+    options.url = "/chat/completions"
+    options.headers = headers
+    options.json_body = {"model": "gpt-4o-mini"}
+    return options
+
+
+def best_time(fn, rounds: int = 1000, runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        for _ in range(rounds):
+            fn()
+        timings.append((time.perf_counter() - started_at) / rounds)
+    return min(timings)
+
+
+class TestRequestHeaders:
+    def test_matches_merged_headers(self) -> None:
+        portkey = Portkey(api_key="test", virtual_key="vk", metadata={"a": "1"})
+        options = make_options(
+            {"x-portkey-trace-id": "t", "x-portkey-virtual-key": "o"}
+        )
+        expected = httpx.Headers(portkey._build_headers(options))
+        assert portkey._request_headers(options) == expected
+        # Custom headers win over option headers.
+        assert portkey._request_headers(options)["x-portkey-virtual-key"] == "vk"
+
+    def test_block_is_reused_until_headers_change(self) -> None:
+        portkey = Portkey(api_key="test")
+        portkey._request_headers(make_options())
+        block = portkey._header_block
+        portkey._request_headers(make_options({"x-portkey-trace-id": "t"}))
+        assert portkey._header_block is block
+
+        derived = portkey.with_options(trace_id="trace")
+        assert derived._request_headers(make_options())["x-portkey-trace-id"] == "trace"
+        assert derived._header_block is not block
+        assert "x-portkey-trace-id" not in portkey._request_headers(make_options())
+
+    def test_shared_block_is_not_modified(self) -> None:
+        portkey = Portkey(api_key="test")
+        shared = portkey._request_headers(make_options(), json_content=True)
+        before = list(shared.raw)
+        request = portkey._build_request(make_options())
+        request.headers["x-extra"] = "1"
+        assert list(shared.raw) == before
+        assert portkey._request_headers(make_options()) is not shared
+        assert "content-type" not in portkey._request_headers(make_options())
+
+    def test_requests_are_not_affected_by_each_other(self) -> None:
+        portkey = Portkey(api_key="test")
+        first = portkey._build_request(make_options({"x-portkey-trace-id": "1"}))
+        second = portkey._build_request(make_options())
+        assert first.headers["x-portkey-trace-id"] == "1"
+        assert first.headers["content-type"] == "application/json"
+        assert "x-portkey-trace-id" not in second.headers
+
+    def test_sent_headers(self, make_client) -> None:
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(200, json={})
+
+        portkey = make_client(handler, virtual_key="vk")
+        portkey.post("/chat/completions", model="gpt-4o-mini")
+        assert seen[0]["x-portkey-api-key"] == "test"
+        assert seen[0]["x-portkey-virtual-key"] == "vk"
+        assert seen[0]["x-portkey-runtime"]
+
+    def test_block_is_compiled_once(self, monkeypatch) -> None:
+        built = []
+
+        class CountingHeaderBlock(base_client.HeaderBlock):
+            __slots__ = ()
+
+            def __init__(self, *args) -> None:
+                built.append(args)
+                super().__init__(*args)
+
+        monkeypatch.setattr(base_client, "HeaderBlock", CountingHeaderBlock)
+        portkey = Portkey(
+            api_key="test", virtual_key="vk", config={"retry": {"attempts": 3}}
+        )
+        options = make_options()
+
+        first = portkey._request_headers(options)
+        for _ in range(100):
+            assert portkey._request_headers(options) is first
+        assert len(built) == 1
+
+        derived = portkey.with_options(virtual_key="other")
+        assert derived._request_headers(options)["x-portkey-virtual-key"] == "other"
+        assert derived._request_headers(options) is derived._request_headers(options)
+        assert portkey._request_headers(options) is first
+        assert len(built) == 2
+
+    def test_header_building_regression(self) -> None:
+        # Reusing the compiled block must stay far cheaper than merging and
+        # parsing the header mappings for every request.
+        portkey = Portkey(
+            api_key="test",
+            virtual_key="vk",
+            config={"retry": {"attempts": 3}},
+            metadata={"a": "1"},
+        )
+        options = make_options()
+        merged = best_time(lambda: httpx.Headers(portkey._build_headers(options)))
+        compiled = best_time(lambda: portkey._request_headers(options))
+        assert compiled < merged / 4, (compiled, merged)
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from portkey_ai import AsyncCoalescingTransport, AsyncPortkey, HedgingPolicy
+from portkey_ai._vendor.openai import BadRequestError
+
+
+class SlowGateway:
+    """Answers requests for the alternate virtual key at once and the others
+    after `delay` seconds, recording which requests were cancelled."""
+
+    def __init__(self, delay: float = 1.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.requests: list = []
+        self.cancelled: list = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        virtual_key = request.headers.get("x-portkey-virtual-key")
+        self.requests.append(virtual_key)
+        if virtual_key != "alternate":
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(virtual_key)
+                raise
+        if self.fail:
+            return httpx.Response(400, json={"error": {"message": "bad"}})
+        return httpx.Response(200, json=self.body(request, virtual_key))
+
+    def body(self, request: httpx.Request, virtual_key) -> dict:
+        if request.url.path.endswith("/embeddings"):
+            return {
+                "object": "list",
+                "model": "m",
+                "data": [{"object": "embedding", "index": 0, "embedding": [1.0]}],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            }
+        return {
+            "id": virtual_key or "primary",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "m",
+            "choices": [],
+        }
+
+
+class HeldGateway(SlowGateway):
+    """Holds the first request until `release` is set and answers the others
+    at once, setting `hedged`. Chat completion ids are `<virtual key>-<n>` for
+    the n-th request. Create it inside the test's event loop."""
+
+    def __init__(self, fail: bool = False) -> None:
+        super().__init__(fail=fail)
+        self.release = asyncio.Event()
+        self.hedged = asyncio.Event()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        virtual_key = request.headers.get("x-portkey-virtual-key")
+        self.requests.append(virtual_key)
+        attempt = len(self.requests)
+        if attempt == 1:
+            try:
+                await self.release.wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(virtual_key)
+                raise
+        else:
+            self.hedged.set()
+        if self.fail:
+            return httpx.Response(400, json={"error": {"message": "bad"}})
+        return httpx.Response(200, json=self.body(request, f"{virtual_key}-{attempt}"))
+
+
+@pytest.fixture
+def make_hedged_client(make_async_client):
+    def make(gateway: SlowGateway, policy: HedgingPolicy) -> AsyncPortkey:
+        return make_async_client(
+            gateway, virtual_key="primary", max_retries=0, hedging_policy=policy
+        )
+
+    return make
+
+
+def chat(portkey: AsyncPortkey):
+    return portkey.chat.completions.create(
+        model="m", messages=[{"role": "user", "content": "hi"}]
+    )
+
+
+class TestHedgingPolicy:
+    def test_adaptive_delay(self) -> None:
+        policy = HedgingPolicy(initial_delay=2.0, min_samples=10, min_delay=0.0)
+        for latency in range(1, 10):
+            policy.observe(latency / 100)
+        assert policy.hedge_delay() == 2.0
+        for latency in range(10, 101):
+            policy.observe(latency / 100)
+        assert policy.hedge_delay() == 0.95
+        assert HedgingPolicy(0.3).hedge_delay() == 0.3
+
+    def test_window_and_min_delay(self) -> None:
+        policy = HedgingPolicy(window=5, min_samples=5, min_delay=0.5)
+        for latency in (9.0, 0.1, 0.1, 0.1, 0.1, 0.1):
+            policy.observe(latency)
+        assert policy.hedge_delay() == 0.5
+        with pytest.raises(ValueError):
+            HedgingPolicy(percentile=0)
+
+    def test_alternate_target(self, make_hedged_client) -> None:
+        policy = HedgingPolicy(virtual_key="alternate", config={"retry": 1})
+        portkey = make_hedged_client(SlowGateway(), policy)
+        alternate = portkey._hedging_client
+        assert alternate.custom_headers["x-portkey-virtual-key"] == "alternate"
+        assert alternate.custom_headers["x-portkey-config"] == json.dumps({"retry": 1})
+        assert alternate.custom_headers["x-portkey-hedge"] == "true"
+        assert alternate._client is portkey._client
+
+        portkey = make_hedged_client(SlowGateway(), HedgingPolicy())
+        same = portkey._hedging_client
+        assert same.custom_headers["x-portkey-virtual-key"] == "primary"
+        assert same.custom_headers["x-portkey-hedge"] == "true"
+
+
+class TestHedgedRequests:
+    def test_slow_primary_is_hedged_and_cancelled(self, make_hedged_client) -> None:
+        gateway = SlowGateway()
+        policy = HedgingPolicy(0.05, virtual_key="alternate")
+
+        async def main():
+            started = time.monotonic()
+            response = await chat(make_hedged_client(gateway, policy))
+            return response, time.monotonic() - started
+
+        response, elapsed = asyncio.run(main())
+        assert response.id == "alternate"
+        assert elapsed < 0.5
+        assert gateway.requests == ["primary", "alternate"]
+        assert gateway.cancelled == ["primary"]
+        assert policy.stats()["hedge_wins"] == 1
+
+    def test_fast_primary_is_not_hedged(self, make_hedged_client) -> None:
+        gateway = SlowGateway(delay=0.0)
+        policy = HedgingPolicy(0.5, virtual_key="alternate")
+        response = asyncio.run(chat(make_hedged_client(gateway, policy)))
+        assert response.id == "primary"
+        assert gateway.requests == ["primary"]
+        assert policy.stats()["hedged"] == 0
+
+    def test_duplicate_of_same_target(self, make_hedged_client) -> None:
+        async def main():
+            gateway = HeldGateway()
+            portkey = make_hedged_client(gateway, HedgingPolicy(0.05))
+            return gateway, await chat(portkey)
+
+        gateway, response = asyncio.run(main())
+        assert response.id == "primary-2"
+        assert gateway.requests == ["primary", "primary"]
+        assert gateway.cancelled == ["primary"]
+
+    def test_both_failing_raises(self, make_hedged_client) -> None:
+        policy = HedgingPolicy(0.05, virtual_key="alternate")
+
+        async def main():
+            gateway = HeldGateway(fail=True)
+            task = asyncio.ensure_future(chat(make_hedged_client(gateway, policy)))
+            await gateway.hedged.wait()
+            gateway.release.set()
+            with pytest.raises(BadRequestError):
+                await task
+            return gateway
+
+        gateway = asyncio.run(main())
+        assert gateway.requests == ["primary", "alternate"]
+        assert gateway.cancelled == []
+
+    def test_hedge_win_observes_latency_from_original_start(
+        self, make_hedged_client
+    ) -> None:
+        policy = HedgingPolicy(
+            initial_delay=0.05, min_delay=0.0, min_samples=1, virtual_key="alternate"
+        )
+
+        async def main():
+            return await chat(make_hedged_client(HeldGateway(), policy))
+
+        assert asyncio.run(main()).id == "alternate-2"
+        assert policy.stats()["hedge_wins"] == 1
+        # At least the hedging delay, not just the duplicate's own latency.
+        assert policy.hedge_delay() >= 0.05
+
+    def test_duplicate_is_not_coalesced(self, make_async_client) -> None:
+        async def main():
+            gateway = HeldGateway()
+            portkey = make_async_client(
+                transport=AsyncCoalescingTransport(httpx.MockTransport(gateway)),
+                virtual_key="primary",
+                max_retries=0,
+                hedging_policy=HedgingPolicy(0.05),
+            )
+            # A hedge that joined the held request would never finish.
+            return portkey, await asyncio.wait_for(chat(portkey), 5)
+
+        portkey, response = asyncio.run(main())
+        assert response.id == "primary-2"
+        assert portkey.coalescing_stats() == {"requests": 2, "coalesced": 0}
+
+    def test_embeddings_and_prompts(self, make_hedged_client) -> None:
+        gateway = SlowGateway()
+        policy = HedgingPolicy(0.05, virtual_key="alternate")
+        portkey = make_hedged_client(gateway, policy)
+
+        async def main():
+            await portkey.embeddings.create(input="hi", model="m")
+            return await portkey.prompts.completions.create(prompt_id="p")
+
+        assert asyncio.run(main()).id == "alternate"
+        assert gateway.cancelled == ["primary", "primary"]
+        assert policy.stats()["hedge_wins"] == 2
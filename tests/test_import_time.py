@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import portkey_ai
+from portkey_ai.api_resources import apis
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+def modules_after(code: str) -> list:
+    return json.loads(
+        run_python(f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))")
+    )
+
+
+def best_import_time(module: str, runs: int = 3) -> float:
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print(time.perf_counter() - start)"
+    )
+    return min(float(run_python(code)) for _ in range(runs))
+
+
+class TestLazyImports:
+    def test_package_import_loads_no_resources(self) -> None:
+        modules = modules_after("import portkey_ai")
+        assert "portkey_ai._vendor.openai" not in modules
+        assert not [
+            m
+            for m in modules
+            if m.startswith("portkey_ai.api_resources.")
+            and m.split(".")[2] in ("apis", "types", "client")
+        ]
+
+    def test_client_loads_only_the_resources_used(self) -> None:
+        modules = modules_after(
+            "from portkey_ai import Portkey\n"
+            "Portkey(api_key='test').chat.completions"
+        )
+        assert "portkey_ai.api_resources.apis.chat_complete" in modules
+        assert "portkey_ai.api_resources.apis.fine_tuning" not in modules
+        assert "portkey_ai.api_resources.apis.vector_stores" not in modules
+
+    def test_public_names_resolve(self) -> None:
+        for module in (portkey_ai, portkey_ai.api_resources, apis):
+            assert [n for n in module.__all__ if not hasattr(module, n)] == []
+        assert portkey_ai.openai.__name__ == "portkey_ai._vendor.openai"
+        assert "Portkey" in dir(portkey_ai)
+        with pytest.raises(AttributeError):
+            portkey_ai.does_not_exist
+
+    def test_import_time_regression(self) -> None:
+        # Importing the package must stay far cheaper than the vendored
+        # OpenAI client it used to load eagerly.
+        package = best_import_time("portkey_ai")
+        vendored = best_import_time("portkey_ai._vendor.openai")
+        assert package < vendored / 2, (package, vendored)
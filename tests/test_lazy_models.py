@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from portkey_ai import LazyModel, Portkey
+from portkey_ai.api_resources.types.chat_complete_type import ChatCompletions
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "hi"},
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
+    "provider_extra": {"a": 1},
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200, json=CHAT_COMPLETION, headers={"x-portkey-trace-id": "trace"}
+    )
+
+
+class TestLazyModel:
+    def test_nested_access(self) -> None:
+        lazy = LazyModel(ChatCompletions, CHAT_COMPLETION)
+        choice = lazy.choices[0]
+        assert isinstance(choice, LazyModel)
+        assert choice.message.content == "hi"
+        assert lazy.usage.total_tokens == 10
+        assert lazy["model"] == "gpt-4o-mini"
+        assert lazy.get("system_fingerprint", "none") == "none"
+        assert lazy.provider_extra == {"a": 1}
+        # Wrapped values are cached, so repeated reads return the same object.
+        assert lazy.choices is lazy.choices
+
+    def test_unknown_attribute(self) -> None:
+        lazy = LazyModel(ChatCompletions, CHAT_COMPLETION)
+        assert lazy.system_fingerprint is None
+        with pytest.raises(AttributeError):
+            lazy.not_a_field
+
+    def test_validate(self) -> None:
+        model = LazyModel(ChatCompletions, CHAT_COMPLETION).validate()
+        assert isinstance(model, ChatCompletions)
+        assert model.choices[0].message.content == "hi"
+
+
+class TestResponseModelMode:
+    def test_rejects_unknown_mode(self) -> None:
+        with pytest.raises(ValueError):
+            Portkey(api_key="test", response_model_mode="fast")
+
+    def test_strict_is_default(self, make_client) -> None:
+        completion = make_client(handler).chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+        assert isinstance(completion, ChatCompletions)
+
+    def test_lazy_mode(self, make_client) -> None:
+        portkey = make_client(handler, response_model_mode="lazy")
+        completion = portkey.chat.completions.create(
+            model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+        )
+        assert isinstance(completion, LazyModel)
+        assert completion.choices[0].message.content == "hi"
+        assert completion.get_headers()["trace-id"] == "trace"
+        assert portkey.copy().response_model_mode == "lazy"
+
+    def test_lazy_chat_stream(self, make_client, make_async_client) -> None:
+        chunk = (
+            b'data: {"id":"c","object":"chat.completion.chunk","created":1,'
+            b'"model":"m","choices":[{"index":0,"delta":{"content":"hi"}}]}\n\n'
+        )
+
+        def stream_handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                headers={"content-type": "text/event-stream"},
+                content=chunk * 2 + b"data: [DONE]\n\n",
+            )
+
+        messages = [{"role": "user", "content": "hi"}]
+        portkey = make_client(stream_handler, response_model_mode="lazy")
+        chunks = list(
+            portkey.chat.completions.create(model="m", messages=messages, stream=True)
+        )
+        assert all(isinstance(chunk, LazyModel) for chunk in chunks)
+        assert [chunk.choices[0].delta.content for chunk in chunks] == ["hi", "hi"]
+
+        async def run():
+            portkey = make_async_client(stream_handler, response_model_mode="lazy")
+            stream = await portkey.chat.completions.create(
+                model="m", messages=messages, stream=True
+            )
+            return [chunk async for chunk in stream]
+
+        chunks = asyncio.run(run())
+        assert all(isinstance(chunk, LazyModel) for chunk in chunks)
+        assert chunks[0].choices[0].delta.content == "hi"
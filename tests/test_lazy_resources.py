@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import pytest
+
+from portkey_ai import AsyncPortkey, Portkey
+from portkey_ai.api_resources.apis.api_resource import APIResource, AsyncAPIResource
+
+from .conftest import BASE_URL
+
+
+@pytest.fixture(params=[Portkey, AsyncPortkey])
+def portkey(request):
+    return request.param(api_key="test", base_url=BASE_URL)
+
+
+def resources(obj) -> list:
+    return [
+        name
+        for name, value in vars(obj).items()
+        if isinstance(value, (APIResource, AsyncAPIResource))
+    ]
+
+
+class TestLazyResources:
+    def test_client_construction_builds_no_resources(self, portkey) -> None:
+        assert resources(portkey) == []
+
+    def test_nested_resources_are_built_on_first_access(self, portkey) -> None:
+        prompts = portkey.prompts
+        assert resources(portkey) == ["prompts"]
+        assert resources(prompts) == []
+
+        completions = prompts.completions
+        assert resources(prompts) == ["completions"]
+        assert completions._client is portkey
+        assert prompts.completions is completions
+        assert portkey.prompts is prompts
+
+    def test_beta_members_are_built_on_first_access(self, portkey) -> None:
+        beta = portkey.beta
+        assert resources(beta) == []
+        threads = beta.threads
+        assert resources(beta) == ["threads"]
+        assert resources(threads) == []
+        assert threads.messages is threads.messages
+
+    def test_copy_starts_with_no_resources(self, portkey) -> None:
+        portkey.vector_stores.files
+        assert resources(portkey.copy()) == []
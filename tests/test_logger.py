@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from portkey_ai.api_resources.apis.logger import AsyncLogger, Logger
+
+from .conftest import BASE_URL
+
+
+class Recorder:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.batches: List[list] = []
+        self.encodings: List[str] = []
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.delay)
+        body = request.content
+        encoding = request.headers.get("content-encoding", "")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        with self.lock:
+            self.batches.append(json.loads(body))
+            self.encodings.append(encoding)
+        return httpx.Response(200, json={})
+
+    @property
+    def logs(self) -> list:
+        return [log for batch in self.batches for log in batch]
+
+
+def make_logger(recorder: Recorder, **kwargs) -> Logger:
+    return Logger(
+        api_key="test",
+        base_url=BASE_URL,
+        http_client=httpx.Client(transport=httpx.MockTransport(recorder)),
+        **kwargs,
+    )
+
+
+class TestLogger:
+    def test_log_does_not_block_and_batches_by_size(self) -> None:
+        recorder = Recorder(delay=0.05)
+        logger = make_logger(recorder, batch_size=10, flush_interval=60)
+        started_at = time.monotonic()
+        for i in range(25):
+            logger.log({"i": i})
+        assert time.monotonic() - started_at < 0.05
+        assert logger.flush(timeout=5)
+        assert [log["i"] for log in recorder.logs] == list(range(25))
+        assert [len(batch) for batch in recorder.batches] == [10, 10, 5]
+        logger.close()
+
+    def test_flush_interval(self) -> None:
+        recorder = Recorder()
+        logger = make_logger(recorder, batch_size=100, flush_interval=0.05)
+        logger.log([{"i": 1}, {"i": 2}])
+        time.sleep(0.3)
+        assert recorder.batches == [[{"i": 1}, {"i": 2}]]
+        logger.close()
+
+    def test_gzip_large_bodies(self) -> None:
+        recorder = Recorder()
+        logger = make_logger(recorder)
+        logger.log({"text": "x" * 5000})
+        logger.log({"text": "x"})
+        logger.close()
+        assert recorder.encodings == ["gzip"]
+
+    @pytest.mark.parametrize(
+        "policy, kept", [("drop_oldest", [2, 3]), ("drop_newest", [0, 1])]
+    )
+    def test_drop_policy(self, policy: str, kept: list) -> None:
+        recorder = Recorder()
+        logger = make_logger(
+            recorder, batch_size=2, max_queue_size=2, drop_policy=policy
+        )
+        with logger._cond:
+            # The worker cannot take anything while the lock is held.
+            logger._queue.extend([{"i": 0}, {"i": 1}])
+            for i in (2, 3):
+                assert logger._enqueue({"i": i})
+        assert logger.dropped == 2
+        assert [log["i"] for log in logger._queue] == kept
+
+    def test_close_flushes_and_rejects_new_logs(self) -> None:
+        recorder = Recorder()
+        logger = make_logger(recorder, flush_interval=60)
+        logger.log({"i": 1})
+        logger.close()
+        assert recorder.logs == [{"i": 1}]
+        with pytest.raises(RuntimeError):
+            logger.log({"i": 2})
+
+    def test_block_policy_first_log_larger_than_queue(self) -> None:
+        recorder = Recorder()
+        logger = make_logger(
+            recorder, batch_size=2, max_queue_size=2, drop_policy="block"
+        )
+
+        # No flush thread is running yet, as in a freshly forked child.
+        thread = threading.Thread(
+            target=logger.log, args=([{"i": i} for i in range(5)],), daemon=True
+        )
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+        logger.close()
+        assert [log["i"] for log in recorder.logs] == list(range(5))
+
+    def test_blocking_mode(self) -> None:
+        recorder = Recorder()
+        logger = make_logger(recorder, background=False)
+        response = logger.log([{"i": 1}])
+        assert response is not None and response.status_code == 200
+        assert recorder.logs == [{"i": 1}]
+
+
+class TestAsyncLogger:
+    @pytest.mark.asyncio
+    async def test_batches_and_flush(self) -> None:
+        recorder = Recorder()
+        logger = AsyncLogger(
+            api_key="test",
+            base_url=BASE_URL,
+            batch_size=4,
+            flush_interval=60,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)),
+        )
+        for i in range(10):
+            await logger.log({"i": i})
+        await logger.flush()
+        assert [log["i"] for log in recorder.logs] == list(range(10))
+        assert [len(batch) for batch in recorder.batches] == [4, 4, 2]
+        await logger.close()
+
+    @pytest.mark.asyncio
+    async def test_block_policy_log_larger_than_queue(self) -> None:
+        recorder = Recorder()
+        logger = AsyncLogger(
+            api_key="test",
+            base_url=BASE_URL,
+            batch_size=2,
+            max_queue_size=2,
+            drop_policy="block",
+            flush_interval=60,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(recorder)),
+        )
+        await logger.log({"i": 0})
+        await logger.flush()
+        await asyncio.wait_for(logger.log([{"i": i} for i in range(1, 6)]), 5)
+        await logger.close()
+        assert [log["i"] for log in recorder.logs] == list(range(6))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+
+def batch(index: int) -> dict:
+    return {"id": f"batch_{index}", "object": "batch", "status": "completed"}
+
+
+class BatchGateway:
+    """Serves `total` batches in pages of `limit`, following `after`."""
+
+    def __init__(self, total: int = 7) -> None:
+        self.total = total
+        self.requests: list = []
+        self.second_page = threading.Event()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if len(self.requests) == 2:
+            self.second_page.set()
+        after = request.url.params.get("after")
+        limit = int(request.url.params.get("limit", 3))
+        start = 0 if after is None else int(after.split("_")[1]) + 1
+        data = [batch(i) for i in range(start, min(start + limit, self.total))]
+        return httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "data": data,
+                "has_more": start + limit < self.total,
+            },
+        )
+
+
+class TestIterAll:
+    def test_follows_cursor(self, make_client) -> None:
+        gateway = BatchGateway()
+        portkey = make_client(gateway)
+
+        ids = [b.id for b in portkey.batches.iter_all(limit=3)]
+
+        assert ids == [f"batch_{i}" for i in range(7)]
+        assert [r.url.params.get("after") for r in gateway.requests] == [
+            None,
+            "batch_2",
+            "batch_5",
+        ]
+
+    def test_prefetches_next_page(self, make_client) -> None:
+        gateway = BatchGateway()
+        portkey = make_client(gateway)
+        items = portkey.batches.iter_all(limit=3)
+
+        next(items)
+        # The second page is requested while the first is being consumed.
+        assert gateway.second_page.wait(timeout=5)
+        assert len(gateway.requests) == 2
+
+    def test_stopping_early_fetches_at_most_one_page_ahead(self, make_client) -> None:
+        gateway = BatchGateway(total=30)
+        portkey = make_client(gateway)
+        for item in portkey.batches.iter_all(limit=3):
+            if item.id == "batch_1":
+                break
+        assert len(gateway.requests) <= 2
+
+    def test_page_numbers(self, make_client) -> None:
+        pages = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            current_page = request.url.params["currentPage"]
+            page = 0 if current_page == "None" else int(current_page)
+            pages.append(page)
+            data = [{"id": f"user_{page}_{i}"} for i in range(2 if page < 2 else 1)]
+            return httpx.Response(200, json={"total": 5, "data": data})
+
+        portkey = make_client(handler)
+        users = list(portkey.admin.users.iter_all(page_size=2))
+
+        assert len(users) == 5
+        assert pages == [0, 1, 2]
+
+        pages.clear()
+        assert len(list(portkey.admin.users.iter_all(current_page=None))) == 5
+        assert pages == [0, 1, 2]
+
+    def test_single_page_endpoints(self, make_client) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"total": 2, "data": [{"a": 1}, {"a": 2}]})
+
+        portkey = make_client(handler)
+        assert list(portkey.configs.iter_all()) == [{"a": 1}, {"a": 2}]
+
+    @pytest.mark.asyncio
+    async def test_async(self, make_async_client) -> None:
+        gateway = BatchGateway()
+        portkey = make_async_client(gateway)
+
+        ids = [b.id async for b in portkey.batches.iter_all(limit=3)]
+
+        assert ids == [f"batch_{i}" for i in range(7)]
+        assert len(gateway.requests) == 3
+
+    def test_async_stops_cleanly(self, make_async_client) -> None:
+        gateway = BatchGateway(total=30)
+        portkey = make_async_client(gateway)
+
+        async def first() -> str:
+            items = portkey.batches.iter_all(limit=3)
+            async for item in items:
+                await items.aclose()
+                return item.id
+            return ""
+
+        assert asyncio.run(first()) == "batch_0"
+        assert len(gateway.requests) <= 2
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from portkey_ai import RateLimiter, RetryPolicy
+from portkey_ai._vendor.openai import BadRequestError
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 1,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "hi"},
+        }
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 5, "total_tokens": 10},
+}
+
+
+class TestRateLimiter:
+    def test_requires_a_limit(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter()
+
+    def test_requests_per_minute_blocks_when_exhausted(self) -> None:
+        limiter = RateLimiter(requests_per_minute=2)
+        limiter.acquire("vk")
+        limiter.acquire("vk")
+        assert limiter._try_acquire("vk", 0) > 0
+        # Budgets are independent per key.
+        assert limiter._try_acquire("other-vk", 0) == 0
+
+    def test_estimate_tokens(self) -> None:
+        limiter = RateLimiter(tokens_per_minute=1000)
+        body = {
+            "messages": [
+                {"role": "user", "content": "a" * 40},
+                {"role": "user", "content": [{"type": "text", "text": "b" * 40}]},
+            ],
+            "max_tokens": 50,
+        }
+        assert limiter.estimate_tokens(body) == 70
+
+    def test_reconcile_refunds_unused_tokens(self) -> None:
+        limiter = RateLimiter(tokens_per_minute=100)
+        limiter.acquire("vk", tokens=100)
+        assert limiter._try_acquire("vk", 50) > 0
+        limiter.reconcile("vk", 100, {"total_tokens": 40})
+        assert limiter._try_acquire("vk", 50) == 0
+
+    @pytest.mark.asyncio
+    async def test_aacquire_waits_for_refill(self) -> None:
+        limiter = RateLimiter(requests_per_minute=600)
+        limiter._get_buckets("default").requests.tokens = 0  # type: ignore
+        started_at = time.monotonic()
+        await limiter.aacquire()
+        assert time.monotonic() - started_at >= 0.05
+
+
+class TestClientRateLimiting:
+    def test_chat_completions_consult_limiter(self, make_client) -> None:
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=CHAT_COMPLETION)
+
+        limiter = RateLimiter(requests_per_minute=1, tokens_per_minute=1000)
+        portkey = make_client(handler, virtual_key="vk", rate_limiter=limiter)
+        completion = portkey.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "a" * 400}],
+            max_tokens=100,
+        )
+        assert completion.choices[0].message.content == "hi"
+        assert len(requests) == 1
+        assert limiter._try_acquire("vk", 0) > 0
+        # 200 estimated tokens were reserved, 10 were used.
+        assert limiter._buckets["vk"].tokens.tokens == pytest.approx(990, abs=1)
+
+    def test_failed_attempts_give_back_tokens(self, make_client) -> None:
+        statuses = [503, 200]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(statuses.pop(0), json=CHAT_COMPLETION)
+
+        limiter = RateLimiter(tokens_per_minute=1000)
+        portkey = make_client(
+            handler,
+            virtual_key="vk",
+            rate_limiter=limiter,
+            retry_policy=RetryPolicy(max_retries=1, initial_delay=0.0),
+        )
+        portkey.prompts.completions.create(prompt_id="p", max_tokens=100)
+        assert statuses == []
+        # Only the attempt that succeeded is charged, for the 10 tokens used.
+        assert limiter._buckets["vk"].tokens.tokens == pytest.approx(990, abs=1)
+
+        portkey = make_client(
+            lambda request: httpx.Response(400, json={"error": {"message": "bad"}}),
+            virtual_key="vk",
+            rate_limiter=limiter,
+        )
+        with pytest.raises(BadRequestError):
+            portkey.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "hi"}],
+                max_tokens=100,
+            )
+        assert limiter._buckets["vk"].tokens.tokens == pytest.approx(990, abs=1)
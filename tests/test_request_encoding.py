@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from portkey_ai._vendor.openai._types import NOT_GIVEN
+from portkey_ai.api_resources.utils import prune_empty_values, remove_empty_values
+from portkey_ai.utils import json_dumps
+
+IMAGE = {
+    "type": "image_url",
+    "image_url": {"url": "data:image/png;base64," + "A" * 4096},
+}
+
+
+def vision_body() -> dict:
+    return {
+        "model": "gpt-4o",
+        "user": "",
+        "temperature": NOT_GIVEN,
+        "messages": [
+            {"role": "system", "content": "be brief", "name": ""},
+            {"role": "user", "content": [{"type": "text", "text": "hi"}, IMAGE]},
+        ],
+        "stop": ["", "END", NOT_GIVEN],
+        "metadata": {},
+    }
+
+
+class TestPruneEmptyValues:
+    def test_matches_remove_empty_values(self) -> None:
+        body = vision_body()
+        assert prune_empty_values(body) == remove_empty_values(body)
+
+    def test_input_is_untouched(self) -> None:
+        body = vision_body()
+        prune_empty_values(body)
+        assert body == vision_body()
+
+    def test_shares_unchanged_parts(self) -> None:
+        body = vision_body()
+        pruned = prune_empty_values(body)
+        assert pruned is not body
+        assert pruned["messages"][1] is body["messages"][1]
+        assert pruned["messages"][1]["content"][1] is IMAGE
+        assert pruned["metadata"] is body["metadata"]
+
+    def test_clean_body_is_returned_as_is(self) -> None:
+        body = {"model": "gpt-4o", "messages": [{"role": "user", "content": "hi"}]}
+        assert prune_empty_values(body) is body
+
+
+class TestJsonDumps:
+    def test_compact_utf8(self) -> None:
+        data = {"text": "héllo", "n": [1, 2.5, None, True]}
+        assert json_dumps(data) == json.dumps(
+            data, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+    def test_falls_back_for_non_string_keys(self) -> None:
+        assert json.loads(json_dumps({1: "a"})) == {"1": "a"}
+
+
+class TestRequestBody:
+    def make_handler(self, seen: list):
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"ok": True})
+
+        return handler
+
+    def test_sync_body_is_pruned_and_sent_as_json(self, make_client) -> None:
+        seen: list = []
+        portkey = make_client(self.make_handler(seen))
+        body = vision_body()
+        portkey.post("/chat/completions", **body)
+
+        assert seen[0].headers["content-type"] == "application/json"
+        assert json.loads(seen[0].content) == remove_empty_values(body)
+        assert body == vision_body()
+
+    @pytest.mark.asyncio
+    async def test_async_body_is_pruned_and_sent_as_json(
+        self, make_async_client
+    ) -> None:
+        seen: list = []
+        portkey = make_async_client(self.make_handler(seen))
+        await portkey.post("/chat/completions", **vision_body())
+
+        assert seen[0].headers["content-type"] == "application/json"
+        assert json.loads(seen[0].content) == remove_empty_values(vision_body())
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from portkey_ai import MemoryResponseCache, SQLiteResponseCache
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "model": "gpt-4o-mini",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "hi"},
+        }
+    ],
+}
+
+EMBEDDING = {
+    "object": "list",
+    "model": "text-embedding-3-small",
+    "data": [{"object": "embedding", "index": 0, "embedding": [0.1, 0.2]}],
+    "usage": {"prompt_tokens": 1, "total_tokens": 1},
+}
+
+PROMPT_COMPLETION = {"id": "p-1", "object": "chat.completion", "choices": []}
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+class Gateway:
+    def __init__(self) -> None:
+        self.requests: list = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.path
+        if path.endswith("/embeddings"):
+            body = EMBEDDING
+        elif path.startswith("/v1/prompts/"):
+            body = PROMPT_COMPLETION
+        else:
+            body = CHAT_COMPLETION
+        return httpx.Response(200, json=body, headers={"x-portkey-trace-id": "t"})
+
+
+class TestMemoryResponseCache:
+    def test_lru_eviction(self) -> None:
+        cache = MemoryResponseCache(max_entries=2)
+        cache.set("a", b"1", {})
+        cache.set("b", b"2", {})
+        assert cache.get("a") is not None
+        cache.set("c", b"3", {})
+        assert cache.get("b") is None
+        assert cache.get("a") == (b"1", {})
+        assert cache.stats()["evictions"] == 1
+
+    def test_size_eviction(self) -> None:
+        cache = MemoryResponseCache(max_bytes=10)
+        cache.set("a", b"12345", {})
+        cache.set("b", b"12345", {})
+        cache.set("c", b"1", {})
+        assert cache.get("a") is None
+        assert cache.stats()["size_bytes"] == 6
+        # Entries larger than the whole budget are not stored at all.
+        cache.set("d", b"x" * 11, {})
+        assert cache.get("d") is None
+
+    def test_ttl(self) -> None:
+        cache = MemoryResponseCache(ttl=0.05)
+        cache.set("a", b"1", {})
+        assert cache.get("a") is not None
+        time.sleep(0.1)
+        assert cache.get("a") is None
+        assert cache.stats()["entries"] == 0
+
+
+class TestSQLiteResponseCache:
+    def test_shared_between_instances(self, tmp_path) -> None:
+        path = str(tmp_path / "responses.db")
+        writer = SQLiteResponseCache(path)
+        reader = SQLiteResponseCache(path)
+        writer.set("a", b'{"x": 1}', {"content-type": "application/json"})
+        assert reader.get("a") == (b'{"x": 1}', {"content-type": "application/json"})
+        assert reader.stats()["hits"] == 1
+        writer.close()
+        reader.close()
+
+    def test_max_entries_and_ttl(self, tmp_path) -> None:
+        cache = SQLiteResponseCache(str(tmp_path / "responses.db"), max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, b"1", {})
+            time.sleep(0.01)
+        assert cache.get("a") is None
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+
+        expiring = SQLiteResponseCache(str(tmp_path / "ttl.db"), ttl=0.05)
+        expiring.set("a", b"1", {})
+        time.sleep(0.1)
+        assert expiring.get("a") is None
+
+
+class TestClientResponseCache:
+    def test_chat_completions_hit_skips_network(self, make_client) -> None:
+        gateway = Gateway()
+        cache = MemoryResponseCache()
+        portkey = make_client(gateway, response_cache=cache)
+
+        first = portkey.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+        second = portkey.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+        assert len(gateway.requests) == 1
+        assert second.choices[0].message.content == "hi"
+        assert second.get_headers() == first.get_headers()
+        assert cache.stats()["hits"] == 1
+
+        portkey.chat.completions.create(
+            model="gpt-4o-mini", messages=MESSAGES, temperature=0.5
+        )
+        assert len(gateway.requests) == 2
+
+    def test_key_ignores_trace_ids_but_not_provider(self, make_client) -> None:
+        gateway = Gateway()
+        cache = MemoryResponseCache()
+        portkey = make_client(gateway, response_cache=cache, virtual_key="vk")
+        portkey.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+        portkey.with_options(trace_id="other").chat.completions.create(
+            model="gpt-4o-mini", messages=MESSAGES
+        )
+        assert len(gateway.requests) == 1
+        portkey.with_options(virtual_key="vk-2").chat.completions.create(
+            model="gpt-4o-mini", messages=MESSAGES
+        )
+        assert len(gateway.requests) == 2
+
+    def test_force_refresh_skips_lookup(self, make_client) -> None:
+        gateway = Gateway()
+        cache = MemoryResponseCache()
+        portkey = make_client(gateway, response_cache=cache)
+        portkey.chat.completions.create(model="gpt-4o-mini", messages=MESSAGES)
+        portkey.with_options(cache_force_refresh=True).chat.completions.create(
+            model="gpt-4o-mini", messages=MESSAGES
+        )
+        assert len(gateway.requests) == 2
+
+    def test_embeddings_completions_and_prompts(self, make_client, tmp_path) -> None:
+        gateway = Gateway()
+        cache = SQLiteResponseCache(str(tmp_path / "responses.db"))
+        portkey = make_client(gateway, response_cache=cache, response_model_mode="lazy")
+        for _ in range(2):
+            embedding = portkey.embeddings.create(
+                input="hi", model="text-embedding-3-small"
+            )
+            portkey.completions.create(model="gpt-3.5-turbo-instruct", prompt="hi")
+            portkey.prompts.completions.create(prompt_id="pp-1", variables={"a": 1})
+        assert embedding.data[0].embedding == [0.1, 0.2]
+        assert len(gateway.requests) == 3
+        assert cache.stats()["hits"] == 3
+
+    @pytest.mark.asyncio
+    async def test_async_chat_completions(self, make_async_client) -> None:
+        gateway = Gateway()
+        cache = MemoryResponseCache()
+        portkey = make_async_client(gateway, response_cache=cache)
+        for _ in range(2):
+            response = await portkey.chat.completions.create(
+                model="gpt-4o-mini", messages=MESSAGES
+            )
+        assert response.choices[0].message.content == "hi"
+        assert len(gateway.requests) == 1
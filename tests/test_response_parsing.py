@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+
+from portkey_ai.api_resources.types.embeddings_type import CreateEmbeddingResponse
+from portkey_ai.api_resources.utils import parse_response
+from portkey_ai.utils import json_loads
+
+
+class TestResponseParsing:
+    def test_json_loads_accepts_bytes_and_memoryview(self) -> None:
+        payload = {"a": [1, 2.5, "x"], "b": None}
+        raw = json.dumps(payload).encode()
+        assert json_loads(raw) == payload
+        assert json_loads(memoryview(raw)) == payload
+        assert json_loads(raw.decode()) == payload
+
+    def test_json_loads_falls_back_to_stdlib(self) -> None:
+        value = json_loads(b'{"x": NaN}')["x"]
+        assert value != value
+
+    def test_parse_response_attaches_headers(self) -> None:
+        response = httpx.Response(
+            200,
+            json={
+                "object": "list",
+                "model": "text-embedding-3-small",
+                "data": [{"object": "embedding", "index": 0, "embedding": [0.5]}],
+            },
+            headers={"x-portkey-trace-id": "trace"},
+        )
+        data = parse_response(CreateEmbeddingResponse, response)
+        assert data.data[0].embedding == [0.5]
+        assert data.get_headers()["trace-id"] == "trace"
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+import pytest
+
+from portkey_ai import RetryPolicy
+from portkey_ai.api_resources.exceptions import InternalServerError, RateLimitError
+
+
+def make_handler(statuses: List[int], calls: List[httpx.Request], headers=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        status = statuses[min(len(calls), len(statuses)) - 1]
+        body = {"success": True} if status == 200 else {"error": {"message": "x"}}
+        return httpx.Response(status, json=body, headers=headers or {})
+
+    return handler
+
+
+class TestRetryPolicy:
+    def test_backoff_is_capped_and_jittered(self) -> None:
+        policy = RetryPolicy(initial_delay=1, max_delay=4)
+        for retry_count in range(10):
+            assert 0 <= policy.backoff(retry_count) <= 4
+
+        policy = RetryPolicy(initial_delay=1, max_delay=4, jitter=False)
+        assert [policy.backoff(i) for i in range(4)] == [1, 2, 4, 4]
+
+    def test_retry_after_headers(self) -> None:
+        policy = RetryPolicy(jitter=False)
+        response = httpx.Response(429, headers={"retry-after-ms": "250"})
+        assert policy.compute_delay(0, response) == 0.25
+        response = httpx.Response(429, headers={"retry-after": "3"})
+        assert policy.compute_delay(0, response) == 3
+        response = httpx.Response(429, headers={"x-ratelimit-reset": "2"})
+        assert policy.compute_delay(0, response) == 2
+        # Anything beyond `max_retry_after` falls back to exponential backoff.
+        response = httpx.Response(429, headers={"retry-after": "3600"})
+        assert policy.compute_delay(0, response) == policy.initial_delay
+
+    def test_gateway_errors_are_not_retried_unless_listed(self) -> None:
+        policy = RetryPolicy()
+        gateway = {"x-portkey-request-id": "abc"}
+        assert policy.should_retry_response(httpx.Response(500))
+        assert not policy.should_retry_response(httpx.Response(500, headers=gateway))
+        assert policy.should_retry_response(httpx.Response(429, headers=gateway))
+        assert policy.should_retry_response(httpx.Response(503, headers=gateway))
+        assert not policy.should_retry_response(httpx.Response(400))
+
+    def test_total_timeout_stops_retries(self) -> None:
+        policy = RetryPolicy(max_retries=5, jitter=False, total_timeout=0.1)
+        assert policy.next_delay(0, started_at=0.0) is None
+
+
+class TestClientRetries:
+    def test_retried_response_is_returned(self, make_client) -> None:
+        calls: List[httpx.Request] = []
+        portkey = make_client(
+            make_handler([503, 503, 200], calls),
+            retry_policy=RetryPolicy(max_retries=2, initial_delay=0),
+        )
+        response = portkey.feedback.create(trace_id="t", value=1)
+        assert response.success is True
+        assert len(calls) == 3
+
+    def test_last_error_is_raised_after_exhausting_retries(self, make_client) -> None:
+        calls: List[httpx.Request] = []
+        portkey = make_client(
+            make_handler([429], calls),
+            retry_policy=RetryPolicy(max_retries=2, initial_delay=0),
+        )
+        with pytest.raises(RateLimitError):
+            portkey.feedback.create(trace_id="t", value=1)
+        assert len(calls) == 3
+
+    def test_non_retryable_status_is_raised_immediately(self, make_client) -> None:
+        calls: List[httpx.Request] = []
+        portkey = make_client(
+            make_handler([500], calls, {"x-portkey-request-id": "abc"}),
+            retry_policy=RetryPolicy(max_retries=3, initial_delay=0),
+        )
+        with pytest.raises(InternalServerError):
+            portkey.feedback.create(trace_id="t", value=1)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_retried_response_is_returned(self, make_async_client) -> None:
+        calls: List[httpx.Request] = []
+        portkey = make_async_client(
+            make_handler([502, 200], calls),
+            retry_policy=RetryPolicy(max_retries=1, initial_delay=0),
+        )
+        response = await portkey.feedback.create(trace_id="t", value=1)
+        assert response.success is True
+        assert len(calls) == 2
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+pytest.importorskip("opentelemetry.sdk", reason="opentelemetry-sdk not installed")
+
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SpanExportResult  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+
+from portkey_ai.api_resources.instrumentation.portkey_span_exporter import (  # noqa: E402
+    PortkeySpanExporter,
+)
+
+from .conftest import BASE_URL  # noqa: E402
+
+
+def finished_spans(count: int):
+    memory = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(memory))
+    tracer = provider.get_tracer("test")
+    with tracer.start_as_current_span("parent", attributes={"_source": "test"}):
+        for i in range(count - 1):
+            with tracer.start_as_current_span(
+                f"child-{i}", attributes={"tags": ("a", "b")}
+            ) as span:
+                span.add_event("step", {"n": i})
+    return memory.get_finished_spans()
+
+
+class TestPortkeySpanExporter:
+    def test_format_span_matches_to_json(self) -> None:
+        exporter = PortkeySpanExporter(api_key="test", base_url=BASE_URL)
+        for span in finished_spans(3):
+            assert exporter.format_span(span) == json.loads(span.to_json())
+
+    def test_export_reuses_client_and_splits_batches(self) -> None:
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={})
+
+        exporter = PortkeySpanExporter(
+            api_key="test", base_url=BASE_URL, max_batch_size=2, compress=False
+        )
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        exporter._logger._client = client
+
+        assert exporter.export(finished_spans(5)) == SpanExportResult.SUCCESS
+        assert [len(json.loads(r.content)) for r in requests] == [2, 2, 1]
+        assert exporter._logger._client is client
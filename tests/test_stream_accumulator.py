@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+
+from portkey_ai import AsyncStreamAccumulator, StreamAccumulator
+from portkey_ai.api_resources.types.chat_complete_type import ChatCompletions
+
+
+def chunk(delta: dict, finish_reason=None, logprobs=None, usage=None) -> dict:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion.chunk",
+        "created": 1,
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "delta": delta,
+                "finish_reason": finish_reason,
+                "logprobs": logprobs,
+            }
+        ],
+        "usage": usage,
+    }
+
+
+def tool_call(index: int, arguments: str, **extra) -> dict:
+    return {"index": index, "function": {"arguments": arguments}, **extra}
+
+
+CHUNKS = [
+    chunk({"role": "assistant", "content": "Hel"}),
+    chunk(
+        {"content": "lo"},
+        logprobs={"content": [{"token": "lo", "logprob": -0.1, "bytes": [108]}]},
+    ),
+    chunk(
+        {
+            "tool_calls": [
+                tool_call(
+                    0,
+                    '{"city": ',
+                    id="call_1",
+                    type="function",
+                    function={"name": "weather", "arguments": '{"city": '},
+                )
+            ]
+        }
+    ),
+    chunk({"tool_calls": [tool_call(1, '{"q"', id="call_2")]}),
+    chunk({"tool_calls": [tool_call(0, '"Paris"}')]}),
+    chunk({"tool_calls": [tool_call(1, ': "x"}')]}),
+    chunk({}, finish_reason="tool_calls"),
+    {
+        **chunk({}),
+        "choices": [],
+        "usage": {"prompt_tokens": 3, "completion_tokens": 7, "total_tokens": 10},
+    },
+]
+
+
+def sse_handler(request: httpx.Request) -> httpx.Response:
+    body = "".join(f"data: {json.dumps(c)}\n\n" for c in CHUNKS) + "data: [DONE]\n\n"
+    return httpx.Response(
+        200, content=body.encode(), headers={"content-type": "text/event-stream"}
+    )
+
+
+def check(completion: ChatCompletions) -> None:
+    assert isinstance(completion, ChatCompletions)
+    assert completion.object == "chat.completion"
+    choice = completion.choices[0]
+    assert choice.finish_reason == "tool_calls"
+    assert choice.message.content == "Hello"
+    assert choice.logprobs.content[0].token == "lo"
+    calls = choice.message.tool_calls
+    assert [c.id for c in calls] == ["call_1", "call_2"]
+    assert calls[0].function.name == "weather"
+    assert json.loads(calls[0].function.arguments) == {"city": "Paris"}
+    assert json.loads(calls[1].function.arguments) == {"q": "x"}
+    assert completion.usage.total_tokens == 10
+
+
+class TestStreamAccumulator:
+    def test_merges_plain_chunks(self) -> None:
+        accumulator = StreamAccumulator(iter(CHUNKS))
+        assert list(accumulator) == CHUNKS
+        check(accumulator.final_completion())
+
+    def test_wraps_chat_completions_stream(self, make_client) -> None:
+        portkey = make_client(sse_handler)
+        stream = portkey.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "hi"}],
+            stream=True,
+        )
+        with StreamAccumulator(stream) as accumulator:
+            first = next(iter(accumulator))
+            assert first.choices[0].delta.content == "Hel"
+            check(accumulator.final_completion())
+
+    @pytest.mark.asyncio
+    async def test_async(self, make_async_client) -> None:
+        portkey = make_async_client(sse_handler)
+        stream = await portkey.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": "hi"}],
+            stream=True,
+        )
+        async with AsyncStreamAccumulator(stream) as accumulator:
+            chunks = [c async for c in accumulator]
+            assert len(chunks) == len(CHUNKS)
+            check(await accumulator.final_completion())
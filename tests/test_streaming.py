@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from portkey_ai.api_resources.streaming import (
+    AsyncStream,
+    SSEBytesDecoder,
+    SSEDecoder,
+    Stream,
+)
+from portkey_ai.api_resources.types.chat_complete_type import ChatCompletionChunk
+
+CHUNK = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion.chunk",
+    "created": 1,
+    "model": "gpt-4o-mini",
+    "choices": [{"index": 0, "delta": {"content": "tok"}, "finish_reason": None}],
+}
+
+
+def sse_body(n: int, newline: str = "\n") -> bytes:
+    event = f"data: {json.dumps(CHUNK)}{newline}{newline}"
+    return (event * n + f"data: [DONE]{newline}{newline}").encode()
+
+
+def split(body: bytes, size: int) -> List[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def best_time(fn, runs: int = 5) -> float:
+    timings = []
+    for _ in range(runs):
+        started_at = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started_at)
+    return min(timings)
+
+
+class TestSSEBytesDecoder:
+    @pytest.mark.parametrize("size", [1, 7, 64, 4096])
+    @pytest.mark.parametrize("newline", ["\n", "\r\n", "\r"])
+    def test_any_chunking(self, size: int, newline: str) -> None:
+        events = list(
+            SSEBytesDecoder().iter_bytes(iter(split(sse_body(3, newline), size)))
+        )
+        assert [e.json() for e in events[:3]] == [CHUNK] * 3
+        assert events[3].done
+
+    def test_fields_and_shared_events(self) -> None:
+        body = (
+            b": keep-alive\n\n"
+            b"event: ping\n\n"
+            b'id: 7\nevent: error\ndata: {"a":\ndata: 1}\n\n'
+            b"data: {}\n\n"
+            b"data: [DONE]\n\n"
+        )
+        ping, error, plain, done = SSEBytesDecoder().feed(body)
+        assert ping.event == "ping"
+        assert ping is SSEBytesDecoder().feed(b"event: ping\n\n")[0]
+        assert error.event == "error" and error.id == "7"
+        assert error.json() == {"a": 1}
+        # The last event id carries over to later events.
+        assert plain.id == "7" and plain.data == "{}"
+        assert done.done and not plain.done
+
+    @pytest.mark.parametrize(
+        "block",
+        [
+            b"id: 5\ndata: [DONE]\n\n",
+            b"event: done\ndata: [DONE]\n\n",
+            b"data: [DONE]\ndata: \n\n",
+        ],
+    )
+    def test_done_with_other_fields(self, block: bytes) -> None:
+        (sse,) = SSEBytesDecoder().feed(block)
+        assert sse.done
+
+        response = httpx.Response(
+            200,
+            content=sse_body(2)[: -len(b"data: [DONE]\n\n")] + block,
+            request=httpx.Request("POST", "http://gateway.test"),
+        )
+        assert len(list(Stream(response=response, cast_to=ChatCompletionChunk))) == 2
+
+    def test_stream_uses_bytes(self) -> None:
+        response = httpx.Response(
+            200,
+            content=split(sse_body(5), 100),
+            headers={"content-type": "text/event-stream"},
+            request=httpx.Request("POST", "http://gateway.test"),
+        )
+        stream = Stream(response=response, cast_to=ChatCompletionChunk)
+        chunks = list(stream)
+        assert len(chunks) == 5
+        assert chunks[0].choices[0].delta.content == "tok"
+
+    @pytest.mark.asyncio
+    async def test_async_stream(self) -> None:
+        async def content():
+            for chunk in split(sse_body(5), 33):
+                yield chunk
+
+        response = httpx.Response(
+            200,
+            content=content(),
+            request=httpx.Request("POST", "http://gateway.test"),
+        )
+        stream = AsyncStream(response=response, cast_to=ChatCompletionChunk)
+        assert len([chunk async for chunk in stream]) == 5
+
+    def test_faster_than_line_decoder(self) -> None:
+        # Decoding bytes must stay faster than the text and line decoding of
+        # `httpx.Response.iter_lines()` that streams used before.
+        chunks = split(sse_body(20_000), 1024)
+
+        def line_decoder() -> None:
+            lines = httpx.Response(200, content=chunks).iter_lines()
+            events = [sse for sse in SSEDecoder().iter(lines) if sse.data != "[DONE]"]
+            assert len([sse.json() for sse in events]) == 20_000
+
+        def bytes_decoder() -> None:
+            events = list(SSEBytesDecoder().iter_bytes(iter(chunks)))
+            assert len([sse.json() for sse in events if not sse.done]) == 20_000
+
+        lines, decoded = best_time(line_decoder), best_time(bytes_decoder)
+        assert decoded < lines, (decoded, lines)
+
+    def test_large_event_in_small_chunks_is_linear(self) -> None:
+        event = b"data: " + json.dumps({"text": "x" * 256 * 1024}).encode() + b"\n\n"
+        large = split(event, 16)
+        # About as many bytes and chunks, in small events.
+        small = split(sse_body(len(event) // len(json.dumps(CHUNK))), 16)
+
+        def decode(chunks: List[bytes]):
+            return lambda: list(SSEBytesDecoder().iter_bytes(iter(chunks)))
+
+        assert len(list(SSEBytesDecoder().iter_bytes(iter(large)))) == 1
+        large_time, small_time = best_time(decode(large)), best_time(decode(small))
+        assert large_time < small_time * 4, (large_time, small_time)
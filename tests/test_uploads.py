@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+import time
+
+import httpx
+import pytest
+
+from portkey_ai import Portkey
+
+# 10240 bytes without repeats, so each part can be located; 11 parts of 1000.
+CONTENT = b"".join(hashlib.sha256(str(i).encode()).digest() for i in range(320))
+
+
+class UploadGateway:
+    """An uploads API that records parts and can fail chosen ones."""
+
+    def __init__(self, fail_parts=(), failures: int = 1, delay: float = 0.0) -> None:
+        self.fail_parts = set(fail_parts)
+        self.failures = failures
+        self.delay = delay
+        self.uploads = 0
+        self.parts: dict = {}
+        self.attempts: dict = {}
+        self.completed: dict = {}
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("/uploads"):
+            self.uploads += 1
+            return httpx.Response(
+                200, json={"id": f"upload_{self.uploads}", "status": "pending"}
+            )
+        if path.endswith("/parts"):
+            data = re.search(
+                rb'filename="[^"]*"\r\n(?:[^\r\n]+\r\n)*\r\n(.*)\r\n--',
+                request.read(),
+                re.S,
+            ).group(1)
+            index = CONTENT.find(data) // 1000
+            with self.lock:
+                self.attempts[index] = self.attempts.get(index, 0) + 1
+                attempt = self.attempts[index]
+                self.active += 1
+                self.max_active = max(self.max_active, self.active)
+            try:
+                time.sleep(self.delay)
+                if index in self.fail_parts and attempt <= self.failures:
+                    return httpx.Response(400, json={"error": {"message": "boom"}})
+                part_id = f"part_{index}"
+                self.parts[part_id] = data
+                return httpx.Response(
+                    200, json={"id": part_id, "object": "upload.part"}
+                )
+            finally:
+                with self.lock:
+                    self.active -= 1
+        if path.endswith("/complete"):
+            body = json.loads(request.content)
+            self.completed = body
+            return httpx.Response(
+                200, json={"id": path.split("/")[-2], "status": "completed"}
+            )
+        return httpx.Response(404)
+
+
+def upload(portkey: Portkey, path, **kwargs):
+    return portkey.uploads.upload_file_chunked(
+        file=path, mime_type="text/plain", purpose="batch", part_size=1000, **kwargs
+    )
+
+
+class TestUploadFileChunked:
+    def test_parallel_parts_in_order_with_md5(self, make_client, tmp_path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(CONTENT)
+        gateway = UploadGateway(delay=0.02)
+
+        result = upload(make_client(gateway, max_retries=0), path, concurrency=4)
+
+        assert result.status == "completed"
+        assert gateway.max_active > 1
+        assert gateway.completed["part_ids"] == [f"part_{i}" for i in range(11)]
+        assert gateway.completed["md5"] == hashlib.md5(CONTENT).hexdigest()
+        assert b"".join(gateway.parts[p] for p in gateway.completed["part_ids"]) == (
+            CONTENT
+        )
+
+    def test_in_memory_file_and_explicit_md5(self, make_client) -> None:
+        gateway = UploadGateway()
+        upload(
+            make_client(gateway, max_retries=0),
+            CONTENT,
+            filename="data.bin",
+            md5="given",
+        )
+        assert gateway.completed["md5"] == "given"
+        assert len(gateway.completed["part_ids"]) == 11
+
+    def test_failed_part_is_retried_alone(self, make_client, tmp_path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(CONTENT)
+        gateway = UploadGateway(fail_parts={3}, failures=2)
+        portkey = make_client(gateway, max_retries=0)
+        portkey.retry_policy.initial_delay = 0.0
+
+        upload(portkey, path, part_retries=2)
+
+        assert sorted(gateway.attempts.values()) == [1] * 10 + [3]
+        assert len(gateway.completed["part_ids"]) == 11
+
+    def test_resumes_from_checkpoint(self, make_client, tmp_path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(CONTENT)
+        checkpoint = tmp_path / "upload.json"
+        failing = UploadGateway(fail_parts={5}, failures=10)
+        portkey = make_client(failing, max_retries=0)
+        portkey.retry_policy.initial_delay = 0.0
+
+        with pytest.raises(Exception):
+            upload(portkey, path, part_retries=0, checkpoint=checkpoint)
+        saved = json.loads(checkpoint.read_text())
+        assert saved["upload_id"] == "upload_1"
+        assert "5" not in saved["parts"]
+
+        gateway = UploadGateway()
+        upload(make_client(gateway, max_retries=0), path, checkpoint=checkpoint)
+
+        assert gateway.uploads == 0
+        assert "part_5" in gateway.parts
+        assert len(gateway.parts) == 11 - len(saved["parts"])
+        assert gateway.completed["part_ids"] == [f"part_{i}" for i in range(11)]
+        assert gateway.completed["md5"] == hashlib.md5(CONTENT).hexdigest()
+        assert not checkpoint.exists()
+
+    def test_async(self, make_async_client, tmp_path) -> None:
+        path = tmp_path / "data.bin"
+        path.write_bytes(CONTENT)
+        gateway = UploadGateway()
+        portkey = make_async_client(gateway)
+        asyncio.run(
+            portkey.uploads.upload_file_chunked(
+                file=path,
+                mime_type="text/plain",
+                purpose="batch",
+                part_size=1000,
+                concurrency=3,
+            )
+        )
+        assert gateway.completed["part_ids"] == [f"part_{i}" for i in range(11)]
+        assert gateway.completed["md5"] == hashlib.md5(CONTENT).hexdigest()
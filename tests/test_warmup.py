@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from portkey_ai import AsyncPortkey, Portkey
+
+
+class WarmupServer(ThreadingHTTPServer):
+    """Records the client port of every request it answers."""
+
+    def __init__(self) -> None:
+        ports = self.ports = []
+        self.warmup_headers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_HEAD(self) -> None:
+                ports.append(self.client_address[1])
+                self.server.warmup_headers.append(  # type: ignore[attr-defined]
+                    self.headers.get("x-portkey-warmup")
+                )
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            do_GET = do_HEAD
+
+            def log_message(self, *args) -> None:
+                pass
+
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server_address[1]}/v1"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def server():
+    server = WarmupServer()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestWarmup:
+    def test_opens_connections_that_later_requests_reuse(self, server) -> None:
+        portkey = Portkey(api_key="test", base_url=server.url)
+
+        timings = portkey.warmup(4)
+
+        assert len(timings) == 4
+        assert all(t["new_connection"] and t["error"] is None for t in timings)
+        assert all(t["connect"] is not None and t["tls"] is None for t in timings)
+        assert all(t["total"] >= t["connect"] for t in timings)
+        assert len(set(server.ports)) == 4
+        assert sorted(server.warmup_headers) == ["0", "1", "2", "3"]
+        assert portkey.pool_stats()["idle"] == 4
+
+        portkey._client.get(server.url)
+        assert server.ports[-1] in server.ports[:4]
+
+    def test_capped_at_keepalive_limit(self, server) -> None:
+        portkey = Portkey(
+            api_key="test",
+            base_url=server.url,
+            connection_limits=httpx.Limits(max_keepalive_connections=2),
+        )
+        assert len(portkey.warmup(5)) == 2
+        with pytest.raises(ValueError):
+            portkey.warmup(0)
+
+    def test_reports_errors(self) -> None:
+        portkey = Portkey(api_key="test", base_url="http://127.0.0.1:1/v1")
+        timings = portkey.warmup(2, timeout=1.0)
+        assert [t["error"] is not None for t in timings] == [True, True]
+
+    def test_async(self, server) -> None:
+        async def main() -> list:
+            portkey = AsyncPortkey(api_key="test", base_url=server.url)
+            timings = await portkey.warmup(3)
+            assert portkey.pool_stats()["idle"] == 3
+            await portkey.close()
+            return timings
+
+        timings = asyncio.run(main())
+        assert all(t["new_connection"] for t in timings)
+        assert len(set(server.ports)) == 3